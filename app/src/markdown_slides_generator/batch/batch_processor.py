@@ -6,20 +6,33 @@ and comprehensive progress reporting.
 """
 
 import time
+import json
+import heapq
 import concurrent.futures
+import multiprocessing
 import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
 from ..utils.logger import get_logger
 from ..utils.exceptions import ProcessingError, InputError
+from ..utils.file_io import write_if_changed
 from ..config import Config
-from ..core.content_splitter import ContentSplitter
+from ..core.content_splitter import ContentSplitter, SplitResult
+from ..core.split_cache import create_split_cache
 from ..core.quarto_orchestrator import QuartoOrchestrator
+from ..core.resource_usage import ResourceUsage, summarize_usage
+from ..core.concurrency import AdaptiveConcurrencyController, SharedRenderCounts
+from ..core.render_cache import render_cache, referenced_files
+from ..core.build_graph import BuildGraph, BuildNode, BuildReport, default_state_file
+from ..core.toolchain import toolchain_registry
 from .file_scanner import FileScanner
 from .progress_reporter import ProgressReporter, ConsoleProgressReporter
+from .render_history import RenderHistory, document_features
+from .build_manifest import BuildManifest, BuildFingerprint, digest_strings, digest_tree
+from .pipeline import Pipeline
 
 logger = get_logger(__name__)
 
@@ -34,13 +47,20 @@ class BatchResult:
     generated_outputs: List[str]
     processing_time: float
     errors: List[Dict[str, Any]]
+    file_results: List['FileProcessingResult'] = field(default_factory=list)
+    # Quarto CPU, peak memory and output size over all renders (see summarize_usage)
+    resource_usage: Dict[str, Any] = field(default_factory=dict)
     
     @property
     def success_rate(self) -> float:
-        """Calculate success rate percentage."""
+        """Percentage of processed files that succeeded; skipped files are not counted."""
         if self.total_files == 0:
             return 0.0
-        return (self.successful_files / self.total_files) * 100
+        attempted = self.successful_files + self.failed_files
+        if attempted == 0:
+            # Every file was skipped (e.g. up to date), so nothing failed
+            return 100.0
+        return (self.successful_files / attempted) * 100
 
 
 @dataclass
@@ -52,6 +72,108 @@ class FileProcessingResult:
     processing_time: float
     error: Optional[Exception] = None
     skip_reason: Optional[str] = None
+    build_report: Optional[BuildReport] = None
+    # Usage of each render that ran, by output file
+    render_resources: Dict[str, ResourceUsage] = field(default_factory=dict)
+    # Seconds of the split and of each render step that ran, for the render history
+    split_time: Optional[float] = None
+    render_times: Dict[str, float] = field(default_factory=dict)
+    # Type name of error when it was raised in a worker process
+    error_type: Optional[str] = None
+    # Whether every build step succeeded, so the build manifest may record the file
+    complete: bool = False
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Compact, picklable summary sent back by worker processes; the build report stays behind."""
+        return {
+            'file_path': str(self.file_path),
+            'status': self.status,
+            'generated_files': list(self.generated_files),
+            'processing_time': self.processing_time,
+            'error': str(self.error) if self.error is not None else None,
+            'error_type': type(self.error).__name__ if self.error is not None else None,
+            'skip_reason': self.skip_reason,
+            'render_resources': {output: usage.to_dict() for output, usage in self.render_resources.items()},
+            'split_time': self.split_time,
+            'render_times': dict(self.render_times),
+            'complete': self.complete
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> 'FileProcessingResult':
+        """Rebuild a result from to_record; errors come back as ProcessingError with the original type name."""
+        return cls(
+            file_path=Path(record['file_path']),
+            status=record['status'],
+            generated_files=record['generated_files'],
+            processing_time=record['processing_time'],
+            error=ProcessingError(record['error']) if record['error'] is not None else None,
+            skip_reason=record['skip_reason'],
+            render_resources={
+                output: ResourceUsage(
+                    peak_rss_bytes=usage['peak_rss_bytes'],
+                    user_cpu=usage['user_cpu'],
+                    system_cpu=usage['system_cpu'],
+                    output_size=usage['output_size']
+                )
+                for output, usage in record['render_resources'].items()
+            },
+            split_time=record['split_time'],
+            render_times=record['render_times'],
+            error_type=record['error_type'],
+            complete=record['complete']
+        )
+
+
+@dataclass
+class SplitAhead:
+    """A file split by the split stage of the pipeline, waiting for a render worker."""
+    file_path: Path
+    split: Optional[SplitResult] = None
+    split_time: Optional[float] = None
+    error: Optional[Exception] = None
+    # (size, mtime_ns) of the source when it was split; a source edited
+    # since is split again by the render worker
+    source_signature: Optional[Tuple[int, int]] = None
+
+
+def _source_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of a source file, or None if it cannot be read."""
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+# Processor of a batch worker process, built once per process by _init_process_worker
+_worker_processor: Optional['BatchProcessor'] = None
+
+
+def _init_process_worker(config: Config, manifest_lock: Any, render_counts: Optional[SharedRenderCounts]) -> None:
+    """Build the splitter and orchestrator a worker process uses for all its files."""
+    global _worker_processor
+    # The parent records the render history from the returned records
+    config.batch.render_history = False
+    render_cache.share_manifest_lock(manifest_lock)
+    _worker_processor = BatchProcessor(config)
+    # Renders of all workers count against one adaptive limit
+    if _worker_processor.concurrency is not None and render_counts is not None:
+        _worker_processor.concurrency.share_counts(render_counts)
+
+
+def _process_file_in_worker(
+    file_path: str,
+    input_dir: str,
+    output_dir: str,
+    manifest_outputs: List[str]
+) -> Dict[str, Any]:
+    """Process one file in a worker process; only paths come in and a result record goes out."""
+    _worker_processor._manifest_outputs = {file_path: manifest_outputs}
+    result = _worker_processor._process_single_file(
+        Path(file_path), Path(input_dir), Path(output_dir), ProgressReporter(total_files=1, update_interval=0)
+    )
+    return result.to_record()
 
 
 class BatchProcessor:
@@ -64,13 +186,35 @@ class BatchProcessor:
     
     def __init__(self, config: Config):
         self.config = config
-        self.file_scanner = FileScanner()
-        self.content_splitter = ContentSplitter()
+        self.file_scanner = FileScanner(use_index=config.batch.scan_index)
+        self.content_splitter = ContentSplitter(
+            split_cache=create_split_cache(config.processing),
+            validation_level=config.processing.validation_level
+        )
         self.quarto_orchestrator = QuartoOrchestrator()
+        if self._incremental:
+            self.quarto_orchestrator.use_render_cache(render_cache)
+        
+        # Renders of all files share one adaptive limit instead of a fixed one
+        self.concurrency: Optional[AdaptiveConcurrencyController] = None
+        if config.batch.adaptive_workers:
+            self.concurrency = AdaptiveConcurrencyController(
+                min_workers=config.batch.min_workers,
+                max_workers=config.batch.max_workers
+            )
+            self.quarto_orchestrator.use_concurrency_controller(self.concurrency)
+        
+        # Split and render times of earlier runs, for estimates and scheduling
+        self.render_history: Optional[RenderHistory] = None
+        if config.batch.render_history:
+            self.render_history = RenderHistory()
         
         # Processing state
         self._processing_lock = threading.Lock()
         self._processed_files: Dict[str, FileProcessingResult] = {}
+        # Outputs the build manifest records for each file, which the batch
+        # may replace even without overwrite
+        self._manifest_outputs: Dict[str, List[str]] = {}
         
         logger.debug("Batch processor initialized")
     
@@ -79,7 +223,8 @@ class BatchProcessor:
         input_dir: Path,
         output_dir: Path,
         progress_callback: Optional[Callable[[ProgressReporter], None]] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        files: Optional[List[Path]] = None
     ) -> BatchResult:
         """
         Process all files in a directory according to configuration.
@@ -89,6 +234,7 @@ class BatchProcessor:
             output_dir: Directory for generated outputs
             progress_callback: Optional callback for progress updates
             dry_run: If True, only simulate processing
+            files: Files found by an earlier scan of input_dir; scanned if None
             
         Returns:
             BatchResult with processing statistics and results
@@ -103,7 +249,8 @@ class BatchProcessor:
         
         try:
             # Scan for files
-            files = self._scan_files(input_dir)
+            if files is None:
+                files = self._scan_files(input_dir)
             
             if not files:
                 logger.warning(f"No files found matching criteria in {input_dir}")
@@ -125,18 +272,48 @@ class BatchProcessor:
             # Create output directory
             output_dir.mkdir(parents=True, exist_ok=True)
             
+            # Files whose inputs, configuration, theme, toolchain and outputs
+            # are as the manifest recorded them are not processed at all
+            total_files = len(files)
+            manifest = BuildManifest(output_dir)
+            fingerprint = self._build_fingerprint()
+            files, input_states, up_to_date = self._partition_stale(files, input_dir, output_dir, manifest, fingerprint)
+            if up_to_date:
+                logger.info(f"{len(up_to_date)} file(s) up to date, {len(files)} to build")
+            
+            parallel = self.config.batch.parallel and len(files) > 1
+            expected_times = self._expected_times(files)
+            if parallel and expected_times:
+                # Longest files first, so a slow one does not start last and
+                # leave the other workers idle; files without history are
+                # assumed to take as long as the average
+                average = sum(expected_times.values()) / len(expected_times)
+                files = sorted(files, key=lambda f: expected_times.get(f, average), reverse=True)
+            
             # Initialize progress reporter
             progress_reporter = ConsoleProgressReporter(
                 total_files=len(files),
                 show_detailed=False,
-                update_interval=self.config.batch.progress_reporting and 1.0 or 0
+                update_interval=self.config.batch.progress_reporting and 1.0 or 0,
+                expected_times={str(f): seconds for f, seconds in expected_times.items()},
+                parallelism=min(self.config.batch.max_workers, len(files)) if parallel else 1
             )
             
             if progress_callback:
                 progress_reporter.update_callback = progress_callback
             
             # Process files
-            results = self._process_files(files, input_dir, output_dir, progress_reporter)
+            try:
+                results = self._process_files(files, input_dir, output_dir, progress_reporter)
+                for result in results:
+                    key = self._manifest_key(result.file_path, input_dir)
+                    if result.status == 'success' and result.complete:
+                        manifest.record(key, fingerprint, input_states[result.file_path], result.generated_files)
+                    elif result.status == 'error':
+                        manifest.forget(key)
+            finally:
+                manifest.save()
+            results = up_to_date + results
             
             # Calculate final statistics
             processing_time = time.time() - start_time
@@ -155,21 +332,25 @@ class BatchProcessor:
                     errors.append({
                         'file': str(result.file_path),
                         'error': str(result.error),
-                        'error_type': type(result.error).__name__,
+                        'error_type': result.error_type or type(result.error).__name__,
                         'processing_time': result.processing_time
                     })
             
             batch_result = BatchResult(
-                total_files=len(files),
+                total_files=total_files,
                 successful_files=successful_files,
                 failed_files=failed_files,
                 skipped_files=skipped_files,
                 generated_outputs=generated_outputs,
                 processing_time=processing_time,
-                errors=errors
+                errors=errors,
+                file_results=results,
+                resource_usage=summarize_usage(
+                    usage for result in results for usage in result.render_resources.values()
+                )
             )
             
-            logger.info(f"Batch processing complete: {successful_files}/{len(files)} successful")
+            logger.info(f"Batch processing complete: {successful_files}/{total_files} successful")
             
             return batch_result
             
@@ -187,6 +368,141 @@ class BatchProcessor:
             file_filters=self.config.batch.file_filters
         )
     
+    @property
+    def _incremental(self) -> bool:
+        """Whether unchanged files and build steps are skipped; turning off the render cache rebuilds all."""
+        return self.config.batch.incremental and self.config.output.render_cache
+    
+    @staticmethod
+    def _manifest_key(file_path: Path, input_dir: Path) -> str:
+        """Build manifest key of a source: its path relative to the input directory."""
+        return Path(file_path).relative_to(input_dir).as_posix()
+    
+    def _partition_stale(
+        self,
+        files: List[Path],
+        input_dir: Path,
+        output_dir: Path,
+        manifest: BuildManifest,
+        fingerprint: BuildFingerprint
+    ) -> Tuple[List[Path], Dict[Path, List[List[Any]]], List[FileProcessingResult]]:
+        """
+        Split files into those to build and those the manifest shows up to date.
+        
+        Returns:
+            Tuple of (files to build, current input state of each of them,
+            skipped results of the up-to-date files)
+        """
+        stale_files, input_states, up_to_date = [], {}, []
+        self._manifest_outputs = {}
+        for file_path in files:
+            key = self._manifest_key(file_path, input_dir)
+            recorded_inputs = manifest.recorded_inputs(key)
+            if recorded_inputs and self._incremental:
+                input_state = manifest.input_state(key, recorded_inputs)
+                reasons = manifest.stale_reasons(key, fingerprint, input_state)
+                if not reasons:
+                    manifest.refresh(key, input_state)
+                    up_to_date.append(FileProcessingResult(
+                        file_path=file_path,
+                        status='skipped',
+                        generated_files=manifest.recorded_outputs(key),
+                        processing_time=0.0,
+                        skip_reason="Up to date"
+                    ))
+                    continue
+                logger.debug(f"Rebuilding {key}: {', '.join(reasons)}")
+            
+            # The source may insert other .bib files or refer to other images than at its last build
+            inputs = [path.resolve() for path in self.content_splitter.source_files(str(file_path))]
+            resources, theme_file = self._render_inputs(file_path, output_dir / file_path.relative_to(input_dir).parent)
+            inputs.extend(path.resolve() for path in resources + ([theme_file] if theme_file else []))
+            input_states[file_path] = manifest.input_state(key, inputs)
+            self._manifest_outputs[str(file_path)] = manifest.recorded_outputs(key)
+            stale_files.append(file_path)
+        return stale_files, input_states, up_to_date
+    
+    def _render_inputs(self, file_path: Path, file_output_dir: Path) -> Tuple[List[Path], Optional[Path]]:
+        """
+        Files the renders of a source read besides its documents.
+        
+        Returns:
+            Tuple of (files the source refers to, resolved next to the
+            documents in file_output_dir as Quarto resolves them; the SCSS
+            file of the slides theme, or None for a built-in reveal.js theme)
+        """
+        try:
+            text = file_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            text = ''
+        resources = [file_output_dir / reference for reference in sorted(referenced_files(text, file_output_dir))]
+        theme = self.config.slides.theme
+        if theme.startswith('academic-'):
+            theme = f"{theme}.scss"
+        theme_file = file_output_dir / theme if theme.endswith('.scss') else None
+        return resources, theme_file
+    
+    def _build_fingerprint(self) -> BuildFingerprint:
+        """Digests of the configuration, theme and templates, and toolchain every file is built with."""
+        # Settings that only change how fast or where from outputs are built
+        processing = {
+            name: value for name, value in asdict(self.config.processing).items()
+            if name not in ('split_cache', 'split_cache_dir', 'split_cache_max_size_mb', 'shard_workers')
+        }
+        config = json.dumps({
+            'formats': self.config.output.formats,
+            'naming_pattern': self.config.output.naming_pattern,
+            'slides': asdict(self.config.slides),
+            'notes': asdict(self.config.notes),
+            'processing': processing,
+            'variables': self.config.variables
+        }, sort_keys=True, default=str)
+        theme = digest_strings([
+            self.config.slides.theme,
+            digest_tree(self.quarto_orchestrator.theme_manager.themes_dir),
+            digest_tree(self.quarto_orchestrator.template_manager.templates_dir)
+        ])
+        toolchain = []
+        for tool in ('quarto', 'pdflatex'):
+            try:
+                toolchain.append(f"{tool} {toolchain_registry.get(tool).version}")
+            except Exception:
+                toolchain.append(f"{tool} unavailable")
+        return BuildFingerprint(
+            config=digest_strings([config]), theme=theme, toolchain=digest_strings(toolchain)
+        )
+    
+    def _render_steps(self) -> List[str]:
+        """History keys of the renders of one file: every slides format and the notes."""
+        return [f"slides:{fmt}" for fmt in self.config.output.formats] + [f"notes:{self._notes_format()}"]
+    
+    def _notes_format(self) -> str:
+        notes_formats = getattr(self.config.notes, 'formats', None) or ['pdf']
+        return notes_formats[0]
+    
+    def _expected_times(self, files: List[Path]) -> Dict[Path, float]:
+        """Seconds each file is expected to take from the render history; files without history are left out."""
+        if self.render_history is None:
+            return {}
+        model = self.render_history.model()
+        if not model.has_history:
+            return {}
+        steps = self._render_steps()
+        expected = {}
+        for file_path in files:
+            wall_time = model.estimate_file(file_path, steps).wall_time
+            if wall_time is not None:
+                expected[file_path] = wall_time
+        return expected
+    
+    @staticmethod
+    def _schedule_length(times: List[float], workers: int) -> float:
+        """Seconds to process files of the given durations longest-first on the given number of workers."""
+        finish_times = [0.0] * max(1, workers)
+        for seconds in sorted(times, reverse=True):
+            heapq.heapreplace(finish_times, finish_times[0] + seconds)
+        return max(finish_times)
+    
     def _simulate_processing(self, files: List[Path], output_dir: Path) -> BatchResult:
         """Simulate processing for dry run."""
         logger.info("Simulating batch processing (dry run)")
@@ -220,7 +536,9 @@ class BatchProcessor:
         progress_reporter.start()
         
         try:
-            if self.config.batch.parallel and len(files) > 1:
+            if self.config.batch.parallel and len(files) > 1 and self.config.batch.backend == 'process':
+                return self._process_files_in_processes(files, input_dir, output_dir, progress_reporter)
+            elif self.config.batch.parallel and len(files) > 1:
                 return self._process_files_parallel(files, input_dir, output_dir, progress_reporter)
             else:
                 return self._process_files_sequential(files, input_dir, output_dir, progress_reporter)
@@ -234,43 +552,108 @@ class BatchProcessor:
         output_dir: Path,
         progress_reporter: ProgressReporter
     ) -> List[FileProcessingResult]:
-        """Process files in parallel using thread pool."""
-        logger.info(f"Processing {len(files)} files with {self.config.batch.max_workers} workers")
+        """
+        Process files in parallel in a split stage and a render stage.
+        
+        Split workers split files ahead of the render workers, at most
+        batch.queue_depth files ahead, so a render worker that finishes a
+        file picks up one that is already split and Quarto keeps rendering
+        while later files are split. Split results waiting for a render
+        worker are bounded by the queue depth, not by the number of files.
+        """
+        split_workers = min(self.config.batch.split_workers, len(files))
+        logger.info(
+            f"Processing {len(files)} files with {split_workers} split and "
+            f"{self.config.batch.max_workers} render workers"
+        )
+        
+        pipeline = Pipeline(queue_depth=self.config.batch.queue_depth)
+        pipeline.add_stage(
+            'split', lambda file_path: self._split_ahead(file_path, input_dir, output_dir), workers=split_workers
+        )
+        pipeline.add_stage(
+            'render',
+            lambda ahead: self._process_single_file(ahead.file_path, input_dir, output_dir, progress_reporter, ahead),
+            workers=self.config.batch.max_workers
+        )
         
         results = []
+        for result in pipeline.run(files):
+            results.append(result)
+            
+            # Handle errors based on configuration
+            if result.status == 'error' and self.config.batch.error_handling == 'stop':
+                logger.error("Stopping batch processing due to error")
+                # Files not yet rendered are dropped
+                break
+        
+        return results
+    
+    def _split_ahead(self, file_path: Path, input_dir: Path, output_dir: Path) -> SplitAhead:
+        """Split a file for a render worker; never raises, a failed split is raised again where it is used."""
+        file_output_dir = output_dir / file_path.relative_to(input_dir).parent
+        if self._foreign_outputs(file_path, file_output_dir):
+            # The render worker skips it without needing the split
+            return SplitAhead(file_path)
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.config.batch.max_workers) as executor:
-            # Submit all tasks
+        source_signature = _source_signature(file_path)
+        split_start = time.time()
+        try:
+            split = self.content_splitter.split_file(str(file_path))
+        except Exception as e:
+            return SplitAhead(file_path, error=e, source_signature=source_signature)
+        return SplitAhead(file_path, split, time.time() - split_start, source_signature=source_signature)
+    
+    def _process_files_in_processes(
+        self,
+        files: List[Path],
+        input_dir: Path,
+        output_dir: Path,
+        progress_reporter: ProgressReporter
+    ) -> List[FileProcessingResult]:
+        """
+        Process files in parallel using a process pool.
+        
+        Splitting runs under the GIL, so worker threads only overlap their
+        Quarto renders; worker processes split on several CPUs at once. Each
+        worker builds its own processor once and handles many files, and
+        only paths and result records cross the process boundary. Render
+        cache manifests are updated under a lock shared by the workers, and
+        the workers' concurrency controllers share their count of running
+        renders and their machine sample, so max_workers and the memory
+        check hold for all processes together.
+        """
+        logger.info(f"Processing {len(files)} files with {self.config.batch.max_workers} worker processes")
+        
+        results = []
+        # Workers are spawned rather than forked, as the progress reporter
+        # and render threads may hold locks at the time of the fork
+        context = multiprocessing.get_context('spawn')
+        
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.config.batch.max_workers,
+            mp_context=context,
+            initializer=_init_process_worker,
+            initargs=(
+                self.config, context.Lock(),
+                SharedRenderCounts(context) if self.config.batch.adaptive_workers else None
+            )
+        ) as executor:
             future_to_file = {
                 executor.submit(
-                    self._process_single_file,
-                    file_path,
-                    input_dir,
-                    output_dir,
-                    progress_reporter
+                    _process_file_in_worker, str(file_path), str(input_dir), str(output_dir),
+                    self._manifest_outputs.get(str(file_path), [])
                 ): file_path
                 for file_path in files
             }
             
-            # Collect results as they complete
             for future in concurrent.futures.as_completed(future_to_file):
+                file_path = future_to_file[future]
                 try:
-                    result = future.result()
-                    results.append(result)
-                    
-                    # Handle errors based on configuration
-                    if result.status == 'error' and self.config.batch.error_handling == 'stop':
-                        logger.error("Stopping batch processing due to error")
-                        # Cancel remaining tasks
-                        for remaining_future in future_to_file:
-                            if not remaining_future.done():
-                                remaining_future.cancel()
-                        break
-                        
+                    result = FileProcessingResult.from_record(future.result())
                 except Exception as e:
-                    file_path = future_to_file[future]
+                    # The worker died or the record could not be sent back
                     logger.error(f"Unexpected error processing {file_path}: {e}")
-                    
                     result = FileProcessingResult(
                         file_path=file_path,
                         status='error',
@@ -278,8 +661,22 @@ class BatchProcessor:
                         processing_time=0.0,
                         error=e
                     )
-                    results.append(result)
-                    progress_reporter.report_file_error(file_path, e)
+                results.append(result)
+                
+                if result.status == 'success':
+                    self._record_history(result)
+                    progress_reporter.report_file_success(file_path, result.processing_time)
+                elif result.status == 'skipped':
+                    progress_reporter.report_file_skipped(file_path, result.skip_reason or '')
+                else:
+                    progress_reporter.report_file_error(file_path, result.error, result.processing_time)
+                
+                if result.status == 'error' and self.config.batch.error_handling == 'stop':
+                    logger.error("Stopping batch processing due to error")
+                    for remaining_future in future_to_file:
+                        if not remaining_future.done():
+                            remaining_future.cancel()
+                    break
         
         return results
     
@@ -328,9 +725,16 @@ class BatchProcessor:
         file_path: Path,
         input_dir: Path,
         output_dir: Path,
-        progress_reporter: ProgressReporter
+        progress_reporter: ProgressReporter,
+        ahead: Optional[SplitAhead] = None
     ) -> FileProcessingResult:
-        """Process a single markdown file."""
+        """
+        Process a single markdown file.
+        
+        Args:
+            ahead: The file as split by the pipeline's split stage, used
+                instead of splitting it again if the split step has to run
+        """
         start_time = time.time()
         
         progress_reporter.report_file_start(file_path)
@@ -340,80 +744,136 @@ class BatchProcessor:
             rel_path = file_path.relative_to(input_dir).parent
             file_output_dir = output_dir / rel_path
             
-            # Check for existing files if not overwriting
-            if not self.config.output.overwrite:
-                existing_files = self._check_existing_files(file_path, file_output_dir)
-                if existing_files:
-                    processing_time = time.time() - start_time
-                    progress_reporter.report_file_skipped(
-                        file_path,
-                        f"Output files already exist: {', '.join(f.name for f in existing_files)}"
-                    )
-                    return FileProcessingResult(
-                        file_path=file_path,
-                        status='skipped',
-                        generated_files=[],
-                        processing_time=processing_time,
-                        skip_reason="Files already exist"
-                    )
+            # Check for existing files if not overwriting; outputs an earlier
+            # batch run built from this file are replaced all the same
+            existing_files = self._foreign_outputs(file_path, file_output_dir)
+            if existing_files:
+                processing_time = time.time() - start_time
+                progress_reporter.report_file_skipped(
+                    file_path,
+                    f"Output files already exist: {', '.join(f.name for f in existing_files)}"
+                )
+                return FileProcessingResult(
+                    file_path=file_path,
+                    status='skipped',
+                    generated_files=[],
+                    processing_time=processing_time,
+                    skip_reason="Files already exist"
+                )
             
             # Create output directory
             file_output_dir.mkdir(parents=True, exist_ok=True)
             
-            # Process the markdown file
-            slides_content, notes_content = self.content_splitter.split_content(str(file_path))
-            
-            # Create temporary files
+            # Write the Quarto documents; unchanged ones keep their mtimes
             slides_file = file_output_dir / f"{file_path.stem}_slides.qmd"
             notes_file_path = file_output_dir / f"{file_path.stem}_notes.qmd"
+            notes_primary = self._notes_format()
             
-            with open(slides_file, 'w', encoding='utf-8') as f:
-                f.write(slides_content)
-            with open(notes_file_path, 'w', encoding='utf-8') as f:
-                f.write(notes_content)
-            
-            generated_files = []
-            
-            # Generate slides for each format
+            # Only the steps whose inputs changed since the last batch run are redone
+            graph = BuildGraph(
+                default_state_file(file_output_dir, file_path), max_workers=self.config.output.render_workers
+            )
+            split_results = {}
+            # Seconds of the steps that actually ran, for the render history
+            split_seconds: List[float] = []
+            render_seconds: Dict[str, float] = {}
+            
+            def split() -> None:
+                if ahead is not None and ahead.source_signature is not None \
+                        and ahead.source_signature == _source_signature(file_path):
+                    if ahead.error is not None:
+                        raise ahead.error
+                    split_results['split'] = ahead.split
+                    split_seconds.append(ahead.split_time)
+                    return
+                # split_file keeps no per-file state on the shared splitter, so
+                # worker threads do not interfere with each other
+                split_start = time.time()
+                split_results['split'] = self.content_splitter.split_file(str(file_path))
+                split_seconds.append(time.time() - split_start)
+            
+            def write_slides() -> None:
+                write_if_changed(slides_file, split_results['split'].slides)
+            
+            def write_notes() -> None:
+                write_if_changed(notes_file_path, split_results['split'].notes)
+            
+            graph.add(BuildNode(
+                'split', split, inputs=self.content_splitter.source_files(str(file_path)),
+                key=self.content_splitter.split_options
+            ))
+            graph.add(BuildNode('qmd[slides]', write_slides, deps=['split'], outputs=[slides_file]))
+            graph.add(BuildNode('qmd[notes]', write_notes, deps=['split'], outputs=[notes_file_path]))
+            
+            quarto_version = self._quarto_version()
+            render_resources: Dict[str, ResourceUsage] = {}
+            # Images and includes the documents refer to, and the theme, are read by the renders
+            resources, theme_file = self._render_inputs(file_path, file_output_dir)
+            slides_inputs = resources + ([theme_file] if theme_file else [])
+            
+            def render(step: str, job) -> List[str]:
+                result = self.quarto_orchestrator.render_jobs([job])[0]
+                output_file = self.quarto_orchestrator.require_output(job, result)
+                if result.resources is not None:
+                    render_resources[output_file] = result.resources
+                if not result.cached:
+                    render_seconds[step] = result.execution_time
+                return [output_file]
+            
+            # One render per slides format plus the notes, run concurrently
             for fmt in self.config.output.formats:
-                try:
-                    output_file = self.quarto_orchestrator.generate_slides(
+                def render_slides(fmt: str = fmt) -> List[str]:
+                    return render(f"slides:{fmt}", self.quarto_orchestrator.prepare_slides(
                         str(slides_file), fmt, None, self.config.slides.theme
-                    )
-                    generated_files.append(output_file)
-                except Exception as e:
-                    logger.error(f"Error generating {fmt} slides for {file_path}: {e}")
-                    if self.config.batch.error_handling == 'stop':
-                        raise
-            
-            # Generate notes (use configured notes formats, default to pdf)
-            try:
-                notes_formats = getattr(self.config.notes, 'formats', None) or ['pdf']
-                notes_primary = notes_formats[0]
-                notes_output = self.quarto_orchestrator.generate_notes(
-                    str(notes_file_path), notes_primary
+                    ))
+                
+                graph.add(BuildNode(
+                    f"render[slides:{fmt}]", render_slides, deps=['qmd[slides]'], inputs=slides_inputs,
+                    key=f"{fmt}:{self.config.slides.theme}:{quarto_version}"
+                ))
+            
+            def render_notes() -> List[str]:
+                return render(
+                    f"notes:{notes_primary}",
+                    self.quarto_orchestrator.prepare_notes(str(notes_file_path), notes_primary)
                 )
-                generated_files.append(notes_output)
-            except Exception as e:
-                logger.error(f"Error generating notes for {file_path}: {e}")
-                if self.config.batch.error_handling == 'stop':
-                    raise
             
-            # Clean up temporary files
-            if slides_file.exists():
-                slides_file.unlink()
-            if notes_file_path.exists():
-                notes_file_path.unlink()
+            graph.add(BuildNode(
+                f"render[notes:{notes_primary}]", render_notes, deps=['qmd[notes]'], inputs=resources,
+                key=f"{notes_primary}:{quarto_version}"
+            ))
             
-            processing_time = time.time() - start_time
-            progress_reporter.report_file_success(file_path, processing_time)
+            build_report = graph.run(force=not self._incremental)
+            split_time = split_seconds[0] if split_seconds else None
             
-            return FileProcessingResult(
+            generated_files = []
+            for name, outcome in build_report.outcomes.items():
+                if not name.startswith('render['):
+                    if outcome.error is not None:
+                        raise outcome.error
+                elif outcome.ok:
+                    generated_files.extend(outcome.outputs[:1])
+                else:
+                    logger.error(f"Error generating {name} for {file_path}: {outcome.error}")
+                    if self.config.batch.error_handling == 'stop':
+                        raise outcome.error
+            
+            processing_time = time.time() - start_time
+            result = FileProcessingResult(
                 file_path=file_path,
                 status='success',
                 generated_files=generated_files,
-                processing_time=processing_time
+                processing_time=processing_time,
+                build_report=build_report,
+                render_resources=render_resources,
+                split_time=split_time,
+                render_times=render_seconds,
+                complete=build_report.ok
             )
+            self._record_history(result)
+            progress_reporter.report_file_success(file_path, processing_time)
+            
+            return result
             
         except Exception as e:
             processing_time = time.time() - start_time
@@ -427,6 +887,31 @@ class BatchProcessor:
                 error=e
             )
     
+    def _record_history(self, result: FileProcessingResult) -> None:
+        """Add the measured steps of a processed file to the render history."""
+        if self.render_history is not None:
+            self.render_history.record(
+                result.file_path, document_features(result.file_path), result.split_time, result.render_times
+            )
+    
+    @staticmethod
+    def _quarto_version() -> str:
+        """Version of the Quarto on PATH, so upgrades redo every render."""
+        try:
+            return toolchain_registry.get('quarto').version
+        except Exception:
+            return ''
+    
+    def _foreign_outputs(self, file_path: Path, file_output_dir: Path) -> List[Path]:
+        """Existing outputs of a file that overwrite is off for and no earlier batch run built."""
+        if self.config.output.overwrite:
+            return []
+        owned = set(self._manifest_outputs.get(str(file_path), []))
+        return [
+            f for f in self._check_existing_files(file_path, file_output_dir)
+            if str(f.resolve()) not in owned
+        ]
+    
     def _check_existing_files(self, file_path: Path, output_dir: Path) -> List[Path]:
         """Check for existing output files."""
         existing_files = []
@@ -461,22 +946,30 @@ class BatchProcessor:
                     'total_size': 0
                 }
             
-            # Get file scanner estimates
-            scanner_estimate = self.file_scanner.estimate_processing_time(files)
+            # Get file scanner estimates, from the render history where there is one
+            expected_times = self._expected_times(files)
+            scanner_estimate = self.file_scanner.estimate_processing_time(files, predict=expected_times.get)
             
             # Calculate output estimates
             outputs_per_file = len(self.config.output.formats) + 1  # slides + notes
             total_outputs = len(files) * outputs_per_file
             
+            max_workers = self.config.batch.max_workers if self.config.batch.parallel else 1
+            file_times = scanner_estimate['file_times']
+            longest_files = sorted(file_times.items(), key=lambda item: item[1], reverse=True)
+            
             return {
                 'total_files': len(files),
                 'estimated_time_seconds': scanner_estimate['estimated_time_seconds'],
                 'estimated_time_human': scanner_estimate['estimated_time_human'],
+                'parallel_time_seconds': self._schedule_length(list(file_times.values()), max_workers),
+                'files_from_history': scanner_estimate['files_from_history'],
+                'longest_files': [(str(f), seconds) for f, seconds in longest_files[:3]],
                 'estimated_outputs': total_outputs,
                 'total_size_bytes': scanner_estimate['total_size_bytes'],
                 'total_size_human': scanner_estimate['total_size_human'],
                 'parallel_processing': self.config.batch.parallel,
-                'max_workers': self.config.batch.max_workers if self.config.batch.parallel else 1,
+                'max_workers': max_workers,
                 'output_formats': self.config.output.formats
             }
             
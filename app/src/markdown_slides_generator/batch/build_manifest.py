@@ -0,0 +1,215 @@
+"""
+Build Manifest for Incremental Batch Builds
+
+Records, in the batch output directory, what every processed source file
+was built from: a digest of its inputs (the markdown and the .bib files it
+inserts), of the configuration, of the theme and template files and the
+toolchain versions, together with the outputs it produced. A later run
+treats a file as up to date when all of those still match and its outputs
+are untouched, and does not process it at all. Input digests are memoized
+by (size, mtime), so checking an unchanged tree reads no source files.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable
+
+from ..utils.logger import get_logger
+from ..utils.file_io import write_if_changed
+
+logger = get_logger(__name__)
+
+
+# Bump when the layout of the manifest changes
+BUILD_MANIFEST_FORMAT_VERSION = 1
+
+# Name of the manifest kept in the batch output directory
+BUILD_MANIFEST_NAME = '.batch-manifest.json'
+
+
+@dataclass(frozen=True)
+class BuildFingerprint:
+    """Digests of what every file of a batch run is built with besides its own inputs."""
+    config: str
+    theme: str
+    toolchain: str
+
+
+def _signature(path: Path) -> Optional[List[int]]:
+    """(size, mtime_ns) of a file, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _file_digest(path: Path) -> str:
+    """sha256 of a file's content; 'missing' if it cannot be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, 'rb') as handle:
+            for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+                digest.update(chunk)
+    except OSError:
+        return 'missing'
+    return digest.hexdigest()
+
+
+def digest_strings(parts: Iterable[str]) -> str:
+    """sha256 of a sequence of strings, kept apart by separators."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def digest_tree(directory: Path) -> str:
+    """Digest of the relative paths and contents of every file under a directory."""
+    directory = Path(directory)
+    parts = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            parts.extend([path.relative_to(directory).as_posix(), _file_digest(path)])
+    return digest_strings(parts)
+
+
+class BuildManifest:
+    """
+    Source-to-output manifest of a batch output directory.
+    
+    Entries are keyed by the source path relative to the input directory.
+    Changes are kept in memory until save(). Safe to use from multiple
+    threads.
+    """
+    
+    def __init__(self, output_dir: Path):
+        self.manifest_file = Path(output_dir) / BUILD_MANIFEST_NAME
+        self._entries: Dict[str, Dict[str, Any]] = self._load()
+        self._lock = threading.Lock()
+        self._dirty = False
+    
+    def input_state(self, key: str, inputs: List[Path]) -> List[List[Any]]:
+        """
+        Current [path, size, mtime_ns, sha256] of the inputs of a file.
+        
+        Inputs whose size and mtime match the entry's reuse its digest
+        instead of being read.
+        """
+        with self._lock:
+            entry = self._entries.get(key, {})
+        known = {path: (signature, digest) for path, *signature, digest in entry.get('inputs', [])}
+        state = []
+        for path in inputs:
+            signature = _signature(path)
+            memo = known.get(str(path))
+            if signature is not None and memo is not None and memo[0] == signature:
+                digest = memo[1]
+            else:
+                digest = _file_digest(path)
+            state.append([str(path)] + (signature or [None, None]) + [digest])
+        return state
+    
+    def recorded_inputs(self, key: str) -> List[Path]:
+        """Inputs recorded for a file at its last build; empty if it was never built."""
+        with self._lock:
+            entry = self._entries.get(key, {})
+        return [Path(path) for path, *_ in entry.get('inputs', [])]
+    
+    def recorded_outputs(self, key: str) -> List[str]:
+        """Outputs recorded for a file at its last build."""
+        with self._lock:
+            entry = self._entries.get(key, {})
+        return list(entry.get('outputs', {}))
+    
+    def stale_reasons(self, key: str, fingerprint: BuildFingerprint, input_state: List[List[Any]]) -> List[str]:
+        """
+        Why a file has to be built again; empty when it is up to date.
+        
+        Args:
+            key: Source path relative to the input directory
+            fingerprint: Configuration, theme and toolchain of this run
+            input_state: Result of input_state for the file's inputs
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return ["not built before"]
+        
+        reasons = []
+        recorded = {path: digest for path, *_, digest in entry['inputs']}
+        current = {path: digest for path, *_, digest in input_state}
+        for path in sorted(set(recorded) | set(current)):
+            if recorded.get(path) != current.get(path):
+                reasons.append(f"{Path(path).name} changed")
+        for name, value in asdict(fingerprint).items():
+            if entry['fingerprint'].get(name) != value:
+                reasons.append(f"{name} changed")
+        for output, signature in entry['outputs'].items():
+            if _signature(Path(output)) != signature:
+                reasons.append(f"{Path(output).name} missing or modified")
+        return reasons
+    
+    def record(
+        self,
+        key: str,
+        fingerprint: BuildFingerprint,
+        input_state: List[List[Any]],
+        outputs: Iterable[str]
+    ) -> None:
+        """Record a successful build of a file from the given inputs."""
+        with self._lock:
+            self._entries[key] = {
+                'inputs': input_state,
+                'fingerprint': asdict(fingerprint),
+                'outputs': {str(Path(output).resolve()): _signature(Path(output)) for output in outputs}
+            }
+            self._dirty = True
+    
+    def refresh(self, key: str, input_state: List[List[Any]]) -> None:
+        """Keep the new size and mtime of inputs that were touched but not changed."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['inputs'] != input_state:
+                entry['inputs'] = input_state
+                self._dirty = True
+    
+    def forget(self, key: str) -> None:
+        """Drop the entry of a file, so its next run rebuilds it."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+    
+    def save(self) -> None:
+        """Write the manifest if it changed; failures are logged, not raised."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(
+                {'format': BUILD_MANIFEST_FORMAT_VERSION, 'entries': self._entries}, indent=1, sort_keys=True
+            )
+            self._dirty = False
+        try:
+            write_if_changed(self.manifest_file, data)
+        except OSError as e:
+            logger.warning(f"Could not write build manifest {self.manifest_file}: {e}")
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the manifest; a missing or unreadable one has no entries."""
+        try:
+            data = json.loads(self.manifest_file.read_text(encoding='utf-8'))
+            if data.get('format') != BUILD_MANIFEST_FORMAT_VERSION:
+                return {}
+            return dict(data['entries'])
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable build manifest {self.manifest_file}: {e}")
+            return {}
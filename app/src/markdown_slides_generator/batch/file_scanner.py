@@ -4,19 +4,32 @@ File Scanner for Batch Processing
 Intelligent file discovery and filtering for batch operations.
 """
 
+import json
 import fnmatch
-from pathlib import Path
-from typing import List, Set, Optional, Dict, Any, Union, Callable
+from pathlib import Path, PurePosixPath
+from typing import List, Set, Optional, Dict, Any, Union, Callable, Iterator, Tuple
 import os
 import stat
+import time
 from datetime import datetime
 
 from ..utils.logger import get_logger
 from ..utils.exceptions import InputError
+from .scan_index import ScanIndex, ScanDelta
 
 logger = get_logger(__name__)
 
 
+def _match_parts(parts: Tuple[str, ...], pattern_parts: Tuple[str, ...]) -> bool:
+    """Whether a relative path matches a glob pattern, split in segments; '**' matches any number of them."""
+    if not pattern_parts:
+        return not parts
+    if pattern_parts[0] == '**':
+        return any(_match_parts(parts[skip:], pattern_parts[1:]) for skip in range(len(parts) + 1))
+    return bool(parts) and fnmatch.fnmatch(parts[0], pattern_parts[0]) \
+        and _match_parts(parts[1:], pattern_parts[1:])
+
+
 class FileScanner:
     """
     Intelligent file scanner for batch processing operations.
@@ -25,10 +38,21 @@ class FileScanner:
     and metadata collection for efficient batch processing.
     """
     
-    def __init__(self):
+    def __init__(self, use_index: bool = False, index_dir: Optional[Path] = None):
+        """
+        Args:
+            use_index: Keep a scan index per scanned directory, so repeated
+                scans only list directories that changed and report a delta
+            index_dir: Directory of the scan indexes; the user cache if None
+        """
+        self.use_index = use_index
+        self.index_dir = index_dir
         self.scanned_files: List[Path] = []
         self.excluded_files: List[Path] = []
         self.scan_stats: Dict[str, Any] = {}
+        # Changes since the previous complete scan of the same directory;
+        # None without an index, or when there was no previous scan
+        self.last_delta: Optional[ScanDelta] = None
     
     def scan_directory(
         self,
@@ -41,7 +65,8 @@ class FileScanner:
         min_size: Optional[int] = None,
         max_size: Optional[int] = None,
         modified_after: Optional[datetime] = None,
-        modified_before: Optional[datetime] = None
+        modified_before: Optional[datetime] = None,
+        include_hidden: bool = False
     ) -> List[Path]:
         """
         Scan directory for files matching criteria.
@@ -57,6 +82,7 @@ class FileScanner:
             max_size: Maximum file size in bytes
             modified_after: Only include files modified after this date
             modified_before: Only include files modified before this date
+            include_hidden: Whether to descend into hidden directories
             
         Returns:
             List of matching file paths
@@ -64,6 +90,60 @@ class FileScanner:
         Raises:
             InputError: If directory doesn't exist or isn't accessible
         """
+        start_time = datetime.now()
+        
+        filtered_files = []
+        for file_path in self.iter_files(
+            directory, pattern, recursive, exclude_patterns, file_filters,
+            min_size, max_size, modified_after, modified_before, include_hidden
+        ):
+            # Stop at the first file past the limit instead of walking the rest
+            if max_files and len(filtered_files) >= max_files:
+                logger.warning(f"Limiting results to {max_files} files")
+                break
+            filtered_files.append(file_path)
+        
+        self.scanned_files = filtered_files
+        self.scan_stats['final_count'] = len(filtered_files)
+        self.scan_stats['scan_time'] = (datetime.now() - start_time).total_seconds()
+        
+        logger.info(f"Scan complete: {len(filtered_files)} files selected")
+        
+        return filtered_files
+    
+    def iter_files(
+        self,
+        directory: Path,
+        pattern: str = '*.md',
+        recursive: bool = False,
+        exclude_patterns: Optional[List[str]] = None,
+        file_filters: Optional[List[Union[str, Callable[[Path], bool]]]] = None,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        modified_after: Optional[datetime] = None,
+        modified_before: Optional[datetime] = None,
+        include_hidden: bool = False
+    ) -> Iterator[Path]:
+        """
+        Lazily yield the files matching criteria, walking the tree with os.scandir.
+        
+        Size and date filters use the stat data of each directory entry, which
+        is fetched once per file. Hidden directories (unless include_hidden)
+        and directories whose name or path matches an exclude pattern are
+        pruned before they are entered, and symlinked directories are not
+        followed. Entries are yielded in name order, each directory's files
+        before its subdirectories. Unreadable subdirectories are skipped with
+        a warning. Takes the same arguments as scan_directory, which collects
+        this generator.
+        
+        With use_index, directories whose mtime matches the scan index are
+        not listed again, and a walk that runs to the end saves the index and
+        sets last_delta.
+        
+        Raises:
+            InputError: If directory doesn't exist or isn't accessible
+        """
+        directory = Path(directory)
         if not directory.exists():
             raise InputError(f"Directory not found: {directory}")
         
@@ -74,125 +154,203 @@ class FileScanner:
         logger.debug(f"Pattern: {pattern}, Recursive: {recursive}")
         
         # Reset state
-        self.scanned_files.clear()
-        self.excluded_files.clear()
+        self.scanned_files = []
+        self.excluded_files = []
         self.scan_stats = {
             'total_found': 0,
             'excluded_by_pattern': 0,
             'excluded_by_size': 0,
             'excluded_by_date': 0,
             'excluded_by_filter': 0,
+            'pruned_directories': 0,
+            'reused_directories': 0,
             'final_count': 0,
             'scan_time': 0
         }
+        exclude_patterns = exclude_patterns or []
+        file_filters = file_filters or []
         
-        start_time = datetime.now()
+        # Patterns with a separator match the path below directory like glob,
+        # '**' standing for any number of directories; recursive scans match
+        # at any depth like rglob
+        pattern_parts = PurePosixPath(pattern).parts
+        descend = recursive or len(pattern_parts) > 1
+        if recursive:
+            pattern_parts = ('**',) + pattern_parts
         
-        try:
-            # Find all matching files
-            if recursive:
-                found_files = list(directory.rglob(pattern))
-            else:
-                found_files = list(directory.glob(pattern))
-            
-            self.scan_stats['total_found'] = len(found_files)
-            logger.debug(f"Found {len(found_files)} files matching pattern")
-            
-            # Apply filters
-            filtered_files = self._apply_filters(
-                found_files,
-                exclude_patterns or [],
-                file_filters or [],
-                min_size,
-                max_size,
-                modified_after,
-                modified_before
-            )
-            
-            # Apply max files limit
-            if max_files and len(filtered_files) > max_files:
-                logger.warning(f"Limiting results to {max_files} files (found {len(filtered_files)})")
-                filtered_files = filtered_files[:max_files]
-            
-            self.scanned_files = filtered_files
-            self.scan_stats['final_count'] = len(filtered_files)
-            self.scan_stats['scan_time'] = (datetime.now() - start_time).total_seconds()
-            
-            logger.info(f"Scan complete: {len(filtered_files)} files selected")
+        index = None
+        if self.use_index:
+            criteria = json.dumps([
+                pattern, recursive, exclude_patterns, include_hidden, min_size, max_size,
+                [getattr(f, '__qualname__', None) or repr(f) for f in file_filters],
+                [d.isoformat() if d else None for d in (modified_after, modified_before)]
+            ])
+            index = ScanIndex(directory, self.index_dir, criteria)
+        self.last_delta = None
+        selected: Dict[str, List[int]] = {}
+        
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                file_names, dir_names, entries = self._list_directory(current, directory, index)
+            except PermissionError as e:
+                if current == directory:
+                    raise InputError(f"Permission denied accessing directory: {directory}", context={'error': str(e)})
+                logger.warning(f"Cannot access directory {current}: {e}")
+                continue
+            except OSError as e:
+                if current == directory:
+                    raise InputError(f"Error scanning directory: {e}", context={'directory': str(directory)})
+                logger.warning(f"Cannot access directory {current}: {e}")
+                continue
             
-            return filtered_files
+            for name in file_names:
+                file_path = current / name
+                try:
+                    if len(pattern_parts) > 1 and pattern_parts != ('**', pattern):
+                        if not _match_parts(file_path.relative_to(directory).parts, pattern_parts):
+                            continue
+                    elif not fnmatch.fnmatch(name, pattern):
+                        continue
+                    
+                    self.scan_stats['total_found'] += 1
+                    # A fresh listing's entry caches the stat where the platform allows
+                    file_stat = entries[name].stat() if name in entries else file_path.stat()
+                    if self._accepts(
+                        file_path, file_stat, exclude_patterns, file_filters,
+                        min_size, max_size, modified_after, modified_before
+                    ):
+                        selected[file_path.relative_to(directory).as_posix()] = [
+                            file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino
+                        ]
+                        self.scanned_files.append(file_path)
+                        yield file_path
+                except OSError as e:
+                    logger.warning(f"Cannot access file {file_path}: {e}")
             
-        except PermissionError as e:
-            raise InputError(f"Permission denied accessing directory: {directory}", context={'error': str(e)})
-        except Exception as e:
-            raise InputError(f"Error scanning directory: {e}", context={'directory': str(directory)})
+            if descend:
+                subdirectories = []
+                for name in dir_names:
+                    if self._prunes_directory(current / name, exclude_patterns, include_hidden):
+                        self.scan_stats['pruned_directories'] += 1
+                    else:
+                        subdirectories.append(current / name)
+                # Depth first, in name order
+                pending.extend(reversed(subdirectories))
+        
+        # Only a walk that ran to the end replaces the index
+        if index is not None:
+            self.scan_stats['reused_directories'] = index.reused_directories
+            delta = index.complete(selected)
+            if index.exists:
+                self.last_delta = delta
+                logger.info(f"Since the last scan of {directory}: {delta.summary()}")
+            index.save()
     
-    def _apply_filters(
+    def _list_directory(
         self,
-        files: List[Path],
+        current: Path,
+        root: Path,
+        index: Optional[ScanIndex]
+    ) -> Tuple[List[str], List[str], Dict[str, os.DirEntry]]:
+        """
+        File and subdirectory names of a directory, in name order.
+        
+        With an index, a directory whose mtime is unchanged is not listed and
+        its recorded names are returned instead of directory entries.
+        
+        Returns:
+            Tuple of (file names, subdirectory names, entries of a fresh listing by name)
+        
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        if index is not None:
+            relative = current.relative_to(root).as_posix()
+            mtime_ns = os.stat(current).st_mtime_ns
+            recorded = index.listing(relative, mtime_ns)
+            if recorded is not None:
+                return recorded[0], recorded[1], {}
+            listed_ns = time.time_ns()
+        
+        with os.scandir(current) as scan:
+            entries = sorted(scan, key=lambda entry: entry.name)
+        
+        file_names, dir_names, files = [], [], {}
+        for entry in entries:
+            try:
+                # Symlinked directories are not followed, symlinked files are kept
+                if entry.is_dir(follow_symlinks=False):
+                    dir_names.append(entry.name)
+                elif entry.is_file():
+                    file_names.append(entry.name)
+                    files[entry.name] = entry
+            except OSError as e:
+                logger.warning(f"Cannot access {entry.path}: {e}")
+        
+        if index is not None:
+            index.record_listing(relative, mtime_ns, listed_ns, file_names, dir_names)
+        return file_names, dir_names, files
+    
+    def _prunes_directory(self, path: Path, exclude_patterns: List[str], include_hidden: bool) -> bool:
+        """Whether a subdirectory is skipped without entering it."""
+        if not include_hidden and path.name.startswith('.'):
+            return True
+        return any(
+            fnmatch.fnmatch(path.name, pattern) or fnmatch.fnmatch(str(path), pattern)
+            for pattern in exclude_patterns
+        )
+    
+    def _accepts(
+        self,
+        file_path: Path,
+        file_stat: os.stat_result,
         exclude_patterns: List[str],
         file_filters: List[Union[str, Callable[[Path], bool]]],
         min_size: Optional[int],
         max_size: Optional[int],
         modified_after: Optional[datetime],
         modified_before: Optional[datetime]
-    ) -> List[Path]:
-        """Apply various filters to the file list."""
-        filtered_files = []
+    ) -> bool:
+        """Apply the exclude patterns, file filters and size and date limits to one file."""
+        # Apply exclude patterns
+        if self._matches_exclude_patterns(file_path, exclude_patterns):
+            self.excluded_files.append(file_path)
+            self.scan_stats['excluded_by_pattern'] += 1
+            return False
         
-        for file_path in files:
-            try:
-                # Check if file is accessible
-                if not file_path.exists() or not file_path.is_file():
-                    continue
-                
-                # Apply exclude patterns
-                if self._matches_exclude_patterns(file_path, exclude_patterns):
-                    self.excluded_files.append(file_path)
-                    self.scan_stats['excluded_by_pattern'] += 1
-                    continue
-                
-                # Apply file filters
-                if file_filters and not self._matches_file_filters(file_path, file_filters):
-                    self.excluded_files.append(file_path)
-                    self.scan_stats['excluded_by_filter'] += 1
-                    continue
-                
-                # Get file stats
-                file_stat = file_path.stat()
-                
-                # Apply size filters
-                if min_size and file_stat.st_size < min_size:
-                    self.excluded_files.append(file_path)
-                    self.scan_stats['excluded_by_size'] += 1
-                    continue
-                
-                if max_size and file_stat.st_size > max_size:
-                    self.excluded_files.append(file_path)
-                    self.scan_stats['excluded_by_size'] += 1
-                    continue
-                
-                # Apply date filters
-                file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
-                
-                if modified_after and file_mtime < modified_after:
-                    self.excluded_files.append(file_path)
-                    self.scan_stats['excluded_by_date'] += 1
-                    continue
-                
-                if modified_before and file_mtime > modified_before:
-                    self.excluded_files.append(file_path)
-                    self.scan_stats['excluded_by_date'] += 1
-                    continue
-                
-                # File passes all filters
-                filtered_files.append(file_path)
-                
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Cannot access file {file_path}: {e}")
-                continue
+        # Apply file filters
+        if file_filters and not self._matches_file_filters(file_path, file_filters):
+            self.excluded_files.append(file_path)
+            self.scan_stats['excluded_by_filter'] += 1
+            return False
         
-        return filtered_files
+        # Apply size filters
+        if min_size and file_stat.st_size < min_size:
+            self.excluded_files.append(file_path)
+            self.scan_stats['excluded_by_size'] += 1
+            return False
+        
+        if max_size and file_stat.st_size > max_size:
+            self.excluded_files.append(file_path)
+            self.scan_stats['excluded_by_size'] += 1
+            return False
+        
+        # Apply date filters
+        file_mtime = datetime.fromtimestamp(file_stat.st_mtime)
+        
+        if modified_after and file_mtime < modified_after:
+            self.excluded_files.append(file_path)
+            self.scan_stats['excluded_by_date'] += 1
+            return False
+        
+        if modified_before and file_mtime > modified_before:
+            self.excluded_files.append(file_path)
+            self.scan_stats['excluded_by_date'] += 1
+            return False
+        
+        return True
     
     def _matches_exclude_patterns(self, file_path: Path, exclude_patterns: List[str]) -> bool:
         """Check if file matches any exclude pattern."""
@@ -237,6 +395,8 @@ class FileScanner:
             'files_found': self.scan_stats.get('total_found', 0),
             'files_selected': self.scan_stats.get('final_count', 0),
             'files_excluded': len(self.excluded_files),
+            'directories_pruned': self.scan_stats.get('pruned_directories', 0),
+            'directories_reused': self.scan_stats.get('reused_directories', 0),
             'exclusion_breakdown': {
                 'by_pattern': self.scan_stats.get('excluded_by_pattern', 0),
                 'by_size': self.scan_stats.get('excluded_by_size', 0),
@@ -313,7 +473,8 @@ class FileScanner:
     def estimate_processing_time(
         self,
         files: Optional[List[Path]] = None,
-        time_per_file_seconds: float = 5.0
+        time_per_file_seconds: float = 5.0,
+        predict: Optional[Callable[[Path], Optional[float]]] = None
     ) -> Dict[str, Any]:
         """
         Estimate processing time for the files.
@@ -321,6 +482,8 @@ class FileScanner:
         Args:
             files: List of files to estimate for (uses scanned files if None)
             time_per_file_seconds: Estimated processing time per file
+            predict: Optional per-file prediction in seconds (e.g. from the
+                render history); files it returns None for take time_per_file_seconds
             
         Returns:
             Dictionary with time estimates
@@ -329,7 +492,16 @@ class FileScanner:
             files = self.scanned_files
         
         total_files = len(files)
-        total_time_seconds = total_files * time_per_file_seconds
+        file_times = {}
+        files_from_history = 0
+        for file_path in files:
+            predicted = predict(file_path) if predict else None
+            if predicted is None:
+                file_times[file_path] = time_per_file_seconds
+            else:
+                file_times[file_path] = predicted
+                files_from_history += 1
+        total_time_seconds = sum(file_times.values())
         
         # Calculate total file size
         total_size = 0
@@ -345,7 +517,9 @@ class FileScanner:
             'estimated_time_human': self._format_duration(total_time_seconds),
             'total_size_bytes': total_size,
             'total_size_human': self._format_file_size(total_size),
-            'average_file_size': total_size / total_files if total_files > 0 else 0
+            'average_file_size': total_size / total_files if total_files > 0 else 0,
+            'file_times': file_times,
+            'files_from_history': files_from_history
         }
     
     def _format_duration(self, seconds: float) -> str:
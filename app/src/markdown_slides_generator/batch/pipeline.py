@@ -0,0 +1,163 @@
+"""
+Pipeline - Stages of worker threads connected by bounded queues.
+
+Batch processing a file is a CPU-bound split followed by Quarto renders that
+mostly wait on a subprocess. Running both in one worker leaves the render
+slots idle while a worker splits its next file. A pipeline gives every step
+its own stage with its own number of threads: a feeder pulls items from the
+source only as fast as the first stage takes them, each stage hands its
+results to the next through a queue of bounded depth, and the results of the
+last stage come back to the caller as they are ready. The first item reaches
+the last stage as soon as it is through the earlier ones, and the items in
+flight are bounded by the queue depths and worker counts, not the source.
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import List, Any, Optional, Callable, Iterable, Iterator
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Marks the end of a queue's items
+_DONE = object()
+
+
+@dataclass
+class PipelineStage:
+    """One step of a pipeline."""
+    name: str
+    # Turns an item of the previous stage into an item of the next one
+    function: Callable[[Any], Any]
+    workers: int = 1
+
+
+class Pipeline:
+    """
+    Stages run by their own worker threads, in the order they were added.
+    
+    An exception raised by a stage function cancels the pipeline and is
+    raised again by run() once every thread has stopped. After cancel(),
+    the feeder stops pulling items and the stages drop the items still
+    queued; results already finished are still returned. run() may be
+    called once per pipeline.
+    """
+    
+    def __init__(self, queue_depth: int = 4):
+        """
+        Args:
+            queue_depth: Items each queue between two stages holds at most
+        """
+        self.queue_depth = max(1, queue_depth)
+        self.stages: List[PipelineStage] = []
+        self._cancelled = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+    
+    def add_stage(self, name: str, function: Callable[[Any], Any], workers: int = 1) -> 'Pipeline':
+        """Append a stage run by the given number of threads."""
+        self.stages.append(PipelineStage(name, function, max(1, workers)))
+        return self
+    
+    def cancel(self) -> None:
+        """Stop taking new items; in-flight stage calls finish."""
+        self._cancelled.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        """Whether the pipeline was cancelled or a stage failed."""
+        return self._cancelled.is_set()
+    
+    def run(self, items: Iterable[Any]) -> Iterator[Any]:
+        """
+        Feed items through every stage.
+        
+        Args:
+            items: Source of the first stage; consumed lazily
+        
+        Yields:
+            Results of the last stage, in the order they finish
+        
+        Raises:
+            ValueError: If the pipeline has no stages
+            Exception: The first exception raised by a stage function
+        """
+        if not self.stages:
+            raise ValueError("Pipeline has no stages")
+        
+        queues = [queue.Queue(maxsize=self.queue_depth) for _ in range(len(self.stages) + 1)]
+        threads = [threading.Thread(target=self._feed, args=(items, queues[0]), name='pipeline-feed', daemon=True)]
+        for index, stage in enumerate(self.stages):
+            # Workers still running in this stage; the last one to see the end passes it on
+            remaining = [stage.workers]
+            for number in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[index], queues[index + 1], remaining),
+                    name=f"pipeline-{stage.name}-{number}",
+                    daemon=True
+                ))
+        for thread in threads:
+            thread.start()
+        
+        result = None
+        try:
+            while True:
+                result = queues[-1].get()
+                if result is _DONE:
+                    break
+                yield result
+        finally:
+            # A caller that stops early cancels the rest; drain so no thread stays blocked
+            if result is not _DONE:
+                self.cancel()
+                while queues[-1].get() is not _DONE:
+                    pass
+            for thread in threads:
+                thread.join()
+        
+        if self._error is not None:
+            raise self._error
+    
+    def _feed(self, items: Iterable[Any], output: queue.Queue) -> None:
+        """Pull items from the source while the first stage keeps up."""
+        try:
+            for item in items:
+                if self._cancelled.is_set():
+                    break
+                # Blocks while the first stage is queue_depth items behind
+                output.put(item)
+        except Exception as e:
+            self._fail('feed', e)
+        output.put(_DONE)
+    
+    def _work(self, stage: PipelineStage, source: queue.Queue, output: queue.Queue, remaining: List[int]) -> None:
+        """Run a stage's function on items until the end of its queue."""
+        while True:
+            item = source.get()
+            if item is _DONE:
+                with self._lock:
+                    remaining[0] -= 1
+                    last = remaining[0] == 0
+                # Taking the end marker made room for putting it back for the siblings
+                (output if last else source).put(_DONE)
+                return
+            if self._cancelled.is_set():
+                continue
+            try:
+                result = stage.function(item)
+            except Exception as e:
+                self._fail(stage.name, e)
+                continue
+            output.put(result)
+    
+    def _fail(self, stage_name: str, error: Exception) -> None:
+        """Record the first failure and cancel the pipeline."""
+        logger.error(f"Pipeline stage {stage_name} failed: {error}")
+        with self._lock:
+            if self._error is None:
+                self._error = error
+        self.cancel()
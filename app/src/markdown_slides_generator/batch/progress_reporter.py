@@ -30,6 +30,14 @@ class ProcessingStats:
     current_file: Optional[str] = None
     processing_times: deque = field(default_factory=lambda: deque(maxlen=10))
     errors: List[Dict[str, Any]] = field(default_factory=list)
+    # Seconds each file is expected to take, from the render history
+    expected_times: Dict[str, float] = field(default_factory=dict)
+    # Files processed at the same time
+    parallelism: int = 1
+    finished_files: set = field(default_factory=set)
+    # Predicted and actual seconds of finished files, to calibrate the predictions
+    predicted_finished_time: float = 0.0
+    actual_finished_time: float = 0.0
     
     @property
     def completion_percentage(self) -> float:
@@ -40,10 +48,13 @@ class ProcessingStats:
     
     @property
     def success_rate(self) -> float:
-        """Calculate success rate percentage."""
+        """Percentage of processed files that succeeded; skipped files are not counted."""
         if self.processed_files == 0:
             return 0.0
-        return (self.successful_files / self.processed_files) * 100
+        attempted = self.successful_files + self.failed_files
+        if attempted == 0:
+            return 100.0
+        return (self.successful_files / attempted) * 100
     
     @property
     def elapsed_time(self) -> timedelta:
@@ -62,7 +73,17 @@ class ProcessingStats:
     
     @property
     def estimated_remaining_time(self) -> timedelta:
-        """Estimate remaining processing time."""
+        """
+        Estimate remaining processing time.
+        
+        With expected times the remaining files' predictions are scaled by
+        how the finished files compared to theirs and shared among the
+        parallel workers; otherwise every remaining file takes the recent
+        average.
+        """
+        if self.expected_times:
+            return self._predicted_remaining_time()
+        
         if self.processed_files == 0 or self.average_processing_time == 0:
             return timedelta(0)
         
@@ -70,6 +91,26 @@ class ProcessingStats:
         estimated_seconds = remaining_files * self.average_processing_time
         return timedelta(seconds=estimated_seconds)
     
+    def record_finished(self, file_path: str, processing_time: Optional[float]) -> None:
+        """Note a finished file; its time calibrates the predictions unless None."""
+        self.finished_files.add(file_path)
+        expected = self.expected_times.get(file_path)
+        if expected and processing_time:
+            self.predicted_finished_time += expected
+            self.actual_finished_time += processing_time
+    
+    def _predicted_remaining_time(self) -> timedelta:
+        remaining = [
+            seconds for path, seconds in self.expected_times.items() if path not in self.finished_files
+        ]
+        unknown_files = max(0, self.total_files - self.processed_files - len(remaining))
+        if self.predicted_finished_time > 0:
+            scale = self.actual_finished_time / self.predicted_finished_time
+        else:
+            scale = 1.0
+        seconds = sum(remaining) * scale + unknown_files * self.average_processing_time
+        return timedelta(seconds=seconds / max(1, self.parallelism))
+    
     @property
     def files_per_minute(self) -> float:
         """Calculate processing rate in files per minute."""
@@ -95,9 +136,15 @@ class ProgressReporter:
         self,
         total_files: int,
         update_callback: Optional[Callable[[ProcessingStats], None]] = None,
-        update_interval: float = 1.0
+        update_interval: float = 1.0,
+        expected_times: Optional[Dict[str, float]] = None,
+        parallelism: int = 1
     ):
-        self.stats = ProcessingStats(total_files=total_files)
+        self.stats = ProcessingStats(
+            total_files=total_files,
+            expected_times=dict(expected_times or {}),
+            parallelism=parallelism
+        )
         self.update_callback = update_callback
         self.update_interval = update_interval
         
@@ -151,6 +198,7 @@ class ProgressReporter:
             self.stats.processed_files += 1
             self.stats.successful_files += 1
             self.stats.processing_times.append(processing_time)
+            self.stats.record_finished(str(file_path), processing_time)
             self.stats.current_file = None
         
         logger.debug(f"Successfully processed: {file_path} ({processing_time:.2f}s)")
@@ -168,6 +216,8 @@ class ProgressReporter:
             self.stats.failed_files += 1
             if processing_time > 0:
                 self.stats.processing_times.append(processing_time)
+            # A failure says little about how long the file would have taken
+            self.stats.record_finished(str(file_path), None)
             
             self.stats.errors.append({
                 'file': str(file_path),
@@ -186,6 +236,7 @@ class ProgressReporter:
         with self._lock:
             self.stats.processed_files += 1
             self.stats.skipped_files += 1
+            self.stats.record_finished(str(file_path), None)
             self.stats.current_file = None
         
         logger.debug(f"Skipped: {file_path} - {reason}")
@@ -211,6 +262,12 @@ class ProgressReporter:
         """Get currently processing file."""
         return self.stats.current_file
     
+    @property
+    def estimated_remaining_time(self) -> timedelta:
+        """Get the estimated time until all files are processed."""
+        with self._lock:
+            return self.stats.estimated_remaining_time
+    
     def get_progress_percentage(self) -> float:
         """Get completion percentage."""
         return self.stats.get_progress_percentage()
@@ -362,7 +419,9 @@ class ConsoleProgressReporter(ProgressReporter):
         self,
         total_files: int,
         show_detailed: bool = False,
-        update_interval: float = 1.0
+        update_interval: float = 1.0,
+        expected_times: Optional[Dict[str, float]] = None,
+        parallelism: int = 1
     ):
         self.show_detailed = show_detailed
         self._last_line_length = 0
@@ -370,7 +429,9 @@ class ConsoleProgressReporter(ProgressReporter):
         super().__init__(
             total_files=total_files,
             update_callback=self._console_update,
-            update_interval=update_interval
+            update_interval=update_interval,
+            expected_times=expected_times,
+            parallelism=parallelism
         )
     
     def _console_update(self, stats: ProcessingStats) -> None:
@@ -0,0 +1,246 @@
+"""
+Render History for Batch Processing
+
+Records how long each source file took to split and to render in every
+format, together with the document's size, math and image counts, in a
+JSON-lines file in the user cache directory. The history feeds a small
+per-step model for time estimates: a file seen before with the same size is
+expected to take what it took last time, other files get a least-squares
+fit of seconds on size, math and images over all recorded files.
+"""
+
+import re
+import json
+import time
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterable
+
+from ..utils.logger import get_logger
+from ..utils.file_io import write_if_changed
+from ..core.split_cache import default_cache_dir
+
+logger = get_logger(__name__)
+
+
+# Bump when the layout of history records changes
+HISTORY_FORMAT_VERSION = 1
+
+# Display and inline math: $$...$$, \[...\], \(...\) and $...$
+MATH_PATTERN = re.compile(r'\$\$.+?\$\$|\\\[.+?\\\]|\\\(.+?\\\)|(?<![\\$])\$[^$\n]+?\$', re.DOTALL)
+IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\(|<img\b', re.IGNORECASE)
+
+
+def default_history_file() -> Path:
+    """Return the per-user file render times are recorded in."""
+    return default_cache_dir().parent / 'render-history.jsonl'
+
+
+@dataclass
+class DocumentFeatures:
+    """What the cost of processing a markdown file depends on."""
+    size: int
+    math: int = 0
+    images: int = 0
+    
+    def vector(self) -> List[float]:
+        """Regression inputs: intercept, size in KB, math and image counts."""
+        return [1.0, self.size / 1024.0, float(self.math), float(self.images)]
+
+
+def document_features(file_path: Path) -> DocumentFeatures:
+    """Measure a markdown file; unreadable files count as empty."""
+    try:
+        content = Path(file_path).read_text(encoding='utf-8', errors='replace')
+    except OSError:
+        return DocumentFeatures(size=0)
+    return DocumentFeatures(
+        size=len(content.encode('utf-8')),
+        math=len(MATH_PATTERN.findall(content)),
+        images=len(IMAGE_PATTERN.findall(content))
+    )
+
+
+@dataclass
+class FileEstimate:
+    """Expected durations of the steps processing one file."""
+    split: Optional[float]
+    renders: Dict[str, Optional[float]] = field(default_factory=dict)
+    
+    @property
+    def known(self) -> bool:
+        """Whether every step has a prediction."""
+        return self.split is not None and all(seconds is not None for seconds in self.renders.values())
+    
+    @property
+    def wall_time(self) -> Optional[float]:
+        """Expected time from start to finish; the renders of a file run concurrently."""
+        if not self.known:
+            return None
+        return self.split + max(self.renders.values(), default=0.0)
+
+
+def _solve(matrix: List[List[float]], vector: List[float]) -> Optional[List[float]]:
+    """Solve a small linear system by Gaussian elimination; None if singular."""
+    size = len(vector)
+    rows = [list(row) + [value] for row, value in zip(matrix, vector)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda row: abs(rows[row][column]))
+        if abs(rows[pivot][column]) < 1e-12:
+            return None
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        for row in range(size):
+            if row != column:
+                factor = rows[row][column] / rows[column][column]
+                for index in range(column, size + 1):
+                    rows[row][index] -= factor * rows[column][index]
+    return [rows[index][size] / rows[index][index] for index in range(size)]
+
+
+class EtaModel:
+    """
+    Expected duration of each processing step, fitted on the render history.
+    
+    Steps are 'split' and '<kind>:<format>' renders such as 'slides:html'
+    or 'notes:pdf'.
+    """
+    
+    # Ridge penalty keeping fits on few or collinear samples sane
+    REGULARIZATION = 1e-3
+    
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        self._latest: Dict[str, Dict[str, Any]] = {}
+        self._samples: Dict[str, List[tuple]] = {}
+        for record in records:
+            features = DocumentFeatures(record['size'], record.get('math', 0), record.get('images', 0))
+            steps = dict(record.get('renders', {}))
+            if record.get('split') is not None:
+                steps['split'] = record['split']
+            latest = self._latest.setdefault(record['source'], {'size': record['size'], 'steps': {}})
+            if latest['size'] != record['size']:
+                latest.update(size=record['size'], steps={})
+            for step, seconds in steps.items():
+                self._samples.setdefault(step, []).append((features.vector(), seconds))
+                latest['steps'][step] = seconds
+        self._weights = {step: self._fit(samples) for step, samples in self._samples.items()}
+    
+    @property
+    def has_history(self) -> bool:
+        """Whether any step has been recorded."""
+        return bool(self._samples)
+    
+    def predict(self, source: Path, features: DocumentFeatures, step: str) -> Optional[float]:
+        """Expected seconds of one step of a file, or None without history for the step."""
+        latest = self._latest.get(str(Path(source).resolve()))
+        if latest is not None and latest['size'] == features.size and step in latest['steps']:
+            return latest['steps'][step]
+        weights = self._weights.get(step)
+        if weights is None:
+            return None
+        return max(0.0, sum(w * x for w, x in zip(weights, features.vector())))
+    
+    def estimate_file(self, source: Path, steps: List[str]) -> FileEstimate:
+        """Expected durations of the split and of the given render steps of a file."""
+        features = document_features(source)
+        return FileEstimate(
+            split=self.predict(source, features, 'split'),
+            renders={step: self.predict(source, features, step) for step in steps}
+        )
+    
+    def _fit(self, samples: List[tuple]) -> List[float]:
+        """Least-squares weights for the samples; the mean when they cannot support a fit."""
+        mean = sum(seconds for _, seconds in samples) / len(samples)
+        width = len(samples[0][0])
+        if len(samples) <= width:
+            return [mean] + [0.0] * (width - 1)
+        
+        gram = [[0.0] * width for _ in range(width)]
+        moments = [0.0] * width
+        for vector, seconds in samples:
+            for row in range(width):
+                moments[row] += vector[row] * seconds
+                for column in range(width):
+                    gram[row][column] += vector[row] * vector[column]
+        for index in range(1, width):
+            gram[index][index] += self.REGULARIZATION * len(samples)
+        weights = _solve(gram, moments)
+        return weights if weights is not None else [mean] + [0.0] * (width - 1)
+
+
+class RenderHistory:
+    """
+    Append-only record of split and render times, shared across runs.
+    
+    The file keeps at most max_records records; older ones are dropped
+    when it grows past twice that. Safe to use from multiple threads.
+    """
+    
+    def __init__(self, history_file: Optional[Path] = None, max_records: int = 5000):
+        self.history_file = Path(history_file) if history_file else default_history_file()
+        self.max_records = max_records
+        self._records: Optional[List[Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+    
+    def record(
+        self,
+        source: Path,
+        features: DocumentFeatures,
+        split_seconds: Optional[float],
+        render_seconds: Dict[str, float]
+    ) -> None:
+        """Append the measured steps of one file; nothing is written if no step ran."""
+        if split_seconds is None and not render_seconds:
+            return
+        record = {
+            'format': HISTORY_FORMAT_VERSION,
+            'source': str(Path(source).resolve()),
+            'size': features.size,
+            'math': features.math,
+            'images': features.images,
+            'split': split_seconds,
+            'renders': dict(render_seconds),
+            'recorded_at': time.time()
+        }
+        with self._lock:
+            records = self._load()
+            records.append(record)
+            try:
+                self.history_file.parent.mkdir(parents=True, exist_ok=True)
+                if len(records) > 2 * self.max_records:
+                    del records[:-self.max_records]
+                    write_if_changed(self.history_file, ''.join(json.dumps(r) + '\n' for r in records))
+                else:
+                    with open(self.history_file, 'a', encoding='utf-8') as history:
+                        history.write(json.dumps(record) + '\n')
+            except OSError as e:
+                logger.debug(f"Could not record render times in {self.history_file}: {e}")
+    
+    def records(self) -> List[Dict[str, Any]]:
+        """All recorded runs, oldest first."""
+        with self._lock:
+            return list(self._load())
+    
+    def model(self) -> EtaModel:
+        """ETA model fitted on the current history."""
+        return EtaModel(self.records())
+    
+    def _load(self) -> List[Dict[str, Any]]:
+        """Read the history file once; unreadable lines are skipped. Called with the lock held."""
+        if self._records is not None:
+            return self._records
+        self._records = []
+        try:
+            with open(self.history_file, encoding='utf-8') as history:
+                for line in history:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and record.get('format') == HISTORY_FORMAT_VERSION:
+                        self._records.append(record)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Ignoring unreadable render history {self.history_file}: {e}")
+        return self._records
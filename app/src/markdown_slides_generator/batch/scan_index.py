@@ -0,0 +1,153 @@
+"""
+Scan Index for Repeated Directory Scans
+
+Keeps, per scanned root and selection criteria (pattern, recursion, excludes
+and filters) in the user cache directory, the modification time
+and the file and subdirectory names of every directory a scan listed, and
+the (size, mtime, inode) of every file it selected. A later scan lists only
+the directories whose mtime changed and reuses the recorded names of the
+others; it still stats the files it selects, since editing a file does not
+change its directory's mtime. Comparing the selections of two scans gives
+the files added, removed and modified in between.
+"""
+
+import json
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.file_io import write_if_changed
+from ..core.split_cache import default_cache_dir
+
+logger = get_logger(__name__)
+
+
+# Bump when the layout of the index changes
+SCAN_INDEX_FORMAT_VERSION = 1
+
+# A directory modified this close to when it was listed may have changed
+# again within the same mtime tick, so its listing is not trusted
+RACY_MARGIN_NS = 2_000_000_000
+
+
+def default_index_dir() -> Path:
+    """Return the per-user directory scan indexes are kept in."""
+    return default_cache_dir().parent / 'scan-index'
+
+
+@dataclass
+class ScanDelta:
+    """Files a scan selected that were not, or not as they are now, selected by the previous one."""
+    added: List[Path] = field(default_factory=list)
+    removed: List[Path] = field(default_factory=list)
+    modified: List[Path] = field(default_factory=list)
+    
+    @property
+    def changed(self) -> bool:
+        """Whether any file was added, removed or modified."""
+        return bool(self.added or self.removed or self.modified)
+    
+    def summary(self) -> str:
+        """One-line count of the changes."""
+        return f"{len(self.added)} added, {len(self.modified)} modified, {len(self.removed)} removed"
+
+
+class ScanIndex:
+    """
+    Directory listings and selected files of the last complete scan of a root.
+    
+    Directories are keyed by their path relative to the root ('.' for the
+    root itself). Updates go to a fresh set of listings, so directories the
+    next scan no longer reaches drop out of the index when it is saved.
+    """
+    
+    def __init__(self, root: Path, index_dir: Optional[Path] = None, criteria: str = ''):
+        """
+        Args:
+            root: Directory the scans start from
+            index_dir: Directory of the index files; the user cache if None
+            criteria: Description of what the scans select; scans with other
+                criteria keep a separate index, so their deltas do not mix
+        """
+        # Deltas name files under root as given, the index file is per resolved root and criteria
+        self.directory = Path(root)
+        self.root = self.directory.resolve()
+        key = hashlib.sha256(f"{self.root}\0{criteria}".encode('utf-8')).hexdigest()[:16]
+        self.index_file = Path(index_dir or default_index_dir()) / f'{key}.json'
+        data = self._load()
+        self.exists = data is not None
+        self._directories: Dict[str, Dict[str, Any]] = data['directories'] if data else {}
+        self._selected: Dict[str, List[int]] = data['selected'] if data else {}
+        self._new_directories: Dict[str, Dict[str, Any]] = {}
+        self.reused_directories = 0
+    
+    def listing(self, relative: str, mtime_ns: int) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Recorded (file names, subdirectory names) of a directory.
+        
+        Returns:
+            The names if the directory's mtime is the recorded one and was
+            not racy when it was listed, otherwise None
+        """
+        entry = self._directories.get(relative)
+        if entry is None or entry['mtime'] != mtime_ns or entry['listed'] - mtime_ns < RACY_MARGIN_NS:
+            return None
+        self._new_directories[relative] = entry
+        self.reused_directories += 1
+        return entry['files'], entry['dirs']
+    
+    def record_listing(self, relative: str, mtime_ns: int, listed_ns: int, files: List[str], dirs: List[str]) -> None:
+        """Record the names a directory held when it was listed at listed_ns."""
+        self._new_directories[relative] = {'mtime': mtime_ns, 'listed': listed_ns, 'files': files, 'dirs': dirs}
+    
+    def complete(self, selected: Dict[str, List[int]]) -> ScanDelta:
+        """
+        Finish a scan that selected the given files and compare it with the previous one.
+        
+        Args:
+            selected: [size, mtime_ns, inode] of each selected file, keyed
+                by its path relative to the root
+        
+        Returns:
+            The files added, removed and modified since the previous scan
+        """
+        delta = ScanDelta(
+            added=[self.directory / path for path in sorted(set(selected) - set(self._selected))],
+            removed=[self.directory / path for path in sorted(set(self._selected) - set(selected))],
+            modified=[
+                self.directory / path for path in sorted(set(selected) & set(self._selected))
+                if selected[path] != self._selected[path]
+            ]
+        )
+        self._directories, self._new_directories = self._new_directories, {}
+        self._selected = selected
+        return delta
+    
+    def save(self) -> None:
+        """Write the index; failures are logged, not raised."""
+        data = json.dumps({
+            'format': SCAN_INDEX_FORMAT_VERSION,
+            'root': str(self.root),
+            'directories': self._directories,
+            'selected': self._selected
+        }, sort_keys=True)
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            write_if_changed(self.index_file, data)
+        except OSError as e:
+            logger.warning(f"Could not write scan index {self.index_file}: {e}")
+    
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Read the index; a missing, unreadable or foreign one is None."""
+        try:
+            data = json.loads(self.index_file.read_text(encoding='utf-8'))
+            if data.get('format') != SCAN_INDEX_FORMAT_VERSION or data.get('root') != str(self.root):
+                return None
+            return {'directories': dict(data['directories']), 'selected': dict(data['selected'])}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable scan index {self.index_file}: {e}")
+            return None
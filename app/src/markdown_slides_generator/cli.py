@@ -6,23 +6,32 @@ Professional CLI using Click framework with comprehensive help text and options.
 
 import click
 import sys
+import atexit
 import os
 import time
 import asyncio
 import re
-import shutil
+import json
+import hashlib
 import webbrowser
 import threading
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set, Callable
 import yaml
 
 from .utils.logger import get_logger, setup_logging
 from .utils.exceptions import MarkdownSlidesError, InputError, ConfigurationError
 from .utils.watchdog_utils import create_file_watcher
+from .utils.bibliography import bibliography_cache
 from .utils.live_server import start_live_server
-from .core.content_splitter import ContentSplitter
+from .utils.file_io import write_if_changed, copy_if_changed
+from .core.content_splitter import ContentSplitter, MarkdownDirectiveParser
+from .core.split_cache import create_split_cache
+from .core.build_graph import BuildGraph, BuildNode, default_state_file
 from .core.quarto_orchestrator import QuartoOrchestrator
+from .core.render_service import QuartoRenderService
+from .core.render_cache import render_cache as shared_render_cache
+from .core.toolchain import toolchain_registry
 from .config import ConfigManager, Config
 
 
@@ -92,13 +101,15 @@ def _handle_server_input(server, port: int, target_file: str, main_loop, reload_
             logger.debug(f"Input handler error: {e}")
 
 
-def _copy_referenced_images(source_file: str, output_dir: Path) -> None:
+def _referenced_images(source_file: str) -> List[Path]:
     """
-    Copy images referenced in the markdown file to the output directory.
+    Find the local images referenced in a markdown file.
     
     Args:
         source_file: Path to the source markdown file
-        output_dir: Output directory to copy images to
+    
+    Returns:
+        Paths of the referenced images that exist
     """
     source_path = Path(source_file)
     source_dir = source_path.parent
@@ -108,12 +119,13 @@ def _copy_referenced_images(source_file: str, output_dir: Path) -> None:
         content = source_path.read_text(encoding='utf-8')
     except Exception as e:
         logger.warning(f"Could not read source file for image detection: {e}")
-        return
+        return []
     
     # Find image references in markdown: ![alt text](image.png)
     image_pattern = r'!\[.*?\]\(([^)]+)\)'
     image_matches = re.findall(image_pattern, content)
     
+    images = []
     for image_path in image_matches:
         # Skip URLs (http/https)
         if image_path.startswith(('http://', 'https://')):
@@ -126,14 +138,34 @@ def _copy_referenced_images(source_file: str, output_dir: Path) -> None:
             source_image_path = Path(image_path)
         
         if source_image_path.exists():
-            dest_image_path = output_dir / source_image_path.name
-            try:
-                shutil.copy2(source_image_path, dest_image_path)
-                logger.info(f"Copied image: {source_image_path.name} -> {dest_image_path}")
-            except Exception as e:
-                logger.warning(f"Failed to copy image {source_image_path}: {e}")
+            images.append(source_image_path)
         else:
             logger.warning(f"Referenced image not found: {source_image_path}")
+    
+    return list(dict.fromkeys(images))
+
+
+def _copy_referenced_images(source_file: str, output_dir: Path) -> List[str]:
+    """
+    Copy images referenced in the markdown file to the output directory.
+    
+    Args:
+        source_file: Path to the source markdown file
+        output_dir: Output directory to copy images to
+    
+    Returns:
+        Paths of the copies in the output directory
+    """
+    copies = []
+    for source_image_path in _referenced_images(source_file):
+        dest_image_path = output_dir / source_image_path.name
+        try:
+            if copy_if_changed(source_image_path, dest_image_path):
+                logger.info(f"Copied image: {source_image_path.name} -> {dest_image_path}")
+            copies.append(str(dest_image_path))
+        except Exception as e:
+            logger.warning(f"Failed to copy image {source_image_path}: {e}")
+    return copies
 
 
 def _perform_generation(
@@ -150,11 +182,28 @@ def _perform_generation(
     notes_only: bool,
     overwrite: bool,
     progress: bool,
-    ctx
+    ctx,
+    content_splitter: Optional[ContentSplitter] = None,
+    render_loop: Optional[asyncio.AbstractEventLoop] = None,
+    render_service: Optional[QuartoRenderService] = None,
+    explain: bool = False
 ) -> List[str]:
     """
     Internal function to perform the actual generation.
     
+    The run is a build graph (split, documents, theme and images, one render
+    per format) that redoes only the steps whose inputs changed since the last
+    run; explain prints why each step was redone or skipped.
+    
+    When a content_splitter is passed (watch mode) it is reused across calls and
+    the markdown is re-split incrementally against its previous run; deferred
+    validation is started once the outputs have been regenerated.
+    
+    When a render_loop is passed (live server), the Quarto processes run on that
+    event loop instead of a thread pool; the calling thread must not be the
+    loop's own thread. A render_service (watch mode) renders the HTML slides
+    with a warm Quarto worker.
+    
     Returns:
         List of generated file paths
     """
@@ -162,42 +211,31 @@ def _perform_generation(
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Initialize components
-    content_splitter = ContentSplitter()
+    incremental = content_splitter is not None
+    if content_splitter is None:
+        content_splitter = ContentSplitter(
+            split_cache=create_split_cache(final_config.processing),
+            validation_level=final_config.processing.validation_level,
+            shard_workers=final_config.processing.shard_workers
+        )
     quarto_orchestrator = QuartoOrchestrator()
+    quarto_orchestrator.use_render_service(render_service)
+    if final_config.output.render_cache:
+        quarto_orchestrator.use_render_cache(shared_render_cache)
     
-    # Show progress if enabled
-    if progress and not ctx.obj.get('quiet', False):
-        click.echo("📝 Processing markdown content...")
-    
-    # Process the markdown file
-    slides_content, notes_content = content_splitter.split_content(str(input_file))
-    
-    # Create temporary files for slides and notes content
+    # Generated documents are kept between runs and only rewritten when their
+    # content changes, so unchanged inputs keep their mtimes
     slides_file = output_dir / f"{input_file.stem}_slides.qmd"
     notes_file_path = output_dir / f"{input_file.stem}_notes.qmd"
+    slides_config = final_config.slides.__dict__
     
-    # Generate proper YAML frontmatter with all RevealJS options
-    slides_frontmatter = quarto_orchestrator.generate_revealjs_frontmatter(
-        final_config.slides.__dict__, theme, str(input_file), str(slides_file)
-    )
-
     # Determine notes format(s) from configuration (allowing override)
     notes_formats = getattr(final_config.notes, 'formats', None) or ['pdf']
     # Use the first requested notes format as the primary output
     notes_primary_format = notes_formats[0]
-    # Generate simple notes frontmatter using the selected format
-    notes_frontmatter = f"---\nformat: {notes_primary_format}\n---\n\n"
-
-    with open(slides_file, 'w', encoding='utf-8') as f:
-        f.write(slides_frontmatter + slides_content)
     
-    # Debug: log the frontmatter content
-    logger.debug(f"Generated slides frontmatter:\n{slides_frontmatter}")
-    with open(notes_file_path, 'w', encoding='utf-8') as f:
-        f.write(notes_frontmatter + notes_content)
-    
-    # Copy referenced images to output directory
-    _copy_referenced_images(str(input_file), output_dir)
+    # Check if theme is a built-in application theme
+    is_builtin_theme = theme in [t for t in quarto_orchestrator.theme_manager.list_themes().keys()]
     
     # Prepare template variables from config and CLI
     variables = dict(final_config.variables)
@@ -210,71 +248,241 @@ def _perform_generation(
     if institute:
         variables['institute'] = institute
     
-    generated_files = []
+    try:
+        quarto_version = toolchain_registry.get('quarto').version
+    except Exception:
+        quarto_version = ''
+    
+    def options_key(**options) -> str:
+        return json.dumps(options, sort_keys=True, default=str)
+    
+    def run_job(job) -> List[str]:
+        if render_loop is not None:
+            def report_line(job, line: str, kind: Optional[str]) -> None:
+                logger.debug(f"[{job.name}] {line}")
+            
+            result = asyncio.run_coroutine_threadsafe(
+                quarto_orchestrator.render_jobs_async([job], on_line=report_line), render_loop
+            ).result()[0]
+        else:
+            result = quarto_orchestrator.render_jobs([job])[0]
+        return [quarto_orchestrator.require_output(job, result)]
+    
+    # Every step declares what it reads and writes, so only the steps whose
+    # inputs changed since the last run are redone
+    graph = BuildGraph(default_state_file(output_dir, input_file), max_workers=final_config.output.render_workers)
+    split_result: Dict[str, str] = {}
+    
+    def split() -> None:
+        split_result['slides'], split_result['notes'] = content_splitter.split_content(
+            str(input_file), incremental=incremental
+        )
+    
+    graph.add(BuildNode(
+        'split', split, inputs=content_splitter.source_files(str(input_file)), key=content_splitter.split_options
+    ))
+    
+    # Only documents with local images get a step copying them; it is stamped by the copies
+    images = _referenced_images(str(input_file))
+    asset_deps = ['assets'] if images else []
+    if images:
+        graph.add(BuildNode(
+            'assets', lambda: _copy_referenced_images(str(input_file), output_dir),
+            inputs=images, outputs=[output_dir / image.name for image in images],
+            key=options_key(images=[str(image) for image in images])
+        ))
+    
+    render_labels: Dict[str, tuple] = {}
     
-    # Generate outputs based on options
     if not notes_only:
-        if progress and not ctx.obj.get('quiet', False):
-            click.echo("🎨 Generating slides...")
+        def write_slides() -> None:
+            # Generate proper YAML frontmatter with all RevealJS options
+            slides_frontmatter = quarto_orchestrator.generate_revealjs_frontmatter(
+                slides_config, theme, str(input_file), str(slides_file)
+            )
+            logger.debug(f"Generated slides frontmatter:\n{slides_frontmatter}")
+            slides_document = slides_frontmatter + split_result['slides']
+            if not template and is_builtin_theme:
+                # Write the themed frontmatter right away so preparing the job leaves the file alone
+                slides_document = quarto_orchestrator.themed_slides_document(
+                    slides_document, theme, slides_config, str(slides_file)
+                )
+            write_if_changed(slides_file, slides_document)
+        
+        graph.add(BuildNode(
+            'qmd[slides]', write_slides, deps=['split'], outputs=[slides_file],
+            key=options_key(theme=theme, template=template, builtin=is_builtin_theme, slides=slides_config)
+        ))
+        
+        render_deps = ['qmd[slides]'] + asset_deps
+        if is_builtin_theme and theme.startswith('academic-'):
+            theme_css = quarto_orchestrator.theme_manager.generate_reveal_css(
+                quarto_orchestrator.theme_manager.get_theme(theme)
+            )
+            graph.add(BuildNode(
+                'scss', lambda: [str(quarto_orchestrator.write_theme_scss(theme, output_dir))],
+                outputs=[output_dir / f"{theme}.scss"],
+                key=options_key(theme=theme, css=hashlib.sha256(theme_css.encode('utf-8')).hexdigest())
+            ))
+            render_deps.append('scss')
         
         for fmt in final_config.output.formats:
-            try:
-                # Check if theme is a built-in application theme
-                is_builtin_theme = theme in [t for t in quarto_orchestrator.theme_manager.list_themes().keys()]
-                
+            # Convert 'html' format to 'revealjs' for proper slide generation
+            slide_format = 'revealjs' if fmt == 'html' else fmt
+            
+            def render_slides(slide_format: str = slide_format) -> List[str]:
                 if template or is_builtin_theme:
-                    # For built-in themes, we need to generate the frontmatter within generate_themed_slides
+                    # For built-in themes, we need to generate the frontmatter within prepare_themed_slides
                     # to include the correct CSS path
-                    # Convert 'html' format to 'revealjs' for proper slide generation
-                    slide_format = 'revealjs' if fmt == 'html' else fmt
-                    output_file = quarto_orchestrator.generate_themed_slides(
-                        str(slides_file), theme, template, slide_format, None, variables, 
-                        slides_config=final_config.slides.__dict__
+                    job = quarto_orchestrator.prepare_themed_slides(
+                        str(slides_file), theme, template, slide_format, None, variables,
+                        slides_config=slides_config
                     )
                 else:
                     # Use standard generation (for RevealJS standard themes)
-                    # Convert 'html' format to 'revealjs' for proper slide generation  
-                    slide_format = 'revealjs' if fmt == 'html' else fmt
-                    output_file = quarto_orchestrator.generate_slides(
+                    job = quarto_orchestrator.prepare_slides(
                         str(slides_file), slide_format, None, theme
                     )
-                generated_files.append(output_file)
-                click.echo(f"✓ Generated slides ({fmt}): {Path(output_file).name}")
-            except Exception as e:
-                logger.error(f"Error generating {fmt} slides: {e}")
-                click.echo(f"✗ Failed to generate {fmt} slides: {e}", err=True)
+                return run_job(job)
+            
+            name = f"render[slides:{fmt}]"
+            graph.add(BuildNode(
+                name, render_slides, deps=render_deps,
+                key=options_key(format=slide_format, theme=theme, template=template,
+                                variables=variables, slides=slides_config, quarto=quarto_version)
+            ))
+            render_labels[name] = (f"slides ({fmt})", f"{fmt} slides")
     
     if not slides_only:
-        if progress and not ctx.obj.get('quiet', False):
-            click.echo("📚 Generating notes...")
+        def write_notes() -> None:
+            # Generate simple notes frontmatter using the selected format
+            notes_frontmatter = f"---\nformat: {notes_primary_format}\n---\n\n"
+            write_if_changed(notes_file_path, notes_frontmatter + split_result['notes'])
         
-        try:
-            # Decide notes generation format(s) and trigger generation for primary
+        graph.add(BuildNode(
+            'qmd[notes]', write_notes, deps=['split'], outputs=[notes_file_path], key=notes_primary_format
+        ))
+        
+        def render_notes() -> List[str]:
             # If template explicitly targets notes, prefer templated generation
             if template and 'notes' in template:
-                notes_output = quarto_orchestrator.generate_templated_notes(
+                job = quarto_orchestrator.prepare_templated_notes(
                     str(notes_file_path), template, notes_primary_format, None, variables
                 )
             else:
                 # Use standard notes generation with configured primary format
-                notes_output = quarto_orchestrator.generate_notes(
+                job = quarto_orchestrator.prepare_notes(
                     str(notes_file_path), notes_primary_format
                 )
-            generated_files.append(notes_output)
-            click.echo(f"✓ Generated notes: {Path(notes_output).name}")
-        except Exception as e:
-            logger.error(f"Error generating notes: {e}")
-            click.echo(f"✗ Failed to generate notes: {e}", err=True)
+            return run_job(job)
+        
+        name = f"render[notes:{notes_primary_format}]"
+        graph.add(BuildNode(
+            name, render_notes, deps=['qmd[notes]'] + asset_deps,
+            key=options_key(format=notes_primary_format, template=template, variables=variables,
+                            quarto=quarto_version)
+        ))
+        render_labels[name] = ("notes", "notes")
+    
+    # Show progress if enabled
+    if progress and not ctx.obj.get('quiet', False):
+        click.echo("📝 Processing markdown content...")
+        if not notes_only:
+            click.echo("🎨 Generating slides...")
+        if not slides_only:
+            click.echo("📚 Generating notes...")
+    
+    report = graph.run(force=not final_config.output.render_cache)
     
-    # Clean up temporary files
-    if slides_file.exists():
-        slides_file.unlink()
-    if notes_file_path.exists():
-        notes_file_path.unlink()
+    if explain:
+        click.echo("🔍 Build steps:")
+        for line in report.explain():
+            click.echo(f"  {line}")
+    
+    # Splitting or writing the documents failing is an error of the whole run
+    for name, outcome in report.outcomes.items():
+        if name not in render_labels and outcome.error is not None:
+            raise outcome.error
+    
+    generated_files = []
+    for name, (label, failure_label) in render_labels.items():
+        outcome = report.outcomes[name]
+        if outcome.ok and outcome.outputs:
+            generated_files.append(outcome.outputs[0])
+            click.echo(f"✓ Generated {label}: {Path(outcome.outputs[0]).name}")
+        else:
+            error = outcome.error if outcome.error is not None else '; '.join(outcome.reasons)
+            logger.error(f"Error generating {failure_label}: {error}")
+            click.echo(f"✗ Failed to generate {failure_label}: {error}", err=True)
+    
+    if incremental and content_splitter.defer_validation and report.outcomes['split'].status == 'rebuilt':
+        content_splitter.start_deferred_validation()
     
     return generated_files
 
 
+def _create_render_service(
+    input_file: Path,
+    output_dir: Path,
+    final_config: Config,
+    notes_only: bool
+) -> Optional[QuartoRenderService]:
+    """Warm render worker for the HTML slides regenerated in watch mode, if enabled."""
+    if notes_only or not final_config.output.render_service:
+        return None
+    if not {'html', 'revealjs'} & set(final_config.output.formats):
+        return None
+    render_service = QuartoRenderService(str(output_dir / f"{input_file.stem}_slides.qmd"), 'revealjs')
+    atexit.register(render_service.stop)
+    return render_service
+
+
+def _bibliography_inputs(input_file: Path) -> Set[Path]:
+    """Resolved .bib files inserted into the input file by INSERT-BIB directives."""
+    try:
+        content = input_file.read_text(encoding='utf-8')
+    except OSError:
+        return set()
+    # Resolved against the working directory, as in ContentSplitter
+    return {path.resolve() for path in MarkdownDirectiveParser().bibliography_inputs(content, base_path=Path.cwd())}
+
+
+def _watch_input_file(input_file: Path, regenerate_on_change: Callable[[Path], None]) -> None:
+    """
+    Watch the input file and the .bib files it inserts until interrupted.
+    
+    regenerate_on_change is called with the changed file when either changes.
+    A changed .bib file is dropped from the bibliography cache first, and the
+    set of watched .bib files is refreshed after every regeneration.
+    """
+    input_path = input_file.resolve()
+    bib_files: Set[Path] = set()
+    
+    def watch_bibliographies() -> None:
+        bib_files.clear()
+        bib_files.update(_bibliography_inputs(input_file))
+        for bib_file in bib_files:
+            if bib_file.parent.is_dir():
+                watcher.watch_directory(bib_file.parent)
+    
+    def on_change(changed_file: Path) -> None:
+        changed_path = changed_file.resolve()
+        if changed_path in bib_files:
+            bibliography_cache.invalidate(changed_path)
+        elif changed_path != input_path:
+            return
+        regenerate_on_change(changed_file)
+        watch_bibliographies()
+    
+    with create_file_watcher(on_change, file_patterns=['.md', '.markdown', '.bib'], debounce_seconds=2.0) as watcher:
+        watcher.watch_file(input_file)
+        watch_bibliographies()
+        if bib_files:
+            logger.info(f"Watching bibliographies: {', '.join(sorted(path.name for path in bib_files))}")
+        watcher.start()
+        watcher.wait()
+
+
 async def _async_watch_with_serve(
     input_file: Path,
     final_config: Config,
@@ -291,7 +499,9 @@ async def _async_watch_with_serve(
     ctx,
     serve_target: str,
     port: int,
-    auto_open: bool
+    auto_open: bool,
+    content_splitter: Optional[ContentSplitter] = None,
+    render_service: Optional[QuartoRenderService] = None
 ) -> None:
     """
     Async watch mode with live server support.
@@ -335,44 +545,42 @@ async def _async_watch_with_serve(
         console_thread.start()
         
         def regenerate_on_change(changed_file: Path) -> None:
-            """Callback function to regenerate files when input changes."""
-            # Only regenerate if the changed file is our input file
-            if changed_file.resolve() == input_file.resolve():
-                click.echo(f"\n🔄 Change detected in {changed_file.name}, regenerating...")
-                try:
-                    # Re-run the generation process with the same parameters
-                    _perform_generation(
-                        input_file=input_file,
-                        final_config=final_config,
-                        output_dir=output_dir,
-                        theme=theme,
-                        template=template,
-                        title=title,
-                        author=author,
-                        date=date,
-                        institute=institute,
-                        slides_only=slides_only,
-                        notes_only=notes_only,
-                        overwrite=True,  # Always overwrite in watch mode
-                        progress=progress,
-                        ctx=ctx
-                    )
-                    click.echo(f"✓ Regeneration complete at {time.strftime('%H:%M:%S')}")
-                    
-                    # Signal that we need to reload the browser using thread-safe call
-                    main_loop.call_soon_threadsafe(reload_event.set)
-                    
-                except Exception as e:
-                    click.echo(f"✗ Error during regeneration: {e}", err=True)
-                    logger.error(f"Watch mode regeneration error: {e}")
+            """Callback function to regenerate files when the input or its bibliographies change."""
+            click.echo(f"\n🔄 Change detected in {changed_file.name}, regenerating...")
+            try:
+                # Re-run the generation process with the same parameters
+                _perform_generation(
+                    input_file=input_file,
+                    final_config=final_config,
+                    output_dir=output_dir,
+                    theme=theme,
+                    template=template,
+                    title=title,
+                    author=author,
+                    date=date,
+                    institute=institute,
+                    slides_only=slides_only,
+                    notes_only=notes_only,
+                    overwrite=True,  # Always overwrite in watch mode
+                    progress=progress,
+                    ctx=ctx,
+                    content_splitter=content_splitter,
+                    render_loop=main_loop,
+                    render_service=render_service
+                )
+                click.echo(f"✓ Regeneration complete at {time.strftime('%H:%M:%S')}")
+                
+                # Signal that we need to reload the browser using thread-safe call
+                main_loop.call_soon_threadsafe(reload_event.set)
+                
+            except Exception as e:
+                click.echo(f"✗ Error during regeneration: {e}", err=True)
+                logger.error(f"Watch mode regeneration error: {e}")
         
         # Start file watcher in a separate thread
         def run_file_watcher():
             try:
-                with create_file_watcher(regenerate_on_change, debounce_seconds=2.0) as watcher:
-                    watcher.watch_file(input_file)
-                    watcher.start()
-                    watcher.wait()
+                _watch_input_file(input_file, regenerate_on_change)
             except Exception as e:
                 logger.error(f"File watcher error: {e}")
         
@@ -465,6 +673,9 @@ def cli(ctx, verbose: bool, quiet: bool):
     log_level = "DEBUG" if verbose else "WARNING" if quiet else "INFO"
     setup_logging(log_level)
     
+    # Remember tool version probes across invocations
+    toolchain_registry.enable_persistence()
+    
     # Store options in context for subcommands
     ctx.obj['verbose'] = verbose
     ctx.obj['quiet'] = quiet
@@ -573,6 +784,36 @@ def cli(ctx, verbose: bool, quiet: bool):
     is_flag=True,
     help="Don't automatically open browser when serving"
 )
+@click.option(
+    '--validation', 'validation_level',
+    type=click.Choice(['none', 'fast', 'standard', 'full'], case_sensitive=False),
+    help="Validation tier: none, fast (directive structure only), standard or full. Default from config or full"
+)
+@click.option(
+    '--shard-workers',
+    type=click.IntRange(0, 32),
+    help="Validate very large documents in this many worker processes (default from config, 0 = off)"
+)
+@click.option(
+    '--render-workers',
+    type=click.IntRange(1, 32),
+    help="Render up to this many output formats concurrently (default from config, 4)"
+)
+@click.option(
+    '--render-service/--no-render-service',
+    default=None,
+    help="In watch mode, re-render the HTML slides with a warm quarto preview worker (default from config, off)"
+)
+@click.option(
+    '--render-cache/--no-render-cache',
+    default=None,
+    help="Skip build steps and renders whose inputs have not changed since the last run (default from config, on)"
+)
+@click.option(
+    '--explain',
+    is_flag=True,
+    help="Print why each build step was redone or skipped"
+)
 @click.pass_context
 def generate(
     ctx,
@@ -596,7 +837,13 @@ def generate(
     serve: bool,
     serve_target: str,
     port: int,
-    no_open: bool
+    no_open: bool,
+    validation_level: Optional[str],
+    shard_workers: Optional[int],
+    render_workers: Optional[int],
+    render_service: Optional[bool],
+    render_cache: Optional[bool],
+    explain: bool
 ):
     """
     Generate slides and notes from a markdown file.
@@ -666,6 +913,11 @@ def generate(
             'title': title,
             'date': date,
             'institute': institute,
+            'validation_level': validation_level.lower() if validation_level else None,
+            'shard_workers': shard_workers,
+            'render_workers': render_workers,
+            'render_service': render_service,
+            'render_cache': render_cache,
             'verbose': ctx.obj.get('verbose', False),
             'quiet': ctx.obj.get('quiet', False),
         }
@@ -730,6 +982,18 @@ def generate(
                     click.echo("Operation cancelled.")
                     return
         
+        # In watch mode keep one splitter so regenerations re-split incrementally,
+        # and validate in the background after each preview is regenerated
+        content_splitter = ContentSplitter(
+            validation_level=final_config.processing.validation_level,
+            defer_validation=True
+        ) if watch else None
+        
+        # In watch mode also keep Quarto warm between regenerations of the HTML slides
+        watch_render_service = _create_render_service(
+            input_file, output_dir, final_config, notes_only
+        ) if watch else None
+        
         # Perform the actual generation
         generated_files = _perform_generation(
             input_file=input_file,
@@ -745,7 +1009,10 @@ def generate(
             notes_only=notes_only,
             overwrite=overwrite,
             progress=progress,
-            ctx=ctx
+            ctx=ctx,
+            content_splitter=content_splitter,
+            render_service=watch_render_service,
+            explain=explain
         )
         
         # Summary
@@ -776,7 +1043,9 @@ def generate(
                     ctx=ctx,
                     serve_target=serve_target,
                     port=port,
-                    auto_open=not no_open
+                    auto_open=not no_open,
+                    content_splitter=content_splitter,
+                    render_service=watch_render_service
                 ))
             else:
                 # Regular watch mode without server
@@ -784,39 +1053,37 @@ def generate(
                 click.echo("Press Ctrl+C to stop watching.")
                 
                 def regenerate_on_change(changed_file: Path) -> None:
-                    """Callback function to regenerate files when input changes."""
-                    # Only regenerate if the changed file is our input file
-                    if changed_file.resolve() == input_file.resolve():
-                        click.echo(f"\n🔄 Change detected in {changed_file.name}, regenerating...")
-                        try:
-                            # Re-run the generation process with the same parameters
-                            # We'll call the internal generation logic directly
-                            _perform_generation(
-                                input_file=input_file,
-                                final_config=final_config,
-                                output_dir=output_dir,
-                                theme=theme,
-                                template=template,
-                                title=title,
-                                author=author,
-                                date=date,
-                                institute=institute,
-                                slides_only=slides_only,
-                                notes_only=notes_only,
-                                overwrite=True,  # Always overwrite in watch mode
-                                progress=progress,
-                                ctx=ctx
-                            )
-                            click.echo(f"✓ Regeneration complete at {time.strftime('%H:%M:%S')}")
-                        except Exception as e:
-                            click.echo(f"✗ Error during regeneration: {e}", err=True)
-                            logger.error(f"Watch mode regeneration error: {e}")
+                    """Callback function to regenerate files when the input or its bibliographies change."""
+                    click.echo(f"\n🔄 Change detected in {changed_file.name}, regenerating...")
+                    try:
+                        # Re-run the generation process with the same parameters
+                        # We'll call the internal generation logic directly
+                        _perform_generation(
+                            input_file=input_file,
+                            final_config=final_config,
+                            output_dir=output_dir,
+                            theme=theme,
+                            template=template,
+                            title=title,
+                            author=author,
+                            date=date,
+                            institute=institute,
+                            slides_only=slides_only,
+                            notes_only=notes_only,
+                            overwrite=True,  # Always overwrite in watch mode
+                            progress=progress,
+                            ctx=ctx,
+                            content_splitter=content_splitter,
+                            render_service=watch_render_service,
+                            explain=explain
+                        )
+                        click.echo(f"✓ Regeneration complete at {time.strftime('%H:%M:%S')}")
+                    except Exception as e:
+                        click.echo(f"✗ Error during regeneration: {e}", err=True)
+                        logger.error(f"Watch mode regeneration error: {e}")
                 
                 try:
-                    with create_file_watcher(regenerate_on_change, debounce_seconds=2.0) as watcher:
-                        watcher.watch_file(input_file)
-                        watcher.start()
-                        watcher.wait()
+                    _watch_input_file(input_file, regenerate_on_change)
                 except KeyboardInterrupt:
                     click.echo(f"\n👋 Watch mode stopped.")
                 except Exception as e:
@@ -879,6 +1146,31 @@ def generate(
     type=int,
     help="Maximum number of parallel workers"
 )
+@click.option(
+    '--backend',
+    type=click.Choice(['thread', 'process'], case_sensitive=False),
+    help="Run parallel files in worker threads or worker processes (default from config, thread)"
+)
+@click.option(
+    '--split-workers',
+    type=click.IntRange(1, 32),
+    help="Threads splitting files ahead of the render workers with the thread backend (default from config, 1)"
+)
+@click.option(
+    '--min-workers',
+    type=click.IntRange(1, 32),
+    help="Renders allowed to run however loaded the machine is (default from config, 1)"
+)
+@click.option(
+    '--adaptive-workers/--fixed-workers',
+    default=None,
+    help="Adjust concurrent renders to load and memory between --min-workers and --max-workers (default from config, on)"
+)
+@click.option(
+    '--incremental/--rebuild-all',
+    default=None,
+    help="Skip files unchanged since the last batch run into the output directory (default from config, on)"
+)
 @click.option(
     '--continue-on-error',
     is_flag=True,
@@ -899,6 +1191,16 @@ def generate(
     default=True,
     help="Show progress indicators"
 )
+@click.option(
+    '--validation', 'validation_level',
+    type=click.Choice(['none', 'fast', 'standard', 'full'], case_sensitive=False),
+    help="Validation tier: none, fast (directive structure only), standard or full. Default from config or full"
+)
+@click.option(
+    '--explain',
+    is_flag=True,
+    help="Print why each build step of each file was redone or skipped"
+)
 @click.pass_context
 def batch(
     ctx,
@@ -911,10 +1213,17 @@ def batch(
     config: Optional[Path],
     parallel: Optional[bool],
     max_workers: Optional[int],
+    backend: Optional[str],
+    split_workers: Optional[int],
+    min_workers: Optional[int],
+    adaptive_workers: Optional[bool],
+    incremental: Optional[bool],
     continue_on_error: bool,
     overwrite: bool,
     dry_run: bool,
-    progress: bool
+    progress: bool,
+    validation_level: Optional[str],
+    explain: bool
 ):
     """
     Batch process multiple markdown files in a directory.
@@ -936,6 +1245,9 @@ def batch(
         # Generate multiple formats with parallel processing
         markdown-slides batch lectures/ -f html -f pdf --parallel --max-workers 4
         
+        # Split on several CPUs at once with worker processes
+        markdown-slides batch lectures/ --backend process
+        
         # Continue processing even if some files fail
         markdown-slides batch lectures/ --continue-on-error
     """
@@ -951,6 +1263,7 @@ def batch(
             'format': format if format else None,
             'output_dir': str(output_dir) if output_dir else None,
             'theme': theme,
+            'validation_level': validation_level.lower() if validation_level else None,
             'verbose': ctx.obj.get('verbose', False),
             'quiet': ctx.obj.get('quiet', False),
         }
@@ -970,6 +1283,16 @@ def batch(
             final_config.batch.parallel = parallel
         if max_workers is not None:
             final_config.batch.max_workers = max_workers
+        if backend is not None:
+            final_config.batch.backend = backend.lower()
+        if split_workers is not None:
+            final_config.batch.split_workers = split_workers
+        if min_workers is not None:
+            final_config.batch.min_workers = min_workers
+        if adaptive_workers is not None:
+            final_config.batch.adaptive_workers = adaptive_workers
+        if incremental is not None:
+            final_config.batch.incremental = incremental
         if continue_on_error:
             final_config.batch.error_handling = 'continue'
         if overwrite:
@@ -989,20 +1312,20 @@ def batch(
         logger.info(f"Recursive: {final_config.batch.recursive}")
         logger.info(f"Parallel: {final_config.batch.parallel}")
         
-        # Find matching files
-        if final_config.batch.recursive:
-            files = list(input_dir.rglob(final_config.batch.pattern))
-        else:
-            files = list(input_dir.glob(final_config.batch.pattern))
+        # Find matching files; batch processing reuses this scan
+        from .batch import BatchProcessor, FileScanner
         
-        # Apply exclude patterns
-        if final_config.batch.exclude_patterns:
-            original_count = len(files)
-            for exclude_pattern in final_config.batch.exclude_patterns:
-                files = [f for f in files if not f.match(exclude_pattern)]
-            excluded_count = original_count - len(files)
-            if excluded_count > 0:
-                logger.info(f"Excluded {excluded_count} files based on exclude patterns")
+        file_scanner = FileScanner(use_index=final_config.batch.scan_index)
+        files = file_scanner.scan_directory(
+            directory=input_dir,
+            pattern=final_config.batch.pattern,
+            recursive=final_config.batch.recursive,
+            exclude_patterns=final_config.batch.exclude_patterns,
+            file_filters=final_config.batch.file_filters
+        )
+        excluded_count = len(file_scanner.excluded_files)
+        if excluded_count > 0:
+            logger.info(f"Excluded {excluded_count} files based on exclude patterns and filters")
         
         if not files:
             click.echo(f"No files matching '{final_config.batch.pattern}' found in {input_dir}")
@@ -1014,6 +1337,8 @@ def batch(
                 click.echo(f"  • {file.relative_to(input_dir)}")
             if len(files) > 10:
                 click.echo(f"  ... and {len(files) - 10} more files")
+            if file_scanner.last_delta is not None:
+                click.echo(f"  Since the last scan: {file_scanner.last_delta.summary()}")
             click.echo()
         
         if dry_run:
@@ -1026,13 +1351,15 @@ def batch(
             click.echo(f"  Output directory: {output_dir}")
             click.echo(f"  Parallel processing: {final_config.batch.parallel}")
             if final_config.batch.parallel:
-                click.echo(f"  Max workers: {final_config.batch.max_workers}")
+                click.echo(f"  Max workers: {final_config.batch.max_workers} ({final_config.batch.backend}s)")
+                if final_config.batch.backend == 'thread':
+                    click.echo(f"  Split workers: {final_config.batch.split_workers}")
+                if final_config.batch.adaptive_workers:
+                    click.echo(f"  Adaptive workers: {final_config.batch.min_workers}-{final_config.batch.max_workers}")
             click.echo(f"  Error handling: {final_config.batch.error_handling}")
             return
         
         # Initialize batch processor
-        from .batch import BatchProcessor
-        
         batch_processor = BatchProcessor(final_config)
         
         # Process files using batch processor
@@ -1040,7 +1367,8 @@ def batch(
             batch_result = batch_processor.process_directory(
                 input_dir=input_dir,
                 output_dir=output_dir,
-                dry_run=dry_run
+                dry_run=dry_run,
+                files=files
             )
             
             # Summary
@@ -1049,12 +1377,29 @@ def batch(
             click.echo(f"  📤 Output directory: {output_dir}")
             click.echo(f"  ✓ Successfully processed: {batch_result.successful_files}")
             if batch_result.skipped_files > 0:
-                click.echo(f"  ⏭️  Skipped: {batch_result.skipped_files}")
+                up_to_date = sum(1 for r in batch_result.file_results if r.skip_reason == "Up to date")
+                click.echo(f"  ⏭️  Skipped: {batch_result.skipped_files} ({up_to_date} up to date)")
             if batch_result.failed_files > 0:
                 click.echo(f"  ✗ Errors: {batch_result.failed_files}")
             click.echo(f"  📄 Total files generated: {len(batch_result.generated_outputs)}")
             click.echo(f"  ⏱️  Processing time: {batch_result.processing_time:.2f}s")
-            click.echo(f"  📈 Success rate: {batch_result.success_rate:.1f}%")
+            skipped_note = " (skipped files not counted)" if batch_result.skipped_files else ""
+            click.echo(f"  📈 Success rate: {batch_result.success_rate:.1f}%{skipped_note}")
+            usage = batch_result.resource_usage
+            if usage.get('measured'):
+                click.echo(
+                    f"  🧮 Quarto CPU: {usage['cpu_time']:.2f}s over {usage['measured']} render(s), "
+                    f"peak memory {usage['peak_rss_bytes'] / (1024 * 1024):.1f} MB, "
+                    f"outputs {usage['output_bytes'] / (1024 * 1024):.1f} MB"
+                )
+            
+            if explain:
+                click.echo(f"\n🔍 Build steps:")
+                for file_result in batch_result.file_results:
+                    if file_result.build_report is not None:
+                        click.echo(f"  {file_result.file_path.relative_to(input_dir)}:")
+                        for line in file_result.build_report.explain():
+                            click.echo(f"    {line}")
             
             # Show recent errors if any
             if batch_result.errors:
@@ -1590,6 +1935,8 @@ def estimate(ctx, input_dir: Path, config: Optional[Path], pattern: Optional[str
         
         click.echo(f"📁 Files:")
         click.echo(f"   Total files found: {estimate_data['total_files']}")
+        if batch_processor.file_scanner.last_delta is not None:
+            click.echo(f"   Since the last scan: {batch_processor.file_scanner.last_delta.summary()}")
         click.echo(f"   Pattern: {base_config.batch.pattern}")
         click.echo(f"   Recursive: {base_config.batch.recursive}")
         click.echo()
@@ -1598,8 +1945,14 @@ def estimate(ctx, input_dir: Path, config: Optional[Path], pattern: Optional[str
             click.echo(f"⏱️  Time Estimate:")
             click.echo(f"   Estimated processing time: {estimate_data['estimated_time_human']}")
             if estimate_data['parallel_processing']:
-                parallel_time = estimate_data['estimated_time_seconds'] / estimate_data['max_workers']
+                parallel_time = estimate_data['parallel_time_seconds']
                 click.echo(f"   With parallel processing ({estimate_data['max_workers']} workers): {parallel_time/60:.1f} minutes")
+            if estimate_data['files_from_history']:
+                click.echo(f"   Based on earlier runs for {estimate_data['files_from_history']} of {estimate_data['total_files']} files")
+                for file_name, seconds in estimate_data['longest_files']:
+                    click.echo(f"     {Path(file_name).name}: {seconds:.1f}s")
+            else:
+                click.echo(f"   No render history yet; assuming 5 seconds per file")
             click.echo()
             
             click.echo(f"📤 Output:")
@@ -1654,11 +2007,9 @@ def check():
         # Check for Quarto
         import subprocess
         try:
-            result = subprocess.run(['quarto', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                quarto_version = result.stdout.strip()
-                click.echo(f"✓ Quarto {quarto_version}")
+            quarto = toolchain_registry.get('quarto')
+            if quarto.available:
+                click.echo(f"✓ Quarto {quarto.version}")
             else:
                 click.echo("✗ Quarto not found or not working")
         except (subprocess.TimeoutExpired, FileNotFoundError):
@@ -1666,9 +2017,8 @@ def check():
         
         # Check for LaTeX (optional but recommended)
         try:
-            result = subprocess.run(['pdflatex', '--version'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
+            pdflatex = toolchain_registry.get('pdflatex')
+            if pdflatex.available:
                 click.echo("✓ LaTeX (pdflatex) available")
             else:
                 click.echo("⚠️  LaTeX not found (PDF generation may not work)")
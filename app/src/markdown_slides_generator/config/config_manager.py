@@ -25,6 +25,9 @@ class OutputConfig:
     preserve_structure: bool = True
     overwrite: bool = False
     naming_pattern: str = '{stem}_{type}.{ext}'
+    render_workers: int = 4
+    render_service: bool = False
+    render_cache: bool = True
 
 
 @dataclass
@@ -92,6 +95,11 @@ class ProcessingConfig:
     image_optimization: bool = True
     link_validation: bool = False
     content_validation: bool = True
+    split_cache: bool = True
+    split_cache_dir: Optional[str] = None  # Defaults to the user cache directory
+    split_cache_max_size_mb: int = 64
+    validation_level: str = 'full'  # 'none', 'fast', 'standard' or 'full'
+    shard_workers: int = 0  # Worker processes for validating very large documents (0 = off)
 
 
 @dataclass
@@ -101,6 +109,27 @@ class BatchConfig:
     recursive: bool = False
     parallel: bool = True
     max_workers: int = 4
+    # Run parallel files in worker threads ('thread') or worker processes
+    # ('process'), which split on several CPUs at once
+    backend: str = 'thread'
+    # With the thread backend, split_workers threads split files ahead of
+    # the max_workers render threads, at most queue_depth files ahead
+    split_workers: int = 1
+    queue_depth: int = 4
+    # Let the number of concurrent renders follow load and memory, between
+    # min_workers and max_workers
+    adaptive_workers: bool = True
+    min_workers: int = 1
+    # Record split and render times across runs and base estimates, ETAs and
+    # the processing order (longest first) on them
+    render_history: bool = True
+    # Skip files whose sources, configuration, theme and toolchain are
+    # unchanged since the build manifest in the output directory recorded
+    # them; off (or output.render_cache off) rebuilds every file
+    incremental: bool = True
+    # Keep an index of the scanned tree in the user cache, so repeated scans
+    # only list directories whose mtime changed and report what changed
+    scan_index: bool = True
     progress_reporting: bool = True
     error_handling: str = 'continue'  # 'continue', 'stop', 'skip'
     file_filters: List[str] = field(default_factory=list)
@@ -252,6 +281,11 @@ class ConfigManager:
             'title': ('variables', 'title'),
             'date': ('variables', 'date'),
             'institute': ('variables', 'institute'),
+            'validation_level': ('processing', 'validation_level'),
+            'shard_workers': ('processing', 'shard_workers'),
+            'render_workers': ('output', 'render_workers'),
+            'render_service': ('output', 'render_service'),
+            'render_cache': ('output', 'render_cache'),
         }
         
         # Apply CLI options
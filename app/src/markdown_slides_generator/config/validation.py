@@ -134,11 +134,19 @@ class ConfigValidator:
                     self.errors.append(f"Invalid output directory path: {directory}")
         
         # Validate boolean options
-        bool_options = ['preserve_structure', 'overwrite']
+        bool_options = ['preserve_structure', 'overwrite', 'render_service', 'render_cache']
         for option in bool_options:
             if option in output_config and not isinstance(output_config[option], bool):
                 self.errors.append(f"output.{option} must be a boolean")
         
+        # Validate concurrent render workers
+        if 'render_workers' in output_config:
+            render_workers = output_config['render_workers']
+            if not isinstance(render_workers, int):
+                self.errors.append("output.render_workers must be an integer")
+            elif not (1 <= render_workers <= 32):
+                self.errors.append("output.render_workers must be between 1 and 32")
+        
         # Validate naming pattern
         if 'naming_pattern' in output_config:
             pattern = output_config['naming_pattern']
@@ -275,13 +283,30 @@ class ConfigValidator:
         # Validate boolean options
         bool_options = [
             'intelligent_splitting', 'preserve_formatting', 'syntax_highlighting',
-            'image_optimization', 'link_validation', 'content_validation'
+            'image_optimization', 'link_validation', 'content_validation', 'split_cache'
         ]
         
         for option in bool_options:
             if option in processing_config and not isinstance(processing_config[option], bool):
                 self.errors.append(f"processing.{option} must be a boolean")
         
+        # Validate validation level
+        if 'validation_level' in processing_config:
+            level = processing_config['validation_level']
+            valid_levels = ['none', 'fast', 'standard', 'full']
+            if not isinstance(level, str):
+                self.errors.append("processing.validation_level must be a string")
+            elif level not in valid_levels:
+                self.errors.append(f"processing.validation_level must be one of: {', '.join(valid_levels)}")
+        
+        # Validate sharded validation workers
+        if 'shard_workers' in processing_config:
+            shard_workers = processing_config['shard_workers']
+            if not isinstance(shard_workers, int):
+                self.errors.append("processing.shard_workers must be an integer")
+            elif not (0 <= shard_workers <= 32):
+                self.errors.append("processing.shard_workers must be between 0 and 32")
+        
         # Validate math renderer
         if 'math_renderer' in processing_config:
             renderer = processing_config['math_renderer']
@@ -306,11 +331,24 @@ class ConfigValidator:
                 self.errors.append("processing.custom_commands must be a dictionary")
             elif not all(isinstance(k, str) and isinstance(v, str) for k, v in commands.items()):
                 self.errors.append("processing.custom_commands must be a dictionary of string key-value pairs")
+        
+        # Validate split cache settings
+        if 'split_cache_dir' in processing_config:
+            cache_dir = processing_config['split_cache_dir']
+            if cache_dir is not None and not isinstance(cache_dir, str):
+                self.errors.append("processing.split_cache_dir must be a string")
+        
+        if 'split_cache_max_size_mb' in processing_config:
+            max_size = processing_config['split_cache_max_size_mb']
+            if not isinstance(max_size, int) or isinstance(max_size, bool):
+                self.errors.append("processing.split_cache_max_size_mb must be an integer")
+            elif max_size < 1:
+                self.errors.append("processing.split_cache_max_size_mb must be at least 1")
     
     def _validate_batch_config(self, batch_config: Dict[str, Any]) -> None:
         """Validate batch processing configuration."""
         # Validate string options
-        string_options = ['pattern', 'error_handling']
+        string_options = ['pattern', 'error_handling', 'backend']
         for option in string_options:
             if option in batch_config and not isinstance(batch_config[option], str):
                 self.errors.append(f"batch.{option} must be a string")
@@ -322,8 +360,18 @@ class ConfigValidator:
             if error_handling not in valid_options:
                 self.errors.append(f"batch.error_handling must be one of: {', '.join(valid_options)}")
         
+        # Validate backend
+        if 'backend' in batch_config:
+            backend = batch_config['backend']
+            valid_backends = ['thread', 'process']
+            if backend not in valid_backends:
+                self.errors.append(f"batch.backend must be one of: {', '.join(valid_backends)}")
+        
         # Validate boolean options
-        bool_options = ['recursive', 'parallel', 'progress_reporting']
+        bool_options = [
+            'recursive', 'parallel', 'progress_reporting', 'adaptive_workers', 'render_history', 'incremental',
+            'scan_index'
+        ]
         for option in bool_options:
             if option in batch_config and not isinstance(batch_config[option], bool):
                 self.errors.append(f"batch.{option} must be a boolean")
@@ -336,6 +384,26 @@ class ConfigValidator:
             elif not (1 <= max_workers <= 32):
                 self.errors.append("batch.max_workers must be between 1 and 32")
         
+        # Validate min_workers
+        if 'min_workers' in batch_config:
+            min_workers = batch_config['min_workers']
+            if not isinstance(min_workers, int):
+                self.errors.append("batch.min_workers must be an integer")
+            elif not (1 <= min_workers <= 32):
+                self.errors.append("batch.min_workers must be between 1 and 32")
+            elif isinstance(batch_config.get('max_workers'), int) and min_workers > batch_config['max_workers']:
+                self.errors.append("batch.min_workers must not exceed batch.max_workers")
+        
+        # Validate split_workers and queue_depth
+        int_ranges = {'split_workers': (1, 32), 'queue_depth': (1, 256)}
+        for option, (low, high) in int_ranges.items():
+            if option in batch_config:
+                value = batch_config[option]
+                if not isinstance(value, int):
+                    self.errors.append(f"batch.{option} must be an integer")
+                elif not (low <= value <= high):
+                    self.errors.append(f"batch.{option} must be between {low} and {high}")
+        
         # Validate list options
         list_options = ['file_filters', 'exclude_patterns']
         for option in list_options:
@@ -0,0 +1,374 @@
+"""
+Build Graph - Dependency-tracked build steps with minimal rebuilds.
+
+Building a lecture takes several steps: split the markdown, write the slides
+and notes documents, write the theme SCSS and copy images, then render every
+output format. Each step is a BuildNode that declares the files it reads, the
+nodes it depends on and the files it writes. BuildGraph records what every
+node was built from in a state file next to the outputs, reruns only the
+nodes whose inputs changed since, and runs independent nodes in parallel.
+
+A node's inputs are summarized by a stamp: the digest of its option key, its
+input files and the stamps of its dependencies. A node that writes files gets
+the digest of those files as its stamp after it runs, so rewriting a document
+with identical content does not rebuild anything downstream. Nodes that write
+no files (like the split, whose result is held in memory) are run on demand
+when a node depending on them has to rebuild.
+"""
+
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+
+from ..utils.logger import get_logger
+from ..utils.file_io import write_if_changed
+
+logger = get_logger(__name__)
+
+
+# Bump when the layout of the state file changes
+BUILD_STATE_FORMAT_VERSION = 1
+
+
+def default_state_file(output_dir: Path, input_file: Path) -> Path:
+    """Return the state file of the build of input_file into output_dir."""
+    return Path(output_dir) / f".{Path(input_file).stem}.build.json"
+
+
+@dataclass
+class BuildNode:
+    """One step of a build."""
+    name: str
+    # Runs the step; may return the paths of the files it wrote
+    action: Callable[[], Optional[Iterable[str]]]
+    inputs: List[Path] = field(default_factory=list)
+    deps: List[str] = field(default_factory=list)
+    outputs: List[Path] = field(default_factory=list)
+    # Options the action depends on besides its input files
+    key: str = ''
+
+
+@dataclass
+class NodeOutcome:
+    """What happened to a node during a build."""
+    name: str
+    status: str  # 'rebuilt', 'skipped', 'failed' or 'blocked'
+    reasons: List[str]
+    outputs: List[str] = field(default_factory=list)
+    error: Optional[Exception] = None
+    duration: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        """Whether the node's outputs are up to date."""
+        return self.status in ('rebuilt', 'skipped')
+
+
+@dataclass
+class BuildReport:
+    """Outcome of every node of a build, in dependency order."""
+    outcomes: Dict[str, NodeOutcome]
+    elapsed: float
+    
+    def names(self, status: str) -> List[str]:
+        """Names of the nodes with the given status."""
+        return [name for name, outcome in self.outcomes.items() if outcome.status == status]
+    
+    @property
+    def ok(self) -> bool:
+        """Whether every node is up to date."""
+        return all(outcome.ok for outcome in self.outcomes.values())
+    
+    def explain(self) -> List[str]:
+        """One line per node saying whether it was rebuilt or skipped, and why."""
+        lines = []
+        for outcome in self.outcomes.values():
+            detail = '; '.join(outcome.reasons)
+            if outcome.error is not None:
+                detail = f"{detail}; {outcome.error}" if detail else str(outcome.error)
+            timing = f" in {outcome.duration:.2f}s" if outcome.status == 'rebuilt' else ''
+            lines.append(f"{outcome.name}: {outcome.status}{timing} ({detail})")
+        return lines
+
+
+class BuildGraph:
+    """
+    Dependency graph of build nodes with persisted stamps.
+    
+    Nodes are added in any order and run once all their dependencies are up
+    to date; a failed node blocks the nodes depending on it but not the rest
+    of the graph. run() may be called once per graph.
+    """
+    
+    def __init__(self, state_file: Optional[Path] = None, max_workers: int = 4):
+        """
+        Args:
+            state_file: JSON file recording the last build (default: none, so
+                every node is rebuilt)
+            max_workers: Maximum number of nodes running at the same time
+        """
+        self.state_file = Path(state_file) if state_file else None
+        self.max_workers = max(1, max_workers)
+        self.nodes: Dict[str, BuildNode] = {}
+        self._previous: Dict[str, Dict[str, Any]] = {}
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._files: Dict[str, List[Any]] = {}
+        self._outcomes: Dict[str, NodeOutcome] = {}
+        self._node_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def add(self, node: BuildNode) -> BuildNode:
+        """Add a node; its name must be unique."""
+        if node.name in self.nodes:
+            raise ValueError(f"Duplicate build node: {node.name}")
+        self.nodes[node.name] = node
+        self._node_locks[node.name] = threading.Lock()
+        return node
+    
+    def run(self, force: bool = False) -> BuildReport:
+        """
+        Bring every node up to date.
+        
+        Args:
+            force: Rebuild every node regardless of the recorded state
+        
+        Returns:
+            BuildReport with the outcome of every node
+        
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+        """
+        start_time = time.time()
+        order = self._topological_order()
+        self._load_state()
+        if force:
+            self._previous = {}
+        
+        dependents: Dict[str, List[str]] = {name: [] for name in order}
+        remaining = {name: len(self.nodes[name].deps) for name in order}
+        for name in order:
+            for dep in self.nodes[name].deps:
+                dependents[dep].append(name)
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(order) or 1)) as pool:
+            running = {pool.submit(self._visit, name, force): name for name in order if not remaining[name]}
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    future.result()
+                    for dependent in dependents[name]:
+                        remaining[dependent] -= 1
+                        if not remaining[dependent]:
+                            running[pool.submit(self._visit, dependent, force)] = dependent
+        
+        self._save_state()
+        report = BuildReport({name: self._outcomes[name] for name in order}, time.time() - start_time)
+        logger.info(
+            f"Build finished in {report.elapsed:.2f}s: {len(report.names('rebuilt'))} rebuilt, "
+            f"{len(report.names('skipped'))} up to date, "
+            f"{len(report.names('failed')) + len(report.names('blocked'))} failed"
+        )
+        return report
+    
+    def _topological_order(self) -> List[str]:
+        """Order nodes so that every node comes after its dependencies."""
+        order: List[str] = []
+        state: Dict[str, str] = {}
+        
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if state.get(name) == 'done':
+                return
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Build graph has a cycle: {' -> '.join(path + (name,))}")
+            state[name] = 'visiting'
+            for dep in self.nodes[name].deps:
+                if dep not in self.nodes:
+                    raise ValueError(f"Build node {name} depends on unknown node {dep}")
+                visit(dep, path + (name,))
+            state[name] = 'done'
+            order.append(name)
+        
+        for name in self.nodes:
+            visit(name, ())
+        return order
+    
+    def _visit(self, name: str, force: bool) -> None:
+        """Decide whether a node is stale and rebuild it if so; never raises."""
+        node = self.nodes[name]
+        with self._lock:
+            failed = [dep for dep in node.deps if not self._outcomes[dep].ok]
+        if failed:
+            self._set_outcome(NodeOutcome(name, 'blocked', [f"{dep} failed" for dep in failed]))
+            return
+        
+        with self._node_locks[name]:
+            record = self._input_record(node)
+            reasons = ['forced'] if force else self._stale_reasons(name, record)
+            if not reasons:
+                previous = self._previous[name]
+                with self._lock:
+                    self._records[name] = previous
+                self._set_outcome(NodeOutcome(name, 'skipped', ['up to date'], list(previous['outputs'])))
+                return
+            self._rebuild(node, record, reasons)
+    
+    def _rebuild(self, node: BuildNode, record: Dict[str, Any], reasons: List[str]) -> None:
+        """Run a node's action and record its new stamp; called with the node's lock held."""
+        start_time = time.time()
+        try:
+            for dep in node.deps:
+                self._realize(dep, node.name)
+            produced = node.action() or []
+        except Exception as e:
+            logger.error(f"Build step {node.name} failed: {e}")
+            self._set_outcome(NodeOutcome(node.name, 'failed', reasons, error=e, duration=time.time() - start_time))
+            return
+        
+        outputs = list(dict.fromkeys([str(path) for path in node.outputs] + [str(path) for path in produced]))
+        record['outputs'] = {path: self._signature(Path(path)) for path in outputs}
+        if outputs:
+            record['stamp'] = self._digest(self._file_digest(Path(path)) for path in outputs)
+        else:
+            record['stamp'] = self._digest([record['key']] + sorted(record['inputs'].values()) + sorted(record['deps'].values()))
+        with self._lock:
+            self._records[node.name] = record
+        self._set_outcome(NodeOutcome(node.name, 'rebuilt', reasons, outputs, duration=time.time() - start_time))
+    
+    def _realize(self, name: str, needed_by: str) -> None:
+        """Run a skipped node that writes no files, because needed_by needs its result."""
+        node = self.nodes[name]
+        with self._node_locks[name]:
+            outcome = self._outcomes[name]
+            if outcome.status != 'skipped' or outcome.outputs:
+                return
+            for dep in node.deps:
+                self._realize(dep, name)
+            node.action()
+            with self._lock:
+                self._outcomes[name] = NodeOutcome(name, 'rebuilt', [f"needed by {needed_by}"])
+    
+    def _set_outcome(self, outcome: NodeOutcome) -> None:
+        with self._lock:
+            self._outcomes[outcome.name] = outcome
+    
+    def _input_record(self, node: BuildNode) -> Dict[str, Any]:
+        """Summarize what a node would be built from."""
+        with self._lock:
+            dep_stamps = {dep: self._records[dep]['stamp'] for dep in node.deps}
+        return {
+            'key': self._digest([node.key]),
+            'inputs': {str(path): self._file_digest(Path(path)) for path in node.inputs},
+            'deps': dep_stamps,
+            'outputs': {},
+            'stamp': None
+        }
+    
+    def _stale_reasons(self, name: str, record: Dict[str, Any]) -> List[str]:
+        """Reasons to rebuild a node, or an empty list if it is up to date."""
+        previous = self._previous.get(name)
+        if previous is None:
+            return ['not built before']
+        
+        reasons = []
+        if previous['key'] != record['key']:
+            reasons.append('options changed')
+        for path, digest in record['inputs'].items():
+            if previous['inputs'].get(path) != digest:
+                reasons.append(f"{Path(path).name} {'missing' if digest == 'missing' else 'changed'}")
+        for dep, stamp in record['deps'].items():
+            if previous['deps'].get(dep) != stamp:
+                reasons.append(f"{dep} changed")
+        if set(previous['deps']) != set(record['deps']) or set(previous['inputs']) != set(record['inputs']):
+            if not reasons:
+                reasons.append('dependencies changed')
+        for path, signature in previous['outputs'].items():
+            current = self._signature(Path(path))
+            if current is None:
+                reasons.append(f"{Path(path).name} missing")
+            elif current != signature:
+                reasons.append(f"{Path(path).name} modified")
+        for path in self.nodes[name].outputs:
+            if str(path) not in previous['outputs'] and not Path(path).exists():
+                reasons.append(f"{Path(path).name} missing")
+        return reasons
+    
+    @staticmethod
+    def _signature(path: Path) -> Optional[List[int]]:
+        """(size, mtime_ns) of a file, or None if it does not exist."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+    
+    def _file_digest(self, path: Path) -> str:
+        """Content digest of a file, reused while its (size, mtime) is unchanged."""
+        signature = self._signature(path)
+        if signature is None:
+            return 'missing'
+        key = str(path)
+        with self._lock:
+            known = self._files.get(key)
+            if known is not None and known[:2] == signature:
+                return known[2]
+        
+        digest = hashlib.sha256()
+        try:
+            with open(path, 'rb') as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        except OSError:
+            return 'missing'
+        with self._lock:
+            self._files[key] = signature + [digest.hexdigest()]
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _digest(parts: Iterable[str]) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def _load_state(self) -> None:
+        """Read the records of the last build; an unreadable state means a full build."""
+        if self.state_file is None:
+            return
+        try:
+            data = json.loads(self.state_file.read_text(encoding='utf-8'))
+            if data.get('format') != BUILD_STATE_FORMAT_VERSION:
+                return
+            self._previous = dict(data['nodes'])
+            self._files = dict(data['files'])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable build state {self.state_file}: {e}")
+    
+    def _save_state(self) -> None:
+        """Record the nodes that are up to date; failed nodes are rebuilt next time."""
+        if self.state_file is None:
+            return
+        # Nodes left out of this build (e.g. notes in a slides-only run) keep their records
+        records = {name: record for name, record in self._previous.items() if name not in self.nodes}
+        records.update(self._records)
+        files = set()
+        for record in records.values():
+            files.update(record['inputs'])
+            files.update(record['outputs'])
+        state = {
+            'format': BUILD_STATE_FORMAT_VERSION,
+            'nodes': records,
+            'files': {path: self._files[path] for path in sorted(files) if path in self._files}
+        }
+        try:
+            write_if_changed(self.state_file, json.dumps(state, indent=1, sort_keys=True))
+        except OSError as e:
+            logger.debug(f"Could not write build state {self.state_file}: {e}")
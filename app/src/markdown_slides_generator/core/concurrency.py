@@ -0,0 +1,341 @@
+"""
+Concurrency - Adaptive limit on concurrent Quarto renders.
+
+A fixed number of batch workers is too many for memory-hungry xelatex PDF
+renders and too few for light HTML renders. The controller below admits
+renders one by one: it keeps the number running between configured bounds,
+holds new renders back while the machine is loaded by other work or short
+of memory for another render of that format, and learns the duration and
+peak memory of each format from the renders it has seen. Waiting renders
+are admitted longest-first, so slow PDF renders start early and do not
+form the tail of a batch.
+"""
+
+import os
+import time
+import heapq
+import itertools
+import threading
+import contextlib
+import multiprocessing
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Callable, Tuple, List
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+MB = 1024 * 1024
+
+# (seconds, peak RSS bytes) assumed for a format until a render of it was seen
+FORMAT_COST_PRIORS: Dict[str, Tuple[float, int]] = {
+    'pdf': (30.0, 800 * MB),
+    'beamer': (30.0, 800 * MB),
+    'revealjs': (5.0, 250 * MB),
+    'html': (5.0, 250 * MB),
+    'pptx': (8.0, 300 * MB),
+    'docx': (8.0, 300 * MB),
+}
+DEFAULT_FORMAT_COST: Tuple[float, int] = (10.0, 400 * MB)
+
+
+@dataclass
+class SystemSample:
+    """Machine state the controller bases its limit on."""
+    cpu_count: int
+    load: Optional[float]
+    available_memory: Optional[int]
+
+
+def _available_memory() -> Optional[int]:
+    """Memory available to new processes in bytes, if the platform tells."""
+    try:
+        with open('/proc/meminfo', encoding='ascii') as meminfo:
+            for line in meminfo:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def sample_system() -> SystemSample:
+    """Read the CPU count, 1-minute load average and available memory."""
+    try:
+        load = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        load = None
+    return SystemSample(os.cpu_count() or 1, load, _available_memory())
+
+
+class SharedRenderCounts:
+    """
+    Running renders and machine sample shared by the controllers of several
+    processes, so that their renders count against one limit.
+    
+    Create it in the parent and hand it to the worker processes when they
+    start (e.g. through a pool initializer), like a multiprocessing lock.
+    """
+    
+    def __init__(self, context: Optional[Any] = None):
+        """
+        Args:
+            context: multiprocessing context the workers are started with
+        """
+        context = context or multiprocessing.get_context()
+        self.lock = context.Lock()
+        self.running = context.RawValue('i', 0)
+        self.started_since_sample = context.RawValue('q', 0)
+        # Wall-clock time of the shared sample; a load or memory of -1 is unknown
+        self.sampled_at = context.RawValue('d', 0.0)
+        self.cpu_count = context.RawValue('i', 0)
+        self.load = context.RawValue('d', -1.0)
+        self.available_memory = context.RawValue('q', -1)
+
+
+class RenderSlot:
+    """
+    Permission for one render to run, used as a context manager.
+    
+    Without a controller entering and leaving it does nothing. Set
+    peak_rss_bytes before leaving to teach the controller the render's
+    memory use. wait_time tells how long entering waited for room.
+    """
+    
+    def __init__(self, output_format: str, controller: Optional['AdaptiveConcurrencyController'] = None):
+        self.output_format = output_format
+        self.peak_rss_bytes: Optional[int] = None
+        self.wait_time = 0.0
+        self._controller = controller
+        self._start_time = 0.0
+    
+    def __enter__(self) -> 'RenderSlot':
+        requested = time.time()
+        if self._controller is not None:
+            self._controller._acquire(self.output_format)
+        self._start_time = time.time()
+        self.wait_time = self._start_time - requested
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self._controller is not None:
+            duration = time.time() - self._start_time if exc_type is None else None
+            self._controller._release(self.output_format, duration, self.peak_rss_bytes)
+
+
+class AdaptiveConcurrencyController:
+    """
+    Admits Quarto renders while the machine has room for them.
+    
+    At least min_workers and at most max_workers renders run at a time. In
+    between, a render is admitted when the CPUs not busy with other work
+    outnumber the running renders and the available memory, less a reserve
+    and the expected peak of renders started since it was sampled, fits the
+    expected peak of the new render. Safe to use from multiple threads, and
+    from multiple processes once their controllers share_counts().
+    """
+    
+    def __init__(
+        self,
+        min_workers: int = 1,
+        max_workers: int = 4,
+        memory_reserve: int = 512 * MB,
+        sample_interval: float = 1.0,
+        smoothing: float = 0.3,
+        probe: Callable[[], SystemSample] = sample_system
+    ):
+        """
+        Args:
+            min_workers: Renders always allowed to run, whatever the load
+            max_workers: Renders never exceeded
+            memory_reserve: Memory left free for the rest of the machine
+            sample_interval: Seconds between reads of load and memory
+            smoothing: Weight of the latest render in the per-format averages
+            probe: Reads the machine state (tests pass a fake)
+        """
+        self.max_workers = max(1, max_workers)
+        self.min_workers = max(1, min(min_workers, self.max_workers))
+        self.memory_reserve = memory_reserve
+        self.sample_interval = sample_interval
+        self.smoothing = smoothing
+        self._probe = probe
+        self._costs: Dict[str, List[float]] = {}
+        self._own_running = 0
+        self._peak_running = 0
+        self._own_started_since_sample = 0
+        self._sample: Optional[SystemSample] = None
+        self._sampled_at = 0.0
+        self._waiting: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._shared: Optional[SharedRenderCounts] = None
+        self._shared_lock: Any = contextlib.nullcontext()
+    
+    def share_counts(self, shared: SharedRenderCounts) -> None:
+        """
+        Count running renders and sample the machine together with the
+        controllers of other processes holding the same shared counts.
+        
+        Waiting renders are admitted longest-first within each process only.
+        Call before the first render.
+        """
+        self._shared = shared
+        self._shared_lock = shared.lock
+    
+    @property
+    def _running(self) -> int:
+        return self._shared.running.value if self._shared is not None else self._own_running
+    
+    @_running.setter
+    def _running(self, value: int) -> None:
+        if self._shared is not None:
+            self._shared.running.value = value
+        else:
+            self._own_running = value
+    
+    @property
+    def _started_since_sample(self) -> int:
+        if self._shared is not None:
+            return self._shared.started_since_sample.value
+        return self._own_started_since_sample
+    
+    @_started_since_sample.setter
+    def _started_since_sample(self, value: int) -> None:
+        if self._shared is not None:
+            self._shared.started_since_sample.value = value
+        else:
+            self._own_started_since_sample = value
+    
+    def slot(self, output_format: str) -> RenderSlot:
+        """Slot for one render of output_format; enter it to wait for room."""
+        return RenderSlot(output_format, self)
+    
+    def expected_cost(self, output_format: str) -> Tuple[float, int]:
+        """Expected (seconds, peak RSS bytes) of a render of output_format."""
+        with self._condition:
+            return self._expected_cost(output_format)
+    
+    def record(self, output_format: str, duration: Optional[float], peak_rss_bytes: Optional[int]) -> None:
+        """Fold a finished render (e.g. from an earlier run) into the per-format averages."""
+        with self._condition:
+            self._record(output_format, duration, peak_rss_bytes)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Running and waiting renders, the highest concurrency reached and the learned costs."""
+        with self._condition:
+            return {
+                'running': self._running,
+                'waiting': len(self._waiting),
+                'peak_running': self._peak_running,
+                'costs': {fmt: {'seconds': cost[0], 'peak_rss_bytes': int(cost[1])}
+                          for fmt, cost in self._costs.items()}
+            }
+    
+    def _expected_cost(self, output_format: str) -> Tuple[float, int]:
+        cost = self._costs.get(output_format)
+        if cost is not None:
+            return cost[0], int(cost[1])
+        return FORMAT_COST_PRIORS.get(output_format, DEFAULT_FORMAT_COST)
+    
+    def _record(self, output_format: str, duration: Optional[float], peak_rss_bytes: Optional[int]) -> None:
+        prior_duration, prior_rss = self._expected_cost(output_format)
+        if output_format not in self._costs:
+            # The first measurement replaces the prior outright
+            self._costs[output_format] = [duration or prior_duration, peak_rss_bytes or prior_rss]
+            return
+        cost = self._costs[output_format]
+        if duration is not None:
+            cost[0] += self.smoothing * (duration - cost[0])
+        if peak_rss_bytes:
+            cost[1] += self.smoothing * (peak_rss_bytes - cost[1])
+    
+    def _acquire(self, output_format: str) -> None:
+        """Block until a render of output_format may start."""
+        duration, rss = self.expected_cost(output_format)
+        # Longest renders first; ties in arrival order
+        entry = (-duration, next(self._sequence), output_format)
+        # Releases in other processes do not notify this one, so look again sooner
+        poll_interval = self.sample_interval if self._shared is None else min(self.sample_interval, 0.05)
+        with self._condition:
+            heapq.heappush(self._waiting, entry)
+            while not self._admit(entry, rss):
+                self._condition.wait(poll_interval)
+            heapq.heappop(self._waiting)
+            # The next waiter may fit as well
+            self._condition.notify_all()
+    
+    def _admit(self, entry: Tuple[float, int, str], rss: int) -> bool:
+        """Start the render of entry if it is first in line and fits; called with the lock held."""
+        if self._waiting[0] is not entry:
+            return False
+        with self._shared_lock:
+            if not self._has_room(rss):
+                return False
+            self._running += 1
+            self._started_since_sample += rss
+            self._peak_running = max(self._peak_running, self._running)
+        return True
+    
+    def _release(self, output_format: str, duration: Optional[float], peak_rss_bytes: Optional[int]) -> None:
+        with self._condition:
+            with self._shared_lock:
+                self._running -= 1
+            self._record(output_format, duration, peak_rss_bytes)
+            self._condition.notify_all()
+    
+    def _has_room(self, rss: int) -> bool:
+        """Whether one more render expected to peak at rss bytes may start; called with the lock held."""
+        if self._running < self.min_workers:
+            return True
+        if self._running >= self.max_workers:
+            return False
+        
+        sample = self._current_sample()
+        if sample.load is not None:
+            # The load average includes our own renders; the rest is other work
+            other_load = max(0.0, sample.load - self._running)
+            if self._running >= sample.cpu_count - other_load:
+                return False
+        if sample.available_memory is not None:
+            room = sample.available_memory - self.memory_reserve - self._started_since_sample
+            if room < rss:
+                return False
+        return True
+    
+    def _current_sample(self) -> SystemSample:
+        if self._shared is not None:
+            return self._current_shared_sample()
+        now = time.monotonic()
+        if self._sample is None or now - self._sampled_at >= self.sample_interval:
+            self._sample = self._probe()
+            self._sampled_at = now
+            # Renders started before this sample are part of its available memory
+            self._started_since_sample = 0
+            logger.debug(
+                f"Render concurrency: {self._running} running, load {self._sample.load}, "
+                f"available memory {self._sample.available_memory}"
+            )
+        return self._sample
+    
+    def _current_shared_sample(self) -> SystemSample:
+        """The sample shared with other processes, refreshed when stale; called with the shared lock held."""
+        shared = self._shared
+        now = time.time()
+        if now - shared.sampled_at.value >= self.sample_interval:
+            sample = self._probe()
+            shared.sampled_at.value = now
+            shared.cpu_count.value = sample.cpu_count
+            shared.load.value = -1.0 if sample.load is None else sample.load
+            shared.available_memory.value = -1 if sample.available_memory is None else sample.available_memory
+            # Renders started by any process before this sample are part of its available memory
+            shared.started_since_sample.value = 0
+            return sample
+        return SystemSample(
+            shared.cpu_count.value,
+            None if shared.load.value < 0 else shared.load.value,
+            None if shared.available_memory.value < 0 else shared.available_memory.value
+        )
@@ -6,21 +6,37 @@ intelligently split content for slides and notes generation.
 """
 
 import re
+import threading
+import multiprocessing
+from bisect import bisect_left
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 import os
 from enum import Enum
-from typing import Tuple, List, Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Tuple, List, Dict, Any, Optional, Pattern, Iterator, TextIO, Union
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 import yaml
 
 from ..utils.logger import get_logger
 from ..utils.exceptions import handle_exception, InputError
-from ..latex import LaTeXProcessor
-from ..utils.bibliography import render_bibliography_markdown
-from ..validation import ContentValidator, SlideOptimizer, ValidationResult, OptimizationResult
+from ..latex import (
+    LaTeXProcessor, LaTeXValidationResult, ExpressionChecks, parse_counter, check_line_range,
+    line_range_extents
+)
+from ..utils.bibliography import bibliography_cache
+from ..utils.file_io import write_if_changed, copy_if_changed
+from ..validation import (
+    ContentValidator, SlideOptimizer, ValidationResult, OptimizationResult,
+    ValidationIssue, IssueType, IssueSeverity, ValidationLevel
+)
+from .split_cache import SplitCache
+from .document_context import DocumentContext
 
 logger = get_logger(__name__)
 
+# Version of the directive parsing and routing rules; part of the split cache key
+PARSER_VERSION = "2"
+
 
 class ContentMode(Enum):
     """Content inclusion modes based on markdown directives."""
@@ -50,15 +66,166 @@ class ContentBlock:
     end_line: int
 
 
+@dataclass
+class DirectiveScan:
+    """Everything found by one directive scan over a run of lines."""
+    directives: List[DirectiveMatch] = field(default_factory=list)
+    fences: List[Tuple[int, str]] = field(default_factory=list)
+    malformed: List[Dict[str, Any]] = field(default_factory=list)
+    in_code_block: bool = False
+    code_block_fence: Optional[str] = None
+
+
+@dataclass
+class SplitState:
+    """Retained result of the last split, used to re-split edited content incrementally."""
+    lines: List[str]
+    directives: List[DirectiveMatch]
+    fences: List[Tuple[int, str]]
+    malformed: List[Dict[str, Any]]
+    blocks: List[ContentBlock]
+    latex_validation_result: Any
+    validation_result: Optional[ValidationResult]
+
+
+@dataclass(frozen=True)
+class SplitResult:
+    """
+    Immutable result of splitting one document.
+    
+    Holds everything produced for the document so that a single ContentSplitter
+    can be shared by concurrent callers. Results restored from the split cache
+    carry no blocks or directives.
+    """
+    slides: str
+    notes: str
+    blocks: Tuple[ContentBlock, ...]
+    directives: Tuple[DirectiveMatch, ...]
+    warnings: Tuple[str, ...]
+    slide_boundaries: Tuple[int, ...]
+    malformed_directives: Tuple[Dict[str, Any], ...] = ()
+    latex_validation_result: Optional[LaTeXValidationResult] = None
+    validation_result: Optional[ValidationResult] = None
+    from_cache: bool = False
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the dictionary form returned by process_directives."""
+        return {
+            "slides": self.slides,
+            "notes": self.notes,
+            "blocks": list(self.blocks),
+            "directives": list(self.directives),
+            "warnings": list(self.warnings)
+        }
+
+
 @dataclass
 class SlideSection:
+    """
+    One slide worth of content.
+    
+    The content is kept as the slice source[start:end] of the buffer the
+    section was indexed from, and is only copied out when accessed.
+    """
     title: str
-    content: str
+    source: str
     slide_number: int
     header_level: int = 1
     has_code: bool = False
     has_math: bool = False
     word_count: int = 0
+    start: int = 0
+    end: Optional[int] = None
+    body_start: Optional[int] = None  # Offset just past the first line
+    
+    @property
+    def content(self) -> str:
+        """Markdown content of the section."""
+        return self.source[self.start:self.end]
+
+
+class SectionIndex:
+    """
+    Slide sections of a slides buffer, found in a single scan.
+    
+    A section starts at a header line, or at the first non-blank line after
+    a '---' separator or at the top of the buffer, and runs until the next
+    header or separator. Each section records its offsets in the buffer, its
+    header, whether its body contains code or math, and its word count.
+    """
+    
+    # Header lines and '---' separator lines; [^\S\n] keeps matches on one line
+    BOUNDARY_PATTERN = re.compile(
+        r'^(?:(#{1,6})[^\S\n]+(.+)|[^\S\n]*---[^\S\n]*$)', re.MULTILINE
+    )
+    TEXT_PATTERN = re.compile(r'\S')
+    
+    def __init__(self, source: str, sections: List[SlideSection], header_offsets: List[int]):
+        self.source = source
+        self.sections = sections
+        self.header_offsets = header_offsets
+    
+    @classmethod
+    def build(cls, content: str) -> 'SectionIndex':
+        """
+        Index the slide sections of content.
+        
+        Args:
+            content: Slides markdown
+            
+        Returns:
+            SectionIndex whose source is content with every line newline-terminated
+        """
+        source = content + '\n'
+        sections = []
+        header_offsets = []
+        
+        def add_section(start: int, end: int, title: str, header_level: int):
+            body_start = source.index('\n', start) + 1
+            sections.append(SlideSection(
+                title=title,
+                source=source,
+                slide_number=len(sections) + 1,
+                header_level=header_level,
+                has_code=source.find('```', body_start, end) != -1,
+                has_math=source.find('$', body_start, end) != -1,
+                word_count=len(source[start:end].split()),
+                start=start,
+                end=end,
+                body_start=body_start
+            ))
+        
+        def add_introduction(start: int, end: int):
+            # Text before the first header (or after a separator) starts at its first non-blank line
+            first_text = cls.TEXT_PATTERN.search(source, start, end)
+            if first_text is not None:
+                line_start = source.rfind('\n', start, first_text.start()) + 1
+                add_section(max(line_start, start), end, "Introduction", 1)
+        
+        # Start of the section being collected, and its header if it has one
+        section_start = 0
+        header = None
+        for boundary in cls.BOUNDARY_PATTERN.finditer(source):
+            offset = boundary.start()
+            if header is not None:
+                add_section(section_start, offset, header[0], header[1])
+            else:
+                add_introduction(section_start, offset)
+            
+            if boundary.group(1):
+                header = (boundary.group(2), len(boundary.group(1)))
+                section_start = offset
+                header_offsets.append(offset)
+            else:
+                header = None
+                section_start = boundary.end() + 1
+        
+        if header is not None:
+            add_section(section_start, len(source), header[0], header[1])
+        else:
+            add_introduction(section_start, len(source))
+        
+        return cls(source, sections, header_offsets)
 
 
 class MarkdownDirectiveParser:  # restore original class header (implementation below remains intact)
@@ -80,85 +247,190 @@ class MarkdownDirectiveParser:  # restore original class header (implementation
         r'<!--\s*ALL\s*-->': ContentMode.ALL,
     }
     
+    # Malformed-directive candidates: single-token HTML comments such as <!-- SLDIE -->
+    MALFORMED_PATTERN = r'<!--\s*[A-Z-]+\s*-->'
+    MALFORMED_KEYWORDS = ('SLIDE', 'SLDIE', 'NOTE', 'ALL')
+    
+    # Bibliography insertion: <!-- INSERT-BIB filename.bib -->
+    BIB_DIRECTIVE_PATTERN = re.compile(r'<!--\s*INSERT-BIB\s+([^\s]+)\s*-->', re.IGNORECASE)
+
     def __init__(self):
         self.current_mode = ContentMode.ALL
         self.directive_stack = []  # For tracking nested directives
         self.malformed_directives = []
-        
+
+    @classmethod
+    def _get_scanner(cls) -> Tuple[Pattern, Dict[str, ContentMode]]:
+        """
+        Build (once per class) the combined scanner used by parse_directives.
+
+        The scanner is a single alternation of code fence markers, every entry of
+        DIRECTIVE_PATTERNS as a named group, and malformed-directive candidates.
+        Whitespace is restricted to horizontal whitespace so that no match ever
+        spans more than one line of the buffer.
+
+        Returns:
+            Tuple of (compiled scanner, mapping of group name to ContentMode)
+        """
+        cached = cls.__dict__.get('_scanner')
+        if cached is not None:
+            return cached
+
+        def single_line(pattern: str) -> str:
+            return pattern.replace(r'\s', r'[^\S\n]')
+
+        group_modes: Dict[str, ContentMode] = {}
+        alternatives = [r'(?P<fence>^[^\S\n]*(?:```|~~~))']
+        for index, (pattern, mode) in enumerate(cls.DIRECTIVE_PATTERNS.items()):
+            name = f'directive_{index}'
+            group_modes[name] = mode
+            alternatives.append(f'(?P<{name}>{single_line(pattern)})')
+        # Malformed candidates come last so valid directives always win
+        alternatives.append(f'(?P<malformed>{single_line(cls.MALFORMED_PATTERN)})')
+
+        scanner = re.compile('|'.join(alternatives), re.IGNORECASE | re.MULTILINE)
+        cls._scanner = (scanner, group_modes)
+        return cls._scanner
+
     def parse_directives(self, content: str) -> List[DirectiveMatch]:
         """
         Parse all directives in the markdown content.
         
+        The whole buffer is scanned once with a combined pattern; code fences,
+        inline code and malformed directives are all handled in the same pass.
+        
         Args:
             content: Raw markdown content
             
         Returns:
             List of DirectiveMatch objects in order of appearance
         """
-        directives = []
-        lines = content.split('\n')
+        scan = self.scan_directives(content)
+        # Malformed directives describe the last parsed content only
+        self.malformed_directives = scan.malformed
+        for malformed in scan.malformed:
+            logger.warning(f"Possible malformed directive at line {malformed['line']}: {malformed['text']}")
+        return scan.directives
+
+    def scan_directives(
+        self,
+        content: str,
+        first_line: int = 1,
+        in_code_block: bool = False,
+        code_block_fence: Optional[str] = None
+    ) -> DirectiveScan:
+        """
+        Scan a run of whole lines for directives, code fences and malformed directives.
         
-        # Track code block state
-        in_code_block = False
-        code_block_fence = None
+        The scan can start anywhere in a document: ``first_line`` gives the line
+        number of the first line of ``content`` and the fence arguments give the
+        code block state in effect before it. The parser itself is not modified.
         
-        for line_num, line in enumerate(lines, 1):
-            # Check for code block boundaries
-            stripped_line = line.strip()
+        Args:
+            content: One or more complete lines of markdown
+            first_line: Line number of the first line of content
+            in_code_block: Whether content starts inside a fenced code block
+            code_block_fence: Fence marker of the open code block, if any
             
-            # Check for fenced code blocks (``` or ~~~)
-            if stripped_line.startswith('```') or stripped_line.startswith('~~~'):
+        Returns:
+            DirectiveScan with everything found and the code block state at the end
+        """
+        scanner, group_modes = self._get_scanner()
+        scan = DirectiveScan()
+        fence_line = 0
+        
+        # Track line number and line start incrementally as matches advance
+        line_num = first_line
+        line_start = 0
+        scanned_to = 0
+        
+        for match in scanner.finditer(content):
+            start = match.start()
+            newlines = content.count('\n', scanned_to, start)
+            if newlines:
+                line_num += newlines
+                line_start = content.rfind('\n', scanned_to, start) + 1
+            scanned_to = start
+            
+            kind = match.lastgroup
+            
+            # Fenced code blocks (``` or ~~~); the fence line itself is never parsed
+            if kind == 'fence':
+                marker = match.group()[-3:]
                 if not in_code_block:
                     in_code_block = True
-                    code_block_fence = stripped_line[:3]
-                elif code_block_fence and stripped_line.startswith(code_block_fence):
+                    code_block_fence = marker
+                elif marker == code_block_fence:
                     in_code_block = False
                     code_block_fence = None
+                fence_line = line_num
+                scan.fences.append((line_num, marker))
                 continue
             
-            # Skip directive parsing if we're inside a code block
-            if in_code_block:
+            if kind == 'malformed':
+                malformed = self._malformed_directive_entry(match.group().strip(), line_num)
+                if malformed:
+                    scan.malformed.append(malformed)
                 continue
             
-            # Check for inline code and skip directives inside backticks
-            if '`' in line:
-                # Find all directive matches and check if they're inside inline code
-                for pattern, mode in self.DIRECTIVE_PATTERNS.items():
-                    matches = re.finditer(pattern, line, re.IGNORECASE)
-                    for match in matches:
-                        if not self._is_inside_inline_code(line, match.start(), match.end()):
-                            directive = DirectiveMatch(
-                                directive=match.group().strip(),
-                                mode=mode,
-                                line_number=line_num,
-                                position=match.start(),
-                                raw_match=match.group()
-                            )
-                            directives.append(directive)
-                            logger.debug(f"Found directive '{directive.directive}' at line {line_num}")
-            else:
-                # No inline code, process normally
-                for pattern, mode in self.DIRECTIVE_PATTERNS.items():
-                    matches = re.finditer(pattern, line, re.IGNORECASE)
-                    for match in matches:
-                        directive = DirectiveMatch(
-                            directive=match.group().strip(),
-                            mode=mode,
-                            line_number=line_num,
-                            position=match.start(),
-                            raw_match=match.group()
-                        )
-                        directives.append(directive)
-                        logger.debug(f"Found directive '{directive.directive}' at line {line_num}")
-        
-        # Check for malformed directives (HTML comments that look like directives but don't match)
-        self._check_malformed_directives(content, lines)
-        
-        return sorted(directives, key=lambda d: (d.line_number, d.position))
+            # Skip directive parsing inside code blocks and on fence lines
+            if in_code_block or line_num == fence_line:
+                continue
+            
+            # Skip directives inside inline code (backticks)
+            line_end = content.find('\n', start)
+            if line_end == -1:
+                line_end = len(content)
+            if content.find('`', line_start, line_end) != -1:
+                line = content[line_start:line_end]
+                if self._is_inside_inline_code(line, start - line_start, match.end() - line_start):
+                    continue
+            
+            directive = DirectiveMatch(
+                directive=match.group().strip(),
+                mode=group_modes[kind],
+                line_number=line_num,
+                position=start - line_start,
+                raw_match=match.group()
+            )
+            scan.directives.append(directive)
+            logger.debug(f"Found directive '{directive.directive}' at line {line_num}")
+        
+        scan.in_code_block = in_code_block
+        scan.code_block_fence = code_block_fence
+        return scan
+
+    @staticmethod
+    def fence_state_after(fences: List[Tuple[int, str]], line_number: int) -> Tuple[bool, Optional[str]]:
+        """
+        Replay fence markers to find the code block state after a given line.
+        
+        Args:
+            fences: (line, marker) pairs as recorded by scan_directives
+            line_number: Last line whose fences are taken into account
+            
+        Returns:
+            Tuple of (in_code_block, code_block_fence)
+        """
+        in_code_block = False
+        code_block_fence = None
+        for fence_line, marker in fences:
+            if fence_line > line_number:
+                break
+            if not in_code_block:
+                in_code_block = True
+                code_block_fence = marker
+            elif marker == code_block_fence:
+                in_code_block = False
+                code_block_fence = None
+        return in_code_block, code_block_fence
 
     def expand_bibliography(self, content: str, base_path: Optional[Path] = None) -> str:
         """Expand bibliography insertion directives of the form <!-- INSERT-BIB filename.bib -->.
 
+        Rendered bibliographies come from the process-wide bibliography cache,
+        so unchanged .bib files are not read again.
+
         Args:
             content: Raw markdown content
             base_path: Optional base path for resolving bib filename (defaults to CWD)
@@ -166,26 +438,33 @@ class MarkdownDirectiveParser:  # restore original class header (implementation
         Returns:
             Content with bibliography directive replaced by generated markdown.
         """
-        pattern = re.compile(r'<!--\s*INSERT-BIB\s+([^\s]+)\s*-->', re.IGNORECASE)
-
         def repl(match):
             bib_name = match.group(1).strip()
-            # Resolve path: relative to base_path if provided, else current working directory
-            if base_path:
-                candidate = (base_path / bib_name).resolve()
-            else:
-                candidate = Path(os.getcwd()) / bib_name
+            candidate = self._resolve_bibliography(bib_name, base_path)
             try:
-                rendered = render_bibliography_markdown(candidate)
+                rendered = bibliography_cache.render(candidate)
             except Exception as e:
                 logger.error(f"Bibliography rendering failed for {bib_name}: {e}")
                 return f"> Error rendering bibliography '{bib_name}': {e}"
             return "\n" + rendered.strip() + "\n"
 
         if '<!--' in content and 'INSERT-BIB' in content.upper():
-            content = pattern.sub(repl, content)
+            content = self.BIB_DIRECTIVE_PATTERN.sub(repl, content)
         return content
     
+    def bibliography_inputs(self, content: str, base_path: Optional[Path] = None) -> List[Path]:
+        """List the .bib files that expand_bibliography would read for this content."""
+        if '<!--' not in content or 'INSERT-BIB' not in content.upper():
+            return []
+        return [self._resolve_bibliography(match.group(1).strip(), base_path)
+                for match in self.BIB_DIRECTIVE_PATTERN.finditer(content)]
+    
+    def _resolve_bibliography(self, bib_name: str, base_path: Optional[Path]) -> Path:
+        """Resolve a bib filename relative to base_path if provided, else the current working directory."""
+        if base_path:
+            return (base_path / bib_name).resolve()
+        return Path(os.getcwd()) / bib_name
+    
     def _is_inside_inline_code(self, line: str, start_pos: int, end_pos: int) -> bool:
         """Check if a position range is inside inline code (backticks)."""
         # Find all backtick pairs in the line
@@ -227,27 +506,18 @@ class MarkdownDirectiveParser:  # restore original class header (implementation
         
         return False
     
-    def _check_malformed_directives(self, content: str, lines: List[str]):
-        """Check for malformed directives and log warnings."""
-        # Look for HTML comments that might be malformed directives
-        malformed_pattern = r'<!--\s*[A-Z-]+\s*-->'
-        
-        for line_num, line in enumerate(lines, 1):
-            matches = re.finditer(malformed_pattern, line, re.IGNORECASE)
-            for match in matches:
-                directive_text = match.group().strip()
-                # Check if it's not a valid directive
-                is_valid = any(re.match(pattern, directive_text, re.IGNORECASE) 
-                             for pattern in self.DIRECTIVE_PATTERNS.keys())
-                
-                if not is_valid and any(keyword in directive_text.upper() 
-                                      for keyword in ['SLIDE', 'SLDIE', 'NOTE', 'ALL']):
-                    self.malformed_directives.append({
-                        'text': directive_text,
-                        'line': line_num,
-                        'suggestion': self._suggest_correction(directive_text)
-                    })
-                    logger.warning(f"Possible malformed directive at line {line_num}: {directive_text}")
+    def _malformed_directive_entry(self, directive_text: str, line_num: int) -> Optional[Dict[str, Any]]:
+        """Describe a malformed directive candidate, or return None if it is not one."""
+        # Only comments that look like directives are reported
+        upper_text = directive_text.upper()
+        if not any(keyword in upper_text for keyword in self.MALFORMED_KEYWORDS):
+            return None
+        
+        return {
+            'text': directive_text,
+            'line': line_num,
+            'suggestion': self._suggest_correction(directive_text)
+        }
     
     def _suggest_correction(self, malformed: str) -> str:
         """Suggest correction for malformed directive."""
@@ -293,15 +563,38 @@ class MarkdownDirectiveParser:  # restore original class header (implementation
             )]
         
         lines = content.split('\n')
+        return self.collect_blocks(lines, directives, 1, len(lines), ContentMode.ALL)
+    
+    def collect_blocks(
+        self,
+        lines: List[str],
+        directives: List[DirectiveMatch],
+        first_line: int,
+        last_line: int,
+        mode: ContentMode
+    ) -> List[ContentBlock]:
+        """
+        Build the content blocks for a line range of an already split document.
+        
+        Args:
+            lines: All lines of the document
+            directives: Directives lying strictly inside the range
+            first_line: First line of the range
+            last_line: Last line of the range
+            mode: Content mode in effect at first_line
+            
+        Returns:
+            List of non-empty ContentBlock objects within the range
+        """
         blocks = []
-        current_mode = ContentMode.ALL
-        current_block_start = 1
+        current_mode = mode
+        current_block_start = first_line
         
         # Add a sentinel directive at the end to process the final block
         final_directive = DirectiveMatch(
             directive="<!-- END -->",
             mode=ContentMode.ALL,
-            line_number=len(lines) + 1,
+            line_number=last_line + 1,
             position=0,
             raw_match="<!-- END -->"
         )
@@ -322,7 +615,7 @@ class MarkdownDirectiveParser:  # restore original class header (implementation
                     ))
             
             # Update state based on directive (except for the sentinel)
-            if directive != final_directive:
+            if directive is not final_directive:
                 current_mode = self._update_state(current_mode, directive)
                 current_block_start = directive.line_number + 1
         
@@ -365,42 +658,176 @@ class MarkdownDirectiveParser:  # restore original class header (implementation
         Returns:
             List of validation warning messages
         """
-        warnings = []
-        mode_stack = []
-        current_mode = ContentMode.ALL
-        
+        checker = DirectiveStructureChecker()
         for directive in directives:
-            if directive.mode in [ContentMode.SLIDES_ONLY, ContentMode.NOTES_ONLY]:
-                # Entering a special mode
-                if current_mode != ContentMode.ALL:
-                    warnings.append(f"Line {directive.line_number}: Nested mode directive {directive.mode.value} "
-                                  f"while already in {current_mode.value} mode")
-                mode_stack.append((directive, current_mode))
-                current_mode = directive.mode
-                
-            elif directive.mode == ContentMode.NOTES_SLIDE_BOUNDARY:
-                # NOTES directive acts as slide boundary + notes-only mode
-                if current_mode != ContentMode.ALL:
-                    warnings.append(f"Line {directive.line_number}: NOTES directive while already in {current_mode.value} mode")
-                mode_stack.append((directive, current_mode))
-                current_mode = ContentMode.NOTES_ONLY
-                
-            elif directive.mode == ContentMode.ALL:
-                # Returning to ALL mode
-                if mode_stack:
-                    mode_stack.pop()
-                    current_mode = ContentMode.ALL
-                else:
-                    warnings.append(f"Line {directive.line_number}: <!-- ALL --> without matching mode directive")
+            checker.add(directive)
+        return checker.finish()
+
+
+class DirectiveStructureChecker:
+    """
+    Incremental directive structure validation.
+    
+    Directives are fed one at a time in document order; only the stack of
+    currently open mode directives is kept, so the check can run while a
+    document is being streamed.
+    """
+    
+    def __init__(self):
+        self.warnings: List[str] = []
+        self.mode_stack: List[Tuple[int, ContentMode]] = []  # (line, mode) of open directives
+        self.current_mode = ContentMode.ALL
+    
+    def add(self, directive: DirectiveMatch):
+        """Check the next directive against the current mode stack."""
+        if directive.mode in [ContentMode.SLIDES_ONLY, ContentMode.NOTES_ONLY]:
+            # Entering a special mode
+            if self.current_mode != ContentMode.ALL:
+                self.warnings.append(f"Line {directive.line_number}: Nested mode directive {directive.mode.value} "
+                                     f"while already in {self.current_mode.value} mode")
+            self.mode_stack.append((directive.line_number, directive.mode))
+            self.current_mode = directive.mode
+            
+        elif directive.mode == ContentMode.NOTES_SLIDE_BOUNDARY:
+            # NOTES directive acts as slide boundary + notes-only mode
+            if self.current_mode != ContentMode.ALL:
+                self.warnings.append(f"Line {directive.line_number}: NOTES directive while already in {self.current_mode.value} mode")
+            self.mode_stack.append((directive.line_number, directive.mode))
+            self.current_mode = ContentMode.NOTES_ONLY
             
-            # SLIDE_BOUNDARY doesn't change the mode stack
+        elif directive.mode == ContentMode.ALL:
+            # Returning to ALL mode
+            if self.mode_stack:
+                self.mode_stack.pop()
+                self.current_mode = ContentMode.ALL
+            else:
+                self.warnings.append(f"Line {directive.line_number}: <!-- ALL --> without matching mode directive")
         
-        # Check for unclosed mode directives
-        if mode_stack:
-            for unclosed_directive, _ in mode_stack:
-                warnings.append(f"Line {unclosed_directive.line_number}: Unclosed {unclosed_directive.mode.value} directive")
+        # SLIDE_BOUNDARY doesn't change the mode stack
+    
+    def finish(self) -> List[str]:
+        """
+        Complete the check at the end of the document.
         
-        return warnings
+        Returns:
+            List of validation warning messages
+        """
+        # Check for unclosed mode directives
+        for line_number, mode in self.mode_stack:
+            self.warnings.append(f"Line {line_number}: Unclosed {mode.value} directive")
+        self.mode_stack = []
+        return self.warnings
+
+
+class _SplitStream:
+    """
+    Line-at-a-time directive state machine used by ContentSplitter.iter_split.
+    
+    Reproduces process_content_blocks and the slides/notes routing of
+    process_directives without materializing blocks: each block is written
+    out line by line, holding back only its last non-blank line and any blank
+    lines after it until it is known whether they are trailing whitespace.
+    """
+    
+    BOUNDARY_MODES = (ContentMode.SLIDE_BOUNDARY, ContentMode.NOTES_SLIDE_BOUNDARY)
+    TARGETS = {
+        ContentMode.SLIDES_ONLY: ('slides',),
+        ContentMode.NOTES_ONLY: ('notes',),
+        ContentMode.ALL: ('slides', 'notes'),
+    }
+    
+    def __init__(self, parser: MarkdownDirectiveParser):
+        self.parser = parser
+        self.line_num = 0
+        self.in_code_block = False
+        self.code_block_fence: Optional[str] = None
+        self.mode = ContentMode.ALL
+        self.structure = DirectiveStructureChecker()
+        self.directive_count = 0
+        self.slide_boundaries: List[int] = []
+        self.malformed: List[Dict[str, Any]] = []
+        self.after_boundary = False
+        # Per output: whether anything was written, and whether the last block is a '---' rule
+        self.has_blocks = {'slides': False, 'notes': False}
+        self.slides_end_with_rule = False
+        self._reset_block()
+    
+    def _reset_block(self):
+        self.block_started = False
+        self.block_targets: Tuple[str, ...] = ()
+        self.held_line = ''
+        self.pending_blank: List[str] = []
+        self.nonblank_lines = 0
+    
+    def feed(self, line: str) -> List[Tuple[str, str]]:
+        """Consume one line (without its newline) and return the chunks it completes."""
+        self.line_num += 1
+        
+        # Only lines with a comment or fence marker can change parser state
+        if '<!--' in line or '```' in line or '~~~' in line:
+            scan = self.parser.scan_directives(line, self.line_num, self.in_code_block, self.code_block_fence)
+            self.in_code_block = scan.in_code_block
+            self.code_block_fence = scan.code_block_fence
+            self.malformed.extend(scan.malformed)
+            if scan.directives:
+                chunks = self._end_block()
+                self.after_boundary = False
+                for directive in scan.directives:
+                    self.mode = self.parser._update_state(self.mode, directive)
+                    self.structure.add(directive)
+                    if directive.mode in self.BOUNDARY_MODES:
+                        self.after_boundary = True
+                        self.slide_boundaries.append(directive.line_number)
+                self.directive_count += len(scan.directives)
+                return chunks
+        
+        return self._add_line(line)
+    
+    def close(self) -> List[Tuple[str, str]]:
+        """Finish the last block and return its remaining chunks."""
+        return self._end_block()
+    
+    def _add_line(self, line: str) -> List[Tuple[str, str]]:
+        if not line.strip():
+            # Leading blank lines are stripped; inner ones wait for the next text line
+            if self.block_started:
+                self.pending_blank.append(line)
+            return []
+        
+        self.nonblank_lines += 1
+        if self.block_started:
+            text = self.held_line + '\n' + ''.join(blank + '\n' for blank in self.pending_blank)
+            self.pending_blank = []
+            self.held_line = line
+            return [(target, text) for target in self.block_targets]
+        
+        # First text line of a new block
+        chunks = []
+        self.block_started = True
+        self.block_targets = self.TARGETS.get(self.mode, ())
+        self.held_line = line.lstrip()
+        
+        if self.after_boundary and self.has_blocks['slides'] and not self.slides_end_with_rule:
+            chunks.append(('slides', '\n\n---'))
+            self.slides_end_with_rule = True
+        
+        for target in self.block_targets:
+            if self.has_blocks[target]:
+                chunks.append((target, '\n\n'))
+            self.has_blocks[target] = True
+        return chunks
+    
+    def _end_block(self) -> List[Tuple[str, str]]:
+        if not self.block_started:
+            self._reset_block()
+            return []
+        
+        text = self.held_line.rstrip()
+        chunks = [(target, text) for target in self.block_targets]
+        if 'slides' in self.block_targets:
+            self.slides_end_with_rule = self.nonblank_lines == 1 and text == '---'
+        self._reset_block()
+        return chunks
 
 
 class ContentSplitter:
@@ -411,8 +838,33 @@ class ContentSplitter:
     split content for slides and notes generation with proper error handling.
     """
     
-    def __init__(self):
+    # Documents shorter than two shards of this many lines are never sharded
+    SHARD_MIN_LINES = 1000
+    # Shards per worker process, so that uneven shards still balance out
+    SHARDS_PER_WORKER = 2
+    
+    def __init__(
+        self,
+        split_cache: Optional[SplitCache] = None,
+        validation_level: Union[str, ValidationLevel] = ValidationLevel.FULL,
+        defer_validation: bool = False,
+        shard_workers: int = 0
+    ):
+        """
+        Args:
+            split_cache: Optional on-disk cache of split results
+            validation_level: How much validation to run on each split ('none',
+                'fast', 'standard' or 'full')
+            defer_validation: Skip LaTeX and content validation in incremental
+                splits and run it later through start_deferred_validation (watch mode)
+            shard_workers: Validate large documents in this many worker processes,
+                sharded at slide boundaries (0 or 1 validates in this process)
+        """
         self.parser = MarkdownDirectiveParser()
+        self.split_cache = split_cache
+        self.validation_level = ValidationLevel(validation_level)
+        self.defer_validation = defer_validation
+        self.shard_workers = shard_workers
         self.latex_processor = LaTeXProcessor()
         self.content_validator = ContentValidator()
         self.slide_optimizer = SlideOptimizer()
@@ -421,14 +873,23 @@ class ContentSplitter:
         self.latex_validation_result = None
         self.validation_result = None
         self.optimization_result = None
+        self.split_state: Optional[SplitState] = None
+        self._validation_lock = threading.Lock()
+        self._validation_executor: Optional[ThreadPoolExecutor] = None
+        self._deferred_validation: Optional[Future] = None
+        self._validation_generation = 0
     
     @handle_exception
-    def split_content(self, filepath: str) -> Tuple[str, str]:
+    def split_content(self, filepath: str, incremental: bool = False) -> Tuple[str, str]:
         """
         Split markdown content into slides and notes based on directives.
         
+        Per-document results are also kept on the splitter for the getters; use
+        split_file to split without touching shared state.
+        
         Args:
             filepath: Path to markdown file
+            incremental: Re-split relative to the previous call (see process_directives_incremental)
             
         Returns:
             Tuple of (slides_content, notes_content)
@@ -436,6 +897,11 @@ class ContentSplitter:
         Raises:
             InputError: If file cannot be read or processed
         """
+        if not incremental:
+            result = self.split_file(filepath)
+            self._apply_result(result)
+            return result.slides, result.notes
+        
         logger.info(f"Processing file: {filepath}")
         
         file_path = Path(filepath)
@@ -446,82 +912,602 @@ class ContentSplitter:
             content = file_path.read_text(encoding='utf-8')
             logger.debug(f"Read {len(content)} characters from {filepath}")
             
-            # Process the content using the directive parser
-            processed = self.process_directives(content)
-            
+            processed = self.process_directives_incremental(content)
             return processed["slides"], processed["notes"]
             
         except Exception as e:
             raise InputError(f"Error processing file {filepath}: {e}")
     
-    def process_directives(self, content: str) -> Dict[str, Any]:
+    def split_file(self, filepath: str) -> SplitResult:
         """
-        Process markdown directives and split content accordingly.
+        Split a markdown file without modifying the splitter.
+        
+        Safe to call from several threads on one splitter. Uses the split cache
+        when one is configured.
+        
+        Args:
+            filepath: Path to markdown file
+            
+        Returns:
+            SplitResult for the file
+            
+        Raises:
+            InputError: If file cannot be read or processed
+        """
+        logger.info(f"Processing file: {filepath}")
+        
+        file_path = Path(filepath)
+        if not file_path.exists():
+            raise InputError(f"File not found: {filepath}")
+        
+        try:
+            source = file_path.read_bytes()
+            content = source.decode('utf-8')
+            logger.debug(f"Read {len(content)} characters from {filepath}")
+            
+            if self.split_cache is None:
+                return self.split(content)
+            
+            cache_key = self.split_cache.make_key(
+                source, self.split_options,
+                self.parser.bibliography_inputs(content, base_path=Path.cwd())
+            )
+            entry = self.split_cache.get(cache_key)
+            if entry is not None:
+                logger.info(f"Using cached split for {filepath}")
+                return self._result_from_cache_entry(entry)
+            
+            result = self.split(content)
+            self.split_cache.put(cache_key, self._result_to_cache_entry(result))
+            return result
+            
+        except InputError:
+            raise
+        except Exception as e:
+            raise InputError(f"Error processing file {filepath}: {e}")
+    
+    @property
+    def split_options(self) -> str:
+        """Identifies the parser version and settings that the split output depends on."""
+        return f"{PARSER_VERSION}:{self.validation_level.value}"
+    
+    def source_files(self, filepath: str) -> List[Path]:
+        """
+        List the files a split of filepath reads.
+        
+        Returns:
+            The document followed by the .bib files it inserts
+        """
+        file_path = Path(filepath)
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return [file_path]
+        return [file_path] + self.parser.bibliography_inputs(content, base_path=Path.cwd())
+    
+    def iter_split(self, filepath: str) -> Iterator[Tuple[str, str]]:
+        """
+        Stream a markdown file through the directive state machine.
+        
+        The file is read line by line and routed content is yielded as
+        ('slides', chunk) and ('notes', chunk) pairs as soon as it is final.
+        Concatenating the chunks of each target gives exactly the slides and
+        notes returned by split_content, while memory stays bounded by the
+        longest run of lines held back at a block boundary.
+        
+        LaTeX and content validation need the whole document and are skipped;
+        slide boundaries and directive warnings are recorded as usual.
+        
+        Args:
+            filepath: Path to markdown file
+            
+        Yields:
+            Tuples of (target, chunk) where target is 'slides' or 'notes'
+            
+        Raises:
+            InputError: If the file does not exist
+        """
+        file_path = Path(filepath)
+        if not file_path.exists():
+            raise InputError(f"File not found: {filepath}")
+        
+        logger.info(f"Streaming file: {filepath}")
+        stream = _SplitStream(self.parser)
+        
+        with open(file_path, 'r', encoding='utf-8') as source:
+            for line in source:
+                if line.endswith('\n'):
+                    line = line[:-1]
+                if '<!--' in line and 'INSERT-BIB' in line.upper():
+                    expanded_lines = self.parser.expand_bibliography(line, base_path=Path.cwd()).split('\n')
+                else:
+                    expanded_lines = (line,)
+                for expanded_line in expanded_lines:
+                    yield from stream.feed(expanded_line)
+        yield from stream.close()
+        
+        logger.info(f"Found {stream.directive_count} directives")
+        warnings = stream.structure.finish() if self.validation_level != ValidationLevel.NONE else []
+        self._log_directive_warnings(warnings, stream.malformed)
+        self._apply_result(SplitResult(
+            slides='',
+            notes='',
+            blocks=(),
+            directives=(),
+            warnings=tuple(warnings),
+            slide_boundaries=tuple(stream.slide_boundaries),
+            malformed_directives=tuple(stream.malformed)
+        ))
+    
+    def split_to_writers(self, filepath: str, slides_writer: TextIO, notes_writer: TextIO) -> Tuple[int, int]:
+        """
+        Split a markdown file, writing slides and notes straight to two writers.
+        
+        Args:
+            filepath: Path to markdown file
+            slides_writer: Text stream receiving the slides markdown
+            notes_writer: Text stream receiving the notes markdown
+            
+        Returns:
+            Tuple of (slides_chars, notes_chars) written
+        """
+        writers = {'slides': slides_writer, 'notes': notes_writer}
+        written = {'slides': 0, 'notes': 0}
+        for target, chunk in self.iter_split(filepath):
+            writers[target].write(chunk)
+            written[target] += len(chunk)
+        return written['slides'], written['notes']
+    
+    def split(self, content: str, context: Optional[DocumentContext] = None) -> SplitResult:
+        """
+        Split markdown content into slides and notes without modifying the splitter.
+        
+        LaTeX and content validation use processors created for this call, so
+        one splitter can serve concurrent callers. LaTeX expressions are parsed
+        once through a DocumentContext and the result is shared with the content
+        validator. What is validated depends on the splitter's validation_level.
         
         Args:
             content: Raw markdown content
+            context: Analysis context of the content; ignored unless its content
+                matches the content after INSERT-BIB expansion
             
         Returns:
-            Dictionary with 'slides' and 'notes' content
+            SplitResult holding the output and all per-document state
         """
         logger.debug("Processing markdown directives")
-
+        
         # Expand bibliography directives before parsing other directives
         content = self.parser.expand_bibliography(content, base_path=Path.cwd())
         # Parse all directives in the content (after expansion)
-        directives = self.parser.parse_directives(content)
+        scan = self.parser.scan_directives(content)
+        directives = scan.directives
         logger.info(f"Found {len(directives)} directives")
         
         # Validate directive structure
-        self.validation_warnings = self.parser.validate_directive_structure(directives)
-        for warning in self.validation_warnings:
-            logger.warning(warning)
-        
-        # Report malformed directives
-        for malformed in self.parser.malformed_directives:
-            logger.warning(f"Malformed directive at line {malformed['line']}: {malformed['text']} "
-                         f"(suggestion: {malformed['suggestion']})")
+        warnings = self._check_directive_structure(directives)
+        self._log_directive_warnings(warnings, scan.malformed)
         
         # Process content into blocks
         content_blocks = self.parser.process_content_blocks(content, directives)
         logger.debug(f"Created {len(content_blocks)} content blocks")
         
-        # Validate LaTeX expressions in the content
-        self.latex_validation_result = self.latex_processor.process_content(content)
-        if not self.latex_validation_result.is_valid:
-            logger.warning(f"Found {len(self.latex_validation_result.errors)} LaTeX errors")
-            for error in self.latex_validation_result.errors:
+        latex_validation_result, validation_result = None, None
+        if self.validation_level.includes(ValidationLevel.STANDARD):
+            shards = self._plan_shards(content, directives)
+            if context is not None and context.content == content:
+                latex_validation_result, validation_result = self._validate(context)
+            elif len(shards) > 1:
+                latex_validation_result, validation_result = self._validate_sharded(content, shards)
+            else:
+                latex_validation_result, validation_result = self._validate(DocumentContext(content))
+        
+        slides_content, notes_content, slide_boundaries = self._route_blocks(content_blocks, directives)
+        
+        return SplitResult(
+            slides=slides_content,
+            notes=notes_content,
+            blocks=tuple(content_blocks),
+            directives=tuple(directives),
+            warnings=tuple(warnings),
+            slide_boundaries=tuple(slide_boundaries),
+            malformed_directives=tuple(scan.malformed),
+            latex_validation_result=latex_validation_result,
+            validation_result=validation_result
+        )
+    
+    def process_directives(self, content: str) -> Dict[str, Any]:
+        """
+        Process markdown directives and split content accordingly.
+        
+        Compatibility wrapper around split that also stores the per-document
+        results on the splitter for the getters.
+        
+        Args:
+            content: Raw markdown content
+            
+        Returns:
+            Dictionary with 'slides' and 'notes' content
+        """
+        result = self.split(content)
+        self._apply_result(result)
+        return result.as_dict()
+    
+    def _apply_result(self, result: SplitResult):
+        """Store a split result on the splitter for the legacy getters."""
+        self.slide_boundaries = list(result.slide_boundaries)
+        self.validation_warnings = list(result.warnings)
+        with self._validation_lock:
+            # Results of a deferred validation still running belong to older content
+            self._validation_generation += 1
+            self.latex_validation_result = result.latex_validation_result
+            self.validation_result = result.validation_result
+        # Optimization system DISABLED - preserving manual slide separators
+        self.optimization_result = None
+        self.parser.malformed_directives = list(result.malformed_directives)
+    
+    def process_directives_incremental(self, content: str) -> Dict[str, Any]:
+        """
+        Re-split content after an edit, reusing the previous split where possible.
+        
+        The new text is compared line by line with the text of the previous call.
+        Directives are re-scanned and content blocks rebuilt only for the changed
+        line range (up to the end of the document if the edit opens or closes a
+        code fence); everything before it is kept and everything after it is
+        shifted by the change in line count. LaTeX expressions are re-parsed the
+        same way unless an environment opened before the edit could reach into
+        it. The result is identical to process_directives on the same content.
+        
+        Args:
+            content: Raw markdown content
+            
+        Returns:
+            Dictionary with 'slides' and 'notes' content
+        """
+        logger.debug("Processing markdown directives incrementally")
+        
+        content = self.parser.expand_bibliography(content, base_path=Path.cwd())
+        lines = content.split('\n')
+        
+        validate = self.validation_level.includes(ValidationLevel.STANDARD) and not self.defer_validation
+        previous = self.split_state
+        if previous is None:
+            state = self._full_split_state(content, lines, validate)
+        elif previous.lines == lines:
+            logger.debug("Content unchanged, reusing previous split")
+            state = previous
+        else:
+            state = self._update_split_state(previous, content, lines, validate)
+        self.split_state = state
+        
+        logger.info(f"Found {len(state.directives)} directives")
+        warnings = self._check_directive_structure(state.directives)
+        self._log_directive_warnings(warnings, state.malformed)
+        if state.latex_validation_result is not None:
+            self._log_latex_validation(state.latex_validation_result)
+        if state.validation_result is not None:
+            self._log_content_validation(state.validation_result)
+        
+        slides_content, notes_content, slide_boundaries = self._route_blocks(state.blocks, state.directives)
+        result = SplitResult(
+            slides=slides_content,
+            notes=notes_content,
+            blocks=tuple(state.blocks),
+            directives=tuple(state.directives),
+            warnings=tuple(warnings),
+            slide_boundaries=tuple(slide_boundaries),
+            malformed_directives=tuple(state.malformed),
+            latex_validation_result=state.latex_validation_result,
+            validation_result=state.validation_result
+        )
+        self._apply_result(result)
+        return result.as_dict()
+    
+    def _full_split_state(self, content: str, lines: List[str], validate: bool = True) -> SplitState:
+        """Split content from scratch and retain everything needed for incremental updates."""
+        scan = self.parser.scan_directives(content)
+        latex_validation_result, validation_result = None, None
+        if validate:
+            latex_validation_result = self.latex_processor.process_content(content)
+            validation_result = self.content_validator.validate_content(
+                content, latex_result=latex_validation_result, level=self.validation_level
+            )
+        return SplitState(
+            lines=lines,
+            directives=scan.directives,
+            fences=scan.fences,
+            malformed=scan.malformed,
+            blocks=self.parser.process_content_blocks(content, scan.directives),
+            latex_validation_result=latex_validation_result,
+            validation_result=validation_result
+        )
+    
+    def _update_split_state(self, previous: SplitState, content: str, lines: List[str],
+                            validate: bool = True) -> SplitState:
+        """Derive the split state of edited content from the state before the edit."""
+        old_lines = previous.lines
+        
+        # Locate the changed hunk by trimming the common prefix and suffix
+        limit = min(len(old_lines), len(lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_lines[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+        
+        first_line = prefix + 1
+        old_last = len(old_lines) - suffix
+        new_last = len(lines) - suffix
+        delta = len(lines) - len(old_lines)
+        logger.debug(f"Changed lines {first_line}-{new_last} (was {first_line}-{old_last})")
+        
+        # Re-scan the hunk for directives, starting from the code block state before it
+        entry_state = MarkdownDirectiveParser.fence_state_after(previous.fences, prefix)
+        scan_old_last, scan_new_last = old_last, new_last
+        scan = self.parser.scan_directives('\n'.join(lines[prefix:new_last]), first_line, *entry_state)
+        exit_state = (scan.in_code_block, scan.code_block_fence)
+        if exit_state != MarkdownDirectiveParser.fence_state_after(previous.fences, old_last):
+            # The edit opened or closed a code block, so the rest of the document must be re-scanned
+            scan_old_last, scan_new_last = len(old_lines), len(lines)
+            scan = self.parser.scan_directives('\n'.join(lines[prefix:]), first_line, *entry_state)
+        
+        directives = self._splice_by_line(
+            previous.directives, scan.directives, first_line, scan_old_last, delta,
+            lambda d: d.line_number, lambda d: replace(d, line_number=d.line_number + delta)
+        )
+        fences = self._splice_by_line(
+            previous.fences, scan.fences, first_line, scan_old_last, delta,
+            lambda f: f[0], lambda f: (f[0] + delta, f[1])
+        )
+        malformed = self._splice_by_line(
+            previous.malformed, scan.malformed, first_line, scan_old_last, delta,
+            lambda m: m['line'], lambda m: dict(m, line=m['line'] + delta)
+        )
+        
+        # Rebuild only the blocks between the directives enclosing the re-scanned lines
+        if not directives or not previous.directives:
+            blocks = self.parser.process_content_blocks(content, directives)
+        else:
+            preceding = [d for d in directives if d.line_number < first_line]
+            following = [d for d in directives if d.line_number > scan_new_last]
+            region_start = preceding[-1].line_number if preceding else 0
+            region_end = following[0].line_number if following else len(lines) + 1
+            mode = self.parser._update_state(ContentMode.ALL, preceding[-1]) if preceding else ContentMode.ALL
+            inside = [d for d in directives if region_start < d.line_number < region_end]
+            
+            blocks = [b for b in previous.blocks if b.end_line < region_start]
+            blocks.extend(self.parser.collect_blocks(lines, inside, region_start + 1, region_end - 1, mode))
+            if following:
+                old_region_end = region_end - delta
+                blocks.extend(
+                    replace(b, start_line=b.start_line + delta, end_line=b.end_line + delta) if delta else b
+                    for b in previous.blocks if b.start_line > old_region_end
+                )
+        
+        # Re-parse LaTeX expressions on the changed lines only, unless an environment
+        # opened before the hunk could extend into it
+        previous_latex = previous.latex_validation_result
+        if not validate:
+            latex_validation_result = None
+        elif previous_latex is None or '\\begin{' in '\n'.join(lines[:prefix]):
+            latex_validation_result = self.latex_processor.process_content(content)
+        else:
+            expressions = self._splice_by_line(
+                previous_latex.expressions,
+                self.latex_processor.parser.parse_lines(lines, first_line, new_last),
+                first_line, old_last, delta,
+                lambda e: e.line_number, lambda e: replace(e, line_number=e.line_number + delta)
+            )
+            latex_validation_result = self.latex_processor.process_expressions(expressions)
+        
+        return SplitState(
+            lines=lines,
+            directives=directives,
+            fences=fences,
+            malformed=malformed,
+            blocks=blocks,
+            latex_validation_result=latex_validation_result,
+            # Readability, structure and link checks are whole-document measures
+            validation_result=self.content_validator.validate_content(
+                content, latex_result=latex_validation_result, level=self.validation_level
+            ) if validate else None
+        )
+    
+    @staticmethod
+    def _splice_by_line(items: List[Any], fresh: List[Any], first_line: int, old_last: int,
+                        delta: int, line_of, shifted) -> List[Any]:
+        """Replace the items on lines first_line..old_last with fresh ones, shifting later items."""
+        spliced = [item for item in items if line_of(item) < first_line]
+        spliced.extend(fresh)
+        spliced.extend(shifted(item) if delta else item for item in items if line_of(item) > old_last)
+        return spliced
+    
+    def _check_directive_structure(self, directives: List[DirectiveMatch]) -> List[str]:
+        """Validate directive structure unless validation is switched off."""
+        if self.validation_level == ValidationLevel.NONE:
+            return []
+        return self.parser.validate_directive_structure(directives)
+    
+    def _validate(self, context: DocumentContext) -> Tuple[LaTeXValidationResult, ValidationResult]:
+        """Run LaTeX and content validation on a document and log the results."""
+        latex_validation_result = context.latex_result
+        self._log_latex_validation(latex_validation_result)
+        
+        validation_result = ContentValidator().validate_content(
+            context.content, latex_result=latex_validation_result, level=self.validation_level
+        )
+        self._log_content_validation(validation_result)
+        return latex_validation_result, validation_result
+    
+    def _plan_shards(self, content: str, directives: List[DirectiveMatch]) -> List[Tuple[int, int]]:
+        """
+        Cut a document into line ranges for sharded validation.
+        
+        Cuts are made at slide boundaries (directive, header and --- lines)
+        near equal-size targets. Any cut gives the same LaTeX expressions, as
+        environments are followed past the end of their shard.
+        
+        Returns:
+            List of (first_line, last_line) ranges covering the document; a
+            single range when sharding is off or the document is too small
+        """
+        line_count = content.count('\n') + 1
+        shard_count = min(self.shard_workers * self.SHARDS_PER_WORKER, line_count // max(self.SHARD_MIN_LINES, 1))
+        if self.shard_workers < 2 or shard_count < 2:
+            return [(1, line_count)]
+        
+        boundaries = {directive.line_number for directive in directives}
+        line_number, offset = 1, 0
+        for match in SectionIndex.BOUNDARY_PATTERN.finditer(content):
+            line_number += content.count('\n', offset, match.start())
+            offset = match.start()
+            boundaries.add(line_number)
+        boundaries = sorted(boundaries)
+        
+        cuts = []
+        for index in range(1, shard_count):
+            position = bisect_left(boundaries, index * line_count // shard_count)
+            if position < len(boundaries) and boundaries[position] > (cuts[-1] if cuts else 1):
+                cuts.append(boundaries[position])
+        return list(zip([1] + cuts, [cut - 1 for cut in cuts] + [line_count]))
+    
+    def _validate_sharded(self, content: str,
+                          shards: List[Tuple[int, int]]) -> Tuple[Optional[LaTeXValidationResult], ValidationResult]:
+        """
+        Validate a large document with the LaTeX work spread over worker processes.
+        
+        Each worker parses and checks the expressions starting in one shard.
+        The shards are merged in document order, then the checks that need the
+        whole expression list are added. Content validation runs here and its
+        checks before the LaTeX step overlap with the workers. The results are
+        identical to _validate.
+        """
+        logger.info(f"Validating {len(shards)} shards in {self.shard_workers} worker processes")
+        
+        # Each worker gets its shard and the lines up to the last \end closing an environment opened in it
+        line_starts = [0] + [match.end() for match in re.finditer('\n', content)]
+        line_starts.append(len(content) + 1)
+        extents = line_range_extents(content, shards)
+        
+        spawn = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(self.shard_workers, len(shards)), mp_context=spawn) as pool:
+            futures = [
+                pool.submit(check_line_range, content[line_starts[first_line - 1]:line_starts[extent] - 1],
+                            first_line, last_line - first_line + 1)
+                for (first_line, last_line), extent in zip(shards, extents)
+            ]
+            
+            def merge_shards() -> LaTeXValidationResult:
+                expressions, checks = [], ExpressionChecks()
+                for future in futures:
+                    shard_expressions, shard_checks = future.result()
+                    expressions.extend(shard_expressions)
+                    checks.merge(shard_checks)
+                parse_counter.record(content)
+                return LaTeXProcessor().process_expressions(expressions, checks)
+            
+            validation_result = ContentValidator().validate_content(
+                content, latex_result=merge_shards, level=self.validation_level
+            )
+        
+        # None if a worker failed; the content validator reports that as an issue
+        latex_validation_result = validation_result.latex_validation
+        if latex_validation_result is not None:
+            self._log_latex_validation(latex_validation_result)
+        self._log_content_validation(validation_result)
+        return latex_validation_result, validation_result
+    
+    def start_deferred_validation(self) -> Optional[Future]:
+        """
+        Validate the last incremental split in a background thread.
+        
+        Used in watch mode with defer_validation, once the preview has been
+        regenerated. A pending run for older content is cancelled, and results
+        are stored for the getters only if no newer split has started validation
+        in the meantime.
+        
+        Returns:
+            Future of (latex_validation_result, validation_result), or None if
+            there is nothing to validate
+        """
+        state = self.split_state
+        if state is None or not self.validation_level.includes(ValidationLevel.STANDARD):
+            return None
+        
+        with self._validation_lock:
+            if self._deferred_validation is not None:
+                self._deferred_validation.cancel()
+            if self._validation_executor is None:
+                self._validation_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='deferred-validation'
+                )
+            self._validation_generation += 1
+            generation = self._validation_generation
+            self._deferred_validation = self._validation_executor.submit(
+                self._run_deferred_validation, DocumentContext('\n'.join(state.lines)), generation
+            )
+            return self._deferred_validation
+    
+    def _run_deferred_validation(self, context: DocumentContext,
+                                 generation: int) -> Tuple[LaTeXValidationResult, ValidationResult]:
+        logger.debug(f"Running deferred {self.validation_level.value} validation")
+        latex_validation_result, validation_result = self._validate(context)
+        with self._validation_lock:
+            if generation == self._validation_generation:
+                self.latex_validation_result = latex_validation_result
+                self.validation_result = validation_result
+        return latex_validation_result, validation_result
+    
+    @staticmethod
+    def _log_directive_warnings(warnings: List[str], malformed_directives: List[Dict[str, Any]]):
+        """Log directive structure warnings and any malformed directives."""
+        for warning in warnings:
+            logger.warning(warning)
+        
+        # Report malformed directives
+        for malformed in malformed_directives:
+            logger.warning(f"Malformed directive at line {malformed['line']}: {malformed['text']} "
+                         f"(suggestion: {malformed['suggestion']})")
+    
+    @staticmethod
+    def _log_latex_validation(latex_validation_result: LaTeXValidationResult):
+        """Log the LaTeX validation result of a split."""
+        if not latex_validation_result.is_valid:
+            logger.warning(f"Found {len(latex_validation_result.errors)} LaTeX errors")
+            for error in latex_validation_result.errors:
                 logger.error(f"LaTeX Error: {error}")
         
-        if self.latex_validation_result.warnings:
-            for warning in self.latex_validation_result.warnings:
+        if latex_validation_result.warnings:
+            for warning in latex_validation_result.warnings:
                 logger.warning(f"LaTeX Warning: {warning}")
         
         # Log LaTeX package requirements
-        if self.latex_validation_result.packages_required:
-            logger.info(f"Required LaTeX packages: {', '.join(sorted(self.latex_validation_result.packages_required))}")
-        
-        # Perform comprehensive content validation
-        self.validation_result = self.content_validator.validate_content(content)
-        if not self.validation_result.is_valid:
-            logger.warning(f"Content validation found {len(self.validation_result.errors)} errors")
-            for error in self.validation_result.errors:
+        if latex_validation_result.packages_required:
+            logger.info(f"Required LaTeX packages: {', '.join(sorted(latex_validation_result.packages_required))}")
+    
+    @staticmethod
+    def _log_content_validation(validation_result: ValidationResult):
+        """Log the content validation result of a split."""
+        if not validation_result.is_valid:
+            logger.warning(f"Content validation found {len(validation_result.errors)} errors")
+            for error in validation_result.errors:
                 logger.error(f"Validation Error: {error.message}")
         
-        if self.validation_result.warnings:
-            logger.info(f"Content validation found {len(self.validation_result.warnings)} warnings")
-        
+        if validation_result.warnings:
+            logger.info(f"Content validation found {len(validation_result.warnings)} warnings")
+    
+    @staticmethod
+    def _route_blocks(content_blocks: List[ContentBlock],
+                      directives: List[DirectiveMatch]) -> Tuple[str, str, List[int]]:
+        """Route content blocks to slides and notes, returning (slides, notes, slide_boundaries)."""
         # Optimization system DISABLED - preserving manual slide separators
         logger.info("Optimization system disabled to preserve manual slide boundaries")
-        self.optimization_result = None
         
         # Split content based on modes
         slides_blocks = []
         notes_blocks = []
-
-        # Build a lookup for directives by line number for quick checks
-        directives_by_line = {d.line_number: d for d in directives}
-
+        
         # Insert separators BEFORE boundary directives instead of after blocks to prevent content bleed.
         boundary_lines = {d.line_number for d in directives if d.mode in (ContentMode.SLIDE_BOUNDARY, ContentMode.NOTES_SLIDE_BOUNDARY)}
         for block in content_blocks:
@@ -529,7 +1515,7 @@ class ContentSplitter:
             if (block.start_line - 1) in boundary_lines:
                 if slides_blocks and slides_blocks[-1].strip() != '---':
                     slides_blocks.append('---')
-
+            
             if block.mode == ContentMode.SLIDES_ONLY:
                 slides_blocks.append(block.content)
             elif block.mode == ContentMode.NOTES_ONLY:
@@ -545,11 +1531,11 @@ class ContentSplitter:
                 # Usually empty; if user placed content same line region treat as slide-only after separator
                 if block.content.strip():
                     slides_blocks.append(block.content)
-
+        
         # Track slide boundaries for later use in task 2.2
-        self.slide_boundaries = [d.line_number for d in directives 
-                               if d.mode in [ContentMode.SLIDE_BOUNDARY, ContentMode.NOTES_SLIDE_BOUNDARY]]
-
+        slide_boundaries = [d.line_number for d in directives
+                            if d.mode in [ContentMode.SLIDE_BOUNDARY, ContentMode.NOTES_SLIDE_BOUNDARY]]
+        
         # Join blocks into final markdown content. Keep separators as their own paragraphs.
         slides_content = '\n\n'.join(slides_blocks).strip()
         notes_content = '\n\n'.join(notes_blocks).strip()
@@ -557,14 +1543,100 @@ class ContentSplitter:
         logger.info(f"Generated slides content: {len(slides_content)} chars")
         logger.info(f"Generated notes content: {len(notes_content)} chars")
         
+        return slides_content, notes_content, slide_boundaries
+    
+    @staticmethod
+    def _result_to_cache_entry(result: SplitResult) -> Dict[str, Any]:
+        """Serialize a split result and its validation summaries for the split cache."""
+        latex = result.latex_validation_result
+        validation = result.validation_result
         return {
-            "slides": slides_content,
-            "notes": notes_content,
-            "blocks": content_blocks,
-            "directives": directives,
-            "warnings": self.validation_warnings
+            "slides": result.slides,
+            "notes": result.notes,
+            "directives": {
+                "slide_boundaries": list(result.slide_boundaries),
+                "warnings": list(result.warnings),
+                "malformed": list(result.malformed_directives)
+            },
+            "latex": None if latex is None else {
+                "is_valid": latex.is_valid,
+                "errors": latex.errors,
+                "warnings": latex.warnings,
+                "packages_required": sorted(latex.packages_required),
+                "custom_commands": sorted(latex.custom_commands)
+            },
+            "validation": None if validation is None else {
+                "is_valid": validation.is_valid,
+                "word_count": validation.word_count,
+                "slide_count_estimate": validation.slide_count_estimate,
+                "readability_score": validation.readability_score,
+                "issues": [
+                    {
+                        "type": issue.type.value,
+                        "severity": issue.severity.value,
+                        "message": issue.message,
+                        "line_number": issue.line_number,
+                        "column": issue.column,
+                        "suggestion": issue.suggestion,
+                        "context": issue.context
+                    }
+                    for issue in validation.issues
+                ]
+            }
         }
     
+    @staticmethod
+    def _result_from_cache_entry(entry: Dict[str, Any]) -> SplitResult:
+        """
+        Rebuild a split result from a split cache entry.
+        
+        LaTeX and content validation results are rebuilt from their summaries;
+        content blocks, directives and individual LaTeX expressions are not cached.
+        """
+        latex = entry["latex"]
+        latex_validation_result = None if latex is None else LaTeXValidationResult(
+            is_valid=latex["is_valid"],
+            expressions=[],
+            errors=latex["errors"],
+            warnings=latex["warnings"],
+            packages_required=set(latex["packages_required"]),
+            custom_commands=set(latex["custom_commands"])
+        )
+        
+        validation = entry["validation"]
+        validation_result = None if validation is None else ValidationResult(
+            is_valid=validation["is_valid"],
+            issues=[
+                ValidationIssue(
+                    type=IssueType(issue["type"]),
+                    severity=IssueSeverity(issue["severity"]),
+                    message=issue["message"],
+                    line_number=issue["line_number"],
+                    column=issue["column"],
+                    suggestion=issue["suggestion"],
+                    context=issue["context"]
+                )
+                for issue in validation["issues"]
+            ],
+            word_count=validation["word_count"],
+            slide_count_estimate=validation["slide_count_estimate"],
+            readability_score=validation["readability_score"],
+            latex_validation=latex_validation_result
+        )
+        
+        return SplitResult(
+            slides=entry["slides"],
+            notes=entry["notes"],
+            blocks=(),
+            directives=(),
+            warnings=tuple(entry["directives"]["warnings"]),
+            slide_boundaries=tuple(entry["directives"]["slide_boundaries"]),
+            malformed_directives=tuple(entry["directives"].get("malformed", ())),
+            latex_validation_result=latex_validation_result,
+            validation_result=validation_result,
+            from_cache=True
+        )
+    
     def get_slide_boundaries(self) -> List[int]:
         """Get line numbers where slide boundaries were detected."""
         return self.slide_boundaries.copy()
@@ -619,6 +1691,11 @@ class ContentSplitter:
         if self.optimization_result and self.optimization_result.suggestions:
             summary['suggestions'].extend([s.description for s in self.optimization_result.suggestions])
         
+        if self.split_cache is not None:
+            summary['split_cache'] = self.split_cache.get_stats()
+        
+        summary['latex_parses'] = parse_counter.get_stats()
+        
         return summary
     
     def split_content_from_string(self, content: str) -> Tuple[str, str]:
@@ -666,8 +1743,8 @@ class ContentSplitter:
         notes_content = self._generate_notes_qmd(processed, base_name)
         
         # Write files
-        slides_path.write_text(slides_content, encoding='utf-8')
-        notes_path.write_text(notes_content, encoding='utf-8')
+        write_if_changed(slides_path, slides_content)
+        write_if_changed(notes_path, notes_content)
         
         # Copy referenced images to output directory
         self._copy_referenced_images(filepath, output_path)
@@ -686,7 +1763,6 @@ class ContentSplitter:
             output_dir: Output directory to copy images to
         """
         import re
-        import shutil
         
         source_path = Path(source_file)
         source_dir = source_path.parent
@@ -716,8 +1792,8 @@ class ContentSplitter:
             if source_image_path.exists():
                 dest_image_path = output_dir / source_image_path.name
                 try:
-                    shutil.copy2(source_image_path, dest_image_path)
-                    logger.info(f"Copied image: {source_image_path.name} -> {dest_image_path}")
+                    if copy_if_changed(source_image_path, dest_image_path):
+                        logger.info(f"Copied image: {source_image_path.name} -> {dest_image_path}")
                 except Exception as e:
                     logger.warning(f"Failed to copy image {source_image_path}: {e}")
             else:
@@ -794,69 +1870,10 @@ class ContentSplitter:
         Returns:
             List of SlideSection objects
         """
-        lines = slides_content.split('\n')
-        sections = []
-        current_section = None
-        slide_number = 1
-        
-        for line in lines:
-            # Check for slide separators
-            if line.strip() == '---':
-                # Save previous section if exists
-                if current_section and current_section.content.strip():
-                    sections.append(current_section)
-                    slide_number += 1
-                    current_section = None
-                continue
-            
-            # Check for headers (potential slide boundaries)
-            header_match = re.match(r'^(#{1,6})\s+(.+)', line)
-            
-            if header_match:
-                # Save previous section if exists
-                if current_section and current_section.content.strip():
-                    sections.append(current_section)
-                    slide_number += 1
-                
-                # Start new section
-                header_level = len(header_match.group(1))
-                title = header_match.group(2)
-                
-                current_section = SlideSection(
-                    title=title,
-                    content=line + '\n',
-                    slide_number=slide_number,
-                    header_level=header_level
-                )
-            else:
-                # Add to current section
-                if current_section:
-                    current_section.content += line + '\n'
-                    
-                    # Analyze content characteristics
-                    if '```' in line:
-                        current_section.has_code = True
-                    if '$' in line:
-                        current_section.has_math = True
-                else:
-                    # Content before first header - create intro section
-                    if line.strip():
-                        current_section = SlideSection(
-                            title="Introduction",
-                            content=line + '\n',
-                            slide_number=slide_number,
-                            header_level=1
-                        )
-        
-        # Add final section
-        if current_section and current_section.content.strip():
-            sections.append(current_section)
-        
-        # Calculate word counts and optimize slide lengths
-        for section in sections:
-            section.word_count = len(section.content.split())
+        index = SectionIndex.build(slides_content)
+        logger.debug(f"Indexed {len(index.sections)} slide sections")
         
-        return self._optimize_slide_lengths(sections)
+        return self._optimize_slide_lengths(index.sections)
     
     def _optimize_slide_lengths(self, sections: List[SlideSection]) -> List[SlideSection]:
         """
@@ -884,54 +1901,32 @@ class ContentSplitter:
     
     def _split_long_section(self, section: SlideSection, max_words: int) -> List[SlideSection]:
         """Split a long section into multiple slides."""
-        # Split content into words for more precise control
-        words = section.content.split()
-        split_sections = []
-        current_words = []
-        part_number = 1
-        
         # Keep the header for the first part
         header_line = ""
-        content_words = words
+        body_start = section.start
         
         # Extract header if present
-        if section.content.startswith('#'):
-            first_line_end = section.content.find('\n')
-            if first_line_end > 0:
-                header_line = section.content[:first_line_end]
-                remaining_content = section.content[first_line_end+1:]
-                content_words = remaining_content.split()
-        
-        for word in content_words:
-            if len(current_words) >= max_words and current_words:
-                # Create new section
-                content = header_line + '\n\n' + ' '.join(current_words) if header_line else ' '.join(current_words)
-                split_sections.append(SlideSection(
-                    title=f"{section.title} ({part_number})",
-                    content=content.strip(),
-                    slide_number=section.slide_number,
-                    header_level=section.header_level,
-                    has_code=section.has_code,
-                    has_math=section.has_math,
-                    word_count=len(current_words)
-                ))
-                
-                current_words = [word]
-                part_number += 1
-            else:
-                current_words.append(word)
+        if section.source.startswith('#', section.start):
+            first_line_end = section.source.find('\n', section.start, section.end)
+            if first_line_end > section.start:
+                header_line = section.source[section.start:first_line_end]
+                body_start = first_line_end + 1
         
-        # Add final part
-        if current_words:
-            content = header_line + '\n\n' + ' '.join(current_words) if header_line else ' '.join(current_words)
+        # Split content into words once for precise control
+        content_words = section.source[body_start:section.end].split()
+        chunks = [content_words[i:i + max_words] for i in range(0, len(content_words), max_words)]
+        
+        split_sections = []
+        for part_number, words in enumerate(chunks, 1):
+            content = header_line + '\n\n' + ' '.join(words) if header_line else ' '.join(words)
             split_sections.append(SlideSection(
-                title=f"{section.title} ({part_number})" if part_number > 1 else section.title,
-                content=content.strip(),
+                title=f"{section.title} ({part_number})" if len(chunks) > 1 else section.title,
+                source=content.strip(),
                 slide_number=section.slide_number,
                 header_level=section.header_level,
                 has_code=section.has_code,
                 has_math=section.has_math,
-                word_count=len(current_words)
+                word_count=len(words)
             ))
         
         return split_sections
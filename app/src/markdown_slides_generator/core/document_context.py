@@ -0,0 +1,57 @@
+"""
+Document Context - Per-document analysis shared between processing stages.
+
+The splitter, the content validator and the math renderer all need the LaTeX
+expressions of the document they work on. A DocumentContext parses them once,
+on first use, and hands the same LaTeXValidationResult to every consumer.
+"""
+
+import threading
+from typing import Dict, Any, Optional
+
+from ..latex import LaTeXProcessor, LaTeXValidationResult, parse_counter
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DocumentContext:
+    """
+    Lazily computed analysis of one markdown document.
+    
+    Safe to share between threads; the LaTeX parse runs at most once per
+    context no matter how many consumers ask for it.
+    """
+    
+    def __init__(self, content: str, source: Optional[str] = None):
+        """
+        Args:
+            content: Markdown content of the document (after INSERT-BIB expansion)
+            source: Optional path of the document, used in log messages
+        """
+        self.content = content
+        self.source = source
+        self._latex_result: Optional[LaTeXValidationResult] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def latex_result(self) -> LaTeXValidationResult:
+        """LaTeX validation result of the document, parsed on first access."""
+        with self._lock:
+            if self._latex_result is None:
+                logger.debug(f"Parsing LaTeX expressions of {self.source or 'document'}")
+                self._latex_result = LaTeXProcessor().process_content(self.content)
+            return self._latex_result
+    
+    @property
+    def parse_count(self) -> int:
+        """Number of LaTeX parses of this document's content recorded in the process."""
+        return parse_counter.count(self.content)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get instrumentation for this document."""
+        return {
+            'source': self.source,
+            'latex_parsed': self._latex_result is not None,
+            'latex_parse_count': self.parse_count
+        }
@@ -5,27 +5,63 @@ Implements comprehensive Quarto command building with format-specific optimizati
 robust error handling, and advanced configuration management for academic presentations.
 """
 
+import asyncio
 import subprocess
 import json
 import re
 import shutil
 import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Any, Union, Callable
+from dataclasses import dataclass, field
 from enum import Enum
 import yaml
 
 from ..utils.logger import get_logger
 from ..utils.exceptions import handle_exception, OutputError
+from ..utils.file_io import write_if_changed
 from ..themes.theme_manager import ThemeManager, AcademicTheme
 from ..themes.template_manager import TemplateManager, TemplateConfig, TemplateType, OutputFormat as TemplateOutputFormat
-from ..latex import MathRenderer, OutputFormat as MathOutputFormat
+from ..latex import MathRenderer, LaTeXValidationResult, OutputFormat as MathOutputFormat
+from .toolchain import toolchain_registry
+from .resource_usage import ResourceUsage, child_usage, run_measured, summarize_usage
+from .concurrency import RenderSlot
 
 logger = get_logger(__name__)
 
 
+# Extension of the file Quarto writes for each output format
+FORMAT_EXTENSIONS = {
+    'revealjs': '.html',
+    'html': '.html',
+    'beamer': '.pdf',
+    'pdf': '.pdf',
+    'pptx': '.pptx'
+}
+
+# Classifies a line of Quarto output in a single match: any warning marker makes
+# the line a warning, otherwise any error marker makes it an error
+OUTPUT_LINE_CLASSIFIER = re.compile(
+    r'(?P<warning>.*?(?:warning:|\[warning\]))'
+    r'|(?P<error>.*?(?:error:|\[error\]|fatal:|failed|not found|cannot))',
+    re.IGNORECASE
+)
+
+
+def classify_output_line(line: str) -> Optional[str]:
+    """
+    Classify a stripped line of Quarto output.
+    
+    Returns:
+        'warning', 'error' or None for ordinary output
+    """
+    match = OUTPUT_LINE_CLASSIFIER.match(line)
+    return match.lastgroup if match else None
+
+
 class OutputFormat(Enum):
     """Supported output formats with their Quarto format names."""
     REVEALJS = "revealjs"
@@ -62,6 +98,10 @@ class QuartoResult:
     execution_time: float
     warnings: List[str] = None
     errors: List[str] = None
+    # True when the output was reused from an earlier render with the same inputs
+    cached: bool = False
+    # CPU, peak memory and output size of the render; None for cached renders
+    resources: Optional[ResourceUsage] = None
     
     def __post_init__(self):
         if self.warnings is None:
@@ -70,6 +110,25 @@ class QuartoResult:
             self.errors = []
 
 
+@dataclass
+class RenderJob:
+    """A prepared Quarto render that can run alongside other jobs."""
+    kind: str
+    command: QuartoCommand
+    timeout: int = 300
+    cleanup: List[str] = field(default_factory=list)
+    
+    @property
+    def format(self) -> str:
+        """Quarto output format of the job."""
+        return self.command.output_format
+    
+    @property
+    def name(self) -> str:
+        """Key of the job's result in QuartoOrchestrator.last_results."""
+        return f"{self.kind}_{self.format}"
+
+
 class QuartoCommandBuilder:
     """
     Builds Quarto commands with format-specific optimizations.
@@ -368,12 +427,21 @@ class QuartoExecutor:
     
     def __init__(self):
         self.last_result: Optional[QuartoResult] = None
+        # Optional warm worker (core.render_service.QuartoRenderService)
+        self.render_service = None
+        # Optional skip-unchanged cache (core.render_cache.RenderCache)
+        self.render_cache = None
+        # Optional limit on concurrent renders (core.concurrency.AdaptiveConcurrencyController)
+        self.concurrency = None
         self._check_quarto_installation()
     
     def _check_quarto_installation(self) -> bool:
         """
         Check if Quarto is installed and accessible.
         
+        The probe result is shared through the toolchain registry, so only the
+        first executor for a given Quarto binary runs `quarto --version`.
+        
         Returns:
             True if Quarto is available, False otherwise
             
@@ -381,19 +449,13 @@ class QuartoExecutor:
             OutputError: If Quarto is not found or not working
         """
         try:
-            result = subprocess.run(
-                ['quarto', '--version'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            quarto = toolchain_registry.get('quarto')
             
-            if result.returncode == 0:
-                version = result.stdout.strip()
-                logger.info(f"Quarto version: {version}")
+            if quarto.available:
+                logger.info(f"Quarto version: {quarto.version}")
                 return True
             else:
-                raise OutputError(f"Quarto check failed: {result.stderr}")
+                raise OutputError(f"Quarto check failed: {quarto.stderr}")
                 
         except FileNotFoundError:
             raise OutputError(
@@ -426,45 +488,32 @@ class QuartoExecutor:
         logger.debug(f"Input file: {command.input_file}")
         logger.debug(f"Output format: {command.output_format}")
         
+        cached_result, inputs_digest = self._cached_render(command)
+        if cached_result is not None:
+            return cached_result
+        
+        service_result = self._render_with_service(command, timeout)
+        if service_result is not None:
+            self._remember_render(command, inputs_digest, service_result)
+            return service_result
+        
         try:
-            # Prepare environment
-            env = dict(os.environ)
-            env.update(command.env_vars)
-            
-            # Determine working directory. If the input file exists, run Quarto
-            # from its parent directory and pass only the filename as the input
-            # to avoid duplicated path segments (e.g., "output/output/...")
-            input_path = Path(command.input_file)
-            cwd = input_path.parent if input_path.exists() else None
-
-            # If we run with cwd set to the input file's parent, replace the
-            # input file argument in the command with the basename so Quarto
-            # is invoked with a path relative to cwd.
-            args = list(command.args)
-            if cwd is not None:
-                try:
-                    idx = args.index(str(command.input_file))
-                    args[idx] = input_path.name
-                except ValueError:
-                    # If the exact string isn't found, try with an absolute path
-                    try:
-                        idx = args.index(str(input_path.resolve()))
-                        args[idx] = input_path.name
-                    except ValueError:
-                        # Fallback: leave args unchanged
-                        pass
-
-            # Execute command
-            result = subprocess.run(
-                args,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                env=env,
-                cwd=str(cwd) if cwd is not None else None
-            )
+            args, cwd, env = self._prepare_invocation(command)
+            
+            # Execute command once there is room for it, keeping the CPU and
+            # memory the child used
+            with self._render_slot(command) as slot:
+                result, usage = run_measured(
+                    args,
+                    text=True,
+                    timeout=timeout,
+                    env=env,
+                    cwd=str(cwd) if cwd is not None else None
+                )
+                slot.peak_rss_bytes = usage.peak_rss_bytes if usage is not None else None
             
-            execution_time = time.time() - start_time
+            # Time spent waiting for a slot is not part of the render
+            execution_time = time.time() - start_time - slot.wait_time
             
             # Parse output and errors
             warnings, errors = self._parse_quarto_output(result.stdout, result.stderr)
@@ -483,10 +532,12 @@ class QuartoExecutor:
                 return_code=result.returncode,
                 execution_time=execution_time,
                 warnings=warnings,
-                errors=errors
+                errors=errors,
+                resources=(usage or ResourceUsage()).with_output(output_file)
             )
             
             self.last_result = quarto_result
+            self._remember_render(command, inputs_digest, quarto_result)
             
             if success:
                 logger.info(f"Quarto command completed successfully in {execution_time:.2f}s")
@@ -533,6 +584,90 @@ class QuartoExecutor:
                 errors=[error_msg]
             )
     
+    def _cached_render(self, command: QuartoCommand) -> Tuple[Optional[QuartoResult], Optional[str]]:
+        """
+        Look a command up in the render cache.
+        
+        Returns:
+            Tuple of (cached result or None, digest of the command's inputs
+            to record a new render under, or None without a cache)
+        """
+        if self.render_cache is None:
+            return None, None
+        inputs_digest = self.render_cache.inputs_digest(command)
+        cached_result = self.render_cache.lookup(command, inputs_digest)
+        if cached_result is not None:
+            self.last_result = cached_result
+        return cached_result, inputs_digest
+    
+    def _remember_render(self, command: QuartoCommand, inputs_digest: Optional[str], result: QuartoResult) -> None:
+        """Record a finished render in the render cache, if there is one."""
+        if self.render_cache is not None:
+            self.render_cache.store(command, inputs_digest, result)
+    
+    def _render_slot(self, command: QuartoCommand) -> RenderSlot:
+        """Slot to run a command in; waits for the concurrency controller if there is one."""
+        if self.concurrency is None:
+            return RenderSlot(command.output_format)
+        return self.concurrency.slot(command.output_format)
+    
+    def _render_with_service(self, command: QuartoCommand, timeout: int) -> Optional[QuartoResult]:
+        """
+        Run a command on the warm render worker if there is one for it.
+        
+        Returns:
+            QuartoResult of the render, or None to run `quarto render` instead
+        """
+        if self.render_service is None or not self.render_service.handles(command):
+            return None
+        try:
+            result = self.render_service.render(timeout)
+        except Exception as e:
+            logger.warning(f"Render worker unavailable ({e}); running quarto render instead")
+            return None
+        
+        logger.info(f"Render worker finished in {result.execution_time:.2f}s")
+        # The long-lived worker's CPU and memory cannot be split per render
+        result.resources = ResourceUsage().with_output(result.output_file)
+        self.last_result = result
+        return result
+    
+    def _prepare_invocation(self, command: QuartoCommand) -> Tuple[List[str], Optional[Path], Dict[str, str]]:
+        """
+        Work out the arguments, working directory and environment of a command.
+        
+        Returns:
+            Tuple of (args, cwd, env)
+        """
+        # Prepare environment
+        env = dict(os.environ)
+        env.update(command.env_vars)
+        
+        # Determine working directory. If the input file exists, run Quarto
+        # from its parent directory and pass only the filename as the input
+        # to avoid duplicated path segments (e.g., "output/output/...")
+        input_path = Path(command.input_file)
+        cwd = input_path.parent if input_path.exists() else None
+
+        # If we run with cwd set to the input file's parent, replace the
+        # input file argument in the command with the basename so Quarto
+        # is invoked with a path relative to cwd.
+        args = list(command.args)
+        if cwd is not None:
+            try:
+                idx = args.index(str(command.input_file))
+                args[idx] = input_path.name
+            except ValueError:
+                # If the exact string isn't found, try with an absolute path
+                try:
+                    idx = args.index(str(input_path.resolve()))
+                    args[idx] = input_path.name
+                except ValueError:
+                    # Fallback: leave args unchanged
+                    pass
+        
+        return args, cwd, env
+    
     def _parse_quarto_output(self, stdout: str, stderr: str) -> Tuple[List[str], List[str]]:
         """
         Parse Quarto output to extract warnings and errors.
@@ -550,45 +685,16 @@ class QuartoExecutor:
         # Combine stdout and stderr for parsing
         combined_output = stdout + "\n" + stderr
         
-        # Common Quarto warning patterns
-        warning_patterns = [
-            r'WARNING:.*',
-            r'Warning:.*',
-            r'\[WARNING\].*',
-            r'.*warning:.*',
-        ]
-        
-        # Common Quarto error patterns
-        error_patterns = [
-            r'ERROR:.*',
-            r'Error:.*',
-            r'\[ERROR\].*',
-            r'.*error:.*',
-            r'FATAL:.*',
-            r'Fatal:.*',
-            r'.*failed.*',
-            r'.*not found.*',
-            r'.*cannot.*',
-        ]
-        
-        lines = combined_output.split('\n')
-        
-        for line in lines:
+        for line in combined_output.split('\n'):
             line = line.strip()
             if not line:
                 continue
             
-            # Check for warnings
-            for pattern in warning_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    warnings.append(line)
-                    break
-            else:
-                # Check for errors (only if not already matched as warning)
-                for pattern in error_patterns:
-                    if re.search(pattern, line, re.IGNORECASE):
-                        errors.append(line)
-                        break
+            kind = classify_output_line(line)
+            if kind == 'warning':
+                warnings.append(line)
+            elif kind == 'error':
+                errors.append(line)
         
         return warnings, errors
     
@@ -631,16 +737,7 @@ class QuartoExecutor:
             base_name = input_path.stem
             parent_dir = input_path.parent
             
-            # Common output extensions by format
-            format_extensions = {
-                'revealjs': '.html',
-                'html': '.html',
-                'beamer': '.pdf',
-                'pdf': '.pdf',
-                'pptx': '.pptx'
-            }
-            
-            ext = format_extensions.get(command.output_format, '.html')
+            ext = FORMAT_EXTENSIONS.get(command.output_format, '.html')
             potential_output = parent_dir / f"{base_name}{ext}"
             
             if potential_output.exists():
@@ -649,6 +746,192 @@ class QuartoExecutor:
         return None
 
 
+class AsyncQuartoExecutor(QuartoExecutor):
+    """
+    Executes Quarto commands as asyncio subprocesses.
+    
+    Output is read line by line while Quarto runs. Every line is classified
+    as it arrives and can be passed to a progress callback, so warnings of a
+    long render show up before it finishes. Cancelling the awaiting task
+    kills the Quarto process.
+    """
+    
+    # Longest output line read in one piece
+    LINE_LIMIT = 1024 * 1024
+    
+    async def execute_command_async(
+        self,
+        command: QuartoCommand,
+        timeout: int = 300,
+        on_line: Optional[Callable[[str, Optional[str]], None]] = None
+    ) -> QuartoResult:
+        """
+        Execute a Quarto command without blocking the event loop.
+        
+        Args:
+            command: QuartoCommand to execute
+            timeout: Maximum execution time in seconds
+            on_line: Optional callback receiving each non-empty output line
+                and its classification ('warning', 'error' or None)
+            
+        Returns:
+            QuartoResult with execution details and results
+            
+        Raises:
+            asyncio.CancelledError: If the awaiting task is cancelled
+        """
+        start_time = time.time()
+        
+        logger.info(f"Executing Quarto command: {' '.join(command.args)}")
+        
+        inputs_digest = None
+        if self.render_cache is not None:
+            # Hashing referenced images can take a while; keep it off the loop
+            cached_result, inputs_digest = await asyncio.get_running_loop().run_in_executor(
+                None, self._cached_render, command
+            )
+            if cached_result is not None:
+                return cached_result
+        
+        if self.render_service is not None and self.render_service.handles(command):
+            # The worker is driven with blocking calls; keep them off the loop
+            service_result = await asyncio.get_running_loop().run_in_executor(
+                None, self._render_with_service, command, timeout
+            )
+            if service_result is not None:
+                self._remember_render(command, inputs_digest, service_result)
+                return service_result
+        
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+        warnings: List[str] = []
+        errors: List[str] = []
+        
+        async def read_stream(stream: asyncio.StreamReader, lines: List[str]) -> None:
+            while True:
+                raw = await stream.readline()
+                if not raw:
+                    return
+                text = raw.decode('utf-8', errors='replace')
+                lines.append(text)
+                
+                line = text.strip()
+                if not line:
+                    continue
+                kind = classify_output_line(line)
+                if kind == 'warning':
+                    warnings.append(line)
+                elif kind == 'error':
+                    errors.append(line)
+                if on_line is not None:
+                    on_line(line, kind)
+        
+        process = None
+        # The event loop reaps the child, so its usage comes from RUSAGE_CHILDREN
+        tracked = child_usage.track()
+        try:
+            args, cwd, env = self._prepare_invocation(command)
+            with tracked:
+                process = await asyncio.create_subprocess_exec(
+                    *args,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(cwd) if cwd is not None else None,
+                    env=env,
+                    limit=self.LINE_LIMIT
+                )
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        read_stream(process.stdout, stdout_lines),
+                        read_stream(process.stderr, stderr_lines),
+                        process.wait()
+                    ),
+                    timeout=timeout
+                )
+            
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            execution_time = time.time() - start_time
+            error_msg = f"Quarto command timed out after {timeout} seconds"
+            logger.error(error_msg)
+            
+            return QuartoResult(
+                success=False,
+                output_file=None,
+                stdout=''.join(stdout_lines),
+                stderr=error_msg,
+                return_code=-1,
+                execution_time=execution_time,
+                errors=[error_msg]
+            )
+            
+        except asyncio.CancelledError:
+            await self._kill(process)
+            logger.info(f"Cancelled Quarto command: {' '.join(command.args)}")
+            raise
+            
+        except Exception as e:
+            await self._kill(process)
+            execution_time = time.time() - start_time
+            error_msg = f"Error executing Quarto command: {e}"
+            logger.error(error_msg)
+            
+            return QuartoResult(
+                success=False,
+                output_file=None,
+                stdout=''.join(stdout_lines),
+                stderr=str(e),
+                return_code=-1,
+                execution_time=execution_time,
+                errors=[error_msg]
+            )
+        
+        execution_time = time.time() - start_time
+        stdout = ''.join(stdout_lines)
+        success = process.returncode == 0 and not errors
+        output_file = self._find_output_file(command, stdout)
+        
+        quarto_result = QuartoResult(
+            success=success,
+            output_file=output_file,
+            stdout=stdout,
+            stderr=''.join(stderr_lines),
+            return_code=process.returncode,
+            execution_time=execution_time,
+            warnings=warnings,
+            errors=errors,
+            resources=(tracked.usage or ResourceUsage()).with_output(output_file)
+        )
+        
+        self.last_result = quarto_result
+        self._remember_render(command, inputs_digest, quarto_result)
+        
+        if success:
+            logger.info(f"Quarto command completed successfully in {execution_time:.2f}s")
+            if output_file:
+                logger.info(f"Generated output: {output_file}")
+        else:
+            logger.error(f"Quarto command failed with return code {process.returncode}")
+            for error in errors:
+                logger.error(f"Error: {error}")
+        
+        for warning in warnings:
+            logger.warning(f"Warning: {warning}")
+        
+        return quarto_result
+    
+    @staticmethod
+    async def _kill(process: Optional[asyncio.subprocess.Process]) -> None:
+        """Kill a Quarto process that is still running and reap it."""
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
 class QuartoOrchestrator:
     """
     Professional Quarto orchestration system with comprehensive command interface.
@@ -660,7 +943,13 @@ class QuartoOrchestrator:
     def __init__(self):
         self.command_builder = QuartoCommandBuilder()
         self.executor = QuartoExecutor()
+        self._async_executor: Optional[AsyncQuartoExecutor] = None
+        self.render_service = None
+        self.render_cache = None
         self.last_results: Dict[str, QuartoResult] = {}
+        # Inputs rendered in place by running render_jobs calls, with their number of renders
+        self._inputs_in_flight: Dict[str, int] = {}
+        self._in_flight_lock = threading.Lock()
         
         # Initialize theme and template managers
         self.theme_manager = ThemeManager()
@@ -669,17 +958,16 @@ class QuartoOrchestrator:
         # Initialize math renderer for perfect math rendering
         self.math_renderer = MathRenderer()
     
-    @handle_exception
-    def generate_slides(
-        self, 
-        input_file: str, 
+    def prepare_slides(
+        self,
+        input_file: str,
         format: str = "revealjs",
         output_file: Optional[str] = None,
         theme: str = "white",
         custom_options: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> RenderJob:
         """
-        Generate slides from Quarto markdown file.
+        Build the render job for slides without running it.
         
         Args:
             input_file: Path to .qmd file
@@ -687,15 +975,13 @@ class QuartoOrchestrator:
             output_file: Optional output file path
             theme: Presentation theme
             custom_options: Optional custom configuration
-            
+        
         Returns:
-            Path to generated slides file
-            
+            RenderJob producing the slides
+        
         Raises:
-            OutputError: If slide generation fails
+            OutputError: If the input file does not exist
         """
-        logger.info(f"Generating {format} slides from {input_file}")
-        
         # Validate input file
         input_path = Path(input_file)
         if not input_path.exists():
@@ -709,34 +995,18 @@ class QuartoOrchestrator:
             output_file=output_file,
             custom_options=custom_options
         )
-        
-        # Execute command
-        result = self.executor.execute_command(command)
-        self.last_results[f"slides_{format}"] = result
-        
-        if not result.success:
-            error_msg = f"Failed to generate {format} slides"
-            if result.errors:
-                error_msg += f": {'; '.join(result.errors)}"
-            raise OutputError(error_msg)
-        
-        if not result.output_file:
-            raise OutputError(f"No output file generated for {format} slides")
-        
-        logger.info(f"Successfully generated {format} slides: {result.output_file}")
-        return result.output_file
+        return RenderJob(kind='slides', command=command)
     
-    @handle_exception
-    def generate_notes(
-        self, 
-        input_file: str, 
+    def prepare_notes(
+        self,
+        input_file: str,
         format: str = "pdf",
         output_file: Optional[str] = None,
         academic_style: bool = True,
         custom_options: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> RenderJob:
         """
-        Generate notes from Quarto markdown file.
+        Build the render job for notes without running it.
         
         Args:
             input_file: Path to .qmd file
@@ -744,15 +1014,13 @@ class QuartoOrchestrator:
             output_file: Optional output file path
             academic_style: Whether to use academic formatting
             custom_options: Optional custom configuration
-            
+        
         Returns:
-            Path to generated notes file
-            
+            RenderJob producing the notes
+        
         Raises:
-            OutputError: If notes generation fails
+            OutputError: If the input file does not exist
         """
-        logger.info(f"Generating {format} notes from {input_file}")
-        
         # Validate input file
         input_path = Path(input_file)
         if not input_path.exists():
@@ -766,25 +1034,348 @@ class QuartoOrchestrator:
             academic_style=academic_style,
             custom_options=custom_options
         )
+        return RenderJob(kind='notes', command=command)
+    
+    def render_jobs(
+        self,
+        jobs: List[RenderJob],
+        max_workers: Optional[int] = None
+    ) -> List[QuartoResult]:
+        """
+        Run render jobs concurrently, one Quarto process per job.
+        
+        Every job gets a QuartoResult, including jobs that failed or raised.
+        Jobs that share an input file, with each other or with renders of
+        concurrent calls, render from sibling copies of it so that the
+        intermediate files Quarto writes next to its input cannot collide.
+        Temporary files listed in the jobs' cleanup are removed once all jobs
+        have finished.
+        
+        Args:
+            jobs: Prepared render jobs
+            max_workers: Maximum number of concurrent Quarto processes
+                (default: one per job)
+        
+        Returns:
+            QuartoResult of each job, in the order of jobs
+        """
+        if not jobs:
+            return []
+        
+        workers = max(1, min(max_workers or len(jobs), len(jobs)))
+        commands, copies, claimed = self._isolate_shared_inputs(jobs)
+        start_time = time.time()
+        
+        try:
+            if workers == 1:
+                results = [self._execute_job(job, command) for job, command in zip(jobs, commands)]
+            else:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(self._execute_job, jobs, commands))
+        finally:
+            self._release_inputs(claimed)
+            self._remove_temporary_files(jobs, copies)
+        
+        self._record_results(jobs, results, workers, start_time)
+        return results
+    
+    async def render_jobs_async(
+        self,
+        jobs: List[RenderJob],
+        max_workers: Optional[int] = None,
+        on_line: Optional[Callable[[RenderJob, str, Optional[str]], None]] = None
+    ) -> List[QuartoResult]:
+        """
+        Run render jobs as subprocesses of the running event loop.
+        
+        Behaves like render_jobs, without a thread per job. Cancelling the
+        awaiting task kills the running Quarto processes and still removes
+        the temporary files.
+        
+        Args:
+            jobs: Prepared render jobs
+            max_workers: Maximum number of concurrent Quarto processes
+                (default: one per job)
+            on_line: Optional callback receiving the job, each non-empty
+                output line and its classification as Quarto prints them
+            
+        Returns:
+            QuartoResult of each job, in the order of jobs
+        """
+        if not jobs:
+            return []
+        
+        workers = max(1, min(max_workers or len(jobs), len(jobs)))
+        executor = self.async_executor
+        semaphore = asyncio.Semaphore(workers)
+        commands, copies, claimed = self._isolate_shared_inputs(jobs)
+        start_time = time.time()
+        
+        async def run(job: RenderJob, command: QuartoCommand) -> QuartoResult:
+            line_callback = None
+            if on_line is not None:
+                line_callback = lambda line, kind: on_line(job, line, kind)
+            async with semaphore:
+                try:
+                    return await executor.execute_command_async(
+                        command, timeout=job.timeout, on_line=line_callback
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    return self._failed_job_result(job, e)
+        
+        try:
+            results = await asyncio.gather(*(run(job, command) for job, command in zip(jobs, commands)))
+        finally:
+            self._release_inputs(claimed)
+            self._remove_temporary_files(jobs, copies)
         
-        # Execute command
-        result = self.executor.execute_command(command)
-        self.last_results[f"notes_{format}"] = result
+        self._record_results(jobs, results, workers, start_time)
+        return list(results)
+    
+    @property
+    def async_executor(self) -> AsyncQuartoExecutor:
+        """Executor used by render_jobs_async, created on first use."""
+        if self._async_executor is None:
+            self._async_executor = AsyncQuartoExecutor()
+            self._async_executor.render_service = self.render_service
+            self._async_executor.render_cache = self.render_cache
+        return self._async_executor
+    
+    def use_render_service(self, render_service) -> None:
+        """
+        Send the renders a warm worker can handle to it.
+        
+        Args:
+            render_service: QuartoRenderService, or None for one-shot renders only
+        """
+        self.render_service = render_service
+        self.executor.render_service = render_service
+        if self._async_executor is not None:
+            self._async_executor.render_service = render_service
+    
+    def use_render_cache(self, render_cache) -> None:
+        """
+        Reuse the outputs of renders whose inputs have not changed.
+        
+        Args:
+            render_cache: RenderCache, or None to always run Quarto
+        """
+        self.render_cache = render_cache
+        self.executor.render_cache = render_cache
+        if self._async_executor is not None:
+            self._async_executor.render_cache = render_cache
+    
+    def use_concurrency_controller(self, controller) -> None:
+        """
+        Hold renders back until an adaptive controller has room for them.
+        
+        Applies to renders through render_jobs; renders on an event loop keep
+        their own limit.
         
+        Args:
+            controller: AdaptiveConcurrencyController, or None for no limit
+                beyond max_workers
+        """
+        self.executor.concurrency = controller
+    
+    def require_output(self, job: RenderJob, result: QuartoResult) -> str:
+        """
+        Return the output file of a finished job.
+        
+        Raises:
+            OutputError: If the job failed or produced no output file
+        """
         if not result.success:
-            error_msg = f"Failed to generate {format} notes"
+            error_msg = f"Failed to generate {job.format} {job.kind}"
             if result.errors:
                 error_msg += f": {'; '.join(result.errors)}"
             raise OutputError(error_msg)
         
         if not result.output_file:
-            raise OutputError(f"No output file generated for {format} notes")
+            raise OutputError(f"No output file generated for {job.format} {job.kind}")
         
-        logger.info(f"Successfully generated {format} notes: {result.output_file}")
+        logger.info(f"Successfully generated {job.format} {job.kind}: {result.output_file}")
         return result.output_file
     
+    def _render(self, job: RenderJob) -> str:
+        """Run a single job and return its output file."""
+        result = self.render_jobs([job])[0]
+        return self.require_output(job, result)
+    
+    def _execute_job(self, job: RenderJob, command: QuartoCommand) -> QuartoResult:
+        """Execute one job's command, turning exceptions into a failed result."""
+        try:
+            return self.executor.execute_command(command, timeout=job.timeout)
+        except Exception as e:
+            return self._failed_job_result(job, e)
+    
+    def _failed_job_result(self, job: RenderJob, error: Exception) -> QuartoResult:
+        """Result of a job whose execution raised."""
+        error_msg = f"Error executing Quarto command: {error}"
+        logger.error(f"{job.name}: {error_msg}")
+        return QuartoResult(
+            success=False,
+            output_file=None,
+            stdout="",
+            stderr=str(error),
+            return_code=-1,
+            execution_time=0.0,
+            errors=[error_msg]
+        )
+    
+    def _remove_temporary_files(self, jobs: List[RenderJob], copies: List[str]) -> None:
+        """Remove input copies and the temporary files listed by jobs."""
+        temporary_files = copies + [path for job in jobs for path in job.cleanup]
+        for path in dict.fromkeys(temporary_files):
+            try:
+                Path(path).unlink()
+            except FileNotFoundError:
+                pass
+    
+    def _record_results(
+        self,
+        jobs: List[RenderJob],
+        results: List[QuartoResult],
+        workers: int,
+        start_time: float
+    ) -> None:
+        """Store the results of finished jobs in last_results."""
+        for job, result in zip(jobs, results):
+            self.last_results[job.name] = result
+        
+        if len(jobs) > 1:
+            quarto_time = sum(result.execution_time for result in results)
+            logger.info(
+                f"Rendered {len(jobs)} jobs with {workers} workers in {time.time() - start_time:.2f}s "
+                f"({quarto_time:.2f}s of Quarto time)"
+            )
+    
+    def _isolate_shared_inputs(self, jobs: List[RenderJob]) -> Tuple[List[QuartoCommand], List[str], List[str]]:
+        """
+        Give every job after the first one rendering a given input its own copy.
+        
+        Inputs already being rendered by another render_jobs call count as
+        taken. The copy is rendered with an explicit --output, so the output
+        file keeps the name it would have had when rendering the original.
+        
+        Returns:
+            Tuple of (command to run for each job, paths of the copies made,
+            inputs claimed for rendering in place, to pass to _release_inputs)
+        """
+        commands = []
+        copies = []
+        claimed = []
+        
+        with self._in_flight_lock:
+            seen_inputs = set(self._inputs_in_flight)
+            
+            for index, job in enumerate(jobs):
+                command = job.command
+                input_path = Path(command.input_file)
+                key = os.path.realpath(input_path)
+                
+                if key in seen_inputs and input_path.exists():
+                    copy_path = input_path.with_name(f"{input_path.stem}__{job.name}_{index}{input_path.suffix}")
+                    shutil.copyfile(input_path, copy_path)
+                    copies.append(str(copy_path))
+                    
+                    if command.output_file:
+                        output_file = command.output_file
+                        extra_args = []
+                    else:
+                        output_name = f"{input_path.stem}{FORMAT_EXTENSIONS.get(command.output_format, '.html')}"
+                        output_file = str(input_path.parent / output_name)
+                        extra_args = ['--output', output_name]
+                    
+                    command = QuartoCommand(
+                        input_file=str(copy_path),
+                        output_format=command.output_format,
+                        output_file=output_file,
+                        args=[str(copy_path) if arg == command.input_file else arg for arg in command.args] + extra_args,
+                        env_vars=dict(command.env_vars)
+                    )
+                else:
+                    claimed.append(key)
+                
+                seen_inputs.add(key)
+                commands.append(command)
+            
+            for key in claimed:
+                self._inputs_in_flight[key] = self._inputs_in_flight.get(key, 0) + 1
+        
+        return commands, copies, claimed
+    
+    def _release_inputs(self, claimed: List[str]) -> None:
+        """Mark inputs claimed by _isolate_shared_inputs as no longer rendering."""
+        with self._in_flight_lock:
+            for key in claimed:
+                self._inputs_in_flight[key] -= 1
+                if not self._inputs_in_flight[key]:
+                    del self._inputs_in_flight[key]
+
     @handle_exception
-    def generate_themed_slides(
+    def generate_slides(
+        self, 
+        input_file: str, 
+        format: str = "revealjs",
+        output_file: Optional[str] = None,
+        theme: str = "white",
+        custom_options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate slides from Quarto markdown file.
+        
+        Args:
+            input_file: Path to .qmd file
+            format: Output format (revealjs, beamer, pptx)
+            output_file: Optional output file path
+            theme: Presentation theme
+            custom_options: Optional custom configuration
+            
+        Returns:
+            Path to generated slides file
+            
+        Raises:
+            OutputError: If slide generation fails
+        """
+        logger.info(f"Generating {format} slides from {input_file}")
+        
+        job = self.prepare_slides(input_file, format, output_file, theme, custom_options)
+        return self._render(job)
+    
+    @handle_exception
+    def generate_notes(
+        self, 
+        input_file: str, 
+        format: str = "pdf",
+        output_file: Optional[str] = None,
+        academic_style: bool = True,
+        custom_options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate notes from Quarto markdown file.
+        
+        Args:
+            input_file: Path to .qmd file
+            format: Output format (pdf, html)
+            output_file: Optional output file path
+            academic_style: Whether to use academic formatting
+            custom_options: Optional custom configuration
+            
+        Returns:
+            Path to generated notes file
+            
+        Raises:
+            OutputError: If notes generation fails
+        """
+        logger.info(f"Generating {format} notes from {input_file}")
+        
+        job = self.prepare_notes(input_file, format, output_file, academic_style, custom_options)
+        return self._render(job)
+    
+    def prepare_themed_slides(
         self,
         input_file: str,
         theme_name: str = "academic-minimal",
@@ -794,9 +1385,9 @@ class QuartoOrchestrator:
         variables: Optional[Dict[str, Any]] = None,
         custom_options: Optional[Dict[str, Any]] = None,
         slides_config: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> RenderJob:
         """
-        Generate slides with custom theme and template.
+        Write the theme (and templated or re-themed input) and build the render job.
         
         Args:
             input_file: Path to .qmd file
@@ -808,12 +1399,12 @@ class QuartoOrchestrator:
             custom_options: Optional custom configuration
             
         Returns:
-            Path to generated slides file
+            RenderJob producing the slides
             
         Raises:
-            OutputError: If generation fails
+            OutputError: If the theme or template cannot be prepared
         """
-        logger.info(f"Generating themed slides with theme '{theme_name}' from {input_file}")
+        logger.info(f"Preparing themed slides with theme '{theme_name}' from {input_file}")
         
         # Get theme
         theme = self.theme_manager.get_theme(theme_name)
@@ -835,11 +1426,8 @@ class QuartoOrchestrator:
             theme_options.update(custom_options)
         
         # Generate theme SCSS if needed
-        if theme_name.startswith('academic-'):
-            scss_content = self.theme_manager.generate_reveal_css(theme)
-            scss_file = Path(input_file).parent / f"{theme_name}.scss"
-            with open(scss_file, 'w', encoding='utf-8') as f:
-                f.write(scss_content)
+        scss_file = self.write_theme_scss(theme_name, Path(input_file).parent)
+        if scss_file is not None:
             # Use the SCSS file path as the theme - use relative path for Quarto
             actual_theme = scss_file.name  # Just the filename, not full path
             logger.info(f"Generated SCSS file for theme '{theme_name}' at: {scss_file}, using relative path: {actual_theme}")
@@ -866,47 +1454,118 @@ class QuartoOrchestrator:
             # Write rendered content to temporary file
             input_path = Path(input_file)
             temp_file = input_path.parent / f"temp_{input_path.stem}.qmd"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(rendered_content)
+            write_if_changed(temp_file, rendered_content)
             
-            try:
-                # Generate slides from templated content
-                result_file = self.generate_slides(
-                    str(temp_file), format, output_file, actual_theme, theme_options
-                )
-                return result_file
-            finally:
-                # Clean up temporary file
-                if temp_file.exists():
-                    temp_file.unlink()
+            # Render from the templated content; the temporary file goes with the job
+            job = self.prepare_slides(
+                str(temp_file), format, output_file, actual_theme, theme_options
+            )
+            job.cleanup.append(str(temp_file))
+            return job
         else:
             # For built-in themes, regenerate the QMD file with correct frontmatter
             if theme_name.startswith('academic-') and slides_config:
-                # Read the content from the input file (without frontmatter)
-                input_path = Path(input_file)
                 with open(input_file, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
-                # Skip existing frontmatter if present
-                if content.startswith('---'):
-                    parts = content.split('---', 2)
-                    if len(parts) >= 3:
-                        content = parts[2].strip()
-                
-                # Generate new frontmatter with correct theme path
-                frontmatter = self.generate_revealjs_frontmatter(slides_config, actual_theme, input_file, output_file)
-                
-                # Overwrite the file with new frontmatter
-                with open(input_file, 'w', encoding='utf-8') as f:
-                    f.write(frontmatter + content)
-                
-                logger.info(f"Updated QMD file with themed frontmatter: {actual_theme}")
+                # Left untouched when the document already has this frontmatter
+                themed_content = self.themed_slides_document(content, theme_name, slides_config, input_file, output_file)
+                if write_if_changed(input_file, themed_content):
+                    logger.info(f"Updated QMD file with themed frontmatter: {actual_theme}")
             
-            # Generate slides without template
-            return self.generate_slides(
+            # Render slides without template
+            return self.prepare_slides(
                 input_file, format, output_file, actual_theme, theme_options
             )
     
+    def write_theme_scss(self, theme_name: str, directory: Path) -> Optional[Path]:
+        """
+        Write the SCSS of a built-in academic theme into directory.
+        
+        The file is left untouched when it is already up to date.
+        
+        Returns:
+            Path of the SCSS file, or None for themes that need none
+        """
+        if not theme_name.startswith('academic-'):
+            return None
+        scss_file = Path(directory) / f"{theme_name}.scss"
+        write_if_changed(scss_file, self.theme_manager.generate_reveal_css(self.theme_manager.get_theme(theme_name)))
+        return scss_file
+    
+    def themed_slides_document(
+        self,
+        content: str,
+        theme_name: str,
+        slides_config: Dict[str, Any],
+        input_file: Optional[str] = None,
+        output_file: Optional[str] = None
+    ) -> str:
+        """
+        Return a slides document with the frontmatter prepare_themed_slides gives it.
+        
+        Writing this content up front means preparing the themed job finds the
+        document up to date and does not rewrite it.
+        
+        Args:
+            content: Slides document, with or without frontmatter
+            theme_name: Built-in academic theme (other themes leave content as is)
+            slides_config: Slides configuration dictionary
+            input_file: Path of the document
+            output_file: Optional output file path
+            
+        Returns:
+            The document with frontmatter referencing the generated theme SCSS
+        """
+        if not (theme_name.startswith('academic-') and slides_config):
+            return content
+        
+        # Skip existing frontmatter if present
+        if content.startswith('---'):
+            parts = content.split('---', 2)
+            if len(parts) >= 3:
+                content = parts[2].strip()
+        
+        # Generate new frontmatter with correct theme path
+        frontmatter = self.generate_revealjs_frontmatter(slides_config, theme_name, input_file, output_file)
+        return frontmatter + content
+    
+    @handle_exception
+    def generate_themed_slides(
+        self,
+        input_file: str,
+        theme_name: str = "academic-minimal",
+        template_name: Optional[str] = None,
+        format: str = "revealjs",
+        output_file: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        custom_options: Optional[Dict[str, Any]] = None,
+        slides_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate slides with custom theme and template.
+        
+        Args:
+            input_file: Path to .qmd file
+            theme_name: Name of theme to use
+            template_name: Optional template name
+            format: Output format (revealjs, beamer, pptx)
+            output_file: Optional output file path
+            variables: Template variables
+            custom_options: Optional custom configuration
+            
+        Returns:
+            Path to generated slides file
+            
+        Raises:
+            OutputError: If generation fails
+        """
+        job = self.prepare_themed_slides(
+            input_file, theme_name, template_name, format, output_file,
+            variables, custom_options, slides_config
+        )
+        return self._render(job)
+    
     @handle_exception
     def generate_slides_with_math_optimization(
         self,
@@ -914,7 +1573,8 @@ class QuartoOrchestrator:
         format: str = "revealjs",
         output_file: Optional[str] = None,
         theme: str = "white",
-        custom_options: Optional[Dict[str, Any]] = None
+        custom_options: Optional[Dict[str, Any]] = None,
+        latex_result: Optional[LaTeXValidationResult] = None
     ) -> str:
         """
         Generate slides with optimized math rendering.
@@ -925,6 +1585,8 @@ class QuartoOrchestrator:
             output_file: Optional output file path
             theme: Presentation theme
             custom_options: Optional custom configuration
+            latex_result: LaTeX analysis of the source document (for example
+                SplitResult.latex_validation_result) to reuse instead of re-parsing
             
         Returns:
             Path to generated slides file with optimized math rendering
@@ -954,12 +1616,12 @@ class QuartoOrchestrator:
         
         # Optimize math rendering
         optimization_result = self.math_renderer.optimize_math_rendering(
-            content, math_format
+            content, math_format, latex_result=latex_result
         )
         
         # Create temporary optimized file
         temp_file = input_path.parent / f"temp_optimized_{input_path.name}"
-        temp_file.write_text(optimization_result.optimized_content, encoding='utf-8')
+        write_if_changed(temp_file, optimization_result.optimized_content)
         
         try:
             # Generate Quarto config with math optimization
@@ -1008,7 +1670,8 @@ class QuartoOrchestrator:
         format: str = "pdf",
         output_file: Optional[str] = None,
         academic_style: bool = True,
-        custom_options: Optional[Dict[str, Any]] = None
+        custom_options: Optional[Dict[str, Any]] = None,
+        latex_result: Optional[LaTeXValidationResult] = None
     ) -> str:
         """
         Generate notes with optimized math rendering.
@@ -1019,6 +1682,8 @@ class QuartoOrchestrator:
             output_file: Optional output file path
             academic_style: Whether to use academic formatting
             custom_options: Optional custom configuration
+            latex_result: LaTeX analysis of the source document (for example
+                SplitResult.latex_validation_result) to reuse instead of re-parsing
             
         Returns:
             Path to generated notes file with optimized math rendering
@@ -1046,12 +1711,12 @@ class QuartoOrchestrator:
         
         # Optimize math rendering
         optimization_result = self.math_renderer.optimize_math_rendering(
-            content, math_format
+            content, math_format, latex_result=latex_result
         )
         
         # Create temporary optimized file
         temp_file = input_path.parent / f"temp_optimized_{input_path.name}"
-        temp_file.write_text(optimization_result.optimized_content, encoding='utf-8')
+        write_if_changed(temp_file, optimization_result.optimized_content)
         
         try:
             # Generate Quarto config with math optimization
@@ -1122,8 +1787,7 @@ class QuartoOrchestrator:
         
         return string_results
     
-    @handle_exception
-    def generate_templated_notes(
+    def prepare_templated_notes(
         self,
         input_file: str,
         template_name: Optional[str] = None,
@@ -1132,9 +1796,9 @@ class QuartoOrchestrator:
         variables: Optional[Dict[str, Any]] = None,
         academic_style: bool = True,
         custom_options: Optional[Dict[str, Any]] = None
-    ) -> str:
+    ) -> RenderJob:
         """
-        Generate notes with custom template.
+        Write the templated input (if any) and build the render job for notes.
         
         Args:
             input_file: Path to .qmd file
@@ -1146,12 +1810,12 @@ class QuartoOrchestrator:
             custom_options: Optional custom configuration
             
         Returns:
-            Path to generated notes file
+            RenderJob producing the notes
             
         Raises:
-            OutputError: If generation fails
+            OutputError: If the template cannot be prepared
         """
-        logger.info(f"Generating templated notes from {input_file}")
+        logger.info(f"Preparing templated notes from {input_file}")
         
         # Use template if specified
         if template_name:
@@ -1174,25 +1838,55 @@ class QuartoOrchestrator:
             
             # Write rendered content to temporary file
             temp_file = Path(input_file).parent / f"temp_{Path(input_file).name}"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                f.write(rendered_content)
+            write_if_changed(temp_file, rendered_content)
             
-            try:
-                # Generate notes from templated content
-                result_file = self.generate_notes(
-                    str(temp_file), format, output_file, academic_style, custom_options
-                )
-                return result_file
-            finally:
-                # Clean up temporary file
-                if temp_file.exists():
-                    temp_file.unlink()
+            # Render from the templated content; the temporary file goes with the job
+            job = self.prepare_notes(
+                str(temp_file), format, output_file, academic_style, custom_options
+            )
+            job.cleanup.append(str(temp_file))
+            return job
         else:
-            # Generate notes without template
-            return self.generate_notes(
+            # Render notes without template
+            return self.prepare_notes(
                 input_file, format, output_file, academic_style, custom_options
             )
     
+    @handle_exception
+    def generate_templated_notes(
+        self,
+        input_file: str,
+        template_name: Optional[str] = None,
+        format: str = "pdf",
+        output_file: Optional[str] = None,
+        variables: Optional[Dict[str, Any]] = None,
+        academic_style: bool = True,
+        custom_options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate notes with custom template.
+        
+        Args:
+            input_file: Path to .qmd file
+            template_name: Optional template name
+            format: Output format (pdf, html)
+            output_file: Optional output file path
+            variables: Template variables
+            academic_style: Whether to use academic formatting
+            custom_options: Optional custom configuration
+            
+        Returns:
+            Path to generated notes file
+            
+        Raises:
+            OutputError: If generation fails
+        """
+        job = self.prepare_templated_notes(
+            input_file, template_name, format, output_file,
+            variables, academic_style, custom_options
+        )
+        return self._render(job)
+    
     def list_available_themes(self) -> Dict[str, Dict[str, str]]:
         """
         List all available themes.
@@ -1296,7 +1990,9 @@ class QuartoOrchestrator:
             'total_executions': len(self.last_results),
             'successful': 0,
             'failed': 0,
+            'cached': 0,
             'total_time': 0.0,
+            'resources': summarize_usage(result.resources for result in self.last_results.values()),
             'results': {}
         }
         
@@ -1306,9 +2002,13 @@ class QuartoOrchestrator:
                 'execution_time': result.execution_time,
                 'output_file': result.output_file,
                 'warnings': len(result.warnings),
-                'errors': len(result.errors)
+                'errors': len(result.errors),
+                'cached': result.cached,
+                'resources': result.resources.to_dict() if result.resources is not None else None
             }
             
+            if result.cached:
+                summary['cached'] += 1
             if result.success:
                 summary['successful'] += 1
             else:
@@ -1447,8 +2147,7 @@ class QuartoOrchestrator:
                 # Read and copy the theme file
                 with open(theme_path, 'r', encoding='utf-8') as f:
                     theme_content = f.read()
-                with open(copied_theme, 'w', encoding='utf-8') as f:
-                    f.write(theme_content)
+                write_if_changed(copied_theme, theme_content)
                 
                 # Use the copied file name (relative to output directory)
                 frontmatter['format']['revealjs']['theme'] = [copied_theme.name]
@@ -0,0 +1,332 @@
+"""
+Render Cache - Skip Quarto renders whose inputs have not changed.
+
+Watch mode and batch runs write the same .qmd files again on every run, and
+editing notes-only content leaves the slides document untouched. The render
+cache keeps a manifest next to the outputs with a digest of everything a
+render read: the document, the command line, the local files the document
+references (theme SCSS, CSS, images, bibliography, includes) and the Quarto
+version. A render whose digest matches and whose output is still in place
+is answered from the manifest without starting Quarto.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import unquote
+
+import yaml
+
+from ..utils.logger import get_logger
+from .quarto_orchestrator import FORMAT_EXTENSIONS, QuartoCommand, QuartoResult
+from .toolchain import toolchain_registry
+
+logger = get_logger(__name__)
+
+
+# Bump when the digest inputs or the layout of the manifest change
+RENDER_CACHE_FORMAT_VERSION = 1
+
+# Name of the manifest kept in every output directory
+RENDER_MANIFEST_NAME = '.render-manifest.json'
+
+# Local paths referenced from the body of a document: markdown links and
+# images, HTML attributes and Quarto include shortcodes
+REFERENCE_PATTERNS = [
+    re.compile(r'!?\[[^\]]*\]\(\s*<?([^)\s>]+)'),
+    re.compile(r'''(?:src|href|data-background-image)\s*=\s*["']([^"']+)["']'''),
+    re.compile(r'\{\{<\s*include\s+([^\s>]+)'),
+]
+
+FRONTMATTER_PATTERN = re.compile(r'\A---\s*\n(.*?)\n---\s*(?:\n|\Z)', re.DOTALL)
+
+
+def expected_output_file(command: QuartoCommand) -> Path:
+    """Return the file a command renders to, as Quarto resolves it."""
+    input_path = Path(command.input_file).absolute()
+    if command.output_file:
+        output_path = Path(command.output_file)
+        return output_path if output_path.is_absolute() else input_path.parent / output_path
+    return input_path.parent / f"{input_path.stem}{FORMAT_EXTENSIONS.get(command.output_format, '.html')}"
+
+
+def _frontmatter_strings(text: str) -> List[str]:
+    """Return every string value of the document's YAML frontmatter."""
+    match = FRONTMATTER_PATTERN.match(text)
+    if not match:
+        return []
+    try:
+        data = yaml.safe_load(match.group(1))
+    except yaml.YAMLError:
+        return []
+    
+    strings = []
+    pending = [data]
+    while pending:
+        value = pending.pop()
+        if isinstance(value, str):
+            strings.append(value)
+        elif isinstance(value, dict):
+            pending.extend(value.values())
+        elif isinstance(value, list):
+            pending.extend(value)
+    return strings
+
+
+def _local_path(reference: str) -> Optional[str]:
+    """Strip a reference down to a local path, or None for URLs and anchors."""
+    reference = reference.strip()
+    if not reference or reference.startswith('#') or '://' in reference:
+        return None
+    if reference.startswith(('data:', 'mailto:')):
+        return None
+    return unquote(reference.split('#', 1)[0].split('?', 1)[0]) or None
+
+
+def _is_file(path: Path) -> bool:
+    """Path.is_file that treats unusable paths (too long, invalid) as missing."""
+    try:
+        return path.is_file()
+    except (OSError, ValueError):
+        return False
+
+
+def referenced_files(text: str, base_dir: Path) -> Dict[str, Optional[Path]]:
+    """
+    Find the local files a document refers to.
+    
+    Links, images and includes in the body count even when the file does not
+    exist (creating it changes the render); frontmatter values only count when
+    they name an existing file.
+    
+    Returns:
+        Mapping of reference to the file it resolves to, or None if missing
+    """
+    references: Dict[str, Optional[Path]] = {}
+    
+    for value in _frontmatter_strings(text):
+        path = _local_path(value)
+        if path and '\n' not in path and _is_file(base_dir / path):
+            references[path] = base_dir / path
+    
+    for pattern in REFERENCE_PATTERNS:
+        for match in pattern.finditer(text):
+            path = _local_path(match.group(1))
+            if path and path not in references:
+                candidate = base_dir / path
+                references[path] = candidate if _is_file(candidate) else None
+    
+    return references
+
+
+class RenderCache:
+    """
+    Skip-unchanged cache of Quarto renders, persisted next to the outputs.
+    
+    Each output directory holds a manifest mapping output file names to the
+    digest of the inputs they were rendered from, plus the size and mtime of
+    the output at that time. Digests of referenced files are memoized by
+    (mtime, size), so unchanged images are not read again. Safe to use from
+    multiple threads.
+    """
+    
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self._file_digests: Dict[str, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+        # Guards manifest updates; replaced by a lock shared between processes
+        # when batch files render in worker processes
+        self._manifest_lock: Any = self._lock
+    
+    def share_manifest_lock(self, lock: Any) -> None:
+        """Guard manifest updates with a lock other processes hold too (e.g. a multiprocessing.Lock)."""
+        self._manifest_lock = lock
+    
+    def inputs_digest(self, command: QuartoCommand) -> Optional[str]:
+        """
+        Digest everything the render of a command depends on.
+        
+        Returns:
+            Hex digest, or None if the input document cannot be read
+        """
+        input_path = Path(command.input_file)
+        try:
+            content = input_path.read_bytes()
+        except OSError:
+            return None
+        
+        # Inputs rendered from a sibling copy must digest like the original
+        input_names = {str(command.input_file), input_path.name, str(input_path.absolute())}
+        args = ['<input>' if arg in input_names else arg for arg in command.args]
+        
+        digest = hashlib.sha256()
+        digest.update(json.dumps({
+            'format': RENDER_CACHE_FORMAT_VERSION,
+            'quarto': self._quarto_version(),
+            'to': command.output_format,
+            'args': args,
+            'env': sorted(command.env_vars.items())
+        }).encode('utf-8'))
+        digest.update(content)
+        
+        text = content.decode('utf-8', errors='replace')
+        for reference, path in sorted(referenced_files(text, input_path.parent).items()):
+            digest.update(f"\0{reference}\0".encode('utf-8'))
+            digest.update((self._file_digest(path) if path is not None else 'missing').encode('utf-8'))
+        
+        return digest.hexdigest()
+    
+    def lookup(self, command: QuartoCommand, inputs_digest: Optional[str]) -> Optional[QuartoResult]:
+        """
+        Return the result of an earlier identical render whose output is intact.
+        
+        Returns:
+            A cached QuartoResult, or None if the command has to run
+        """
+        if inputs_digest is None:
+            return None
+        
+        output_path = expected_output_file(command)
+        entry = self._read_manifest(output_path.parent).get(output_path.name)
+        if entry is None or entry.get('inputs') != inputs_digest or not self._output_intact(output_path, entry):
+            with self._lock:
+                self.misses += 1
+            return None
+        
+        with self._lock:
+            self.hits += 1
+        logger.info(f"Inputs unchanged, reusing {output_path}")
+        return QuartoResult(
+            success=True,
+            output_file=str(output_path.absolute()),
+            stdout='',
+            stderr='',
+            return_code=0,
+            execution_time=0.0,
+            warnings=list(entry.get('warnings', [])),
+            cached=True
+        )
+    
+    def store(self, command: QuartoCommand, inputs_digest: Optional[str], result: QuartoResult) -> None:
+        """Record a successful render of a command in its output directory's manifest."""
+        if inputs_digest is None or not result.success or not result.output_file:
+            return
+        
+        output_path = expected_output_file(command)
+        if Path(result.output_file).resolve() != output_path.resolve():
+            return
+        try:
+            stat = output_path.stat()
+        except OSError:
+            return
+        
+        support_dir = output_path.with_name(f"{output_path.stem}_files")
+        entry = {
+            'inputs': inputs_digest,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'support': [support_dir.name] if support_dir.is_dir() else [],
+            'warnings': list(result.warnings),
+            'rendered_at': time.time()
+        }
+        with self._manifest_lock:
+            entries = self._read_manifest(output_path.parent)
+            entries[output_path.name] = entry
+            self._write_manifest(output_path.parent, entries)
+    
+    def invalidate(self, output_dir: Path) -> None:
+        """Forget every render recorded in an output directory."""
+        with self._manifest_lock:
+            try:
+                (Path(output_dir) / RENDER_MANIFEST_NAME).unlink()
+            except FileNotFoundError:
+                pass
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit and miss counters of the cache."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'file_digests': len(self._file_digests)}
+    
+    @staticmethod
+    def _output_intact(output_path: Path, entry: Dict[str, Any]) -> bool:
+        """Whether an output and its support files are as the render left them."""
+        try:
+            stat = output_path.stat()
+        except OSError:
+            return False
+        if (stat.st_size, stat.st_mtime_ns) != (entry.get('size'), entry.get('mtime_ns')):
+            return False
+        return all((output_path.parent / name).is_dir() for name in entry.get('support', []))
+    
+    def _file_digest(self, path: Path) -> str:
+        """Return the content digest of a referenced file, memoized by (mtime, size)."""
+        key = str(path.resolve())
+        try:
+            stat = path.stat()
+        except OSError:
+            return 'missing'
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            memo = self._file_digests.get(key)
+            if memo is not None and memo[0] == signature:
+                return memo[1]
+        
+        digest = hashlib.sha256()
+        try:
+            with open(path, 'rb') as handle:
+                for chunk in iter(lambda: handle.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        except OSError:
+            return 'missing'
+        
+        with self._lock:
+            self._file_digests[key] = (signature, digest.hexdigest())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _quarto_version() -> str:
+        """Version of the Quarto on PATH, so upgrades invalidate every render."""
+        try:
+            return toolchain_registry.get('quarto').version
+        except Exception:
+            return ''
+    
+    @staticmethod
+    def _read_manifest(output_dir: Path) -> Dict[str, Dict[str, Any]]:
+        """Load the entries of a directory's manifest; unreadable manifests are empty."""
+        manifest_file = output_dir / RENDER_MANIFEST_NAME
+        try:
+            data = json.loads(manifest_file.read_text(encoding='utf-8'))
+            if data.get('format') != RENDER_CACHE_FORMAT_VERSION:
+                return {}
+            return dict(data['outputs'])
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable render manifest {manifest_file}: {e}")
+            return {}
+    
+    @staticmethod
+    def _write_manifest(output_dir: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Replace a directory's manifest; called with the manifest lock held."""
+        manifest_file = output_dir / RENDER_MANIFEST_NAME
+        temp_path = manifest_file.with_name(f"{manifest_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            temp_path.write_text(
+                json.dumps({'format': RENDER_CACHE_FORMAT_VERSION, 'outputs': entries}, indent=1),
+                encoding='utf-8'
+            )
+            os.replace(temp_path, manifest_file)
+        except OSError as e:
+            logger.debug(f"Could not write render manifest {manifest_file}: {e}")
+
+
+# Shared by the CLI and batch processing so file digests are memoized per process
+render_cache = RenderCache()
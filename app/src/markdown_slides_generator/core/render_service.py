@@ -0,0 +1,221 @@
+"""
+Render Service - Warm Quarto worker for watch mode.
+
+Every `quarto render` starts Quarto, Deno and Pandoc from scratch, which costs
+seconds per regeneration. A QuartoRenderService keeps one `quarto preview
+--no-serve` process running for the document being watched. Quarto watches
+the document and re-renders it when the splitter rewrites it; the service
+waits for the output Quarto reports. If the worker cannot be started or stops
+responding, the service disables itself and the executor falls back to
+one-shot `quarto render`.
+"""
+
+import os
+import queue
+import signal
+import threading
+import subprocess
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional, Tuple
+
+from ..utils.logger import get_logger
+from .quarto_orchestrator import QuartoCommand, QuartoResult, classify_output_line
+
+logger = get_logger(__name__)
+
+
+class RenderServiceError(Exception):
+    """Raised when the warm render worker cannot serve a request."""
+
+
+class QuartoRenderService:
+    """
+    Resident `quarto preview` process that re-renders one document as it changes.
+    
+    The worker is started by the first render, whose output is the preview's
+    own initial render. Quarto re-renders the document whenever it is written;
+    later renders wait for the output Quarto reports after the last write, or
+    return the previous result when the document was not written since. Safe
+    to call from multiple threads; renders are serialized.
+    """
+    
+    STARTUP_TIMEOUT = 60
+    RENDER_TIMEOUT = 60
+    
+    def __init__(self, input_file: str, output_format: str = 'revealjs'):
+        """
+        Args:
+            input_file: The .qmd file the worker renders
+            output_format: Quarto format the worker renders to
+        """
+        self.input_file = Path(input_file).resolve()
+        self.output_format = output_format
+        self.failed = False
+        self.renders = 0
+        self._process: Optional[subprocess.Popen] = None
+        # (time read, line) of the worker's output; a line of None marks its exit
+        self._lines: 'queue.Queue[Tuple[float, Optional[str]]]' = queue.Queue()
+        # Modification time and size of the document the last result was for
+        self._rendered_signature: Optional[Tuple[int, int]] = None
+        self._last_result: Optional[QuartoResult] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def alive(self) -> bool:
+        """Whether the worker process is running."""
+        return self._process is not None and self._process.poll() is None
+    
+    def handles(self, command: QuartoCommand) -> bool:
+        """Whether a command can be run by this worker instead of `quarto render`."""
+        return (
+            not self.failed
+            and command.output_file is None
+            and command.output_format == self.output_format
+            and Path(command.input_file).resolve() == self.input_file
+        )
+    
+    def render(self, timeout: Optional[float] = None) -> QuartoResult:
+        """
+        Render the document with the warm worker, starting it if needed.
+        
+        Args:
+            timeout: Seconds to wait for the render, at most RENDER_TIMEOUT
+        
+        Returns:
+            QuartoResult of the render; it fails if Quarto reported an error
+        
+        Raises:
+            RenderServiceError: If the worker died or did not answer in time;
+                the service is stopped and marked as failed
+        """
+        with self._lock:
+            if self.failed:
+                raise RenderServiceError("Render worker is disabled")
+            
+            start_time = time.time()
+            try:
+                if self._process is not None and not self.alive:
+                    raise RenderServiceError(f"Render worker exited with code {self._process.returncode}")
+                signature = self._input_signature()
+                if self.alive and signature == self._rendered_signature and self._last_result is not None:
+                    # Quarto only re-renders a document that was written
+                    return replace(self._last_result, stdout='', execution_time=0.0)
+                if self.alive:
+                    # Output read before the document was written belongs to earlier renders
+                    result = self._wait_for_render(
+                        start_time + min(timeout or self.RENDER_TIMEOUT, self.RENDER_TIMEOUT),
+                        since=signature[0] / 1e9
+                    )
+                else:
+                    self._start()
+                    result = self._wait_for_render(start_time + self.STARTUP_TIMEOUT)
+            except RenderServiceError as e:
+                logger.warning(f"Render worker failed, falling back to one-shot renders: {e}")
+                self.failed = True
+                self._terminate()
+                raise
+            
+            self.renders += 1
+            result.execution_time = time.time() - start_time
+            self._rendered_signature = signature
+            self._last_result = result
+            return result
+    
+    def stop(self) -> None:
+        """Stop the worker process."""
+        with self._lock:
+            self._terminate()
+    
+    def _input_signature(self) -> Tuple[int, int]:
+        """Modification time (ns) and size of the document."""
+        try:
+            stat = self.input_file.stat()
+        except OSError as e:
+            raise RenderServiceError(f"Cannot read {self.input_file}: {e}")
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _start(self) -> None:
+        """Launch `quarto preview` for the document, watching it but serving nothing."""
+        args = [
+            'quarto', 'preview', self.input_file.name,
+            '--to', self.output_format,
+            '--no-serve', '--no-browser'
+        ]
+        logger.info(f"Starting render worker: {' '.join(args)}")
+        self._lines = queue.Queue()
+        try:
+            self._process = subprocess.Popen(
+                args,
+                cwd=str(self.input_file.parent),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                start_new_session=(os.name == 'posix')
+            )
+        except OSError as e:
+            raise RenderServiceError(f"Could not start quarto preview: {e}")
+        
+        threading.Thread(target=self._read_output, args=(self._process, self._lines), daemon=True).start()
+    
+    @staticmethod
+    def _read_output(process: subprocess.Popen, lines: 'queue.Queue[Tuple[float, Optional[str]]]') -> None:
+        """Forward the worker's output lines with the time they were read; None marks its exit."""
+        for line in process.stdout:
+            lines.put((time.time(), line.strip()))
+        lines.put((time.time(), None))
+    
+    def _wait_for_render(self, deadline: float, since: float = 0.0) -> QuartoResult:
+        """Collect worker output read after since until it reports an output file or an error."""
+        result = QuartoResult(
+            success=False, output_file=None, stdout='', stderr='', return_code=0, execution_time=0.0
+        )
+        while True:
+            try:
+                read_at, line = self._lines.get(timeout=max(0.0, deadline - time.time()))
+            except queue.Empty:
+                raise RenderServiceError("Render worker did not finish in time")
+            if line is None:
+                raise RenderServiceError("Render worker exited")
+            if not line or read_at < since:
+                continue
+            
+            result.stdout += line + '\n'
+            kind = classify_output_line(line)
+            if kind == 'warning':
+                result.warnings.append(line)
+            elif kind == 'error':
+                result.errors.append(line)
+                result.return_code = 1
+                return result
+            elif line.startswith('Output created:'):
+                output_file = line[len('Output created:'):].strip()
+                result.output_file = str((self.input_file.parent / output_file).absolute())
+                result.success = True
+                return result
+    
+    def _terminate(self) -> None:
+        """Stop the worker process and everything it started."""
+        process, self._process = self._process, None
+        if process is None or process.poll() is not None:
+            return
+        logger.info("Stopping render worker")
+        try:
+            self._signal(process, signal.SIGTERM)
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._signal(process, signal.SIGKILL if os.name == 'posix' else signal.SIGTERM)
+            process.wait()
+        except ProcessLookupError:
+            pass
+    
+    @staticmethod
+    def _signal(process: subprocess.Popen, signum: int) -> None:
+        """Signal the worker's whole process group where supported."""
+        if os.name == 'posix':
+            os.killpg(process.pid, signum)
+        else:
+            process.send_signal(signum)
+
@@ -0,0 +1,222 @@
+"""
+Resource Usage - CPU, memory and output size of Quarto renders.
+
+Sizing render workers to the build host needs the cost of each render, not
+just its wall time. Renders run through subprocess are reaped with
+os.wait4, which returns the rusage of that one child (including the pandoc
+and deno processes it waited for). Asyncio reaps its children itself, so
+renders on an event loop fall back to the growth of RUSAGE_CHILDREN while
+they ran, which is only attributed when no other tracked render overlapped.
+On platforms without the resource module only the output size is known.
+"""
+
+import os
+import sys
+import threading
+import subprocess
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterable, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+@dataclass
+class ResourceUsage:
+    """Resources used by one render; None where they could not be measured."""
+    peak_rss_bytes: Optional[int] = None
+    user_cpu: Optional[float] = None
+    system_cpu: Optional[float] = None
+    output_size: Optional[int] = None
+    
+    @property
+    def cpu_time(self) -> Optional[float]:
+        """User plus system CPU seconds."""
+        if self.user_cpu is None or self.system_cpu is None:
+            return None
+        return self.user_cpu + self.system_cpu
+    
+    @classmethod
+    def from_rusage(cls, rusage: Any) -> 'ResourceUsage':
+        """Build from a struct_rusage of a single child."""
+        return cls(
+            peak_rss_bytes=rusage.ru_maxrss * MAXRSS_UNIT,
+            user_cpu=rusage.ru_utime,
+            system_cpu=rusage.ru_stime
+        )
+    
+    def with_output(self, output_file: Optional[str]) -> 'ResourceUsage':
+        """Record the size of the rendered file (and its _files support directory)."""
+        self.output_size = output_size(output_file) if output_file else None
+        return self
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data['cpu_time'] = self.cpu_time
+        return data
+
+
+def output_size(output_file: str) -> Optional[int]:
+    """Size in bytes of an output file plus its _files support directory."""
+    path = Path(output_file)
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return None
+    
+    support_dir = path.with_name(f"{path.stem}_files")
+    if support_dir.is_dir():
+        for root, _, files in os.walk(support_dir):
+            for name in files:
+                try:
+                    size += os.stat(os.path.join(root, name)).st_size
+                except OSError:
+                    pass
+    return size
+
+
+def summarize_usage(usages: Iterable[Optional[ResourceUsage]]) -> Dict[str, Any]:
+    """
+    Aggregate the usage of several renders.
+    
+    CPU times and output sizes add up; the peak RSS is the largest of the
+    renders, which is what a single worker needs. Renders without a
+    measurement are counted but contribute nothing.
+    
+    Returns:
+        Dictionary with measured, user_cpu, system_cpu, cpu_time,
+        peak_rss_bytes and output_bytes
+    """
+    summary = {
+        'measured': 0,
+        'user_cpu': 0.0,
+        'system_cpu': 0.0,
+        'cpu_time': 0.0,
+        'peak_rss_bytes': 0,
+        'output_bytes': 0
+    }
+    for usage in usages:
+        if usage is None:
+            continue
+        if usage.cpu_time is not None:
+            summary['measured'] += 1
+            summary['user_cpu'] += usage.user_cpu
+            summary['system_cpu'] += usage.system_cpu
+            summary['cpu_time'] += usage.cpu_time
+        if usage.peak_rss_bytes is not None:
+            summary['peak_rss_bytes'] = max(summary['peak_rss_bytes'], usage.peak_rss_bytes)
+        if usage.output_size is not None:
+            summary['output_bytes'] += usage.output_size
+    return summary
+
+
+class RusagePopen(subprocess.Popen):
+    """
+    Popen that keeps the rusage of the child when it reaps it.
+    
+    Overrides the hook Popen uses to wait for the child on POSIX, so
+    communicate(), wait() and subprocess.run work unchanged.
+    """
+    
+    rusage = None
+    
+    def _try_wait(self, wait_flags):
+        if not hasattr(os, 'wait4'):
+            return super()._try_wait(wait_flags)
+        try:
+            pid, status, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:
+            # The child was reaped elsewhere; report it like Popen does
+            return (self.pid, 0)
+        if pid == self.pid:
+            self.rusage = rusage
+        return (pid, status)
+
+
+def run_measured(args, **kwargs) -> Tuple[subprocess.CompletedProcess, Optional[ResourceUsage]]:
+    """
+    subprocess.run that also returns the child's resource usage.
+    
+    Raises:
+        subprocess.TimeoutExpired: Like subprocess.run
+    """
+    timeout = kwargs.pop('timeout', None)
+    with child_usage.track():
+        with RusagePopen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs) as process:
+            try:
+                stdout, stderr = process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise
+            completed = subprocess.CompletedProcess(args, process.poll(), stdout, stderr)
+    usage = ResourceUsage.from_rusage(process.rusage) if process.rusage is not None else None
+    return completed, usage
+
+
+class ChildUsageMeter:
+    """
+    Attribute growth of RUSAGE_CHILDREN to renders that ran alone.
+    
+    Every tracked render bumps an epoch when it starts; a window is only
+    attributed to its render if it started with no other render running
+    and no other render started before it finished.
+    """
+    
+    def __init__(self):
+        self._running = 0
+        self._epoch = 0
+        self._lock = threading.Lock()
+    
+    def track(self) -> '_TrackedChild':
+        """Context manager around a child that is reaped by someone else."""
+        return _TrackedChild(self)
+    
+    def _start(self) -> Tuple[int, bool, Any]:
+        with self._lock:
+            self._running += 1
+            self._epoch += 1
+            alone = self._running == 1
+            before = resource.getrusage(resource.RUSAGE_CHILDREN) if resource is not None else None
+            return self._epoch, alone, before
+    
+    def _stop(self, epoch: int, alone: bool, before: Any) -> Optional[ResourceUsage]:
+        with self._lock:
+            self._running -= 1
+            if not alone or epoch != self._epoch or before is None:
+                return None
+            after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        # The children's maximum RSS only tells this child's peak when it grew
+        peak = after.ru_maxrss * MAXRSS_UNIT if after.ru_maxrss > before.ru_maxrss else None
+        return ResourceUsage(
+            peak_rss_bytes=peak,
+            user_cpu=after.ru_utime - before.ru_utime,
+            system_cpu=after.ru_stime - before.ru_stime
+        )
+
+
+class _TrackedChild:
+    """Window of one tracked child; usage is set on exit if it could be attributed."""
+    
+    def __init__(self, meter: ChildUsageMeter):
+        self._meter = meter
+        self._window = None
+        self.usage: Optional[ResourceUsage] = None
+    
+    def __enter__(self) -> '_TrackedChild':
+        self._window = self._meter._start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.usage = self._meter._stop(*self._window)
+
+
+# Shared by every executor, since RUSAGE_CHILDREN covers the whole process
+child_usage = ChildUsageMeter()
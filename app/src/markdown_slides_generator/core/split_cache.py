@@ -0,0 +1,246 @@
+"""
+Split Cache - Content-addressed on-disk cache for ContentSplitter results.
+
+Stores the slides/notes markdown of a split together with its directive,
+LaTeX and validation summaries, keyed by a hash of everything the split
+depends on, so unchanged sources can skip the splitter on repeat runs.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Bump when the layout of cache entries changes
+CACHE_FORMAT_VERSION = 1
+
+
+def default_cache_dir() -> Path:
+    """Return the per-user directory used for split cache entries."""
+    base = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+    return Path(base) / 'markdown-slides-generator' / 'splits'
+
+
+class SplitCache:
+    """
+    Content-addressed, size-bounded cache of split results.
+    
+    Each entry is a JSON file named after its key. Reads refresh the entry's
+    modification time, and eviction removes the least recently used entries
+    once either the entry count or the total size exceeds its bound. The
+    directory is listed on the first store, then the entry count and size are
+    kept up to date by the stores and only listed again when a store takes
+    them over a bound, or every RESCAN_INTERVAL stores to count the entries
+    other processes wrote. Counters are kept per instance and are safe to
+    update from worker threads.
+    """
+    
+    DEFAULT_MAX_ENTRIES = 512
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    RESCAN_INTERVAL = 64
+    
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        # [entries, bytes] of the cache as last listed plus the stores since; None until listed
+        self._usage: Optional[List[int]] = None
+        self._stores_since_scan = 0
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(source: bytes, parser_version: str, bibliography_inputs: List[Path]) -> str:
+        """
+        Compute the cache key of a split.
+        
+        Args:
+            source: Raw bytes of the markdown source
+            parser_version: Version of the directive parser producing the split
+            bibliography_inputs: Resolved .bib files expanded into the source
+        
+        Returns:
+            Hex digest identifying the split
+        """
+        digest = hashlib.sha256()
+        digest.update(f"format={CACHE_FORMAT_VERSION};parser={parser_version}\0".encode('utf-8'))
+        digest.update(hashlib.sha256(source).digest())
+        for bib_path in bibliography_inputs:
+            digest.update(str(bib_path).encode('utf-8') + b'\0')
+            try:
+                digest.update(hashlib.sha256(bib_path.read_bytes()).digest())
+            except OSError:
+                digest.update(b'missing')
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached split.
+        
+        Args:
+            key: Key from make_key
+        
+        Returns:
+            The stored entry, or None on a miss
+        """
+        entry_path = self._entry_path(key)
+        try:
+            entry = json.loads(entry_path.read_text(encoding='utf-8'))
+            if entry.get('format') != CACHE_FORMAT_VERSION:
+                raise ValueError(f"unsupported cache format {entry.get('format')}")
+            os.utime(entry_path)  # Mark as recently used
+        except FileNotFoundError:
+            entry = None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable split cache entry {entry_path.name}: {e}")
+            self._remove(entry_path)
+            entry = None
+        
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+    
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        """
+        Store a split and evict old entries if the cache is over its bounds.
+        
+        Args:
+            key: Key from make_key
+            entry: JSON-serializable split result
+        """
+        entry_path = self._entry_path(key)
+        temp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        data = json.dumps(dict(entry, format=CACHE_FORMAT_VERSION)).encode('utf-8')
+        try:
+            replaced_size = entry_path.stat().st_size
+        except OSError:
+            replaced_size = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(data)
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            logger.warning(f"Could not write split cache entry to {self.cache_dir}: {e}")
+            self._remove(temp_path)
+            return
+        
+        with self._lock:
+            self.stores += 1
+            self._stores_since_scan += 1
+            if self._usage is None or self._stores_since_scan >= self.RESCAN_INTERVAL:
+                needs_scan = True
+            else:
+                if replaced_size is None:
+                    self._usage[0] += 1
+                    self._usage[1] += len(data)
+                else:
+                    self._usage[1] += len(data) - replaced_size
+                needs_scan = self._usage[0] > self.max_entries or self._usage[1] > self.max_bytes
+        if needs_scan:
+            self._evict()
+    
+    def clear(self) -> None:
+        """Remove all cache entries."""
+        for entry_path in self._list_entries():
+            self._remove(entry_path[0])
+        with self._lock:
+            self._usage = None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for this cache instance."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / lookups * 100) if lookups else 0.0
+            }
+    
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+    
+    def _list_entries(self) -> List[tuple]:
+        """List (path, size, mtime) for every cache entry."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as scanner:
+                for dir_entry in scanner:
+                    if not dir_entry.name.endswith('.json'):
+                        continue
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((Path(dir_entry.path), stat.st_size, stat.st_mtime))
+        except OSError:
+            pass
+        return entries
+    
+    def _evict(self) -> None:
+        """List the cache and drop least recently used entries until it is within its bounds."""
+        with self._evict_lock:
+            entries = self._list_entries()
+            remaining = len(entries)
+            total_bytes = sum(size for _, size, _ in entries)
+            if remaining > self.max_entries or total_bytes > self.max_bytes:
+                entries.sort(key=lambda entry: entry[2])
+                for entry_path, size, _ in entries:
+                    if remaining <= self.max_entries and total_bytes <= self.max_bytes:
+                        break
+                    if self._remove(entry_path):
+                        with self._lock:
+                            self.evictions += 1
+                    remaining -= 1
+                    total_bytes -= size
+                logger.debug(f"Split cache evicted down to {remaining} entries ({total_bytes} bytes)")
+            with self._lock:
+                self._usage = [remaining, total_bytes]
+                self._stores_since_scan = 0
+    
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+
+def create_split_cache(processing_config) -> Optional[SplitCache]:
+    """
+    Create the split cache described by a ProcessingConfig.
+    
+    Args:
+        processing_config: ProcessingConfig with split cache settings
+    
+    Returns:
+        SplitCache instance, or None if caching is disabled
+    """
+    if not getattr(processing_config, 'split_cache', False):
+        return None
+    
+    cache_dir = getattr(processing_config, 'split_cache_dir', None)
+    max_size_mb = getattr(processing_config, 'split_cache_max_size_mb', None)
+    max_bytes = max_size_mb * 1024 * 1024 if max_size_mb else SplitCache.DEFAULT_MAX_BYTES
+    return SplitCache(Path(cache_dir).expanduser() if cache_dir else None, max_bytes=max_bytes)
@@ -0,0 +1,198 @@
+"""
+Toolchain Registry - Process-wide cache of external tool version probes.
+
+Running `quarto --version` starts the Quarto runtime and takes hundreds of
+milliseconds. The registry keeps the outcome of each successful probe keyed by
+the resolved binary path and its modification time, for a bounded time, and
+can persist it so that short CLI runs skip the probe altogether.
+"""
+
+import os
+import json
+import time
+import shutil
+import threading
+import subprocess
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple
+
+from ..utils.logger import get_logger
+from .split_cache import default_cache_dir
+
+logger = get_logger(__name__)
+
+
+# Bump when the layout of the persisted registry changes
+REGISTRY_FORMAT_VERSION = 1
+
+
+def default_registry_file() -> Path:
+    """Return the per-user file the toolchain registry is persisted to."""
+    return default_cache_dir().parent / 'toolchain.json'
+
+
+@dataclass
+class ToolInfo:
+    """Outcome of running an external tool with --version."""
+    name: str
+    path: Optional[str]
+    version: str
+    return_code: int
+    stderr: str = ''
+    probed_at: float = 0.0
+    
+    @property
+    def available(self) -> bool:
+        """Whether the tool ran successfully."""
+        return self.return_code == 0
+
+
+class ToolchainRegistry:
+    """
+    TTL-bounded registry of tool version probes.
+    
+    Entries are keyed by (resolved binary path, mtime), so upgrading or
+    switching a tool on PATH is noticed on the next lookup. Only successful
+    probes are kept; tools that fail or cannot be located are probed again
+    every time. Safe to use from multiple threads.
+    """
+    
+    DEFAULT_TTL = 24 * 60 * 60
+    PROBE_TIMEOUT = 10
+    
+    def __init__(self, ttl: float = DEFAULT_TTL, cache_file: Optional[Path] = None):
+        """
+        Args:
+            ttl: Seconds a probe result stays valid
+            cache_file: Optional JSON file the registry is persisted to
+        """
+        self.ttl = ttl
+        self.cache_file = cache_file
+        self.hits = 0
+        self.probes = 0
+        self._entries: Dict[Tuple[str, int], ToolInfo] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+    
+    def enable_persistence(self, cache_file: Optional[Path] = None) -> None:
+        """Persist probe results to cache_file (default: the user cache directory)."""
+        with self._lock:
+            self.cache_file = Path(cache_file) if cache_file else default_registry_file()
+            self._loaded = False
+    
+    def get(self, name: str) -> ToolInfo:
+        """
+        Return the version probe of a tool, running `<name> --version` if needed.
+        
+        Args:
+            name: Executable name, looked up on PATH
+        
+        Returns:
+            ToolInfo of the tool currently on PATH
+        
+        Raises:
+            FileNotFoundError: If the tool cannot be executed
+            subprocess.TimeoutExpired: If the probe does not finish in time
+        """
+        key = self._binary_key(name)
+        if key is not None:
+            with self._lock:
+                self._load()
+                info = self._entries.get(key)
+                if info is not None and time.time() - info.probed_at < self.ttl:
+                    self.hits += 1
+                    return info
+        
+        info = self._probe(name, key)
+        if key is not None and info.available:
+            with self._lock:
+                self._entries[key] = info
+                self._save()
+        return info
+    
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget the probes of one tool, or of all tools."""
+        with self._lock:
+            self._load()
+            self._entries = {
+                key: info for key, info in self._entries.items()
+                if name is not None and info.name != name
+            }
+            self._save()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get probe counters of the registry."""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'probes': self.probes}
+    
+    @staticmethod
+    def _binary_key(name: str) -> Optional[Tuple[str, int]]:
+        """Return (resolved path, mtime_ns) of the executable name resolves to on PATH."""
+        located = shutil.which(name)
+        if located is None:
+            return None
+        path = os.path.realpath(located)
+        try:
+            return path, os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _probe(self, name: str, key: Optional[Tuple[str, int]]) -> ToolInfo:
+        with self._lock:
+            self.probes += 1
+        logger.debug(f"Probing {name} --version")
+        result = subprocess.run(
+            [name, '--version'],
+            capture_output=True,
+            text=True,
+            timeout=self.PROBE_TIMEOUT
+        )
+        return ToolInfo(
+            name=name,
+            path=key[0] if key else None,
+            version=result.stdout.strip(),
+            return_code=result.returncode,
+            stderr=result.stderr,
+            probed_at=time.time()
+        )
+    
+    def _load(self) -> None:
+        """Merge persisted entries into the registry; called with the lock held."""
+        if self._loaded or self.cache_file is None:
+            return
+        self._loaded = True
+        try:
+            data = json.loads(self.cache_file.read_text(encoding='utf-8'))
+            if data.get('format') != REGISTRY_FORMAT_VERSION:
+                return
+            for record in data['tools']:
+                self._entries.setdefault((record['path'], record['mtime_ns']), ToolInfo(**record['info']))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable toolchain registry {self.cache_file}: {e}")
+    
+    def _save(self) -> None:
+        """Write unexpired entries to the cache file; called with the lock held."""
+        if self.cache_file is None:
+            return
+        now = time.time()
+        records = [
+            {'path': path, 'mtime_ns': mtime_ns, 'info': asdict(info)}
+            for (path, mtime_ns), info in self._entries.items()
+            if now - info.probed_at < self.ttl
+        ]
+        temp_path = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(
+                json.dumps({'format': REGISTRY_FORMAT_VERSION, 'tools': records}), encoding='utf-8'
+            )
+            os.replace(temp_path, self.cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write toolchain registry {self.cache_file}: {e}")
+
+
+# Shared by every QuartoExecutor in the process; the CLI enables persistence
+toolchain_registry = ToolchainRegistry()
@@ -12,7 +12,12 @@ from .latex_processor import (
     LaTeXValidator,
     LaTeXExpression,
     LaTeXExpressionType,
-    LaTeXValidationResult
+    LaTeXValidationResult,
+    ExpressionChecks,
+    LaTeXParseCounter,
+    parse_counter,
+    check_line_range,
+    line_range_extents
 )
 from .math_renderer import (
     MathRenderer,
@@ -31,6 +36,11 @@ __all__ = [
     'LaTeXExpression',
     'LaTeXExpressionType',
     'LaTeXValidationResult',
+    'ExpressionChecks',
+    'LaTeXParseCounter',
+    'parse_counter',
+    'check_line_range',
+    'line_range_extents',
     'MathRenderer',
     'MathRenderingOptimizer',
     'MathCompatibilityChecker',
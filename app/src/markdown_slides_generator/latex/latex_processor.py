@@ -9,9 +9,12 @@ LaTeX support with comprehensive validation and custom command handling.
 import re
 import subprocess
 import tempfile
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Set, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 from ..utils.logger import get_logger
@@ -20,6 +23,65 @@ from ..utils.exceptions import handle_exception, InputError
 logger = get_logger(__name__)
 
 
+# A \begin as the parser finds it, which is within one line
+_BEGIN_ON_ONE_LINE = re.compile(r'\\begin\{([^}\n]+)\}')
+# Environment names whose \end pattern cannot match a line break
+_SINGLE_LINE_NAME = re.compile(r'[\w*.@: -]+')
+
+
+class LaTeXParseCounter:
+    """
+    Process-wide count of LaTeX parses per document.
+    
+    Documents are identified by their content, so repeated parses of the same
+    text by different consumers add up. Only the most recently parsed
+    documents are tracked to keep memory bounded in long-running watch mode.
+    """
+    
+    MAX_DOCUMENTS = 1024
+    
+    def __init__(self, max_documents: int = MAX_DOCUMENTS):
+        self.max_documents = max_documents
+        self.total_parses = 0
+        self._counts = OrderedDict()  # hash of content -> parse count
+        self._lock = threading.Lock()
+    
+    def record(self, content: str) -> None:
+        """Record one parse of content."""
+        key = hash(content)
+        with self._lock:
+            self.total_parses += 1
+            self._counts[key] = self._counts.pop(key, 0) + 1
+            if len(self._counts) > self.max_documents:
+                self._counts.popitem(last=False)
+    
+    def count(self, content: str) -> int:
+        """Get the number of recorded parses of content."""
+        with self._lock:
+            return self._counts.get(hash(content), 0)
+    
+    def reset(self) -> None:
+        """Forget all recorded parses."""
+        with self._lock:
+            self.total_parses = 0
+            self._counts.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get parse totals across all tracked documents."""
+        with self._lock:
+            documents = len(self._counts)
+            return {
+                'total_parses': self.total_parses,
+                'documents': documents,
+                'reparsed_documents': sum(1 for count in self._counts.values() if count > 1),
+                'max_parses_per_document': max(self._counts.values(), default=0)
+            }
+
+
+# Shared by every LaTeXExpressionParser in the process
+parse_counter = LaTeXParseCounter()
+
+
 class LaTeXExpressionType(Enum):
     """Types of LaTeX expressions found in markdown."""
     INLINE_MATH = "inline_math"  # $...$
@@ -46,6 +108,31 @@ class LaTeXExpression:
             self.suggestions = []
 
 
+@dataclass
+class ExpressionChecks:
+    """
+    Findings of the per-expression checks over a run of expressions.
+    
+    Checks of consecutive runs can be merged in document order and handed to
+    LaTeXValidator.validate_expressions, which then only adds the checks that
+    need the whole expression list.
+    """
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    syntax_errors: List[str] = field(default_factory=list)
+    packages_required: Set[str] = field(default_factory=set)
+    custom_commands: Set[str] = field(default_factory=set)
+    
+    def merge(self, other: 'ExpressionChecks') -> 'ExpressionChecks':
+        """Append the findings of the run following this one."""
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.syntax_errors.extend(other.syntax_errors)
+        self.packages_required.update(other.packages_required)
+        self.custom_commands.update(other.custom_commands)
+        return self
+
+
 @dataclass
 class LaTeXValidationResult:
     """Result of LaTeX validation process."""
@@ -134,6 +221,7 @@ class LaTeXExpressionParser:
     
     def __init__(self):
         self.expressions: List[LaTeXExpression] = []
+        self._line_start = 0
         self.required_packages: Set[str] = set()
         self.custom_commands: Set[str] = set()
     
@@ -147,14 +235,36 @@ class LaTeXExpressionParser:
         Returns:
             List of LaTeXExpression objects with location information
         """
-        self.expressions = []
+        parse_counter.record(content)
         lines = content.split('\n')
+        return self.parse_lines(lines, 1, len(lines))
+    
+    def parse_lines(self, lines: List[str], first_line: int, last_line: int) -> List[LaTeXExpression]:
+        """
+        Parse LaTeX expressions starting on a range of lines of a document.
         
-        for line_num, line in enumerate(lines, 1):
+        Environments opened inside the range are followed past last_line to
+        their closing \\end, exactly as when parsing the whole document.
+        
+        Args:
+            lines: All lines of the document
+            first_line: First line of the range (1-based)
+            last_line: Last line of the range (inclusive)
+            
+        Returns:
+            List of LaTeXExpression objects found in the range
+        """
+        self.expressions = []
+        
+        for line_index in range(first_line - 1, last_line):
+            line = lines[line_index]
+            line_num = line_index + 1
+            # Expressions found on this line start here
+            self._line_start = len(self.expressions)
             # Parse different types of expressions
             self._parse_display_math(line, line_num)
             self._parse_inline_math(line, line_num)
-            self._parse_environments(line, line_num, lines, line_num - 1)
+            self._parse_environments(line, line_num, lines, line_index)
             self._parse_commands_and_symbols(line, line_num)
         
         return self.expressions
@@ -278,10 +388,10 @@ class LaTeXExpressionParser:
         for match in re.finditer(symbol_pattern, line):
             symbol_name = match.group(1)
             
-            # Skip if already captured as command
+            # Skip if already captured as command (only this line's expressions can overlap)
             if any(expr.line_number == line_num and 
                    expr.column_start <= match.start() < expr.column_end 
-                   for expr in self.expressions):
+                   for expr in self.expressions[self._line_start:]):
                 continue
             
             expression = LaTeXExpression(
@@ -352,35 +462,29 @@ class LaTeXValidator:
         self.errors: List[str] = []
         self.warnings: List[str] = []
     
-    def validate_expressions(self, expressions: List[LaTeXExpression]) -> LaTeXValidationResult:
+    def validate_expressions(self, expressions: List[LaTeXExpression],
+                             checks: Optional[ExpressionChecks] = None) -> LaTeXValidationResult:
         """
         Validate a list of LaTeX expressions.
         
         Args:
             expressions: List of LaTeX expressions to validate
+            checks: Per-expression findings already computed for these
+                expressions by check_expressions, possibly in several runs
             
         Returns:
             LaTeXValidationResult with validation details
         """
-        self.errors = []
-        self.warnings = []
-        all_packages = set()
-        all_custom_commands = set()
-        
-        for expr in expressions:
-            self._validate_single_expression(expr)
-            
-            # Collect package requirements
-            parser = LaTeXExpressionParser()
-            parser._track_package_requirements(self._extract_command_name(expr.content))
-            all_packages.update(parser.required_packages)
-            all_custom_commands.update(parser.custom_commands)
+        if checks is None:
+            checks = self.check_expressions(expressions)
+        self.errors = list(checks.errors)
+        self.warnings = list(checks.warnings)
         
         # Validate environment matching across expressions
         self._validate_environment_matching(expressions)
         
-        # Check for common syntax issues
-        self._check_common_syntax_issues(expressions)
+        # Common syntax issues are reported after the environment checks
+        self.errors.extend(checks.syntax_errors)
         
         is_valid = len(self.errors) == 0
         
@@ -389,10 +493,41 @@ class LaTeXValidator:
             expressions=expressions,
             errors=self.errors,
             warnings=self.warnings,
-            packages_required=all_packages,
-            custom_commands=all_custom_commands
+            packages_required=set(checks.packages_required),
+            custom_commands=set(checks.custom_commands)
         )
     
+    def check_expressions(self, expressions: List[LaTeXExpression]) -> ExpressionChecks:
+        """
+        Run the checks that look at one expression at a time.
+        
+        Args:
+            expressions: LaTeX expressions to check; their validity and
+                suggestions are updated in place
+            
+        Returns:
+            ExpressionChecks with the findings and package requirements
+        """
+        self.errors = []
+        self.warnings = []
+        checks = ExpressionChecks()
+        
+        for expr in expressions:
+            self._validate_single_expression(expr)
+            
+            # Collect package requirements
+            parser = LaTeXExpressionParser()
+            parser._track_package_requirements(self._extract_command_name(expr.content))
+            checks.packages_required.update(parser.required_packages)
+            checks.custom_commands.update(parser.custom_commands)
+        checks.errors, checks.warnings = self.errors, self.warnings
+        
+        # Check for common syntax issues
+        self.errors = []
+        self._check_common_syntax_issues(expressions)
+        checks.syntax_errors = self.errors
+        return checks
+    
     def _validate_single_expression(self, expr: LaTeXExpression):
         """Validate a single LaTeX expression."""
         content = expr.content
@@ -582,6 +717,25 @@ class LaTeXProcessor:
         except Exception as e:
             raise InputError(f"Error processing LaTeX content: {e}")
     
+    def process_expressions(self, expressions: List[LaTeXExpression],
+                            checks: Optional[ExpressionChecks] = None) -> LaTeXValidationResult:
+        """
+        Validate an already parsed list of LaTeX expressions.
+        
+        Used when expressions are re-parsed for part of a document only; the
+        result is the same as process_content on the full content.
+        
+        Args:
+            expressions: LaTeX expressions of the whole document, in order
+            checks: Per-expression findings already computed for the expressions
+            
+        Returns:
+            LaTeXValidationResult with validation details and requirements
+        """
+        validation_result = self.validator.validate_expressions(expressions, checks)
+        self.last_validation_result = validation_result
+        return validation_result
+    
     def validate_latex_syntax(self, latex_code: str, line_number: int = 1) -> Tuple[bool, List[str]]:
         """
         Validate LaTeX syntax using external LaTeX compiler.
@@ -712,4 +866,82 @@ class LaTeXProcessor:
                                    if expr.expression_type == expr_type)
                 for expr_type in LaTeXExpressionType
             }
-        }
\ No newline at end of file
+        }
+
+
+def check_line_range(text: str, first_line: int, line_count: int) -> Tuple[List[LaTeXExpression], ExpressionChecks]:
+    """
+    Parse and check the LaTeX expressions starting on a range of lines.
+    
+    A module-level function so that a shard of a large document can be handled
+    in a worker process. Expressions and messages carry document line numbers.
+    
+    Args:
+        text: The document from first_line at least to the line given for
+            the range by line_range_extents, so environments opened in the
+            range can be followed to their closing \\end
+        first_line: Document line number of the first line of text
+        line_count: Number of lines in the range
+        
+    Returns:
+        Tuple of (expressions, per-expression checks) for the range
+    """
+    expressions = LaTeXExpressionParser().parse_lines(text.split('\n'), 1, line_count)
+    for expr in expressions:
+        expr.line_number += first_line - 1
+    return expressions, LaTeXValidator().check_expressions(expressions)
+
+
+def line_range_extents(text: str, ranges: List[Tuple[int, int]]) -> List[int]:
+    """
+    Last line of text that check_line_range needs for each of a list of ranges.
+    
+    That is the range's own last line, or the line of the \\end closing an
+    environment opened in the range, whichever is later. Environments never
+    closed do not extend a range: they give no expression either way.
+    
+    Args:
+        text: The whole document
+        ranges: (first_line, last_line) ranges of the document, in order
+        
+    Returns:
+        One last line per range
+    """
+    line_starts = [0] + [match.end() for match in re.finditer('\n', text)]
+    line_count = len(line_starts)
+    lines: Optional[List[str]] = None
+    closing_lines: Dict[str, List[int]] = {}
+    
+    def lines_closing(env_name: str) -> List[int]:
+        """Lines on which the parser finds the \\end of env_name."""
+        nonlocal lines
+        if env_name not in closing_lines:
+            # The parser puts the name into its pattern unescaped, as here
+            end_pattern = re.compile(f'\\\\end\\{{{env_name}\\}}')
+            if _SINGLE_LINE_NAME.fullmatch(env_name):
+                found = [bisect_right(line_starts, match.start()) for match in end_pattern.finditer(text)]
+            else:
+                # Other names could make the pattern match across lines; search line by line like the parser
+                lines = text.split('\n') if lines is None else lines
+                found = [number for number, line in enumerate(lines, 1) if end_pattern.search(line)]
+            closing_lines[env_name] = sorted(set(found))
+        return closing_lines[env_name]
+    
+    extents = [last_line for _, last_line in ranges]
+    firsts = [first_line for first_line, _ in ranges]
+    for match in _BEGIN_ON_ONE_LINE.finditer(text):
+        line_number = bisect_right(line_starts, match.start())
+        index = bisect_right(firsts, line_number) - 1
+        if index < 0 or line_number > ranges[index][1]:
+            continue
+        try:
+            closing = lines_closing(match.group(1))
+        except re.error:
+            # The parser fails on this name too; let it see the whole rest
+            extents[index] = line_count
+            continue
+        # The parser looks for the \end on the lines after the \begin
+        position = bisect_right(closing, line_number)
+        if position < len(closing):
+            extents[index] = max(extents[index], closing[position])
+    return extents
@@ -601,7 +601,8 @@ class MathRenderer:
         self, 
         content: str, 
         target_format: OutputFormat,
-        custom_config: Optional[MathRenderingConfig] = None
+        custom_config: Optional[MathRenderingConfig] = None,
+        latex_result: Optional[LaTeXValidationResult] = None
     ) -> MathOptimizationResult:
         """
         Optimize math rendering for specific output format with comprehensive validation.
@@ -610,6 +611,7 @@ class MathRenderer:
             content: Markdown content with LaTeX math expressions
             target_format: Target output format
             custom_config: Optional custom rendering configuration
+            latex_result: LaTeX validation result already computed for the document
             
         Returns:
             MathOptimizationResult with optimized content and configuration
@@ -620,8 +622,9 @@ class MathRenderer:
         logger.info(f"Optimizing math rendering for {target_format.value}")
         
         try:
-            # First, validate LaTeX expressions
-            latex_result = self.latex_processor.process_content(content)
+            # First, validate LaTeX expressions unless the caller already has
+            if latex_result is None:
+                latex_result = self.latex_processor.process_content(content)
             
             # Then optimize for target format
             optimization_result = self.optimizer.optimize_for_format(
@@ -438,7 +438,8 @@ class ThemeManager:
     
     def _generate_font_imports(self, typography: TypographyConfig) -> str:
         """Generate font import statements."""
-        fonts = set([typography.heading_font, typography.body_font, typography.code_font])
+        # In a fixed order, so the generated SCSS is the same in every process
+        fonts = dict.fromkeys([typography.heading_font, typography.body_font, typography.code_font])
         imports = []
         
         for font in fonts:
@@ -1,6 +1,7 @@
 import re
+import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple, Optional, Any
 
 BIB_ENTRY_PATTERN = re.compile(r'@(?P<type>\w+)\s*\{\s*(?P<key>[^,]+),')
 FIELD_PATTERN = re.compile(r'\s*(?P<field>\w+)\s*=\s*[\"\{](?P<value>.*?)[\"\}]\s*,?\s*$')
@@ -84,3 +85,57 @@ def render_bibliography_markdown(bib_path: Path) -> str:
     lines = [e.format_markdown(i+1) for i, e in enumerate(entries)]
     header = '## References\n'
     return header + '\n'.join(lines) + '\n'
+
+
+class BibliographyCache:
+    """
+    Process-wide cache of rendered bibliographies.
+    
+    Entries are keyed by resolved path and checked against the file's
+    (mtime, size) on every lookup, so a .bib file is only read and parsed
+    again after it changes. Safe to use from multiple threads.
+    """
+    
+    def __init__(self):
+        self._entries: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def render(self, bib_path: Path) -> str:
+        """Return render_bibliography_markdown(bib_path), reusing the last rendering if the file is unchanged."""
+        path = Path(bib_path).resolve()
+        try:
+            stat = path.stat()
+        except OSError:
+            return render_bibliography_markdown(Path(bib_path))
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        
+        rendered = render_bibliography_markdown(path)
+        with self._lock:
+            self._entries[path] = (signature, rendered)
+        return rendered
+    
+    def invalidate(self, bib_path: Optional[Path] = None) -> None:
+        """Drop the entry of one .bib file, or all entries."""
+        with self._lock:
+            if bib_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(Path(bib_path).resolve(), None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters of the cache."""
+        with self._lock:
+            return {'entries': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+# Shared by every splitter in the process
+bibliography_cache = BibliographyCache()
@@ -0,0 +1,111 @@
+"""
+File I/O helpers for generated files.
+
+Generated .qmd, .scss and copied images are rewritten on every run with the
+same content, which bumps their mtimes and makes Quarto, the file watcher and
+mtime-based caches treat them as changed. These helpers leave a file alone
+when it already has the right content and otherwise replace it atomically
+(temporary file + rename), so readers never see a half-written file.
+"""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Union
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _temporary_path(path: Path) -> Path:
+    """Return a temporary sibling of path unique to this process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _replace(temp_path: Path, path: Path) -> None:
+    """Move temp_path over path, removing temp_path if that fails."""
+    try:
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def write_if_changed(path: Union[str, Path], content: Union[str, bytes], encoding: str = 'utf-8') -> bool:
+    """
+    Atomically write content to path unless the file already holds it.
+    
+    Args:
+        path: File to write
+        content: Text (encoded with encoding) or bytes
+        encoding: Encoding of text content
+    
+    Returns:
+        True if the file was written, False if it was already up to date
+    
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = Path(path)
+    data = content.encode(encoding) if isinstance(content, str) else content
+    
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            logger.debug(f"Unchanged, not rewriting {path}")
+            return False
+    except OSError:
+        pass
+    
+    temp_path = _temporary_path(path)
+    try:
+        temp_path.write_bytes(data)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+    _replace(temp_path, path)
+    return True
+
+
+def copy_if_changed(source: Union[str, Path], destination: Union[str, Path]) -> bool:
+    """
+    Atomically copy a file with its metadata unless the destination matches it.
+    
+    The destination counts as up to date when it has the source's size and
+    modification time, which copying with metadata preserves.
+    
+    Returns:
+        True if the file was copied, False if it was already up to date
+    
+    Raises:
+        OSError: If the file cannot be copied
+    """
+    source = Path(source)
+    destination = Path(destination)
+    source_stat = source.stat()
+    
+    try:
+        destination_stat = destination.stat()
+        if (destination_stat.st_size, destination_stat.st_mtime_ns) == (source_stat.st_size, source_stat.st_mtime_ns):
+            return False
+    except OSError:
+        pass
+    
+    temp_path = _temporary_path(destination)
+    try:
+        shutil.copy2(source, temp_path)
+    except OSError:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        raise
+    _replace(temp_path, destination)
+    return True
@@ -10,7 +10,8 @@ from .content_validator import (
     ValidationResult,
     ValidationIssue,
     IssueType,
-    IssueSeverity
+    IssueSeverity,
+    ValidationLevel
 )
 from .slide_optimizer import (
     SlideOptimizer,
@@ -29,6 +30,7 @@ __all__ = [
     'ValidationIssue',
     'IssueType',
     'IssueSeverity',
+    'ValidationLevel',
     'SlideOptimizer',
     'OptimizationResult',
     'OptimizationSuggestion',
@@ -8,7 +8,7 @@ and provides automatic splitting suggestions for optimal presentation.
 import re
 import math
 from enum import Enum
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -39,6 +39,23 @@ class IssueSeverity(Enum):
     SUGGESTION = "suggestion"
 
 
+class ValidationLevel(Enum):
+    """How much validation to run while splitting content."""
+    NONE = "none"  # No validation at all
+    FAST = "fast"  # Directive structure only
+    STANDARD = "standard"  # Adds LaTeX, length, structure and formatting checks
+    FULL = "full"  # Adds readability, link and image checks
+    
+    @property
+    def rank(self) -> int:
+        """Position of the level from NONE (0) to FULL (3)."""
+        return list(ValidationLevel).index(self)
+    
+    def includes(self, other: 'ValidationLevel') -> bool:
+        """Check whether this level runs everything other runs."""
+        return self.rank >= other.rank
+
+
 @dataclass
 class ValidationIssue:
     """Represents a validation issue found in content."""
@@ -108,36 +125,50 @@ class ContentValidator:
         self.issues: List[ValidationIssue] = []
     
     @handle_exception
-    def validate_content(self, content: str, filepath: Optional[str] = None) -> ValidationResult:
+    def validate_content(
+        self,
+        content: str,
+        filepath: Optional[str] = None,
+        latex_result: Union[LaTeXValidationResult, Callable[[], LaTeXValidationResult], None] = None,
+        level: ValidationLevel = ValidationLevel.FULL
+    ) -> ValidationResult:
         """
         Perform comprehensive content validation.
         
         Args:
             content: Markdown content to validate
             filepath: Optional path to the source file
+            latex_result: LaTeX validation result already computed for this content,
+                or a callable returning it, called when the LaTeX checks are reached
+                so that it can be computed while the earlier checks run
+            level: STANDARD skips the readability, link and image checks
+                (readability_score is then 0.0); FULL runs everything
             
         Returns:
             ValidationResult with all validation findings
         """
-        logger.info("Starting comprehensive content validation")
+        logger.info(f"Starting {level.value} content validation")
         self.issues = []
+        full = level.includes(ValidationLevel.FULL)
         
         # Basic content analysis
         word_count = self._count_words(content)
         slide_count = self._estimate_slide_count(content)
-        readability_score = self._calculate_readability(content)
+        readability_score = self._calculate_readability(content) if full else 0.0
         
         # Validate content length and structure
         self._validate_content_length(content, slide_count)
         self._validate_structure(content)
-        self._validate_readability(content, readability_score)
+        if full:
+            self._validate_readability(content, readability_score)
         
         # Validate LaTeX expressions
-        latex_result = self._validate_latex_expressions(content)
+        latex_result = self._validate_latex_expressions(content, latex_result)
         
         # Validate links and images
-        self._validate_links(content, filepath)
-        self._validate_images(content, filepath)
+        if full:
+            self._validate_links(content, filepath)
+            self._validate_images(content, filepath)
         
         # Check formatting and style
         self._validate_formatting(content)
@@ -334,10 +365,16 @@ class ContentValidator:
                 suggestion="Consider breaking up long sentences and using active voice"
             ))
     
-    def _validate_latex_expressions(self, content: str) -> Optional[LaTeXValidationResult]:
-        """Validate LaTeX expressions in content."""
+    def _validate_latex_expressions(
+        self, content: str,
+        latex_result: Union[LaTeXValidationResult, Callable[[], LaTeXValidationResult], None] = None
+    ) -> Optional[LaTeXValidationResult]:
+        """Validate LaTeX expressions in content, reusing latex_result when given."""
         try:
-            latex_result = self.latex_processor.process_content(content)
+            if callable(latex_result):
+                latex_result = latex_result()
+            if latex_result is None:
+                latex_result = self.latex_processor.process_content(content)
             
             # Convert LaTeX errors to validation issues
             for error in latex_result.errors:
@@ -2,10 +2,34 @@
 Pytest configuration and shared fixtures.
 """
 
+import os
 import pytest
 import tempfile
 from pathlib import Path
 
+from markdown_slides_generator.core.toolchain import toolchain_registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_toolchain_registry(monkeypatch, tmp_path_factory):
+    """Start every test with an empty, unpersisted toolchain registry and a private cache directory."""
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path_factory.mktemp('cache')))
+    monkeypatch.setattr(toolchain_registry, 'cache_file', None)
+    toolchain_registry.invalidate()
+
+
+@pytest.fixture
+def fake_quarto(monkeypatch, tmp_path):
+    """Put the stand-in quarto script first on PATH; returns the file its renders are logged to."""
+    bin_dir = Path(__file__).parent / 'fixtures' / 'bin'
+    log_file = tmp_path / 'fake_quarto.log'
+    monkeypatch.setenv('PATH', f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    monkeypatch.setenv('FAKE_QUARTO_LOG', str(log_file))
+    for name in ('FAKE_QUARTO_DELAY', 'FAKE_QUARTO_FAIL', 'FAKE_QUARTO_STEPS', 'FAKE_QUARTO_WARN',
+                 'FAKE_QUARTO_STARTUP', 'FAKE_QUARTO_PREVIEW_RENDERS'):
+        monkeypatch.delenv(name, raising=False)
+    return log_file
+
 
 @pytest.fixture
 def temp_dir():
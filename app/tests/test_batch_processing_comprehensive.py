@@ -5,6 +5,7 @@ Tests parallel processing, error handling, progress reporting, and performance
 characteristics for large-scale batch operations.
 """
 
+import os
 import pytest
 import tempfile
 import shutil
@@ -426,6 +427,66 @@ class TestFileScanner:
         assert len(files) == 1
         assert files[0].name == "lecture1.md"
     
+    def test_excluded_and_hidden_directories_are_pruned(self):
+        """Test that excluded and hidden directories are never entered."""
+        for directory in ["lectures", "drafts/old", ".git", "lectures/.quarto"]:
+            (self.temp_path / directory).mkdir(parents=True)
+            (self.temp_path / directory / "lecture.md").write_text("content")
+        
+        entered = []
+        original_scandir = os.scandir
+        
+        def recording_scandir(path):
+            entered.append(Path(path).relative_to(self.temp_path).as_posix())
+            return original_scandir(path)
+        
+        with patch.object(os, 'scandir', recording_scandir):
+            files = self.scanner.scan_directory(
+                directory=self.temp_path,
+                pattern="*.md",
+                recursive=True,
+                exclude_patterns=["drafts"]
+            )
+        
+        assert [f.relative_to(self.temp_path).as_posix() for f in files] == ["lectures/lecture.md"]
+        assert entered == [".", "lectures"]
+        assert self.scanner.get_scan_summary()['directories_pruned'] == 3
+    
+    def test_iter_files_is_lazy(self):
+        """Test that files are yielded before the rest of the tree is walked."""
+        for i in range(3):
+            (self.temp_path / f"part{i}").mkdir()
+            (self.temp_path / f"part{i}" / "lecture.md").write_text("content")
+        
+        files = self.scanner.iter_files(self.temp_path, pattern="*.md", recursive=True)
+        first = next(files)
+        shutil.rmtree(self.temp_path / "part2")
+        
+        assert first == self.temp_path / "part0" / "lecture.md"
+        assert list(files) == [self.temp_path / "part1" / "lecture.md"]
+    
+    def test_pattern_with_directory(self):
+        """Test that patterns with a separator match the path below the directory, like glob."""
+        (self.temp_path / "week1").mkdir()
+        (self.temp_path / "week1" / "lecture.md").write_text("content")
+        (self.temp_path / "week1" / "extra").mkdir()
+        (self.temp_path / "week1" / "extra" / "reading.md").write_text("content")
+        
+        files = self.scanner.scan_directory(directory=self.temp_path, pattern="week*/*.md")
+        
+        assert files == [self.temp_path / "week1" / "lecture.md"]
+    
+    def test_double_star_pattern_matches_any_depth(self):
+        """Test that '**' matches any number of directories, as Path.glob does."""
+        for name in ["top.md", "a/one.md", "a/b/two.md", "a/b/skip.txt"]:
+            (self.temp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (self.temp_path / name).write_text("content")
+        
+        for pattern in ["**/*.md", "a/**/*.md"]:
+            files = self.scanner.scan_directory(directory=self.temp_path, pattern=pattern)
+            assert sorted(files) == sorted(self.temp_path.glob(pattern))
+        assert len(self.scanner.scan_directory(directory=self.temp_path, pattern="**/*.md")) == 3
+    
     def test_file_filters(self):
         """Test file filtering by size and modification time."""
         # Create files of different sizes
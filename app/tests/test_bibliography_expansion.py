@@ -1,5 +1,10 @@
+import os
 from pathlib import Path
 from markdown_slides_generator.core.content_splitter import ContentSplitter
+from markdown_slides_generator.utils import bibliography
+from markdown_slides_generator.utils.bibliography import (
+    BibliographyCache, bibliography_cache, render_bibliography_markdown
+)
 
 
 def test_bibliography_expansion(tmp_path: Path):
@@ -11,4 +16,39 @@ def test_bibliography_expansion(tmp_path: Path):
     slides, notes = splitter.split_content(str(md))
     assert '## References' in slides
     assert 'An Example Paper' in notes
-    assert '1.' in notes
\ No newline at end of file
+    assert '1.' in notes
+
+def test_bibliography_cache_reuses_unchanged_file(tmp_path: Path, monkeypatch):
+    bib = tmp_path / 'refs.bib'
+    bib.write_text("@article{a,\n  title={First Paper},\n  year={2020}\n}\n", encoding='utf-8')
+    cache = BibliographyCache()
+    calls = []
+    monkeypatch.setattr(bibliography, 'render_bibliography_markdown',
+                        lambda path: calls.append(path) or render_bibliography_markdown(path))
+
+    first = cache.render(bib)
+    assert cache.render(tmp_path / '.' / 'refs.bib') == first
+    assert len(calls) == 1
+    assert cache.get_stats() == {'entries': 1, 'hits': 1, 'misses': 1}
+
+    bib.write_text("@article{b,\n  title={Second Paper},\n  year={2021}\n}\n", encoding='utf-8')
+    os.utime(bib, ns=(bib.stat().st_atime_ns, bib.stat().st_mtime_ns + 10**9))
+    assert 'Second Paper' in cache.render(bib)
+    assert len(calls) == 2
+
+    cache.invalidate(bib)
+    cache.render(bib)
+    assert len(calls) == 3
+
+
+def test_expansion_uses_shared_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'refs.bib').write_text("@book{c,\n  title={Cached Book},\n  year={2019}\n}\n", encoding='utf-8')
+    bibliography_cache.invalidate()
+    parser = ContentSplitter().parser
+
+    content = "<!-- INSERT-BIB refs.bib -->"
+    hits = bibliography_cache.get_stats()['hits']
+    assert 'Cached Book' in parser.expand_bibliography(content)
+    assert parser.expand_bibliography(content) == parser.expand_bibliography(content)
+    assert bibliography_cache.get_stats()['hits'] == hits + 2
@@ -0,0 +1,258 @@
+"""
+Tests for the dependency-tracked build graph.
+"""
+
+import os
+import sys
+import threading
+import time
+import subprocess
+
+import pytest
+from click.testing import CliRunner
+
+from markdown_slides_generator.cli import cli
+from markdown_slides_generator.config import Config
+from markdown_slides_generator.batch import BatchProcessor
+from markdown_slides_generator.core.build_graph import BuildGraph, BuildNode
+
+
+class TestBuildGraph:
+    """Test staleness tracking and scheduling of BuildGraph."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.state_file = tmp_path / ".lecture.build.json"
+        self.source = tmp_path / "lecture.md"
+        self.source.write_text("# Lecture\n")
+        self.runs = []
+    
+    def _copy(self, name, source, target):
+        """Node copying source to target, recording that it ran."""
+        def action():
+            self.runs.append(name)
+            target.write_text(source.read_text())
+        return action
+    
+    def _graph(self, key=''):
+        """source -> first -> second chain plus an independent node."""
+        graph = BuildGraph(self.state_file)
+        first = self.tmp_path / "first.txt"
+        second = self.tmp_path / "second.txt"
+        graph.add(BuildNode('first', self._copy('first', self.source, first),
+                            inputs=[self.source], outputs=[first], key=key))
+        graph.add(BuildNode('second', self._copy('second', first, second), deps=['first'], outputs=[second]))
+        graph.add(BuildNode('other', lambda: self.runs.append('other')))
+        return graph
+    
+    def test_unchanged_inputs_are_skipped(self):
+        """Test that a second run with the same inputs rebuilds nothing."""
+        first = self._graph().run()
+        self.runs.clear()
+        
+        second = self._graph().run()
+        
+        assert first.names('rebuilt') == ['first', 'second', 'other']
+        assert second.names('skipped') == ['first', 'second', 'other']
+        assert self.runs == []
+    
+    def test_only_stale_nodes_rebuild(self):
+        """Test that a changed input rebuilds its node and the nodes depending on it."""
+        self._graph().run()
+        self.runs.clear()
+        self.source.write_text("# Edited lecture\n")
+        
+        report = self._graph().run()
+        
+        assert sorted(self.runs) == ['first', 'second']
+        assert report.outcomes['first'].reasons == ['lecture.md changed']
+        assert report.outcomes['second'].reasons == ['first changed']
+    
+    def test_identical_output_stops_propagation(self):
+        """Test that a node rewriting the same content does not rebuild its dependents."""
+        self._graph().run()
+        self.runs.clear()
+        
+        report = self._graph(key='new options').run()
+        
+        assert self.runs == ['first']
+        assert report.outcomes['first'].reasons == ['options changed']
+        assert report.outcomes['second'].status == 'skipped'
+    
+    def test_missing_output_and_force(self):
+        """Test that deleted outputs are rebuilt and force rebuilds everything."""
+        self._graph().run()
+        (self.tmp_path / "second.txt").unlink()
+        self.runs.clear()
+        
+        assert self._graph().run().outcomes['second'].reasons == ['second.txt missing']
+        assert self.runs == ['second']
+        
+        self.runs.clear()
+        self._graph().run(force=True)
+        assert sorted(self.runs) == ['first', 'other', 'second']
+    
+    def test_failure_blocks_dependents_only(self):
+        """Test that a failed node blocks its dependents and is retried next run."""
+        def fail():
+            raise RuntimeError("boom")
+        
+        graph = BuildGraph(self.state_file)
+        graph.add(BuildNode('broken', fail))
+        graph.add(BuildNode('after', lambda: self.runs.append('after'), deps=['broken']))
+        graph.add(BuildNode('other', lambda: self.runs.append('other')))
+        
+        report = graph.run()
+        
+        assert report.outcomes['broken'].status == 'failed'
+        assert report.outcomes['after'].status == 'blocked'
+        assert report.outcomes['other'].status == 'rebuilt'
+        assert not report.ok
+        assert "broken: failed" in report.explain()[0] and "boom" in report.explain()[0]
+    
+    def test_independent_nodes_run_in_parallel(self):
+        """Test that nodes without dependencies between them overlap."""
+        barrier = threading.Barrier(3, timeout=5)
+        graph = BuildGraph(max_workers=3)
+        
+        def meet():
+            barrier.wait()
+        
+        for name in ('a', 'b', 'c'):
+            graph.add(BuildNode(name, meet))
+        
+        start = time.time()
+        report = graph.run()
+        
+        assert report.ok
+        assert time.time() - start < 5
+    
+    def test_value_node_runs_when_needed(self):
+        """Test that a skipped node without outputs runs again for a rebuilding dependent."""
+        values = {}
+        
+        def graph(key):
+            graph = BuildGraph(self.state_file)
+            graph.add(BuildNode('split', lambda: values.update(text=self.source.read_text()), inputs=[self.source]))
+            graph.add(BuildNode('render', lambda: self.runs.append(values['text']), deps=['split'], key=key))
+            return graph
+        
+        graph('a').run()
+        values.clear()
+        
+        report = graph('b').run()
+        
+        assert self.runs == ["# Lecture\n", "# Lecture\n"]
+        assert report.outcomes['split'].reasons == ['needed by render']
+    
+    def test_invalid_graphs(self):
+        """Test that unknown dependencies, cycles and duplicates are rejected."""
+        graph = BuildGraph()
+        graph.add(BuildNode('a', lambda: None, deps=['b']))
+        graph.add(BuildNode('b', lambda: None, deps=['a']))
+        with pytest.raises(ValueError, match="cycle"):
+            graph.run()
+        with pytest.raises(ValueError, match="Duplicate"):
+            graph.add(BuildNode('a', lambda: None))
+        
+        graph = BuildGraph()
+        graph.add(BuildNode('a', lambda: None, deps=['missing']))
+        with pytest.raises(ValueError, match="unknown node missing"):
+            graph.run()
+
+
+def _rendered(log_file):
+    """(input, format) of every render in the fake quarto log."""
+    if not log_file.exists():
+        return []
+    return [tuple(line.split()[:2]) for line in log_file.read_text().splitlines()]
+
+
+class TestGenerateBuildGraph:
+    """Test generate and batch running on the build graph with the fake quarto."""
+    
+    def test_notes_edit_rebuilds_only_notes(self, fake_quarto, tmp_path):
+        """Test that --explain shows the slides steps skipped after a notes-only edit."""
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("# Lecture\n\nBody\n\n<!-- NOTES-ONLY -->\nDetails\n")
+        output_dir = tmp_path / "out"
+        args = ["generate", str(input_file), "-o", str(output_dir), "-f", "html", "--overwrite"]
+        
+        first = CliRunner().invoke(cli, args)
+        input_file.write_text("# Lecture\n\nBody\n\n<!-- NOTES-ONLY -->\nMore details\n")
+        second = CliRunner().invoke(cli, args + ["--explain"])
+        
+        assert first.exit_code == 0, first.output
+        assert second.exit_code == 0, second.output
+        assert "split: rebuilt" in second.output and "lecture.md changed" in second.output
+        assert "render[slides:html]: skipped (up to date)" in second.output
+        assert "render[notes:pdf]: rebuilt" in second.output
+        assert "✓ Generated slides (html): lecture_slides.html" in second.output
+        assert sorted(fmt for _, fmt in _rendered(fake_quarto)) == ["pdf", "pdf", "revealjs"]
+    
+    def test_assets_step_tracks_the_copied_images(self, fake_quarto, tmp_path):
+        """Test that copying images is a step only for documents with images, redone when one changes."""
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("# Lecture\n\nBody\n")
+        args = ["generate", str(input_file), "-o", str(tmp_path / "out"), "-f", "html", "--overwrite", "--explain"]
+        
+        CliRunner().invoke(cli, args)
+        plain = CliRunner().invoke(cli, args)
+        input_file.write_text("# Lecture\n\n![Figure](figure.png)\n")
+        (tmp_path / "figure.png").write_bytes(b"png 1")
+        CliRunner().invoke(cli, args)
+        (tmp_path / "figure.png").write_bytes(b"png 2")
+        changed = CliRunner().invoke(cli, args)
+        
+        assert plain.exit_code == 0, plain.output
+        assert "  assets:" not in plain.output and ": rebuilt" not in plain.output
+        assert "assets: rebuilt" in changed.output and "figure.png changed" in changed.output
+        assert "render[slides:html]: rebuilt" in changed.output and "assets changed" in changed.output
+        assert (tmp_path / "out" / "figure.png").read_bytes() == b"png 2"
+    
+    def test_rerun_in_new_process_skips_every_step(self, fake_quarto, tmp_path):
+        """Test that generate run again in another process, with another hash seed, redoes nothing."""
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("# Lecture\n\n![Figure](figure.png)\n\n<!-- NOTES-ONLY -->\nDetails\n")
+        (tmp_path / "figure.png").write_bytes(b"png")
+        args = ["generate", str(input_file), "-o", str(tmp_path / "out"), "-f", "html",
+                "--theme", "academic-modern", "--overwrite", "--explain"]
+        
+        runs = []
+        for seed in ("1", "3"):
+            env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=os.pathsep.join(sys.path))
+            runs.append(subprocess.run(
+                [sys.executable, "-c", "from markdown_slides_generator.cli import cli; cli()"] + args,
+                env=env, capture_output=True, text=True, cwd=tmp_path
+            ))
+        
+        assert runs[0].returncode == 0 and runs[1].returncode == 0, runs[1].stderr
+        steps = [line.strip() for line in runs[1].stdout.splitlines() if line.startswith("  ") and ": " in line]
+        assert {step.split(": ")[0] for step in steps} >= {"split", "assets", "scss", "render[slides:html]"}
+        assert all(step.endswith(": skipped (up to date)") for step in steps), runs[1].stdout
+        assert len(_rendered(fake_quarto)) == 2
+    
+    def test_batch_rebuilds_only_changed_files(self, fake_quarto, tmp_path):
+        """Test that a batch rerun renders only the lecture that changed."""
+        input_dir = tmp_path / "lectures"
+        input_dir.mkdir()
+        for name in ("one", "two"):
+            (input_dir / f"{name}.md").write_text(f"# Lecture {name}\n\nBody\n")
+        config = Config()
+        config.output.formats = ["html"]
+        config.output.overwrite = True
+        
+        BatchProcessor(config).process_directory(input_dir, tmp_path / "out")
+        (input_dir / "two.md").write_text("# Lecture two\n\nEdited\n")
+        result = BatchProcessor(config).process_directory(input_dir, tmp_path / "out")
+        
+        assert result.successful_files == 1
+        assert result.skipped_files == 1
+        assert len(result.generated_outputs) == 2
+        results = {r.file_path.name: r for r in result.file_results}
+        assert results["one.md"].skip_reason == "Up to date"
+        assert set(results["two.md"].build_report.names('rebuilt')) >= {'split', 'qmd[slides]', 'render[slides:html]'}
+        assert sorted(name for name, _ in _rendered(fake_quarto)) == [
+            "one_notes.qmd", "one_slides.qmd", "two_notes.qmd", "two_notes.qmd", "two_slides.qmd", "two_slides.qmd"
+        ]
@@ -0,0 +1,164 @@
+"""
+Tests for incremental batch builds based on the build manifest.
+"""
+
+import json
+
+import pytest
+
+from markdown_slides_generator.config import Config
+from markdown_slides_generator.batch import BatchProcessor
+from markdown_slides_generator.batch.build_manifest import (
+    BuildManifest, BuildFingerprint, BUILD_MANIFEST_NAME
+)
+
+
+def _rendered(log_file):
+    """(input, format) of every render the fake quarto ran."""
+    if not log_file.exists():
+        return []
+    return [tuple(line.split()[:2]) for line in log_file.read_text().splitlines()]
+
+
+class TestBuildManifest:
+    """Test staleness checks of BuildManifest."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.tmp_path = tmp_path
+        self.source = tmp_path / "lecture.md"
+        self.source.write_text("# Lecture\n")
+        self.output = tmp_path / "lecture_slides.html"
+        self.output.write_text("<html>")
+        self.fingerprint = BuildFingerprint(config='c', theme='t', toolchain='q')
+    
+    def _recorded(self):
+        manifest = BuildManifest(self.tmp_path)
+        manifest.record('lecture.md', self.fingerprint, manifest.input_state('lecture.md', [self.source]),
+                        [str(self.output)])
+        manifest.save()
+        return BuildManifest(self.tmp_path)
+    
+    def test_unchanged_file_is_up_to_date(self):
+        """Test that a recorded file is fresh on the next run."""
+        manifest = self._recorded()
+        state = manifest.input_state('lecture.md', manifest.recorded_inputs('lecture.md'))
+        
+        assert manifest.stale_reasons('lecture.md', self.fingerprint, state) == []
+        assert manifest.stale_reasons('other.md', self.fingerprint, state) == ["not built before"]
+    
+    def test_changes_make_a_file_stale(self):
+        """Test that source, fingerprint and output changes are all noticed."""
+        manifest = self._recorded()
+        self.source.write_text("# Lecture\n\nEdited\n")
+        self.output.unlink()
+        state = manifest.input_state('lecture.md', [self.source])
+        fingerprint = BuildFingerprint(config='c', theme='other', toolchain='q')
+        
+        assert manifest.stale_reasons('lecture.md', fingerprint, state) == [
+            "lecture.md changed", "theme changed", "lecture_slides.html missing or modified"
+        ]
+    
+    def test_touched_file_is_not_read_again(self, monkeypatch):
+        """Test that digests are reused while size and mtime match, and a touch is refreshed."""
+        manifest = self._recorded()
+        reads = []
+        original_open = open
+        
+        def counting_open(path, *args, **kwargs):
+            reads.append(str(path))
+            return original_open(path, *args, **kwargs)
+        
+        monkeypatch.setattr('builtins.open', counting_open)
+        manifest.input_state('lecture.md', [self.source])
+        assert str(self.source) not in reads
+        
+        self.source.touch()
+        state = manifest.input_state('lecture.md', [self.source])
+        assert str(self.source) in reads
+        assert manifest.stale_reasons('lecture.md', self.fingerprint, state) == []
+
+
+class TestIncrementalBatch:
+    """Test batch runs skipping up-to-date files with the fake quarto."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_quarto, tmp_path):
+        self.log_file = fake_quarto
+        self.input_dir = tmp_path / "lectures"
+        (self.input_dir / "part").mkdir(parents=True)
+        for name in ("one.md", "two.md", "part/three.md"):
+            (self.input_dir / name).write_text(f"# Lecture {name}\n\nBody\n")
+        self.output_dir = tmp_path / "out"
+        self.config = Config()
+        self.config.output.formats = ["html"]
+        self.config.batch.recursive = True
+    
+    def test_only_changed_lecture_is_rebuilt(self):
+        """Test that after a typo fix only that lecture is processed."""
+        first = BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        (self.input_dir / "part" / "three.md").write_text("# Lecture three\n\nBody, fixed\n")
+        second = BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        
+        assert first.successful_files == 3
+        assert second.successful_files == 1 and second.skipped_files == 2
+        assert [r.file_path.name for r in second.file_results if r.status == 'success'] == ["three.md"]
+        assert len(_rendered(self.log_file)) == 8
+        entries = json.loads((self.output_dir / BUILD_MANIFEST_NAME).read_text())['entries']
+        assert sorted(entries) == ["one.md", "part/three.md", "two.md"]
+        
+        # Nothing changed: every file is skipped, and skipped files are not failures
+        third = BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        assert third.skipped_files == 3 and third.successful_files == 0
+        assert third.success_rate == 100.0
+    
+    def test_config_change_and_rebuild_all(self):
+        """Test that a changed theme rebuilds every file, as does turning incremental off."""
+        BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        self.config.slides.theme = "academic-dark"
+        themed = BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        renders_before = len(_rendered(self.log_file))
+        self.config.batch.incremental = False
+        forced = BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        
+        assert themed.successful_files == 3
+        assert all(r.build_report.names('skipped') == ['split', 'qmd[slides]', 'qmd[notes]', 'render[notes:pdf]']
+                   for r in themed.file_results)
+        assert forced.successful_files == 3
+        assert len(_rendered(self.log_file)) == renders_before + 6
+    
+    def test_referenced_image_and_theme_redo_renders(self):
+        """Test that a changed image or theme SCSS next to the documents redoes the renders reading it."""
+        (self.input_dir / "one.md").write_text("# Lecture one\n\n![Figure](figure.png)\n")
+        self.output_dir.mkdir()
+        (self.output_dir / "figure.png").write_bytes(b"png 1")
+        self.config.slides.theme = "academic-minimal"
+        BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        
+        (self.output_dir / "figure.png").write_bytes(b"png 2")
+        image_changed = BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        (self.output_dir / "academic-minimal.scss").write_text("/*-- scss:defaults --*/\n")
+        theme_changed = BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        
+        rebuilt = {r.file_path.name: r.build_report.names('rebuilt') for r in image_changed.file_results
+                   if r.status == 'success'}
+        assert rebuilt == {"one.md": ['render[slides:html]', 'render[notes:pdf]']}
+        assert image_changed.skipped_files == 2
+        # part/three.md is rendered in out/part, next to a theme file of its own
+        assert theme_changed.successful_files == 2 and theme_changed.skipped_files == 1
+        assert all(r.build_report.names('rebuilt') == ['render[slides:html]'] for r in theme_changed.file_results
+                   if r.status == 'success')
+    
+    def test_own_outputs_are_replaced_without_overwrite(self):
+        """Test that outputs an earlier run built are rebuilt, while foreign ones are protected."""
+        BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        (self.input_dir / "one.md").write_text("# Lecture one\n\nEdited\n")
+        (self.input_dir / "four.md").write_text("# Lecture four\n")
+        (self.output_dir / "four_slides.html").write_text("someone else's")
+        
+        result = BatchProcessor(self.config).process_directory(self.input_dir, self.output_dir)
+        
+        statuses = {r.file_path.name: (r.status, r.skip_reason) for r in result.file_results}
+        assert statuses["one.md"] == ('success', None)
+        assert statuses["four.md"] == ('skipped', "Files already exist")
+        assert statuses["two.md"] == ('skipped', "Up to date")
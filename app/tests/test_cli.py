@@ -7,7 +7,9 @@ Comprehensive tests will be added in task 8.1 and 8.2.
 
 import pytest
 from click.testing import CliRunner
+from markdown_slides_generator import cli as cli_module
 from markdown_slides_generator.cli import cli
+from markdown_slides_generator.utils.bibliography import bibliography_cache
 
 
 class TestCLI:
@@ -56,4 +58,57 @@ class TestCLI:
         result = runner.invoke(cli, ['check'])
         
         assert result.exit_code == 0
-        assert 'dependencies' in result.output.lower()
\ No newline at end of file
+        assert 'dependencies' in result.output.lower()
+
+
+class TestWatchBibliographies:
+    """Test that watch mode follows the .bib files inserted by the lecture."""
+    
+    def test_bib_change_invalidates_and_regenerates(self, tmp_path, monkeypatch):
+        """Test routing of watcher events for the input, its .bib files and other files."""
+        monkeypatch.chdir(tmp_path)
+        bib_dir = tmp_path / "refs"
+        bib_dir.mkdir()
+        bib_file = bib_dir / "course.bib"
+        bib_file.write_text("@misc{a, title={A}}")
+        lecture = tmp_path / "lecture.md"
+        lecture.write_text("# Lecture\n\n<!-- INSERT-BIB refs/course.bib -->\n")
+        
+        watched = []
+        regenerated = []
+        invalidated = []
+        
+        class FakeWatcher:
+            def __init__(self, callback, file_patterns=None, debounce_seconds=1.0):
+                self.callback = callback
+                assert '.bib' in file_patterns
+            
+            def __enter__(self):
+                return self
+            
+            def __exit__(self, *args):
+                pass
+            
+            def watch_file(self, path):
+                watched.append(path.parent)
+            
+            def watch_directory(self, path):
+                watched.append(path)
+            
+            def start(self):
+                pass
+            
+            def wait(self):
+                self.callback(tmp_path / "other.md")
+                self.callback(bib_file)
+                self.callback(lecture)
+        
+        monkeypatch.setattr(cli_module, 'create_file_watcher', FakeWatcher)
+        monkeypatch.setattr(bibliography_cache, 'invalidate', invalidated.append)
+        
+        cli_module._watch_input_file(lecture, regenerated.append)
+        
+        assert bib_dir.resolve() in watched
+        assert regenerated == [bib_file, lecture]
+        assert invalidated == [bib_file.resolve()]
+
@@ -0,0 +1,162 @@
+"""
+Tests for the adaptive render concurrency controller.
+"""
+
+import threading
+import time
+
+import pytest
+
+from markdown_slides_generator.batch import BatchProcessor
+from markdown_slides_generator.config import Config
+from markdown_slides_generator.core.concurrency import (
+    AdaptiveConcurrencyController, SharedRenderCounts, SystemSample, FORMAT_COST_PRIORS, MB
+)
+
+
+class FakeMachine:
+    """Probe returning a settable machine state."""
+    
+    def __init__(self, cpu_count=8, load=0.0, available_memory=16 * 1024 * MB):
+        self.sample = SystemSample(cpu_count, load, available_memory)
+    
+    def __call__(self):
+        return self.sample
+
+
+class TestAdaptiveConcurrencyController:
+    """Test admission, bounds, priorities and cost learning."""
+    
+    def _controller(self, machine, **kwargs):
+        kwargs.setdefault('max_workers', 4)
+        return AdaptiveConcurrencyController(probe=machine, sample_interval=0.01, memory_reserve=0, **kwargs)
+    
+    def _start(self, controller, fmt, started, release):
+        """Thread holding a slot of fmt until release is set."""
+        def run():
+            with controller.slot(fmt):
+                started.append(fmt)
+                release.wait(5)
+        thread = threading.Thread(target=run)
+        thread.start()
+        return thread
+    
+    def _settle(self, controller, running, waiting=0):
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            stats = controller.get_stats()
+            if stats['running'] == running and stats['waiting'] == waiting:
+                return
+            time.sleep(0.01)
+        pytest.fail(f"controller did not settle: {controller.get_stats()}")
+    
+    def test_idle_machine_runs_up_to_max(self):
+        """Test that an idle machine admits renders up to max_workers."""
+        controller = self._controller(FakeMachine())
+        started, release = [], threading.Event()
+        threads = [self._start(controller, 'html', started, release) for _ in range(6)]
+        
+        self._settle(controller, running=4, waiting=2)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert controller.get_stats()['peak_running'] == 4
+    
+    def test_shared_counts_make_one_limit(self):
+        """Test that controllers sharing counts, as batch worker processes do, keep to one memory and worker limit."""
+        machine = FakeMachine(available_memory=550 * MB)
+        shared = SharedRenderCounts()
+        controllers = []
+        for _ in range(2):
+            controller = AdaptiveConcurrencyController(max_workers=4, probe=machine, sample_interval=60, memory_reserve=0)
+            controller.share_counts(shared)
+            controllers.append(controller)
+        started, release = [], threading.Event()
+        threads = [self._start(c, 'html', started, release) for c in controllers for _ in range(3)]
+        
+        # One render runs before the first sample; two more of 250 MB fit in 550 MB, whichever process starts them
+        deadline = time.time() + 5
+        while len(started) < 3 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.2)
+        assert len(started) == 3 and shared.running.value == 3
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert len(started) == 6 and shared.running.value == 0
+    
+    def test_load_and_memory_hold_renders_back(self):
+        """Test that busy CPUs or scarce memory keep the limit low, but never below min_workers."""
+        machine = FakeMachine(cpu_count=4, load=4.0)
+        controller = self._controller(machine, min_workers=1)
+        started, release = [], threading.Event()
+        threads = [self._start(controller, 'html', started, release) for _ in range(3)]
+        
+        self._settle(controller, running=1, waiting=2)
+        machine.sample = SystemSample(4, 0.0, 200 * MB)
+        time.sleep(0.1)
+        self._settle(controller, running=1, waiting=2)
+        
+        machine.sample = SystemSample(4, 0.0, 16 * 1024 * MB)
+        self._settle(controller, running=3)
+        
+        release.set()
+        for thread in threads:
+            thread.join()
+    
+    def test_longest_formats_first(self):
+        """Test that waiting PDF renders are admitted before HTML renders."""
+        controller = self._controller(FakeMachine(), max_workers=1)
+        started, release = [], threading.Event()
+        blocker = self._start(controller, 'html', started, release)
+        self._settle(controller, running=1)
+        waiters = []
+        for fmt in ('html', 'revealjs', 'pdf', 'beamer'):
+            waiters.append(self._start(controller, fmt, started, release))
+            self._settle(controller, running=1, waiting=len(waiters))
+        
+        release.set()
+        for thread in [blocker] + waiters:
+            thread.join()
+        
+        assert started == ['html', 'pdf', 'beamer', 'html', 'revealjs']
+    
+    def test_learns_format_costs(self):
+        """Test that measured renders replace and then refine the priors."""
+        controller = self._controller(FakeMachine())
+        assert controller.expected_cost('pdf') == FORMAT_COST_PRIORS['pdf']
+        
+        controller.record('pdf', 10.0, 100 * MB)
+        controller.record('pdf', 20.0, None)
+        
+        seconds, rss = controller.expected_cost('pdf')
+        assert seconds == pytest.approx(13.0)
+        assert rss == 100 * MB
+
+
+class TestBatchConcurrency:
+    """Test the controller in batch processing with the fake quarto."""
+    
+    def test_batch_renders_within_bounds(self, fake_quarto, tmp_path, monkeypatch):
+        """Test that all files' renders share the controller's limit."""
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "0.2")
+        input_dir = tmp_path / "lectures"
+        input_dir.mkdir()
+        for index in range(4):
+            (input_dir / f"lecture{index}.md").write_text(f"# Lecture {index}\n\nBody\n")
+        config = Config()
+        config.output.formats = ["html"]
+        config.batch.max_workers = 2
+        
+        processor = BatchProcessor(config)
+        result = processor.process_directory(input_dir, tmp_path / "out")
+        
+        assert result.successful_files == 4
+        spans = [tuple(map(float, line.split()[2:4])) for line in fake_quarto.read_text().splitlines()]
+        assert len(spans) == 8
+        assert max(sum(start <= t < end for start, end in spans) for t, _ in spans) <= 2
+        stats = processor.concurrency.get_stats()
+        assert stats['peak_running'] <= 2
+        assert set(stats['costs']) == {'html', 'pdf'}
@@ -172,11 +172,14 @@ invalid: yaml: content:
             'theme': 'dark',
             'output_dir': '/custom/output',
             'author': 'CLI Author',
+            'validation_level': 'fast',
             'verbose': True
         }
         
         merged = self.manager.merge_cli_options(config, cli_options)
         
+        assert merged.processing.validation_level == 'fast'
+        
         assert merged.output.formats == ['pdf', 'html']
         assert merged.slides.theme == 'dark'
         assert merged.output.directory == '/custom/output'
@@ -412,6 +415,35 @@ class TestConfigValidation:
         with pytest.raises(ConfigurationError):
             self.validator.validate(invalid_config, config_file)
     
+    def test_invalid_validation_level(self):
+        """Test validation of the processing validation tier."""
+        invalid_config = {
+            'processing': {
+                'validation_level': 'thorough'
+            }
+        }
+        
+        config_file = self.temp_path / "invalid.yaml"
+        
+        with pytest.raises(ConfigurationError) as exc_info:
+            self.validator.validate(invalid_config, config_file)
+        
+        assert "validation_level" in str(exc_info.value)
+    
+    def test_invalid_shard_workers(self):
+        """Test validation of the sharded validation worker count."""
+        for shard_workers in ['4', -1, 64]:
+            with pytest.raises(ConfigurationError) as exc_info:
+                self.validator.validate({'processing': {'shard_workers': shard_workers}})
+            assert "shard_workers" in str(exc_info.value)
+    
+    def test_invalid_render_workers(self):
+        """Test validation of the concurrent render worker count."""
+        for render_workers in ['4', 0, 64]:
+            with pytest.raises(ConfigurationError) as exc_info:
+                self.validator.validate({'output': {'render_workers': render_workers}})
+            assert "render_workers" in str(exc_info.value)
+    
     def test_path_validation(self):
         """Test validation of file paths."""
         invalid_config = {
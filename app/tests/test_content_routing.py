@@ -11,7 +11,7 @@ import shutil
 from pathlib import Path
 import yaml
 
-from markdown_slides_generator.core.content_splitter import ContentSplitter
+from markdown_slides_generator.core.content_splitter import ContentSplitter, SectionIndex
 
 
 class TestIntelligentContentRouting:
@@ -195,6 +195,36 @@ Regular text content."""
         assert section.has_code is True
         assert section.has_math is True
     
+    def test_section_index(self):
+        """Test offsets, flags and word counts recorded by the section index."""
+        test_content = """Opening words.
+# Title 1
+Text with $x$.
+---
+
+Loose text
+```
+code
+```
+## Title 2"""
+        
+        index = SectionIndex.build(test_content)
+        
+        assert [section.title for section in index.sections] == [
+            "Introduction", "Title 1", "Introduction", "Title 2"
+        ]
+        assert [section.slide_number for section in index.sections] == [1, 2, 3, 4]
+        assert index.header_offsets == [test_content.index("# Title 1"), test_content.index("## Title 2")]
+        
+        intro, first, loose, second = index.sections
+        assert first.content == "# Title 1\nText with $x$.\n"
+        assert first.has_math and not first.has_code
+        assert loose.content == "Loose text\n```\ncode\n```\n"
+        assert loose.has_code and not loose.has_math
+        assert second.content == "## Title 2\n"
+        assert second.header_level == 2
+        assert [section.word_count for section in index.sections] == [2, 6, 5, 3]
+    
     def test_slide_separator_insertion(self):
         """Test that slide separators are properly inserted."""
         test_content = """# Title 1
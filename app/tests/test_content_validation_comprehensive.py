@@ -11,7 +11,7 @@ from pathlib import Path
 from unittest.mock import Mock, patch, AsyncMock
 
 from src.markdown_slides_generator.validation import (
-    ContentValidator, ValidationResult, ValidationIssue, IssueType, IssueSeverity,
+    ContentValidator, ValidationResult, ValidationIssue, IssueType, IssueSeverity, ValidationLevel,
     SlideOptimizer, OptimizationResult, OptimizationType,
     LinkChecker, LinkValidationResult, check_links_sync,
     ImageValidator, ImageValidationResult,
@@ -164,6 +164,23 @@ Line with trailing spaces
         that facilitate optimization of performance characteristics."""
         result = self.validator.validate_content(complex_content)
         assert result.readability_score < 70
+    
+    def test_standard_level_skips_heavy_checks(self):
+        """Test that the standard level skips readability, link and image checks."""
+        content = """# Title
+
+The implementation of sophisticated algorithmic methodologies necessitates comprehensive understanding.
+
+![Missing](does_not_exist.png)
+"""
+        full = self.validator.validate_content(content)
+        standard = self.validator.validate_content(content, level=ValidationLevel.STANDARD)
+        
+        skipped = {IssueType.READABILITY, IssueType.IMAGE_MISSING, IssueType.LINK_BROKEN}
+        assert any(issue.type in skipped for issue in full.issues)
+        assert not any(issue.type in skipped for issue in standard.issues)
+        assert standard.readability_score == 0.0
+        assert standard.word_count == full.word_count
 
 
 class TestSlideOptimizer:
@@ -5,14 +5,23 @@ Tests the robust parsing of special markdown comments and state machine
 implementation for content mode tracking with extensive edge cases.
 """
 
+import io
+import random
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from markdown_slides_generator.core.content_splitter import (
     MarkdownDirectiveParser, 
     ContentSplitter,
     ContentMode,
     DirectiveMatch,
-    ContentBlock
+    ContentBlock,
+    SplitResult
 )
+from markdown_slides_generator.core.document_context import DocumentContext
+from markdown_slides_generator.latex import LaTeXExpressionParser, check_line_range, line_range_extents
+from markdown_slides_generator.validation import ValidationLevel
+from markdown_slides_generator.utils.exceptions import InputError
 
 
 class TestMarkdownDirectiveParser:
@@ -876,5 +885,371 @@ This conclusion appears in both slides and notes.
         assert len(self.splitter.slide_boundaries) == 3  # SLIDE, NOTES, slides
 
 
+class TestIncrementalSplit:
+    """Test that incremental re-splitting matches a full split after every edit."""
+    
+    LINE_POOL = [
+        "# Title", "", "Some text here.", "- bullet item",
+        "<!-- SLIDE -->", "<!-- NOTES -->", "<!-- ALL -->", "<!-- SLIDE-ONLY -->",
+        "<!-- NOTES-ONLY -->", "<!-- END SLIDE -->", "<!-- SLDIE -->",
+        "```python", "```", "~~~", "`<!-- SLIDE -->` in inline code",
+        "Math $x^2 + y$ here", "$$\\frac{a}{b}$$", "\\alpha and \\mathbb{R}",
+        "\\begin{align}", "a &= b \\\\", "\\end{align}", "{unbalanced", "a/b ratio",
+    ]
+    
+    def _snapshot(self, splitter, result):
+        """Collect everything a split exposes, for comparison."""
+        latex = splitter.get_latex_validation_result()
+        validation = splitter.get_validation_result()
+        return {
+            'slides': result['slides'],
+            'notes': result['notes'],
+            'blocks': result['blocks'],
+            'directives': result['directives'],
+            'warnings': result['warnings'],
+            'boundaries': splitter.get_slide_boundaries(),
+            'latex': (latex.errors, latex.warnings, latex.packages_required, latex.custom_commands,
+                      [(e.content, e.expression_type, e.line_number, e.column_start) for e in latex.expressions]),
+            'validation': [(i.type, i.severity, i.message) for i in validation.issues],
+        }
+    
+    def _random_edit(self, rng, lines):
+        """Insert, delete or replace a few random lines."""
+        lines = list(lines)
+        position = rng.randint(0, len(lines))
+        operation = rng.random()
+        if operation < 0.4 or not lines:
+            lines[position:position] = [rng.choice(self.LINE_POOL) for _ in range(rng.randint(1, 3))]
+        elif operation < 0.7:
+            position = min(position, len(lines) - 1)
+            del lines[position:position + rng.randint(1, 3)]
+        else:
+            lines[min(position, len(lines) - 1)] = rng.choice(self.LINE_POOL)
+        return lines
+    
+    def _assert_matches_full_split(self, splitter, content):
+        incremental = self._snapshot(splitter, splitter.process_directives_incremental(content))
+        fresh = ContentSplitter()
+        full = self._snapshot(fresh, fresh.process_directives(content))
+        assert incremental == full
+    
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_edit_sequences(self, seed):
+        """Test incremental output against a full split over random edit sequences."""
+        rng = random.Random(seed)
+        splitter = ContentSplitter()
+        lines = [rng.choice(self.LINE_POOL) for _ in range(rng.randint(0, 30))]
+        
+        for _ in range(12):
+            self._assert_matches_full_split(splitter, '\n'.join(lines))
+            lines = self._random_edit(rng, lines)
+    
+    def test_edit_opening_code_fence(self):
+        """Test that opening a code fence hides directives after the edit."""
+        splitter = ContentSplitter()
+        lines = ["Intro", "<!-- SLIDE -->", "Slide text", "Gap", "<!-- NOTES -->", "Notes text"]
+        self._assert_matches_full_split(splitter, '\n'.join(lines))
+        
+        lines[3] = "```"
+        self._assert_matches_full_split(splitter, '\n'.join(lines))
+        assert [d.line_number for d in splitter.split_state.directives] == [2]
+    
+    def test_edit_inside_environment(self):
+        """Test editing the body of a LaTeX environment opened before the edit."""
+        splitter = ContentSplitter()
+        lines = ["\\begin{align}", "a &= b", "\\end{align}", "<!-- SLIDE -->", "Text"]
+        self._assert_matches_full_split(splitter, '\n'.join(lines))
+        
+        lines[1] = "a &= \\frac{b}{c}"
+        self._assert_matches_full_split(splitter, '\n'.join(lines))
+    
+    def test_unchanged_content_reuses_state(self):
+        """Test that re-splitting identical content keeps the previous state."""
+        splitter = ContentSplitter()
+        content = "Intro\n<!-- SLIDE -->\nSlide text"
+        splitter.process_directives_incremental(content)
+        state = splitter.split_state
+        
+        splitter.process_directives_incremental(content)
+        assert splitter.split_state is state
+
+
+class TestReentrantSplit:
+    """Test the stateless split API and its use from several threads."""
+    
+    def _document(self, index):
+        return (
+            f"# Document {index}\n"
+            f"<!-- SLIDE -->\nSlide {index} with $x_{index}$\n"
+            f"<!-- NOTES -->\nNotes {index}\n"
+            f"<!-- SLIDE-ONY -->\n"
+            f"<!-- ALL -->\nShared {index}\n"
+        )
+    
+    def test_split_leaves_splitter_untouched(self):
+        """Test that split returns everything in the result and stores nothing."""
+        splitter = ContentSplitter()
+        result = splitter.split(self._document(1))
+        
+        assert isinstance(result, SplitResult)
+        assert "Slide 1" in result.slides
+        assert "Notes 1" in result.notes
+        assert result.slide_boundaries == (4,)
+        assert len(result.malformed_directives) == 1
+        assert result.latex_validation_result.is_valid
+        assert splitter.get_slide_boundaries() == []
+        assert splitter.get_latex_validation_result() is None
+        assert splitter.parser.malformed_directives == []
+        with pytest.raises(AttributeError):
+            result.slides = ""
+    
+    def test_process_directives_matches_split(self):
+        """Test that the compatibility layer mirrors the split result."""
+        splitter = ContentSplitter()
+        processed = splitter.process_directives(self._document(2))
+        result = ContentSplitter().split(self._document(2))
+        
+        assert processed == result.as_dict()
+        assert splitter.get_slide_boundaries() == list(result.slide_boundaries)
+        assert splitter.get_validation_warnings() == list(result.warnings)
+    
+    def test_malformed_directives_do_not_accumulate(self):
+        """Test that repeated parses report only the last content's malformed directives."""
+        parser = MarkdownDirectiveParser()
+        content = "<!-- SLIDE-ONY -->\ntext"
+        for _ in range(3):
+            parser.parse_directives(content)
+        
+        assert len(parser.malformed_directives) == 1
+        
+        parser.parse_directives("<!-- SLIDE -->")
+        assert parser.malformed_directives == []
+    
+    def test_shared_splitter_across_threads(self):
+        """Test that one splitter gives the sequential results when used concurrently."""
+        documents = [self._document(index) for index in range(40)]
+        expected = [ContentSplitter().split(document) for document in documents]
+        
+        shared = ContentSplitter()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(shared.split, documents))
+        
+        for result, reference in zip(results, expected):
+            assert result.as_dict() == reference.as_dict()
+            assert result.malformed_directives == reference.malformed_directives
+            assert result.latex_validation_result.packages_required == reference.latex_validation_result.packages_required
+            assert len(result.latex_validation_result.expressions) == len(reference.latex_validation_result.expressions)
+            assert result.validation_result.word_count == reference.validation_result.word_count
+
+
+class TestValidationTiers:
+    """Test validation levels and deferred validation in the splitter."""
+    
+    CONTENT = "Intro $x^2$\n<!-- SLIDE-ONLY -->\nOpen slides-only block\n<!-- NOTES -->\nNotes"
+    
+    def test_levels(self):
+        """Test what each validation level runs."""
+        results = {
+            level: ContentSplitter(validation_level=level).split(self.CONTENT)
+            for level in ValidationLevel
+        }
+        
+        assert results[ValidationLevel.NONE].warnings == ()
+        assert results[ValidationLevel.FAST].warnings
+        assert results[ValidationLevel.FAST].latex_validation_result is None
+        assert results[ValidationLevel.FAST].validation_result is None
+        assert results[ValidationLevel.STANDARD].validation_result.readability_score == 0.0
+        assert results[ValidationLevel.FULL].validation_result.readability_score != 0.0
+        for result in results.values():
+            assert result.as_dict() == dict(results[ValidationLevel.FULL].as_dict(), warnings=list(result.warnings))
+    
+    def test_level_from_string(self):
+        """Test configuring the level by name."""
+        assert ContentSplitter(validation_level='fast').validation_level == ValidationLevel.FAST
+        with pytest.raises(ValueError):
+            ContentSplitter(validation_level='thorough')
+    
+    def test_deferred_validation(self):
+        """Test that deferred validation runs after the incremental split."""
+        splitter = ContentSplitter(defer_validation=True)
+        splitter.process_directives_incremental(self.CONTENT)
+        assert splitter.get_latex_validation_result() is None
+        
+        latex_result, validation_result = splitter.start_deferred_validation().result(timeout=10)
+        
+        assert splitter.get_latex_validation_result() is latex_result
+        assert splitter.get_validation_result() is validation_result
+        assert latex_result.expressions
+    
+    def test_stale_deferred_validation_is_dropped(self):
+        """Test that results for older content do not overwrite newer splits."""
+        splitter = ContentSplitter(defer_validation=True)
+        splitter.process_directives_incremental(self.CONTENT)
+        stale_generation = splitter._validation_generation
+        splitter.process_directives_incremental(self.CONTENT + "\nMore")
+        
+        splitter._run_deferred_validation(DocumentContext(self.CONTENT), stale_generation)
+        
+        assert splitter.get_validation_result() is None
+
+
+class TestShardedValidation:
+    """Test validating large documents in worker processes."""
+    
+    CONTENT = "\n".join([
+        "# Course",
+        "Intro with $x^2$ and $a*b$.",
+        "\\begin{align}",
+        "a &= b \\\\",
+        "<!-- SLIDE -->",
+        "## Spanning",
+        "c &= d",
+        "\\end{align}",
+        "---",
+        "Unbalanced $\\frac{1}{2$ here.",
+        "```",
+        "## Inside a fence",
+        "```",
+        "<!-- NOTES -->",
+        "\\begin{matrix} never closed",
+        "# Last",
+        "Closing $y$.",
+        "",
+    ]) * 20
+    
+    def _sharded_splitter(self, workers=3):
+        splitter = ContentSplitter(shard_workers=workers)
+        splitter.SHARD_MIN_LINES = 10
+        return splitter
+    
+    def test_matches_unsharded_split(self):
+        """Test that environments spanning shards are merged like a single parse."""
+        splitter = self._sharded_splitter()
+        assert len(splitter._plan_shards(self.CONTENT, [])) > 1
+        
+        expected = ContentSplitter().split(self.CONTENT)
+        result = splitter.split(self.CONTENT)
+        
+        assert result.as_dict() == expected.as_dict()
+        latex, expected_latex = result.latex_validation_result, expected.latex_validation_result
+        assert latex.errors == expected_latex.errors
+        assert latex.warnings == expected_latex.warnings
+        assert latex.packages_required == expected_latex.packages_required
+        assert [(e.content, e.line_number, e.is_valid) for e in latex.expressions] == \
+            [(e.content, e.line_number, e.is_valid) for e in expected_latex.expressions]
+        assert [issue.message for issue in result.validation_result.issues] == \
+            [issue.message for issue in expected.validation_result.issues]
+    
+    def test_workers_get_only_the_lines_their_shard_needs(self):
+        """Test that a shard extends only to the \\end of environments opened in it."""
+        content = "\n".join([
+            "\\begin{align}",      # 1, closed on line 4
+            "a",
+            "# Cut",
+            "\\end{align}",
+            "\\begin{matrix}",     # 5, never closed
+            "# Cut",
+            "\\begin{cases} b",    # 7, closed on line 9
+            "\\end{align}",
+            "\\end{cases}",
+            "# Last",
+        ])
+        shards = [(1, 2), (3, 6), (7, 8), (9, 10)]
+        
+        assert line_range_extents(content, shards) == [4, 6, 9, 10]
+        lines = content.split("\n")
+        for (first_line, last_line), extent in zip(shards, line_range_extents(content, shards)):
+            text = "\n".join(lines[first_line - 1:extent])
+            expressions, _ = check_line_range(text, first_line, last_line - first_line + 1)
+            whole = LaTeXExpressionParser().parse_lines(lines, first_line, last_line)
+            assert [(e.content, e.line_number) for e in expressions] == \
+                [(e.content, e.line_number) for e in whole]
+    
+    def test_cuts_at_slide_boundaries(self):
+        """Test that shards start on header, separator or directive lines."""
+        lines = self.CONTENT.split("\n")
+        shards = self._sharded_splitter()._plan_shards(self.CONTENT, [])
+        
+        assert shards[0][0] == 1 and shards[-1][1] == len(lines)
+        for (_, last_line), (first_line, _) in zip(shards, shards[1:]):
+            assert first_line == last_line + 1
+            assert lines[first_line - 1].startswith(("#", "---", "<!--"))
+    
+    def test_small_documents_are_not_sharded(self):
+        """Test that sharding is opt-in and skipped below the size threshold."""
+        assert ContentSplitter()._plan_shards(self.CONTENT, []) == [(1, self.CONTENT.count("\n") + 1)]
+        assert len(ContentSplitter(shard_workers=4)._plan_shards(self.CONTENT, [])) == 1
+
+
+class TestStreamingSplit:
+    """Test that iter_split streams exactly what split_content returns."""
+    
+    LINE_POOL = TestIncrementalSplit.LINE_POOL + [
+        "   ", "  indented text  ", "---", " --- ", "\t",
+        "text <!-- SLIDE --> <!-- NOTES -->", "<!-- NOTES --><!-- ALL -->",
+    ]
+    
+    def _assert_streams_like_split(self, tmp_path, content):
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text(content, encoding='utf-8')
+        
+        splitter = ContentSplitter()
+        expected = splitter.split_content(str(input_file))
+        
+        streaming = ContentSplitter()
+        slides_writer, notes_writer = io.StringIO(), io.StringIO()
+        streaming.split_to_writers(str(input_file), slides_writer, notes_writer)
+        
+        assert (slides_writer.getvalue(), notes_writer.getvalue()) == expected
+        assert streaming.get_slide_boundaries() == splitter.get_slide_boundaries()
+        assert streaming.get_validation_warnings() == splitter.get_validation_warnings()
+    
+    def test_directives_and_separators(self, tmp_path):
+        """Test routing, separators and whitespace trimming around directives."""
+        content = """
+   # Intro
+
+Shared text.
+
+<!-- SLIDE -->
+Slide one.
+
+
+<!-- NOTES -->
+  Notes for slide one.  
+
+<!-- ALL -->
+---
+<!-- SLIDE -->
+```
+<!-- NOTES -->
+```
+"""
+        self._assert_streams_like_split(tmp_path, content)
+    
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_documents(self, tmp_path, seed):
+        """Test random documents against split_content."""
+        rng = random.Random(seed)
+        lines = [rng.choice(self.LINE_POOL) for _ in range(rng.randint(0, 40))]
+        self._assert_streams_like_split(tmp_path, '\n'.join(lines) + rng.choice(['', '\n']))
+    
+    def test_iter_split_yields_targets(self, tmp_path):
+        """Test the (target, chunk) pairs produced by iter_split."""
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("Both\n<!-- SLIDE-ONLY -->\nSlides\n<!-- NOTES-ONLY -->\nNotes\n")
+        
+        chunks = list(ContentSplitter().iter_split(str(input_file)))
+        
+        assert ('slides', 'Slides') in chunks
+        assert ('notes', 'Notes') in chunks
+        assert ('notes', 'Slides') not in chunks
+    
+    def test_missing_file(self, tmp_path):
+        """Test that streaming a missing file raises InputError."""
+        with pytest.raises(InputError):
+            list(ContentSplitter().iter_split(str(tmp_path / "missing.md")))
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,92 @@
+"""
+Tests for the write-if-changed helpers used for generated files.
+"""
+
+import os
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from markdown_slides_generator.cli import cli
+from markdown_slides_generator.utils.file_io import write_if_changed, copy_if_changed
+
+
+def _age(path, seconds=100):
+    """Move a file's mtime into the past and return the new mtime."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 10**9))
+    return path.stat().st_mtime_ns
+
+
+class TestWriteIfChanged:
+    """Test write_if_changed."""
+    
+    def test_writes_new_and_changed_files(self, tmp_path):
+        """Test that missing or different files are written."""
+        target = tmp_path / "doc.qmd"
+        
+        assert write_if_changed(target, "# One\n")
+        assert write_if_changed(target, "# Two\n")
+        assert target.read_text() == "# Two\n"
+    
+    def test_same_content_keeps_mtime(self, tmp_path):
+        """Test that identical content does not touch the file."""
+        target = tmp_path / "doc.qmd"
+        write_if_changed(target, "# Slides\n")
+        mtime = _age(target)
+        
+        assert not write_if_changed(target, "# Slides\n")
+        assert not write_if_changed(target, "# Slides\n".encode("utf-8"))
+        assert target.stat().st_mtime_ns == mtime
+    
+    def test_replaces_atomically(self, tmp_path):
+        """Test that the write goes through a renamed temporary file."""
+        target = tmp_path / "doc.qmd"
+        target.write_text("old")
+        inode = target.stat().st_ino
+        
+        write_if_changed(target, "new")
+        
+        assert target.read_text() == "new"
+        assert target.stat().st_ino != inode
+        assert [p.name for p in tmp_path.iterdir()] == ["doc.qmd"]
+
+
+class TestCopyIfChanged:
+    """Test copy_if_changed."""
+    
+    def test_copies_only_when_source_changes(self, tmp_path):
+        """Test that a copy with the source's size and mtime is left alone."""
+        source = tmp_path / "figure.png"
+        source.write_bytes(b"png-1")
+        destination = tmp_path / "out.png"
+        
+        assert copy_if_changed(source, destination)
+        assert not copy_if_changed(source, destination)
+        
+        source.write_bytes(b"png-22")
+        assert copy_if_changed(source, destination)
+        assert destination.read_bytes() == b"png-22"
+
+
+class TestGeneratedDocumentsPersist:
+    """Test that generate keeps its .qmd files and leaves unchanged ones alone."""
+    
+    def test_rerun_keeps_documents_untouched(self, fake_quarto, tmp_path):
+        """Test that a second run with the same input rewrites nothing."""
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("# Lecture\n\nBody\n\n<!-- NOTES-ONLY -->\nDetails\n")
+        output_dir = tmp_path / "out"
+        args = ["generate", str(input_file), "-o", str(output_dir), "-f", "html", "--overwrite"]
+        
+        first = CliRunner().invoke(cli, args)
+        assert first.exit_code == 0, first.output
+        generated = [output_dir / "lecture_slides.qmd", output_dir / "lecture_notes.qmd",
+                     output_dir / "academic-minimal.scss"]
+        mtimes = [_age(path) for path in generated]
+        
+        second = CliRunner().invoke(cli, args)
+        
+        assert second.exit_code == 0, second.output
+        assert [path.stat().st_mtime_ns for path in generated] == mtimes
+        assert "theme:\n    - academic-minimal.scss" in Path(generated[0]).read_text()
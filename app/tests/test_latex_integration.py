@@ -7,14 +7,18 @@ content splitting and Quarto orchestration systems.
 
 import pytest
 import tempfile
+import uuid
 from pathlib import Path
 
 from markdown_slides_generator.core.content_splitter import ContentSplitter
+from markdown_slides_generator.core.document_context import DocumentContext
 from markdown_slides_generator.core.quarto_orchestrator import QuartoOrchestrator
 from markdown_slides_generator.latex import (
     LaTeXProcessor, 
+    LaTeXParseCounter,
     MathRenderer, 
-    OutputFormat
+    OutputFormat,
+    parse_counter
 )
 
 
@@ -273,5 +277,57 @@ This should work: $x = y$
         # The important thing is that the processor handles it gracefully and finds expressions
 
 
+class TestSharedLaTeXAnalysis:
+    """Test that one document's LaTeX is parsed once for all consumers."""
+    
+    def _document(self):
+        # Unique text so counts are not shared with documents from other tests
+        return f"""# Lecture {uuid.uuid4().hex}
+
+Inline $E = mc^2$ and \\alpha.
+
+<!-- SLIDE -->
+$$\\int_0^1 x^2 dx = \\frac{{1}}{{3}}$$
+
+<!-- NOTES -->
+Notes with $\\mathbb{{R}}$.
+"""
+    
+    def test_split_parses_latex_once(self):
+        """Test that splitting shares the LaTeX parse with the content validator."""
+        content = self._document()
+        result = ContentSplitter().split(content)
+        
+        assert parse_counter.count(content) == 1
+        assert result.validation_result.latex_validation is result.latex_validation_result
+    
+    def test_context_shared_with_math_renderer(self):
+        """Test that splitter and math renderer reuse one context."""
+        content = self._document()
+        context = DocumentContext(content, source="lecture.md")
+        
+        result = ContentSplitter().split(content, context=context)
+        renderer = MathRenderer()
+        for output_format in (OutputFormat.REVEALJS, OutputFormat.PDF):
+            renderer.optimize_math_rendering(content, output_format, latex_result=context.latex_result)
+        
+        assert result.latex_validation_result is context.latex_result
+        assert context.parse_count == 1
+        assert context.get_stats()["latex_parse_count"] == 1
+    
+    def test_counter_is_bounded(self):
+        """Test that the counter forgets the oldest documents."""
+        counter = LaTeXParseCounter(max_documents=2)
+        counter.record("a")
+        counter.record("a")
+        counter.record("b")
+        counter.record("c")
+        
+        assert counter.count("a") == 0
+        assert counter.count("c") == 1
+        stats = counter.get_stats()
+        assert stats["total_parses"] == 4
+        assert stats["documents"] == 2
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -11,6 +11,7 @@ import shutil
 import time
 import psutil
 import os
+import tracemalloc
 from pathlib import Path
 from unittest.mock import Mock, patch
 import threading
@@ -139,6 +140,99 @@ Key takeaways from section {i}:
         assert processing_time < 5.0  # Should handle 6000 directives in under 5 seconds
         assert len(result["directives"]) == directive_count
         assert directive_count / processing_time > 1000  # At least 1000 directives/second
+
+    def test_directive_scan_scales_linearly(self):
+        """Test that directive scanning cost grows linearly with file size."""
+        parser = self.splitter.parser
+        unit = """## Section
+
+Some `inline code` and math $x^2$ with ordinary lecture prose around it.
+<!-- SLIDE -->
+Slide text.
+<!-- NOTES-ONLY -->
+Notes text with a typo directive <!-- SLDIE --> inside.
+<!-- ALL -->
+```python
+# <!-- SLIDE --> inside a fence is ignored
+print("hello")
+```
+"""
+        timings = []
+        for repeat in [250, 2000]:  # ~40 KB and ~320 KB
+            content = unit * repeat
+            best = float('inf')
+            for _ in range(3):
+                start_time = time.perf_counter()
+                directives = parser.parse_directives(content)
+                best = min(best, time.perf_counter() - start_time)
+            
+            assert len(directives) == 3 * repeat
+            timings.append((len(content), best))
+            print(f"Scanned {len(content) / 1024:.0f} KB in {best * 1000:.1f} ms "
+                  f"({best / len(content) * 1e9:.0f} ns/byte)")
+        
+        (small_size, small_time), (large_size, large_time) = timings
+        per_byte_ratio = (large_time / large_size) / (small_time / small_size)
+        
+        # Linear scaling keeps the per-byte cost roughly constant
+        assert per_byte_ratio < 3.0
+
+    def test_intelligent_slides_scale_linearly(self):
+        """Test that section indexing stays linear for many and for very long sections."""
+        many_sections = "".join(
+            f"## Section {i}\n\nProse for section {i} with $x_{i}$.\n\n---\n\n"
+            f"### Detail {i}\n\n```python\nprint({i})\n```\n\n" for i in range(1000)
+        )
+        start_time = time.perf_counter()
+        sections = self.splitter._create_intelligent_slides(many_sections)
+        many_time = time.perf_counter() - start_time
+        
+        assert len(sections) == 2000
+        assert all(section.has_math for section in sections[::2])
+        assert all(section.has_code for section in sections[1::2])
+        print(f"Indexed 1000-section fixture in {many_time * 1000:.1f} ms")
+        
+        timings = []
+        for repeat in [2000, 16000]:
+            content = "# Long\n" + "A line of words in one long section.\n" * repeat
+            best = float('inf')
+            for _ in range(3):
+                start_time = time.perf_counter()
+                self.splitter._create_intelligent_slides(content)
+                best = min(best, time.perf_counter() - start_time)
+            timings.append((len(content), best))
+        
+        (small_size, small_time), (large_size, large_time) = timings
+        per_byte_ratio = (large_time / large_size) / (small_time / small_size)
+        print(f"Long section per-byte cost ratio: {per_byte_ratio:.2f}")
+        
+        # Appending line by line grew quadratically; slices keep it linear
+        assert per_byte_ratio < 3.0
+    
+    def test_sharded_validation_workers(self):
+        """Benchmark splitting one large document with 1, 2, 4 and 8 shard workers."""
+        content = "".join(
+            f"## Section {i}\n\nProse for section {i} with $x_{i}^2$ and \\alpha.\n\n"
+            f"$$\\frac{{a_{i}}}{{b}}$$\n\n\\begin{{align}}\na &= {i} \\\\\nb &= c\n\\end{{align}}\n\n"
+            f"<!-- SLIDE -->\nSlide {i}.\n<!-- NOTES -->\nNotes {i}.\n<!-- ALL -->\n---\n\n"
+            for i in range(1500)
+        )
+        
+        timings = {}
+        results = {}
+        for workers in [1, 2, 4, 8]:
+            splitter = ContentSplitter(shard_workers=workers)
+            start_time = time.perf_counter()
+            results[workers] = splitter.split(content)
+            timings[workers] = time.perf_counter() - start_time
+            print(f"{workers} shard worker(s): {timings[workers]:.2f}s")
+        print(f"Speedup with 8 workers on {os.cpu_count()} CPUs: {timings[1] / timings[8]:.2f}x")
+        
+        expected = results[1]
+        for result in results.values():
+            assert result.as_dict() == expected.as_dict()
+            assert result.latex_validation_result.errors == expected.latex_validation_result.errors
+            assert len(result.latex_validation_result.expressions) == len(expected.latex_validation_result.expressions)
     
     def test_memory_usage_large_files(self):
         """Test memory usage characteristics with large files."""
@@ -187,6 +281,54 @@ Notes content {i} with detailed explanation.
         for measurement in memory_measurements:
             assert measurement['memory_ratio'] < 10.0
     
+    def test_streaming_split_memory_is_flat(self):
+        """Test that streaming split memory does not grow with file size."""
+        unit = """## Section
+
+Lecture text with math $x^2$ and some ordinary prose around it.
+
+<!-- SLIDE-ONLY -->
+- point one
+- point two
+<!-- ALL -->
+Shared paragraph.
+
+<!-- NOTES-ONLY -->
+Detailed notes paragraph with a longer explanation.
+<!-- ALL -->
+
+"""
+        
+        class CountingWriter:
+            def __init__(self):
+                self.chars = 0
+            
+            def write(self, chunk):
+                self.chars += len(chunk)
+        
+        peaks = []
+        for repeat in [1000, 10000]:  # ~0.2 MB and ~2 MB
+            input_file = self.temp_path / f"semester_{repeat}.md"
+            input_file.write_text(unit * repeat, encoding='utf-8')
+            file_mb = input_file.stat().st_size / 1024 / 1024
+            
+            slides_writer, notes_writer = CountingWriter(), CountingWriter()
+            tracemalloc.start()
+            try:
+                self.splitter.split_to_writers(str(input_file), slides_writer, notes_writer)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            
+            assert slides_writer.chars > 0 and notes_writer.chars > 0
+            peaks.append(peak)
+            print(f"Streamed {file_mb:.1f} MB with peak {peak / 1024:.0f} KB traced memory")
+        
+        small_peak, large_peak = peaks
+        # Ten times the input must not need noticeably more memory
+        assert large_peak < small_peak * 2 + 64 * 1024
+        assert large_peak < 1024 * 1024
+    
     def test_concurrent_processing_safety(self):
         """Test thread safety of content splitter."""
         # Create multiple content pieces
@@ -450,6 +592,82 @@ Notes content
         assert result.successful_files == file_count
 
 
+class TestBatchBackendPerformance:
+    """Compare the thread and process batch backends."""
+    
+    @staticmethod
+    def _write_lectures(input_dir: Path, file_count: int, section_count: int) -> None:
+        """Write synthetic lectures with math, environments and directives."""
+        input_dir.mkdir()
+        for i in range(file_count):
+            sections = "".join(
+                f"## Section {j}\n\nProse for section {j} with $x_{j}^2$ and \\alpha.\n\n"
+                f"$$\\frac{{a_{j}}}{{b}}$$\n\n\\begin{{align}}\na &= {j} \\\\\nb &= c\n\\end{{align}}\n\n"
+                f"<!-- SLIDE -->\nSlide {j}.\n<!-- NOTES-ONLY -->\nNotes {j}.\n<!-- ALL -->\n"
+                for j in range(section_count)
+            )
+            (input_dir / f"lecture_{i + 1:03d}.md").write_text(f"# Lecture {i + 1}\n\n{sections}")
+    
+    @staticmethod
+    def _run_backends(input_dir: Path, tmp_path: Path, max_workers: int) -> dict:
+        """Process input_dir with each backend; returns {backend: (result, seconds)}."""
+        config = Config()
+        config.batch.max_workers = max_workers
+        config.output.formats = ['html']
+        config.output.overwrite = True
+        config.output.render_cache = False
+        config.batch.render_history = False
+        config.processing.split_cache = False
+        
+        runs = {}
+        for backend in ['thread', 'process']:
+            config.batch.backend = backend
+            start_time = time.perf_counter()
+            result = BatchProcessor(config).process_directory(input_dir, tmp_path / f"output_{backend}")
+            runs[backend] = (result, time.perf_counter() - start_time)
+        return runs
+    
+    def test_backends_produce_the_same_results(self, fake_quarto, tmp_path):
+        """Test that the process backend builds the same outputs as the thread backend."""
+        input_dir = tmp_path / "lectures"
+        self._write_lectures(input_dir, file_count=4, section_count=3)
+        
+        runs = self._run_backends(input_dir, tmp_path, max_workers=2)
+        
+        thread_result, process_result = runs['thread'][0], runs['process'][0]
+        assert thread_result.successful_files == process_result.successful_files == 4
+        assert sorted(Path(f).name for f in process_result.generated_outputs) == \
+            sorted(Path(f).name for f in thread_result.generated_outputs)
+        documents = sorted((tmp_path / "output_thread").glob("*.qmd"))
+        assert len(documents) == 8
+        for qmd in documents:
+            assert (tmp_path / "output_process" / qmd.name).read_text() == qmd.read_text()
+    
+    @pytest.mark.slow
+    @pytest.mark.skipif(
+        not os.environ.get('RUN_SLOW_BENCHMARKS'),
+        reason="Benchmark of a couple of minutes; set RUN_SLOW_BENCHMARKS=1 to run it"
+    )
+    def test_thread_vs_process_backend(self, fake_quarto, tmp_path):
+        """Benchmark the thread and process backends on 200 synthetic lectures with the fake quarto."""
+        file_count = 200
+        input_dir = tmp_path / "lectures"
+        self._write_lectures(input_dir, file_count, section_count=40)
+        
+        runs = self._run_backends(input_dir, tmp_path, max_workers=4)
+        for backend, (_, seconds) in runs.items():
+            print(f"{backend} backend: {seconds:.2f}s")
+        print(f"Process backend speedup on {os.cpu_count()} CPUs: {runs['thread'][1] / runs['process'][1]:.2f}x")
+        
+        results = {backend: result for backend, (result, _) in runs.items()}
+        for backend, result in results.items():
+            assert result.successful_files == file_count, result.errors
+            assert len(result.generated_outputs) == 2 * file_count
+        thread_outputs = sorted(Path(f).name for f in results['thread'].generated_outputs)
+        assert sorted(Path(f).name for f in results['process'].generated_outputs) == thread_outputs
+        assert results['process'].resource_usage['measured'] == results['thread'].resource_usage['measured']
+
+
 class TestQuartoOrchestratorPerformance:
     """Test performance characteristics of Quarto orchestrator."""
     
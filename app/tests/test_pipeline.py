@@ -0,0 +1,123 @@
+"""
+Tests for the staged batch pipeline.
+"""
+
+import threading
+
+import pytest
+
+from markdown_slides_generator.config import Config
+from markdown_slides_generator.batch import BatchProcessor
+from markdown_slides_generator.batch.pipeline import Pipeline
+
+
+class TestPipeline:
+    """Test stages connected by bounded queues."""
+    
+    def test_items_pass_every_stage(self):
+        """Test that every item goes through all stages, with several workers per stage."""
+        pipeline = Pipeline(queue_depth=2)
+        pipeline.add_stage('double', lambda x: x * 2, workers=3)
+        pipeline.add_stage('increment', lambda x: x + 1, workers=2)
+        
+        assert sorted(pipeline.run(range(50))) == [x * 2 + 1 for x in range(50)]
+    
+    def test_source_is_pulled_only_as_far_as_the_queues_allow(self):
+        """Test that a blocked last stage stops the source, and results come before the source ends."""
+        pulled = []
+        release = threading.Event()
+        
+        def source():
+            for item in range(1000):
+                pulled.append(item)
+                yield item
+        
+        def slow(item):
+            release.wait()
+            return item
+        
+        pipeline = Pipeline(queue_depth=2)
+        pipeline.add_stage('split', lambda x: x, workers=1)
+        pipeline.add_stage('render', slow, workers=1)
+        results = pipeline.run(source())
+        
+        # Ask for the first result while the render stage is held back
+        first = []
+        waiter = threading.Thread(target=lambda: first.append(next(results)))
+        waiter.start()
+        waiter.join(timeout=0.5)
+        
+        assert first == []
+        # Three queues of two, one item in each stage and one the feeder waits to put
+        assert 3 <= len(pulled) <= 3 * 2 + 2 + 1
+        
+        release.set()
+        waiter.join()
+        assert first == [0]
+        assert len(list(results)) == 999
+    
+    def test_stage_error_cancels_and_is_raised(self):
+        """Test that an exception in a stage stops the pipeline and reaches the caller."""
+        def fail_on_three(item):
+            if item == 3:
+                raise ValueError("bad item")
+            return item
+        
+        pipeline = Pipeline(queue_depth=1)
+        pipeline.add_stage('check', fail_on_three)
+        
+        with pytest.raises(ValueError, match="bad item"):
+            list(pipeline.run(range(100)))
+        assert pipeline.cancelled
+
+
+class TestPipelinedBatch:
+    """Test parallel batch runs split ahead of rendering, with the fake quarto."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_quarto, tmp_path):
+        self.input_dir = tmp_path / "lectures"
+        self.input_dir.mkdir()
+        for i in range(6):
+            (self.input_dir / f"lecture{i}.md").write_text(f"# Lecture {i}\n\nBody\n")
+        self.output_dir = tmp_path / "out"
+        self.config = Config()
+        self.config.output.formats = ["html"]
+        self.config.batch.max_workers = 3
+        self.config.batch.split_workers = 2
+        self.config.batch.queue_depth = 2
+    
+    def test_each_file_is_split_once(self, monkeypatch):
+        """Test that render workers use the split stage's result instead of splitting again."""
+        processor = BatchProcessor(self.config)
+        splits = []
+        original_split_file = processor.content_splitter.split_file
+        
+        def counting_split_file(filepath):
+            splits.append(filepath)
+            return original_split_file(filepath)
+        
+        monkeypatch.setattr(processor.content_splitter, 'split_file', counting_split_file)
+        result = processor.process_directory(self.input_dir, self.output_dir)
+        
+        assert result.successful_files == 6
+        assert sorted(splits) == sorted(str(f) for f in self.input_dir.glob("*.md"))
+        assert all(r.split_time is not None for r in result.file_results)
+        assert (self.output_dir / "lecture5_slides.html").exists()
+    
+    def test_split_error_is_reported_for_its_file(self, monkeypatch):
+        """Test that a file whose split fails is an error, while the others are rendered."""
+        processor = BatchProcessor(self.config)
+        original_split_file = processor.content_splitter.split_file
+        
+        def failing_split_file(filepath):
+            if filepath.endswith("lecture2.md"):
+                raise RuntimeError("cannot split")
+            return original_split_file(filepath)
+        
+        monkeypatch.setattr(processor.content_splitter, 'split_file', failing_split_file)
+        result = processor.process_directory(self.input_dir, self.output_dir)
+        
+        assert result.successful_files == 5 and result.failed_files == 1
+        assert result.errors[0]['file'].endswith("lecture2.md")
+        assert "cannot split" in result.errors[0]['error']
@@ -211,18 +211,19 @@ class TestQuartoExecutor:
             QuartoExecutor()
     
     @patch('subprocess.run')
-    def test_successful_command_execution(self, mock_run):
+    @patch('src.markdown_slides_generator.core.quarto_orchestrator.run_measured')
+    def test_successful_command_execution(self, mock_measured, mock_run):
         """Test successful Quarto command execution."""
         # Mock version check
         mock_run.return_value = Mock(returncode=0, stdout="1.4.0\n", stderr="")
         executor = QuartoExecutor()
         
         # Mock successful render command
-        mock_run.return_value = Mock(
+        mock_measured.return_value = (Mock(
             returncode=0,
             stdout="Output created: test.html\n",
             stderr=""
-        )
+        ), None)
         
         command = QuartoCommand(
             input_file=str(self.test_file),
@@ -238,18 +239,19 @@ class TestQuartoExecutor:
         assert "Output created: test.html" in result.stdout
     
     @patch('subprocess.run')
-    def test_failed_command_execution(self, mock_run):
+    @patch('src.markdown_slides_generator.core.quarto_orchestrator.run_measured')
+    def test_failed_command_execution(self, mock_measured, mock_run):
         """Test handling of failed Quarto command execution."""
         # Mock version check
         mock_run.return_value = Mock(returncode=0, stdout="1.4.0\n", stderr="")
         executor = QuartoExecutor()
         
         # Mock failed render command
-        mock_run.return_value = Mock(
+        mock_measured.return_value = (Mock(
             returncode=1,
             stdout="",
             stderr="ERROR: File not found\n"
-        )
+        ), None)
         
         command = QuartoCommand(
             input_file="nonexistent.qmd",
@@ -265,14 +267,15 @@ class TestQuartoExecutor:
         assert "ERROR: File not found" in result.stderr
     
     @patch('subprocess.run')
-    def test_command_timeout(self, mock_run):
+    @patch('src.markdown_slides_generator.core.quarto_orchestrator.run_measured')
+    def test_command_timeout(self, mock_measured, mock_run):
         """Test handling of command timeout."""
         # Mock version check
         mock_run.return_value = Mock(returncode=0, stdout="1.4.0\n", stderr="")
         executor = QuartoExecutor()
         
         # Mock timeout
-        mock_run.side_effect = subprocess.TimeoutExpired(['quarto'], 1)
+        mock_measured.side_effect = subprocess.TimeoutExpired(['quarto'], 1)
         
         command = QuartoCommand(
             input_file=str(self.test_file),
@@ -0,0 +1,208 @@
+"""
+Tests for the skip-unchanged render cache.
+
+Renders run through the stand-in quarto from tests/fixtures/bin, whose log
+shows which renders actually started a Quarto process.
+"""
+
+import json
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from markdown_slides_generator.cli import cli
+from markdown_slides_generator.core.quarto_orchestrator import QuartoOrchestrator
+from markdown_slides_generator.core.render_cache import RenderCache, RENDER_MANIFEST_NAME, referenced_files
+
+
+def _rendered(log_file):
+    """(input, format) of every render in the fake quarto log."""
+    if not log_file.exists():
+        return []
+    return [tuple(line.split()[:2]) for line in log_file.read_text().splitlines()]
+
+
+class TestRenderCache:
+    """Test RenderCache through QuartoOrchestrator."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_quarto, tmp_path):
+        self.log_file = fake_quarto
+        self.tmp_path = tmp_path
+        (tmp_path / "theme.scss").write_text("/*-- scss:defaults --*/\n$body-bg: #fff;\n")
+        (tmp_path / "figure.png").write_bytes(b"\x89PNG v1")
+        self.slides_file = tmp_path / "lecture_slides.qmd"
+        self.slides_file.write_text(
+            "---\nformat:\n  revealjs:\n    theme: [default, theme.scss]\n---\n\n"
+            "# Slides\n\n![A figure](figure.png)\n"
+        )
+        self.orchestrator = QuartoOrchestrator()
+        self.orchestrator.use_render_cache(RenderCache())
+    
+    def _render(self, *formats):
+        jobs = [self.orchestrator.prepare_slides(str(self.slides_file), fmt) for fmt in formats]
+        return self.orchestrator.render_jobs(jobs)
+    
+    def test_unchanged_inputs_skip_quarto(self):
+        """Test that a second identical render reuses the output."""
+        first = self._render("revealjs")[0]
+        second = self._render("revealjs")[0]
+        
+        assert first.success and not first.cached
+        assert second.success and second.cached
+        assert second.output_file == first.output_file
+        assert _rendered(self.log_file) == [("lecture_slides.qmd", "revealjs")]
+        assert self.orchestrator.get_execution_summary()["cached"] == 1
+        manifest = json.loads((self.tmp_path / RENDER_MANIFEST_NAME).read_text())
+        assert list(manifest["outputs"]) == ["lecture_slides.html"]
+    
+    def test_rewriting_same_content_is_unchanged(self):
+        """Test that regenerated inputs with the same content count as unchanged."""
+        self._render("revealjs")
+        content = self.slides_file.read_text()
+        self.slides_file.unlink()
+        self.slides_file.write_text(content)
+        
+        assert self._render("revealjs")[0].cached
+    
+    @pytest.mark.parametrize("changed_file, content", [
+        ("lecture_slides.qmd", "# Edited slides\n"),
+        ("theme.scss", "$body-bg: #000;\n"),
+        ("figure.png", "\x89PNG v2"),
+    ])
+    def test_changed_input_rerenders(self, changed_file, content):
+        """Test that the document, its theme and its images are all inputs."""
+        self._render("revealjs")
+        (self.tmp_path / changed_file).write_text(content)
+        
+        result = self._render("revealjs")[0]
+        
+        assert result.success and not result.cached
+        assert len(_rendered(self.log_file)) == 2
+    
+    def test_modified_or_missing_output_rerenders(self):
+        """Test that an output touched after the render is not trusted."""
+        output_file = Path(self._render("revealjs")[0].output_file)
+        
+        output_file.write_text("edited by hand")
+        assert not self._render("revealjs")[0].cached
+        
+        output_file.unlink()
+        assert not self._render("revealjs")[0].cached
+        assert output_file.exists()
+        assert len(_rendered(self.log_file)) == 3
+    
+    def test_formats_cached_separately(self):
+        """Test that outputs of a shared input are cached even when rendered from copies."""
+        self._render("revealjs", "beamer")
+        
+        results = self._render("revealjs", "beamer", "pptx")
+        
+        assert [result.cached for result in results] == [True, True, False]
+        assert sorted(fmt for _, fmt in _rendered(self.log_file)) == ["beamer", "pptx", "revealjs"]
+    
+    def test_failed_render_not_cached(self, monkeypatch):
+        """Test that only successful renders are recorded."""
+        monkeypatch.setenv("FAKE_QUARTO_FAIL", "revealjs")
+        assert not self._render("revealjs")[0].success
+        monkeypatch.delenv("FAKE_QUARTO_FAIL")
+        
+        assert not self._render("revealjs")[0].cached
+        assert self._render("revealjs")[0].cached
+    
+    @pytest.mark.asyncio
+    async def test_async_renders_use_cache(self):
+        """Test that renders on the event loop share the manifest."""
+        self._render("pptx")
+        job = self.orchestrator.prepare_slides(str(self.slides_file), "pptx")
+        
+        results = await self.orchestrator.render_jobs_async([job])
+        
+        assert results[0].cached
+        assert len(_rendered(self.log_file)) == 1
+
+
+class TestReferencedFiles:
+    """Test discovery of the local files a document depends on."""
+    
+    def test_frontmatter_links_and_includes(self, tmp_path):
+        """Test that existing frontmatter files and every body reference count."""
+        for name in ("custom.scss", "refs.bib", "plot.svg", "part.qmd"):
+            (tmp_path / name).write_text(name)
+        text = (
+            "---\ntitle: custom.scss talk\ntheme: [white, custom.scss]\nbibliography: refs.bib\n---\n\n"
+            "![Plot](plot.svg){width=50%} [site](https://example.org) [top](#intro)\n"
+            "<img src=\"missing.png\">\n\n{{< include part.qmd >}}\n"
+        )
+        
+        references = referenced_files(text, tmp_path)
+        
+        assert references == {
+            "custom.scss": tmp_path / "custom.scss",
+            "refs.bib": tmp_path / "refs.bib",
+            "plot.svg": tmp_path / "plot.svg",
+            "missing.png": None,
+            "part.qmd": tmp_path / "part.qmd",
+        }
+
+
+class TestGenerateSkipsUnchangedRenders:
+    """Test the generate command end to end with the fake quarto."""
+    
+    def _generate(self, input_file, output_dir, *extra):
+        return CliRunner().invoke(cli, [
+            "generate", str(input_file), "-o", str(output_dir), "-f", "html", "-t", "white", "--overwrite", *extra
+        ])
+    
+    def test_notes_edit_renders_only_notes(self, fake_quarto, tmp_path):
+        """Test that editing notes-only content does not re-render the slides."""
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("# Lecture\n\nBody\n\n<!-- NOTES-ONLY -->\nDetails\n")
+        output_dir = tmp_path / "out"
+        
+        first = self._generate(input_file, output_dir)
+        input_file.write_text("# Lecture\n\nBody\n\n<!-- NOTES-ONLY -->\nMore details\n")
+        second = self._generate(input_file, output_dir)
+        
+        assert first.exit_code == 0, first.output
+        assert second.exit_code == 0, second.output
+        assert "✓ Generated slides (html): lecture_slides.html" in second.output
+        assert sorted(fmt for _, fmt in _rendered(fake_quarto)) == ["pdf", "pdf", "revealjs"]
+        assert os.listdir(output_dir).count(RENDER_MANIFEST_NAME) == 1
+    
+    def test_themed_renders_hit_across_processes(self, fake_quarto, tmp_path):
+        """Test that a themed render is reused by another process with another hash seed."""
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("# Lecture\n\nBody\n")
+        output_dir = tmp_path / "out"
+        args = ["generate", str(input_file), "-o", str(output_dir), "-f", "html",
+                "--theme", "academic-modern", "--slides-only", "--overwrite"]
+        
+        for seed in ("1", "3"):
+            env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=os.pathsep.join(sys.path))
+            result = subprocess.run(
+                [sys.executable, "-c", "from markdown_slides_generator.cli import cli; cli()"] + args,
+                env=env, capture_output=True, text=True, cwd=tmp_path
+            )
+            assert result.returncode == 0, result.stderr
+            # Forget the build graph's state so the render step runs and asks the render cache
+            (output_dir / ".lecture.build.json").unlink()
+        
+        assert (output_dir / "academic-modern.scss").exists()
+        assert _rendered(fake_quarto) == [("lecture_slides.qmd", "revealjs")]
+    
+    def test_no_render_cache_flag(self, fake_quarto, tmp_path):
+        """Test that --no-render-cache always runs Quarto."""
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("# Lecture\n\nBody\n")
+        output_dir = tmp_path / "out"
+        
+        for _ in range(2):
+            result = self._generate(input_file, output_dir, "--slides-only", "--no-render-cache")
+            assert result.exit_code == 0, result.output
+        
+        assert len(_rendered(fake_quarto)) == 2
@@ -0,0 +1,153 @@
+"""
+Tests for the cross-run render history and the ETA model fitted on it.
+"""
+
+import json
+from datetime import timedelta
+
+import pytest
+
+from markdown_slides_generator.batch import BatchProcessor, FileScanner
+from markdown_slides_generator.batch.progress_reporter import ProgressReporter
+from markdown_slides_generator.batch.render_history import (
+    RenderHistory, EtaModel, DocumentFeatures, document_features, default_history_file
+)
+from markdown_slides_generator.config import Config
+
+
+class TestRenderHistory:
+    """Test the history store and the model."""
+    
+    def test_document_features(self, tmp_path):
+        """Test counting math and images."""
+        source = tmp_path / "lecture.md"
+        source.write_text("# T\n\n$x$ and $$\\int f$$\n\n![a](a.png) ![b](b.png)\n\\(y\\)\n")
+        
+        features = document_features(source)
+        
+        assert features.size == source.stat().st_size
+        assert features.math == 3
+        assert features.images == 2
+    
+    def test_records_persist_across_instances(self, tmp_path):
+        """Test that records written by one run are read by the next, skipping corrupt lines."""
+        history_file = tmp_path / "history.jsonl"
+        RenderHistory(history_file).record(tmp_path / "a.md", DocumentFeatures(100), 0.5, {'slides:html': 2.0})
+        with open(history_file, 'a') as history:
+            history.write("not json\n")
+        RenderHistory(history_file).record(tmp_path / "b.md", DocumentFeatures(200), None, {})
+        
+        records = RenderHistory(history_file).records()
+        
+        assert len(records) == 1
+        assert records[0]['renders'] == {'slides:html': 2.0}
+    
+    def test_history_is_compacted(self, tmp_path):
+        """Test that the file is cut back to max_records when it doubles."""
+        history = RenderHistory(tmp_path / "history.jsonl", max_records=3)
+        for index in range(7):
+            history.record(tmp_path / f"{index}.md", DocumentFeatures(index), 0.1, {})
+        
+        lines = (tmp_path / "history.jsonl").read_text().splitlines()
+        assert [json.loads(line)['size'] for line in lines] == [4, 5, 6]
+    
+    def test_model_fits_size_and_math(self, tmp_path):
+        """Test that unseen files are predicted from size and math counts."""
+        records = [
+            {'source': str(tmp_path / f"{size}-{math}.md"), 'size': size * 1024, 'math': math, 'images': 0,
+             'split': 0.1, 'renders': {'slides:pdf': 1.0 + 0.5 * size + 0.2 * math}}
+            for size in (1, 2, 4, 8) for math in (0, 10, 20)
+        ]
+        model = EtaModel(records)
+        
+        predicted = model.predict(tmp_path / "new.md", DocumentFeatures(6 * 1024, 5), 'slides:pdf')
+        
+        assert predicted == pytest.approx(1.0 + 3.0 + 1.0, rel=0.01)
+        assert model.predict(tmp_path / "new.md", DocumentFeatures(1024), 'slides:docx') is None
+    
+    def test_model_prefers_same_file(self, tmp_path):
+        """Test that an unchanged file is expected to take its last measured time."""
+        source = tmp_path / "lecture.md"
+        source.write_text("# Lecture\n")
+        size = source.stat().st_size
+        records = [
+            {'source': str(source.resolve()), 'size': size, 'split': 0.2, 'renders': {'slides:html': 3.0}},
+            {'source': str(tmp_path / "other.md"), 'size': size, 'split': 0.2, 'renders': {'slides:html': 1.0}},
+            {'source': str(source.resolve()), 'size': size, 'split': None, 'renders': {'slides:html': 4.0}},
+        ]
+        
+        estimate = EtaModel(records).estimate_file(source, ['slides:html'])
+        
+        assert estimate.split == 0.2
+        assert estimate.renders == {'slides:html': 4.0}
+        assert estimate.wall_time == pytest.approx(4.2)
+
+
+class TestEstimates:
+    """Test estimates and progress ETAs based on the history."""
+    
+    def test_scanner_uses_predictions(self, tmp_path):
+        """Test that predicted files replace the flat per-file time."""
+        files = [tmp_path / "a.md", tmp_path / "b.md"]
+        for file_path in files:
+            file_path.write_text("# A\n")
+        
+        estimate = FileScanner().estimate_processing_time(files, predict={files[0]: 20.0}.get)
+        
+        assert estimate['estimated_time_seconds'] == 25.0
+        assert estimate['files_from_history'] == 1
+    
+    def test_progress_eta_is_calibrated(self):
+        """Test that the ETA scales remaining predictions by how finished files compared."""
+        reporter = ProgressReporter(3, expected_times={'a': 10.0, 'b': 10.0, 'c': 30.0}, parallelism=2)
+        reporter.start()
+        
+        assert reporter.estimated_remaining_time == timedelta(seconds=25)
+        reporter.report_file_success('a', 20.0)
+        assert reporter.estimated_remaining_time == timedelta(seconds=40)
+        reporter.report_file_skipped('c', "exists")
+        assert reporter.estimated_remaining_time == timedelta(seconds=10)
+        reporter.stop()
+    
+    def test_batch_records_history_and_schedules_longest_first(self, fake_quarto, tmp_path, monkeypatch):
+        """Test that a batch run records render times the next run's estimate and order use."""
+        input_dir = tmp_path / "lectures"
+        input_dir.mkdir()
+        (input_dir / "short.md").write_text("# Short\n\nBody\n")
+        (input_dir / "long.md").write_text("# Long\n\nBody\n")
+        config = Config()
+        config.output.formats = ["html"]
+        config.output.overwrite = True
+        config.output.render_cache = False
+        config.batch.max_workers = 2
+        
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "0.05")
+        monkeypatch.setenv("FAKE_QUARTO_DELAY_HTML", "0.05")
+        BatchProcessor(config).process_directory(input_dir, tmp_path / "out")
+        records = RenderHistory().records()
+        assert default_history_file().exists()
+        assert {r['source'] for r in records} == {str(p.resolve()) for p in input_dir.iterdir()}
+        assert all(set(r['renders']) == {'slides:html', 'notes:pdf'} for r in records)
+        
+        for record in records:
+            if record['source'].endswith("long.md"):
+                record['renders']['notes:pdf'] = 60.0
+        default_history_file().write_text(''.join(json.dumps(r) + '\n' for r in records))
+        
+        processor = BatchProcessor(config)
+        estimate = processor.get_processing_estimate(input_dir)
+        assert estimate['files_from_history'] == 2
+        assert estimate['longest_files'][0][0].endswith("long.md")
+        assert estimate['estimated_time_seconds'] > 60.0
+        assert estimate['parallel_time_seconds'] == pytest.approx(estimate['longest_files'][0][1])
+        
+        scheduled = []
+        process_files = processor._process_files
+        
+        def spy(files, *args):
+            scheduled.extend(files)
+            return process_files(files, *args)
+        
+        monkeypatch.setattr(processor, '_process_files', spy)
+        processor.process_directory(input_dir, tmp_path / "out")
+        assert [f.name for f in scheduled] == ["long.md", "short.md"]
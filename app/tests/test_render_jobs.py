@@ -0,0 +1,219 @@
+"""
+Tests for concurrent rendering of several output formats.
+
+Uses the stand-in quarto script from tests/fixtures/bin, so the renders run
+real subprocesses without the Quarto toolchain being installed.
+"""
+
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from markdown_slides_generator.cli import cli
+from markdown_slides_generator.core.quarto_orchestrator import QuartoOrchestrator
+from markdown_slides_generator.utils.exceptions import OutputError
+
+
+def _renders(log_file):
+    """Parse the fake quarto log into (input, format, start, end) tuples."""
+    if not log_file.exists():
+        return []
+    renders = []
+    for line in log_file.read_text().splitlines():
+        name, fmt, start, end = line.split()
+        renders.append((name, fmt, float(start), float(end)))
+    return renders
+
+
+class TestRenderJobs:
+    """Test QuartoOrchestrator.render_jobs against the fake quarto."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_quarto, tmp_path):
+        self.log_file = fake_quarto
+        self.slides_file = tmp_path / "lecture_slides.qmd"
+        self.slides_file.write_text("# Slides\n")
+        self.notes_file = tmp_path / "lecture_notes.qmd"
+        self.notes_file.write_text("# Notes\n")
+        self.orchestrator = QuartoOrchestrator()
+    
+    def _jobs(self):
+        return [
+            self.orchestrator.prepare_slides(str(self.slides_file), "revealjs"),
+            self.orchestrator.prepare_slides(str(self.slides_file), "beamer"),
+            self.orchestrator.prepare_notes(str(self.notes_file), "pdf"),
+        ]
+    
+    def test_jobs_run_concurrently(self, monkeypatch):
+        """Test that wall-clock time approaches the slowest job, not the sum."""
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "0.6")
+        
+        start = time.time()
+        results = self.orchestrator.render_jobs(self._jobs())
+        elapsed = time.time() - start
+        
+        assert [result.success for result in results] == [True, True, True]
+        assert elapsed < 1.5
+        renders = _renders(self.log_file)
+        assert max(start for _, _, start, _ in renders) < min(end for _, _, _, end in renders)
+    
+    def test_max_workers_bounds_concurrency(self, monkeypatch):
+        """Test that a single worker renders the jobs one after another."""
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "0.2")
+        
+        self.orchestrator.render_jobs(self._jobs(), max_workers=1)
+        
+        renders = sorted(_renders(self.log_file), key=lambda render: render[2])
+        assert len(renders) == 3
+        for previous, following in zip(renders, renders[1:]):
+            assert previous[3] <= following[2]
+    
+    def test_one_result_per_job_in_order(self, monkeypatch):
+        """Test that a failing format does not affect the others."""
+        monkeypatch.setenv("FAKE_QUARTO_FAIL", "beamer")
+        jobs = self._jobs()
+        
+        results = self.orchestrator.render_jobs(jobs)
+        
+        assert [result.success for result in results] == [True, False, True]
+        assert Path(results[0].output_file).name == "lecture_slides.html"
+        assert Path(results[2].output_file).name == "lecture_notes.pdf"
+        with pytest.raises(OutputError, match="Failed to generate beamer slides"):
+            self.orchestrator.require_output(jobs[1], results[1])
+        assert set(self.orchestrator.last_results) == {"slides_revealjs", "slides_beamer", "notes_pdf"}
+        assert self.orchestrator.get_execution_summary()["failed"] == 1
+    
+    def test_shared_input_renders_from_private_copies(self):
+        """Test that formats of the same input do not share Quarto's working files."""
+        results = self.orchestrator.render_jobs(self._jobs())
+        
+        inputs = [name for name, fmt, _, _ in _renders(self.log_file) if fmt != "pdf"]
+        assert len(set(inputs)) == 2
+        assert "lecture_slides.qmd" in inputs
+        assert Path(results[1].output_file).name == "lecture_slides.pdf"
+        assert Path(results[1].output_file).read_text().startswith("<!-- beamer -->")
+        assert sorted(p.name for p in self.slides_file.parent.glob("*.qmd")) == [
+            "lecture_notes.qmd", "lecture_slides.qmd"
+        ]
+    
+    def test_cleanup_files_removed_after_all_jobs(self):
+        """Test that temporary inputs listed by jobs outlive every render using them."""
+        temp_file = self.slides_file.with_name("temp_lecture_slides.qmd")
+        temp_file.write_text("# Templated\n")
+        jobs = [self.orchestrator.prepare_slides(str(temp_file), fmt) for fmt in ("revealjs", "pptx")]
+        for job in jobs:
+            job.cleanup.append(str(temp_file))
+        
+        results = self.orchestrator.render_jobs(jobs)
+        
+        assert all(result.success for result in results)
+        assert not temp_file.exists()
+    
+    def test_generate_slides_still_returns_output(self):
+        """Test that the single-format API goes through the same path."""
+        output_file = self.orchestrator.generate_slides(str(self.slides_file), "pptx")
+        
+        assert Path(output_file).name == "lecture_slides.pptx"
+        assert self.orchestrator.get_last_result("slides_pptx").success
+
+
+class TestGenerateCommandRendersConcurrently:
+    """Test the generate command end to end with the fake quarto."""
+    
+    def test_all_formats_rendered(self, fake_quarto, tmp_path, monkeypatch):
+        """Test that every format is reported and rendered in parallel."""
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "0.5")
+        input_file = tmp_path / "lecture.md"
+        input_file.write_text("# Lecture\n\nBody\n\n<!-- NOTES-ONLY -->\nDetails\n")
+        output_dir = tmp_path / "out"
+        
+        result = CliRunner().invoke(cli, [
+            "generate", str(input_file), "-o", str(output_dir),
+            "-f", "html", "-f", "beamer", "-t", "white"
+        ])
+        
+        assert result.exit_code == 0, result.output
+        assert "✓ Generated slides (html): lecture_slides.html" in result.output
+        assert "✓ Generated slides (beamer): lecture_slides.pdf" in result.output
+        assert "✓ Generated notes: lecture_notes.pdf" in result.output
+        renders = _renders(fake_quarto)
+        assert len(renders) == 3
+        assert max(start for _, _, start, _ in renders) < min(end for _, _, _, end in renders)
+
+
+class TestAsyncQuartoExecutor:
+    """Test streaming execution on the event loop."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_quarto, tmp_path):
+        self.log_file = fake_quarto
+        self.slides_file = tmp_path / "lecture_slides.qmd"
+        self.slides_file.write_text("# Slides\n")
+        self.orchestrator = QuartoOrchestrator()
+        self.command = self.orchestrator.prepare_slides(str(self.slides_file), "revealjs").command
+    
+    @pytest.mark.asyncio
+    async def test_lines_reported_while_rendering(self, monkeypatch):
+        """Test that output lines are classified and reported as they arrive."""
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "0.6")
+        monkeypatch.setenv("FAKE_QUARTO_STEPS", "3")
+        monkeypatch.setenv("FAKE_QUARTO_WARN", "missing alt text")
+        lines = []
+        
+        result = await self.orchestrator.async_executor.execute_command_async(
+            self.command, on_line=lambda line, kind: lines.append((time.time(), line, kind))
+        )
+        
+        assert result.success
+        assert Path(result.output_file).name == "lecture_slides.html"
+        assert result.warnings == ["WARNING: missing alt text"]
+        assert ("WARNING: missing alt text", "warning") in [(line, kind) for _, line, kind in lines]
+        progress = [seen for seen, line, kind in lines if line.startswith("[1/3]")]
+        finished = _renders(self.log_file)[0][3]
+        assert progress and progress[0] < finished - 0.2
+    
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_quarto(self, monkeypatch):
+        """Test that cancelling the task stops the render."""
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "5")
+        task = asyncio.ensure_future(self.orchestrator.async_executor.execute_command_async(self.command))
+        await asyncio.sleep(0.3)
+        
+        start = time.time()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        
+        assert time.time() - start < 2
+        assert _renders(self.log_file) == []
+        assert not self.slides_file.with_suffix(".html").exists()
+    
+    @pytest.mark.asyncio
+    async def test_timeout(self, monkeypatch):
+        """Test that a render over its timeout yields a failed result."""
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "5")
+        
+        result = await self.orchestrator.async_executor.execute_command_async(self.command, timeout=0.3)
+        
+        assert not result.success
+        assert "timed out" in result.errors[0]
+    
+    @pytest.mark.asyncio
+    async def test_render_jobs_async(self, monkeypatch):
+        """Test concurrent renders on the loop with per-job line callbacks."""
+        monkeypatch.setenv("FAKE_QUARTO_DELAY", "0.5")
+        jobs = [self.orchestrator.prepare_slides(str(self.slides_file), fmt) for fmt in ("revealjs", "pptx", "beamer")]
+        seen = set()
+        
+        start = time.time()
+        results = await self.orchestrator.render_jobs_async(
+            jobs, on_line=lambda job, line, kind: seen.add(job.name)
+        )
+        
+        assert [result.success for result in results] == [True, True, True]
+        assert time.time() - start < 1.4
+        assert seen == {"slides_revealjs", "slides_pptx", "slides_beamer"}
+        assert sorted(p.name for p in self.slides_file.parent.glob("*.qmd")) == ["lecture_slides.qmd"]
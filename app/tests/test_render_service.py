@@ -0,0 +1,108 @@
+"""
+Tests for the warm Quarto render worker used in watch mode.
+
+The stand-in quarto from tests/fixtures/bin implements `quarto preview` by
+watching the document and rendering it again whenever it is written.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from markdown_slides_generator.core.quarto_orchestrator import QuartoOrchestrator
+from markdown_slides_generator.core.render_service import QuartoRenderService, RenderServiceError
+
+
+def _render_formats(log_file):
+    """Formats of the renders in the fake quarto log, in order."""
+    if not log_file.exists():
+        return []
+    return [line.split()[1] for line in log_file.read_text().splitlines()]
+
+
+class TestQuartoRenderService:
+    """Test the render worker against the fake quarto preview server."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_quarto, tmp_path, monkeypatch):
+        monkeypatch.setenv("FAKE_QUARTO_STARTUP", "0.8")
+        self.log_file = fake_quarto
+        self.slides_file = tmp_path / "lecture_slides.qmd"
+        self.slides_file.write_text("# Version 1\n")
+        self.orchestrator = QuartoOrchestrator()
+        self.service = QuartoRenderService(str(self.slides_file))
+        yield
+        self.service.stop()
+    
+    def test_rerender_skips_startup(self):
+        """Test that later renders go to the running worker."""
+        first = self.service.render()
+        self.slides_file.write_text("# Version 2\n")
+        
+        start = time.time()
+        second = self.service.render()
+        elapsed = time.time() - start
+        
+        assert first.success and second.success
+        assert first.execution_time >= 0.8
+        assert elapsed < 0.5
+        assert "# Version 2" in Path(second.output_file).read_text()
+        assert _render_formats(self.log_file) == ["revealjs@preview", "revealjs@preview"]
+        assert self.service.alive and self.service.renders == 2
+        
+        # Nothing was written, so Quarto does not render and the last result stands
+        third = self.service.render()
+        assert third.success and third.output_file == second.output_file
+        assert len(_render_formats(self.log_file)) == 2
+        
+        self.service.stop()
+        assert not self.service.alive
+    
+    def test_executor_falls_back_when_worker_dies(self, monkeypatch):
+        """Test that a dead worker is replaced by one-shot renders."""
+        monkeypatch.setenv("FAKE_QUARTO_PREVIEW_RENDERS", "1")
+        self.orchestrator.use_render_service(self.service)
+        
+        first = self.orchestrator.generate_slides(str(self.slides_file), "revealjs")
+        time.sleep(0.2)
+        second = self.orchestrator.generate_slides(str(self.slides_file), "revealjs")
+        
+        assert first == second
+        assert self.service.failed
+        assert _render_formats(self.log_file) == ["revealjs@preview", "revealjs"]
+        with pytest.raises(RenderServiceError):
+            self.service.render()
+    
+    def test_other_formats_use_quarto_render(self):
+        """Test that only the worker's own document and format go to it."""
+        self.orchestrator.use_render_service(self.service)
+        
+        results = self.orchestrator.render_jobs([
+            self.orchestrator.prepare_slides(str(self.slides_file), "revealjs"),
+            self.orchestrator.prepare_slides(str(self.slides_file), "pptx"),
+        ])
+        
+        assert all(result.success for result in results)
+        assert sorted(_render_formats(self.log_file)) == ["pptx", "revealjs@preview"]
+    
+    def test_render_errors_keep_worker(self, monkeypatch):
+        """Test that a broken document fails the render but not the worker."""
+        monkeypatch.setenv("FAKE_QUARTO_FAIL", "revealjs")
+        
+        result = self.service.render()
+        
+        assert not result.success
+        assert result.errors and "broke" in result.errors[0]
+        assert self.service.alive and not self.service.failed
+    
+    @pytest.mark.asyncio
+    async def test_async_executor_uses_worker(self):
+        """Test that renders on the event loop go to the worker as well."""
+        self.orchestrator.use_render_service(self.service)
+        job = self.orchestrator.prepare_slides(str(self.slides_file), "revealjs")
+        
+        results = await self.orchestrator.render_jobs_async([job])
+        
+        assert results[0].success
+        assert _render_formats(self.log_file) == ["revealjs@preview"]
@@ -0,0 +1,131 @@
+"""
+Tests for per-render resource accounting.
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from markdown_slides_generator.batch import BatchProcessor
+from markdown_slides_generator.config import Config
+from markdown_slides_generator.core.quarto_orchestrator import QuartoOrchestrator
+from markdown_slides_generator.core.resource_usage import (
+    ResourceUsage, ChildUsageMeter, run_measured, summarize_usage, output_size
+)
+
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="rusage is POSIX only")
+
+
+class TestRunMeasured:
+    """Test measuring a single child process."""
+    
+    def test_reports_cpu_and_peak_memory(self):
+        """Test that the usage is that of the child, not of the test process."""
+        script = "data = bytearray(64 * 1024 * 1024)\nsum(range(2000000))\nprint('done')"
+        
+        completed, usage = run_measured([sys.executable, "-c", script], text=True)
+        
+        assert completed.returncode == 0 and completed.stdout == "done\n"
+        assert usage.peak_rss_bytes > 64 * 1024 * 1024
+        assert usage.user_cpu > 0
+        assert usage.cpu_time == usage.user_cpu + usage.system_cpu
+    
+    def test_timeout_kills_child(self):
+        """Test that a timeout behaves like subprocess.run."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            run_measured([sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.2)
+    
+    def test_meter_attributes_only_lone_children(self):
+        """Test that overlapping children get no RUSAGE_CHILDREN share."""
+        meter = ChildUsageMeter()
+        
+        with meter.track() as first:
+            with meter.track() as second:
+                pass
+        with meter.track() as alone:
+            run_measured([sys.executable, "-c", "pass"])
+        
+        assert first.usage is None and second.usage is None
+        assert alone.usage is not None and alone.usage.cpu_time >= 0
+
+
+class TestSummaries:
+    """Test aggregation of render usage."""
+    
+    def test_summarize_usage(self, tmp_path):
+        """Test that CPU and output sizes add up and memory is the largest peak."""
+        (tmp_path / "a.html").write_text("x" * 10)
+        (tmp_path / "a_files").mkdir()
+        (tmp_path / "a_files" / "reveal.js").write_text("y" * 5)
+        
+        summary = summarize_usage([
+            ResourceUsage(100, 1.0, 0.5).with_output(str(tmp_path / "a.html")),
+            ResourceUsage(300, 2.0, 0.25, 7),
+            ResourceUsage(output_size=3),
+            None
+        ])
+        
+        assert output_size(str(tmp_path / "a.html")) == 15
+        assert summary == {
+            'measured': 2,
+            'user_cpu': 3.0,
+            'system_cpu': 0.75,
+            'cpu_time': 3.75,
+            'peak_rss_bytes': 300,
+            'output_bytes': 25
+        }
+
+
+class TestRenderResources:
+    """Test resource accounting of renders with the fake quarto."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_quarto, tmp_path):
+        self.slides_file = tmp_path / "lecture_slides.qmd"
+        self.slides_file.write_text("# Slides\n")
+        self.orchestrator = QuartoOrchestrator()
+    
+    def test_concurrent_renders_measured_separately(self):
+        """Test that every render of a concurrent batch gets its own usage."""
+        jobs = [self.orchestrator.prepare_slides(str(self.slides_file), fmt) for fmt in ("revealjs", "beamer")]
+        
+        results = self.orchestrator.render_jobs(jobs)
+        
+        for result in results:
+            assert result.resources.cpu_time > 0
+            assert result.resources.peak_rss_bytes > 0
+            assert result.resources.output_size == Path(result.output_file).stat().st_size
+        summary = self.orchestrator.get_execution_summary()
+        assert summary['resources']['measured'] == 2
+        assert summary['results']['slides_revealjs']['resources']['cpu_time'] > 0
+    
+    @pytest.mark.asyncio
+    async def test_async_render_measured(self):
+        """Test that a lone render on the event loop is measured."""
+        job = self.orchestrator.prepare_slides(str(self.slides_file), "revealjs")
+        
+        result = (await self.orchestrator.render_jobs_async([job]))[0]
+        
+        assert result.success
+        assert result.resources.cpu_time > 0
+        assert result.resources.output_size > 0
+    
+    def test_batch_result_aggregates(self, tmp_path):
+        """Test that BatchResult sums the usage of every render of every file."""
+        input_dir = tmp_path / "lectures"
+        input_dir.mkdir()
+        for name in ("one", "two"):
+            (input_dir / f"{name}.md").write_text(f"# Lecture {name}\n\nBody\n")
+        config = Config()
+        config.output.formats = ["html"]
+        config.output.render_cache = False
+        
+        result = BatchProcessor(config).process_directory(input_dir, tmp_path / "out")
+        
+        assert result.resource_usage['measured'] == 4
+        assert result.resource_usage['cpu_time'] > 0
+        assert result.resource_usage['output_bytes'] > 0
+        assert all(len(r.render_resources) == 2 for r in result.file_results)
@@ -0,0 +1,103 @@
+"""
+Tests for repeated directory scans with the scan index.
+"""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from markdown_slides_generator.batch import FileScanner
+
+
+class TestScanIndex:
+    """Test that rescans only list changed directories and report a delta."""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.root = tmp_path / "course"
+        for name in ("intro.md", "week1/lecture.md", "week1/lab.md", "week2/lecture.md"):
+            (self.root / name).parent.mkdir(parents=True, exist_ok=True)
+            (self.root / name).write_text(f"# {name}\n")
+        self.index_dir = tmp_path / "index"
+        self._age()
+    
+    def _age(self):
+        """Move every mtime a minute back, past the window in which listings are not trusted."""
+        past = time.time_ns() - 60_000_000_000
+        for path in [self.root, *self.root.rglob('*')]:
+            os.utime(path, ns=(past, past))
+    
+    def _scan(self):
+        """Scan the course recursively; returns the scanner and the directories it listed."""
+        scanner = FileScanner(use_index=True, index_dir=self.index_dir)
+        listed = []
+        original_scandir = os.scandir
+        
+        def recording_scandir(path):
+            listed.append(Path(path).relative_to(self.root).as_posix())
+            return original_scandir(path)
+        
+        with patch.object(os, 'scandir', recording_scandir):
+            files = scanner.scan_directory(self.root, pattern="*.md", recursive=True)
+        return scanner, [f.relative_to(self.root).as_posix() for f in files], listed
+    
+    def test_unchanged_tree_is_not_listed_again(self):
+        """Test that a second scan selects the same files without listing any directory."""
+        first, first_files, first_listed = self._scan()
+        second, second_files, second_listed = self._scan()
+        
+        assert first.last_delta is None
+        assert first_listed == [".", "week1", "week2"]
+        assert second_files == first_files == ["intro.md", "week1/lab.md", "week1/lecture.md", "week2/lecture.md"]
+        assert second_listed == []
+        assert second.get_scan_summary()['directories_reused'] == 3
+        assert not second.last_delta.changed
+    
+    def test_changes_are_reported(self):
+        """Test that added, removed and modified files make up the delta, and only changed directories are listed."""
+        self._scan()
+        (self.root / "week2" / "exercises.md").write_text("# Exercises\n")
+        (self.root / "week1" / "lab.md").unlink()
+        (self.root / "intro.md").write_text("# Introduction, revised\n")
+        
+        scanner, files, listed = self._scan()
+        
+        assert sorted(listed) == ["week1", "week2"]
+        assert files == ["intro.md", "week1/lecture.md", "week2/exercises.md", "week2/lecture.md"]
+        assert scanner.last_delta.added == [self.root / "week2" / "exercises.md"]
+        assert scanner.last_delta.removed == [self.root / "week1" / "lab.md"]
+        assert scanner.last_delta.modified == [self.root / "intro.md"]
+    
+    def test_recently_modified_directory_is_listed_again(self):
+        """Test that a listing taken right after its directory changed is not reused."""
+        (self.root / "week1" / "notes.md").write_text("# Notes\n")
+        self._scan()
+        _, files, listed = self._scan()
+        
+        assert listed == ["week1"]
+        assert "week1/notes.md" in files
+    
+    def test_early_stop_keeps_previous_index(self):
+        """Test that a scan cut short by max_files does not replace the index."""
+        FileScanner(use_index=True, index_dir=self.index_dir).scan_directory(
+            self.root, pattern="*.md", recursive=True, max_files=1
+        )
+        
+        assert not self.index_dir.exists() or not list(self.index_dir.iterdir())
+    
+    def test_other_criteria_keep_their_own_index(self):
+        """Test that scans with another pattern neither disturb nor borrow the delta of the first."""
+        (self.root / "week1" / "data.txt").write_text("1 2 3\n")
+        self._age()
+        self._scan()
+        
+        text = FileScanner(use_index=True, index_dir=self.index_dir)
+        text.scan_directory(self.root, pattern="*.txt", recursive=True)
+        markdown, files, _ = self._scan()
+        
+        assert text.last_delta is None
+        assert len(files) == 4
+        assert not markdown.last_delta.changed
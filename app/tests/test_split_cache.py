@@ -0,0 +1,191 @@
+"""
+Tests for the content-addressed split cache.
+
+Covers cache keys, hit/miss accounting, LRU eviction and restoring a
+cached split into ContentSplitter.
+"""
+
+import os
+import tempfile
+import shutil
+from pathlib import Path
+
+import pytest
+from markdown_slides_generator.core.content_splitter import ContentSplitter
+from markdown_slides_generator.core.split_cache import SplitCache, create_split_cache
+from markdown_slides_generator.config.config_manager import ProcessingConfig
+
+
+SAMPLE = """# Lecture
+
+Intro with $x^2$ and \\alpha.
+
+<!-- SLIDE -->
+## Slide
+
+Slide text.
+
+<!-- NOTES -->
+Notes text.
+
+<!-- ALL -->
+Closing.
+"""
+
+
+class TestSplitCache:
+    """Test the SplitCache storage layer."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache = SplitCache(self.temp_dir / "cache")
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_key_depends_on_source_version_and_bibliography(self):
+        """Test that every split input changes the key."""
+        bib_file = self.temp_dir / "refs.bib"
+        bib_file.write_text("@article{a, title={A}}")
+        
+        key = SplitCache.make_key(b"text", "1", [bib_file])
+        assert key == SplitCache.make_key(b"text", "1", [bib_file])
+        assert key != SplitCache.make_key(b"other", "1", [bib_file])
+        assert key != SplitCache.make_key(b"text", "2", [bib_file])
+        
+        bib_file.write_text("@article{b, title={B}}")
+        assert key != SplitCache.make_key(b"text", "1", [bib_file])
+    
+    def test_hit_and_miss_counters(self):
+        """Test counting of lookups."""
+        assert self.cache.get("abc") is None
+        self.cache.put("abc", {"slides": "s", "notes": "n"})
+        entry = self.cache.get("abc")
+        
+        assert entry["slides"] == "s"
+        stats = self.cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["stores"] == 1
+    
+    def test_evicts_least_recently_used(self):
+        """Test that eviction keeps the most recently used entries."""
+        cache = SplitCache(self.temp_dir / "lru", max_entries=2)
+        cache.put("first", {"slides": "1"})
+        cache.put("second", {"slides": "2"})
+        os.utime(cache.cache_dir / "first.json", (1, 1))
+        os.utime(cache.cache_dir / "second.json", (2, 2))
+        
+        cache.get("first")  # refresh
+        cache.put("third", {"slides": "3"})
+        
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+        assert cache.get_stats()["evictions"] == 1
+    
+    def test_evicts_by_total_size(self):
+        """Test that the byte bound is enforced."""
+        cache = SplitCache(self.temp_dir / "size", max_bytes=1500)
+        for index in range(5):
+            cache.put(f"key{index}", {"slides": "x" * 500})
+        
+        total = sum(path.stat().st_size for path in cache.cache_dir.glob("*.json"))
+        assert total <= 1500
+    
+    def test_stores_list_the_directory_only_when_needed(self, monkeypatch):
+        """Test that the cache is listed on the first store and when a store takes it over a bound."""
+        cache = SplitCache(self.temp_dir / "listed", max_entries=5)
+        listings = []
+        original_list_entries = cache._list_entries
+        monkeypatch.setattr(cache, '_list_entries', lambda: listings.append(1) or original_list_entries())
+        
+        for index in range(5):
+            cache.put(f"key{index}", {"slides": "x"})
+        cache.put("key0", {"slides": "replaced"})
+        assert len(listings) == 1
+        
+        cache.put("key5", {"slides": "x"})
+        assert len(listings) == 2
+        assert len(list(cache.cache_dir.glob("*.json"))) == 5
+        assert cache.get_stats()["evictions"] == 1
+    
+    def test_corrupt_entry_is_a_miss(self):
+        """Test that unreadable entries are discarded."""
+        self.cache.put("bad", {"slides": "s"})
+        (self.cache.cache_dir / "bad.json").write_text("{not json")
+        
+        assert self.cache.get("bad") is None
+        assert not (self.cache.cache_dir / "bad.json").exists()
+    
+    def test_create_from_config(self):
+        """Test building the cache from processing configuration."""
+        assert create_split_cache(ProcessingConfig(split_cache=False)) is None
+        
+        cache = create_split_cache(ProcessingConfig(
+            split_cache_dir=str(self.temp_dir / "configured"), split_cache_max_size_mb=2
+        ))
+        assert cache.cache_dir == self.temp_dir / "configured"
+        assert cache.max_bytes == 2 * 1024 * 1024
+
+
+class TestContentSplitterCache:
+    """Test split_content with a split cache attached."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.source = self.temp_dir / "lecture.md"
+        self.source.write_text(SAMPLE)
+        self.cache = SplitCache(self.temp_dir / "cache")
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_repeat_split_uses_cache(self):
+        """Test that a second split of the same file is served from the cache."""
+        first = ContentSplitter(split_cache=self.cache)
+        expected = first.split_content(str(self.source))
+        expected_summary = first.get_validation_summary()
+        
+        second = ContentSplitter(split_cache=self.cache)
+        assert second.split_content(str(self.source)) == expected
+        
+        summary = second.get_validation_summary()
+        assert summary["split_cache"]["hits"] == 1
+        assert summary["split_cache"]["misses"] == 1
+        for key in ("latex_valid", "content_valid", "total_issues", "suggestions"):
+            assert summary[key] == expected_summary[key]
+        assert second.get_slide_boundaries() == first.get_slide_boundaries()
+        assert second.get_validation_warnings() == first.get_validation_warnings()
+        assert second.get_required_latex_packages() == first.get_required_latex_packages()
+    
+    def test_changed_source_misses(self):
+        """Test that editing the source invalidates the cached split."""
+        splitter = ContentSplitter(split_cache=self.cache)
+        splitter.split_content(str(self.source))
+        
+        self.source.write_text(SAMPLE + "\nAppendix.\n")
+        slides, notes = splitter.split_content(str(self.source))
+        
+        assert "Appendix." in notes
+        assert splitter.get_validation_summary()["split_cache"]["misses"] == 2
+    
+    def test_changed_bibliography_misses(self, monkeypatch):
+        """Test that editing an inserted .bib file invalidates the cached split."""
+        monkeypatch.chdir(self.temp_dir)
+        bib_file = self.temp_dir / "refs.bib"
+        bib_file.write_text("@article{first, title={First Paper}, author={A. Author}, year={2020}}")
+        self.source.write_text(SAMPLE + "\n<!-- INSERT-BIB refs.bib -->\n")
+        
+        splitter = ContentSplitter(split_cache=self.cache)
+        splitter.split_content(str(self.source))
+        
+        bib_file.write_text("@article{second, title={Second Paper}, author={B. Author}, year={2021}}")
+        slides, notes = splitter.split_content(str(self.source))
+        
+        assert "Second Paper" in notes
+        assert splitter.get_validation_summary()["split_cache"]["hits"] == 0
@@ -2,6 +2,9 @@
 Tests for the theme management system.
 """
 
+import os
+import sys
+import subprocess
 import pytest
 import tempfile
 import shutil
@@ -290,4 +293,25 @@ class TestThemeCSS:
         for css in [minimal_css, modern_css]:
             assert ":root {" in css
             assert ".reveal" in css
-            assert "font-family:" in css
\ No newline at end of file
+            assert "font-family:" in css
+    
+    def test_css_is_the_same_in_every_process(self):
+        """Test that the generated SCSS does not depend on the process's hash seed."""
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from markdown_slides_generator.themes.theme_manager import ThemeManager\n"
+            "manager = ThemeManager()\n"
+            "Path(sys.argv[1]).write_text(''.join(\n"
+            "    manager.generate_reveal_css(manager.get_theme(name)) for name in sorted(manager.list_themes())\n"
+            "))\n"
+        )
+        outputs = []
+        for seed in ('1', '3'):
+            env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=os.pathsep.join(sys.path))
+            scss_file = Path(self.temp_dir) / f"seed{seed}.scss"
+            subprocess.run([sys.executable, '-c', script, str(scss_file)], env=env, check=True, cwd=self.temp_dir)
+            outputs.append(scss_file.read_bytes())
+        
+        assert b"@import url(" in outputs[0]
+        assert outputs[0] == outputs[1]
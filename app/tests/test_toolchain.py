@@ -0,0 +1,131 @@
+"""
+Tests for the toolchain registry.
+
+Covers caching of version probes by binary path and mtime, TTL expiry,
+persistence across registry instances and its use by QuartoExecutor.
+"""
+
+import os
+import tempfile
+import shutil
+from pathlib import Path
+
+import pytest
+from markdown_slides_generator.core.toolchain import ToolchainRegistry, toolchain_registry
+from markdown_slides_generator.core.quarto_orchestrator import QuartoExecutor
+from markdown_slides_generator.utils.exceptions import OutputError
+
+
+class TestToolchainRegistry:
+    """Test probing fake tools placed on PATH."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.bin_dir = self.temp_dir / "bin"
+        self.bin_dir.mkdir()
+        self.calls_file = self.temp_dir / "calls"
+    
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _install_tool(self, monkeypatch, name="quarto", version="1.4.550", exit_code=0):
+        """Write a fake tool that records each invocation."""
+        tool = self.bin_dir / name
+        tool.write_text(
+            f"#!/bin/sh\necho {name} >> '{self.calls_file}'\necho {version}\nexit {exit_code}\n"
+        )
+        tool.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{self.bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+        return tool
+    
+    def _calls(self):
+        return self.calls_file.read_text().split() if self.calls_file.exists() else []
+    
+    def test_probe_is_cached(self, monkeypatch):
+        """Test that a second lookup does not run the tool again."""
+        self._install_tool(monkeypatch)
+        registry = ToolchainRegistry()
+        
+        first = registry.get("quarto")
+        second = registry.get("quarto")
+        
+        assert first.available and first.version == "1.4.550"
+        assert first.path == os.path.realpath(self.bin_dir / "quarto")
+        assert second is first
+        assert self._calls() == ["quarto"]
+        assert registry.get_stats() == {"entries": 1, "hits": 1, "probes": 1}
+    
+    def test_changed_binary_is_probed_again(self, monkeypatch):
+        """Test that replacing the binary invalidates its entry."""
+        tool = self._install_tool(monkeypatch)
+        registry = ToolchainRegistry()
+        registry.get("quarto")
+        
+        self._install_tool(monkeypatch, version="1.5.0")
+        os.utime(tool, ns=(tool.stat().st_atime_ns, tool.stat().st_mtime_ns + 10**9))
+        
+        assert registry.get("quarto").version == "1.5.0"
+        assert len(self._calls()) == 2
+    
+    def test_expired_and_failed_probes_are_repeated(self, monkeypatch):
+        """Test the TTL and that failures are never cached."""
+        self._install_tool(monkeypatch)
+        self._install_tool(monkeypatch, name="pdflatex", exit_code=1)
+        registry = ToolchainRegistry(ttl=0)
+        
+        registry.get("quarto")
+        registry.get("quarto")
+        assert not registry.get("pdflatex").available
+        registry.get("pdflatex")
+        
+        assert self._calls() == ["quarto", "quarto", "pdflatex", "pdflatex"]
+    
+    def test_missing_tool_raises(self, monkeypatch):
+        """Test that a tool that is not installed raises FileNotFoundError."""
+        monkeypatch.setenv("PATH", str(self.bin_dir))
+        
+        with pytest.raises(FileNotFoundError):
+            ToolchainRegistry().get("quarto")
+    
+    def test_persisted_probe_is_reused(self, monkeypatch):
+        """Test that a new registry reads probes written by an earlier one."""
+        self._install_tool(monkeypatch)
+        cache_file = self.temp_dir / "toolchain.json"
+        
+        writer = ToolchainRegistry()
+        writer.enable_persistence(cache_file)
+        writer.get("quarto")
+        
+        reader = ToolchainRegistry(cache_file=cache_file)
+        assert reader.get("quarto").version == "1.4.550"
+        assert reader.get_stats()["probes"] == 0
+        assert self._calls() == ["quarto"]
+    
+    def test_corrupt_cache_file_is_ignored(self, monkeypatch):
+        """Test that an unreadable registry file falls back to probing."""
+        self._install_tool(monkeypatch)
+        cache_file = self.temp_dir / "toolchain.json"
+        cache_file.write_text("{not json")
+        
+        assert ToolchainRegistry(cache_file=cache_file).get("quarto").available
+        assert self._calls() == ["quarto"]
+    
+    def test_executors_share_the_probe(self, monkeypatch):
+        """Test that every QuartoExecutor after the first skips the version check."""
+        self._install_tool(monkeypatch)
+        hits = toolchain_registry.get_stats()["hits"]
+        
+        QuartoExecutor()
+        QuartoExecutor()
+        
+        assert self._calls() == ["quarto"]
+        assert toolchain_registry.get_stats()["hits"] == hits + 1
+    
+    def test_executor_reports_broken_quarto(self, monkeypatch):
+        """Test that a failing probe still surfaces as OutputError."""
+        self._install_tool(monkeypatch, exit_code=3)
+        
+        with pytest.raises(OutputError, match="Quarto check failed"):
+            QuartoExecutor()